@@ -89,3 +89,9 @@ FRONT_PAGE_INTRODUCTION_CARDS = [
 ]
 
 DEFAULT_RECENT_DAYS = 30
+DEFAULT_NEWS_ARTICLE_THRESHOLD = 0.5
+
+ANALYTIC_RECENT_DAYS_CONFIG = "ANALYTIC_RECENT_DAYS"
+NEWS_ARTICLE_THRESHOLD_CONFIG = "NEWS_ARTICLE_THRESHOLD"
+
+APP_VALUE_CONFIG_CACHE_TIMEOUT = 60
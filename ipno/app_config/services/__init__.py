@@ -0,0 +1,6 @@
+from .app_value_config_cache import clear_app_value_config_cache, get_app_value_config
+
+__all__ = [
+    "get_app_value_config",
+    "clear_app_value_config_cache",
+]
@@ -0,0 +1,27 @@
+import time
+
+from app_config.constants import APP_VALUE_CONFIG_CACHE_TIMEOUT
+from app_config.models import AppValueConfig
+
+_app_value_configs = {"values": None, "loaded_at": 0}
+
+
+def get_app_value_configs():
+    values = _app_value_configs["values"]
+    loaded_at = _app_value_configs["loaded_at"]
+
+    if values is None or time.monotonic() - loaded_at > APP_VALUE_CONFIG_CACHE_TIMEOUT:
+        values = dict(
+            AppValueConfig.objects.order_by("-id").values_list("name", "value")
+        )
+        _app_value_configs.update(values=values, loaded_at=time.monotonic())
+
+    return values
+
+
+def get_app_value_config(name, default=None):
+    return get_app_value_configs().get(name, default)
+
+
+def clear_app_value_config_cache():
+    _app_value_configs.update(values=None, loaded_at=0)
@@ -1,26 +1,47 @@
-from django.db.models.signals import post_save
+from django.contrib.admin.models import LogEntry
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from app_config.constants import NEWS_ARTICLE_THRESHOLD_CONFIG
 from app_config.models import (
     AppTextContent,
     AppValueConfig,
     FrontPageCard,
     FrontPageOrder,
 )
-from utils.cache_utils import delete_cache
+from app_config.services import clear_app_value_config_cache
+from news_articles.services import ProcessPublishableArticles
+from utils.cache_utils import bump_data_version, delete_cache
 
 
 @receiver(post_save, sender=AppValueConfig)
 @receiver(post_save, sender=AppTextContent)
 def app_config_cache(*args, **kwargs):
     delete_cache("api:app-config-list")
+    bump_data_version()
+
+
+@receiver(post_save, sender=AppValueConfig)
+@receiver(post_delete, sender=AppValueConfig)
+def app_value_config_in_process_cache(sender, instance, **kwargs):
+    clear_app_value_config_cache()
+
+    if instance.name == NEWS_ARTICLE_THRESHOLD_CONFIG:
+        ProcessPublishableArticles().process()
 
 
 @receiver(post_save, sender=FrontPageCard)
 def front_page_card_cache(*args, **kwargs):
     delete_cache("api:front-page-cards-list")
+    bump_data_version()
 
 
 @receiver(post_save, sender=FrontPageOrder)
 def front_page_order_cache(*args, **kwargs):
     delete_cache("api:front-page-orders-list")
+    bump_data_version()
+
+
+@receiver(post_save, sender=LogEntry)
+def admin_change_data_version(*args, **kwargs):
+    bump_data_version()
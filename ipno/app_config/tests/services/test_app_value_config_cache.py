@@ -0,0 +1,43 @@
+from django.test.testcases import TestCase
+
+from mock import patch
+
+from app_config.factories import AppValueConfigFactory
+from app_config.models import AppValueConfig
+from app_config.services import clear_app_value_config_cache, get_app_value_config
+
+
+class AppValueConfigCacheTestCase(TestCase):
+    def setUp(self):
+        clear_app_value_config_cache()
+
+    def test_get_app_value_config(self):
+        AppValueConfigFactory(name="ANALYTIC_RECENT_DAYS", value="15")
+
+        assert get_app_value_config("ANALYTIC_RECENT_DAYS") == "15"
+        assert get_app_value_config("NO_OF_RECENT_SEARCHES") is None
+        assert get_app_value_config("NO_OF_RECENT_SEARCHES", 5) == 5
+
+    def test_get_app_value_config_from_cache(self):
+        AppValueConfigFactory(name="ANALYTIC_RECENT_DAYS", value="15")
+        get_app_value_config("ANALYTIC_RECENT_DAYS")
+
+        AppValueConfig.objects.update(value="20")
+
+        with self.assertNumQueries(0):
+            assert get_app_value_config("ANALYTIC_RECENT_DAYS") == "15"
+
+        clear_app_value_config_cache()
+
+        assert get_app_value_config("ANALYTIC_RECENT_DAYS") == "20"
+
+    @patch("app_config.services.app_value_config_cache.time.monotonic")
+    def test_get_app_value_config_after_timeout(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        AppValueConfigFactory(name="ANALYTIC_RECENT_DAYS", value="15")
+        get_app_value_config("ANALYTIC_RECENT_DAYS")
+
+        AppValueConfig.objects.update(value="20")
+        mock_monotonic.return_value = 200
+
+        assert get_app_value_config("ANALYTIC_RECENT_DAYS") == "20"
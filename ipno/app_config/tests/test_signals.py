@@ -1,3 +1,5 @@
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.contrib.contenttypes.models import ContentType
 from django.test.testcases import TestCase
 
 from mock import patch
@@ -8,6 +10,7 @@ from app_config.factories import (
     FrontPageCardFactory,
     FrontPageOrderFactory,
 )
+from authentication.factories import UserFactory
 
 
 class AppConfigTestCase(TestCase):
@@ -21,6 +24,25 @@ class AppConfigTestCase(TestCase):
 
         mock_delete_cache.assert_called_with("api:app-config-list")
 
+    @patch("app_config.signals.ProcessPublishableArticles")
+    @patch("app_config.signals.clear_app_value_config_cache")
+    def test_clear_in_process_cache_when_AppValueConfig_is_changed(
+        self, mock_clear_app_value_config_cache, mock_process_publishable_articles
+    ):
+        app_value_config = AppValueConfigFactory(name="ANALYTIC_RECENT_DAYS")
+        app_value_config.delete()
+
+        assert mock_clear_app_value_config_cache.call_count == 2
+        mock_process_publishable_articles.assert_not_called()
+
+    @patch("app_config.signals.ProcessPublishableArticles")
+    def test_process_publishable_articles_when_threshold_is_saved(
+        self, mock_process_publishable_articles
+    ):
+        AppValueConfigFactory(name="NEWS_ARTICLE_THRESHOLD", value="0.6")
+
+        mock_process_publishable_articles.return_value.process.assert_called()
+
     @patch("app_config.signals.delete_cache")
     def test_delete_app_config_cache_when_AppTextContent_is_saved(
         self, mock_delete_cache
@@ -50,3 +72,18 @@ class AppConfigTestCase(TestCase):
         front_page_order.save()
 
         mock_delete_cache.assert_called_with("api:front-page-orders-list")
+
+    @patch("app_config.signals.bump_data_version")
+    def test_bump_data_version_when_admin_saves_an_object(self, mock_bump_data_version):
+        user = UserFactory()
+        front_page_card = FrontPageCardFactory()
+
+        LogEntry.objects.log_action(
+            user_id=user.id,
+            content_type_id=ContentType.objects.get_for_model(front_page_card).id,
+            object_id=front_page_card.id,
+            object_repr=str(front_page_card),
+            action_flag=CHANGE,
+        )
+
+        mock_bump_data_version.assert_called()
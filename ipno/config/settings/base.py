@@ -223,6 +223,9 @@ ELASTICSEARCH_DSL = {
         "hosts": env.str("ELASTICSEARCH_HOST", "elasticsearch:9200"),
     },
 }
+ELASTICSEARCH_INDEXING_THREAD_COUNT = env.int("ELASTICSEARCH_INDEXING_THREAD_COUNT", 4)
+ELASTICSEARCH_INDEXING_CHUNK_SIZE = env.int("ELASTICSEARCH_INDEXING_CHUNK_SIZE", 500)
+SEARCH_HYDRATION_WORKERS = env.int("SEARCH_HYDRATION_WORKERS", 4)
 
 DROPBOX_APP_KEY = env.str("DROPBOX_APP_KEY", None)
 DROPBOX_APP_SECRET = env.str("DROPBOX_APP_SECRET", None)
@@ -19,6 +19,8 @@ GC_RAW_DATA_BUCKET_PATH = f"https://storage.googleapis.com/{RAW_DATA_BUCKET_NAME
 
 HOST = "http://localhost:8080"
 
+SEARCH_HYDRATION_WORKERS = 1
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
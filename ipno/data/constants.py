@@ -31,5 +31,8 @@ IMPORT_LOG_STATUSES = (
 )
 
 MAP_IMAGES_SUB_DIR = "map_images"
+MAP_IMAGES_UPLOAD_THREAD_COUNT = 8
 
 IMPORT_TASK_ID_CACHE_KEY = "import_task_id_cache_key"
+
+DOCUMENT_PREVIEW_BACKFILL_BATCH_SIZE = 500
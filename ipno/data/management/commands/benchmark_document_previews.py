@@ -0,0 +1,71 @@
+import statistics
+import time
+from pathlib import Path
+
+from django.core.management import BaseCommand
+
+from utils.image_generator import generate_from_blob
+from utils.preview_renderer import PreviewRenderer
+
+
+class Command(BaseCommand):
+    help = "Measure preview image rendering latency over a corpus of sample PDFs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("corpus_dir")
+        parser.add_argument("--workers", type=int)
+
+    def report_sequential(self, blobs):
+        latencies = []
+        failed_count = 0
+
+        for blob in blobs:
+            start_time = time.monotonic()
+            if not generate_from_blob(blob):
+                failed_count += 1
+            latencies.append((time.monotonic() - start_time) * 1000)
+
+        self.stdout.write(
+            f"sequential: median {statistics.median(latencies):.1f} ms, "
+            f"max {max(latencies):.1f} ms, failed {failed_count}"
+        )
+
+    def report_pool(self, blobs, workers):
+        rendered = []
+        start_time = time.monotonic()
+
+        with PreviewRenderer(
+            lambda key, preview_image_blob: rendered.append(preview_image_blob),
+            max_workers=workers,
+        ) as renderer:
+            for index, blob in enumerate(blobs):
+                renderer.submit(index, blob)
+
+        elapsed_time = time.monotonic() - start_time
+        failed_count = len([blob for blob in rendered if not blob])
+
+        self.stdout.write(
+            f"pool: {elapsed_time:.2f}s, "
+            f"{len(blobs) / elapsed_time if elapsed_time else 0:.1f} files/s, "
+            f"failed {failed_count}"
+        )
+
+    def handle(self, *args, **options):
+        paths = sorted(
+            path
+            for path in Path(options["corpus_dir"]).iterdir()
+            if path.suffix.lower() == ".pdf"
+        )
+
+        if not paths:
+            self.stdout.write("No PDF files found")
+            return
+
+        blobs = [path.read_bytes() for path in paths]
+        self.stdout.write(
+            f"{len(blobs)} files,"
+            f" {sum(len(blob) for blob in blobs) / 1024 / 1024:.1f} MB"
+        )
+
+        self.report_sequential(blobs)
+        self.report_pool(blobs, options["workers"])
@@ -0,0 +1,54 @@
+import statistics
+import time
+
+from django.core.management import BaseCommand
+
+from django_elasticsearch_dsl.registries import registry
+
+from search.queries.search_all_query import SEARCH_MAPPINGS
+from shared.constants import SEARCH_BENCHMARK_QUERIES
+
+
+class Command(BaseCommand):
+    help = "Report search index sizes and query latency over a fixed query set"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+
+    def report_index_sizes(self):
+        self.stdout.write(f"{'index':<20} {'docs':>10} {'size (MB)':>12}")
+
+        for doc in registry.get_documents(registry.get_models()):
+            es_doc = doc()
+            stats = es_doc._get_connection().indices.stats(
+                index=es_doc._index._name, metric="docs,store"
+            )["_all"]["primaries"]
+
+            self.stdout.write(
+                f"{es_doc._index._name:<20} {stats['docs']['count']:>10} "
+                f"{stats['store']['size_in_bytes'] / 1024 / 1024:>12.2f}"
+            )
+
+    def report_query_latencies(self, runs):
+        self.stdout.write(
+            f"{'section':<10} {'query':<16} {'median (ms)':>12} {'max (ms)':>10}"
+        )
+
+        for search_key, search_mapping in SEARCH_MAPPINGS.items():
+            for query in SEARCH_BENCHMARK_QUERIES:
+                search_query = search_mapping["search_query"](query)
+                latencies = []
+
+                for _ in range(runs):
+                    start_time = time.monotonic()
+                    search_query.search()
+                    latencies.append((time.monotonic() - start_time) * 1000)
+
+                self.stdout.write(
+                    f"{search_key:<10} {query:<16} "
+                    f"{statistics.median(latencies):>12.1f} {max(latencies):>10.1f}"
+                )
+
+    def handle(self, *args, **options):
+        self.report_index_sizes()
+        self.report_query_latencies(options["runs"])
@@ -0,0 +1,87 @@
+import time
+
+from django.core.management import BaseCommand
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from elasticsearch import TransportError
+
+from search.queries.search_all_query import SEARCH_MAPPINGS
+from shared.constants import SEARCH_LIMIT
+from utils.es_pagination import ESPagination
+
+
+class Command(BaseCommand):
+    help = "Measure page-N latency of offset and cursor search pagination"
+
+    def add_arguments(self, parser):
+        parser.add_argument("query")
+        parser.add_argument(
+            "--doc-type", default="documents", choices=list(SEARCH_MAPPINGS)
+        )
+        parser.add_argument("--pages", type=int, default=100)
+        parser.add_argument("--limit", type=int, default=SEARCH_LIMIT)
+        parser.add_argument("--step", type=int, default=10)
+
+    def run_pages(self, search_query, pages, params):
+        latencies = []
+        request = Request(APIRequestFactory().get("/api/search/", params))
+
+        for _ in range(pages):
+            paginator = ESPagination()
+            start_time = time.monotonic()
+
+            try:
+                paginator.paginate_es_query(search_query, request)
+            except TransportError as e:
+                self.stdout.write(f"Stopped after {len(latencies)} pages: {e}")
+                break
+
+            latencies.append((time.monotonic() - start_time) * 1000)
+            next_link = paginator.get_next_link()
+
+            if not next_link:
+                break
+
+            request = Request(APIRequestFactory().get(next_link))
+
+        return latencies
+
+    def handle(self, *args, **options):
+        search_query = SEARCH_MAPPINGS[options["doc_type"]]["search_query"](
+            options["query"]
+        )
+        limit = options["limit"]
+
+        offset_latencies = self.run_pages(
+            search_query, options["pages"], {"limit": limit}
+        )
+        cursor_latencies = self.run_pages(
+            search_query, options["pages"], {"limit": limit, "pagination": "cursor"}
+        )
+
+        pages_count = max(len(offset_latencies), len(cursor_latencies))
+
+        if not pages_count:
+            self.stdout.write("No results")
+            return
+
+        reported_pages = sorted(
+            {1, pages_count, *range(options["step"], pages_count, options["step"])}
+        )
+
+        self.stdout.write(f"{'page':>6} {'offset (ms)':>12} {'cursor (ms)':>12}")
+
+        for page in reported_pages:
+            offset_latency = (
+                f"{offset_latencies[page - 1]:.1f}"
+                if page <= len(offset_latencies)
+                else "-"
+            )
+            cursor_latency = (
+                f"{cursor_latencies[page - 1]:.1f}"
+                if page <= len(cursor_latencies)
+                else "-"
+            )
+            self.stdout.write(f"{page:>6} {offset_latency:>12} {cursor_latency:>12}")
@@ -0,0 +1,17 @@
+from django.core.management import BaseCommand
+
+from utils.constants import SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE
+from utils.search_index import check_search_index_consistency
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE,
+            help="Number of documents sampled from each search index",
+        )
+
+    def handle(self, *args, **options):
+        check_search_index_consistency(options["size"])
@@ -0,0 +1,60 @@
+from django.core.management import BaseCommand
+
+from elasticsearch_dsl.function import ScriptScore
+from elasticsearch_dsl.query import FunctionScore
+
+from search.queries import DepartmentsSearchQuery, OfficersSearchQuery
+from shared.constants import SEARCH_BENCHMARK_QUERIES
+
+
+class Command(BaseCommand):
+    help = "Compare top-k search ranking against the legacy script scoring"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=10)
+
+    def get_legacy_ids(self, search_query, size):
+        script = " * ".join(
+            [
+                *[
+                    f"doc['{impact_factor}'].value"
+                    for impact_factor in search_query.impact_factors
+                ],
+                "_score",
+            ]
+        )
+        search = (
+            search_query.document_klass()
+            .search()
+            .query(
+                FunctionScore(
+                    query=search_query.text_query(),
+                    functions=[ScriptScore(script=script)],
+                )
+            )
+        )
+
+        return [hit.id for hit in search.source(["id"])[:size].execute()]
+
+    def handle(self, *args, **options):
+        size = options["top"]
+
+        self.stdout.write(f"{'section':<12} {'query':<16} {'top-1':>6} {'overlap':>8}")
+
+        for search_query_klass in [DepartmentsSearchQuery, OfficersSearchQuery]:
+            for query in SEARCH_BENCHMARK_QUERIES:
+                search_query = search_query_klass(query)
+                legacy_ids = self.get_legacy_ids(search_query, size)
+                ids = [hit.id for hit in search_query.search(size)]
+
+                same_top = "yes" if legacy_ids[:1] == ids[:1] else "no"
+                overlap = (
+                    len(set(legacy_ids) & set(ids)) / len(legacy_ids)
+                    if legacy_ids
+                    else 1
+                )
+
+                self.stdout.write(
+                    f"{search_query_klass.document_klass._index._name:<12} "
+                    f"{query:<16} {same_top:>6} {overlap:>8.0%}"
+                )
@@ -0,0 +1,104 @@
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+import requests
+import structlog
+from tqdm import tqdm
+
+from data.constants import DOCUMENT_PREVIEW_BACKFILL_BATCH_SIZE
+from documents.models import Document
+from utils.cache_utils import bump_data_version
+from utils.constants import FILE_TYPES
+from utils.google_cloud import GoogleCloudService
+from utils.preview_renderer import PreviewRenderer
+from utils.search_index import record_search_index_changes
+
+logger = structlog.get_logger("IPNO")
+
+
+class Command(BaseCommand):
+    help = "Generate preview images for PDF documents that are missing one"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int)
+        parser.add_argument(
+            "--batch-size", type=int, default=DOCUMENT_PREVIEW_BACKFILL_BATCH_SIZE
+        )
+
+    def upload_preview_image(self, document, preview_image_blob):
+        if not preview_image_blob:
+            logger.warning(f"Cannot generate preview image for document {document.id}")
+            return
+
+        preview_image_url = document.url.replace(".pdf", "-preview.jpeg").replace(
+            ".PDF", "-preview.jpeg"
+        )
+        upload_location = unquote(
+            preview_image_url[len(settings.GC_DOCUMENT_BUCKET_PATH) :]
+        )
+
+        try:
+            self.gs.upload_file_from_string(
+                upload_location, preview_image_blob, FILE_TYPES["IMG"]
+            )
+        except Exception as ex:
+            logger.error(
+                f"Error when uploading preview image of document {document.id}: "
+                f"{str(ex)}"
+            )
+            return
+
+        document.preview_image_url = preview_image_url
+        self.updated_documents.append(document)
+
+        if len(self.updated_documents) >= self.batch_size:
+            self.save_documents()
+
+    def save_documents(self):
+        Document.objects.bulk_update(self.updated_documents, ["preview_image_url"])
+        record_search_index_changes(
+            Document, [document.id for document in self.updated_documents]
+        )
+
+        self.updated_count += len(self.updated_documents)
+        self.updated_documents = []
+
+    def handle(self, *args, **options):
+        self.gs = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
+        self.batch_size = options["batch_size"]
+        self.updated_documents = []
+        self.updated_count = 0
+
+        documents = Document.objects.filter(
+            preview_image_url__isnull=True,
+            url__startswith=settings.GC_DOCUMENT_BUCKET_PATH,
+            document_type=FILE_TYPES["PDF"],
+        ).only("id", "url")
+
+        with PreviewRenderer(
+            self.upload_preview_image, max_workers=options["workers"]
+        ) as renderer:
+            for document in tqdm(
+                documents.iterator(chunk_size=self.batch_size),
+                total=documents.count(),
+                desc="Generate document previews",
+            ):
+                try:
+                    blob = requests.get(document.url).content
+                except requests.RequestException as ex:
+                    logger.error(
+                        f"Error when downloading document {document.id}: {str(ex)}"
+                    )
+                    continue
+
+                renderer.submit(document, blob)
+
+        if self.updated_documents:
+            self.save_documents()
+
+        if self.updated_count:
+            bump_data_version()
+
+        self.stdout.write(f"Generated {self.updated_count} document preview images")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from django.conf import settings
 from django.core.management import BaseCommand
@@ -6,35 +6,90 @@ from django.core.management import BaseCommand
 import structlog
 from tqdm import tqdm
 
-from data.constants import MAP_IMAGES_SUB_DIR
+from data.constants import MAP_IMAGES_SUB_DIR, MAP_IMAGES_UPLOAD_THREAD_COUNT
 from departments.models import Department
 from utils.google_cloud import GoogleCloudService
-from utils.image_generator import generate_map_thumbnail
+from utils.image_generator import generate_map_thumbnail, get_map_thumbnail_hash
 
 logger = structlog.get_logger("IPNO")
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int)
+
+    def get_outdated_deps(self):
+        deps = Department.objects.filter(location__isnull=False).only(
+            "id", "agency_slug", "location", "location_map_url"
+        )
+        outdated_deps = []
+
+        for dep in deps:
+            thumbnail_hash = get_map_thumbnail_hash(*dep.location)
+            upload_location = (
+                f"{MAP_IMAGES_SUB_DIR}/{dep.agency_slug}-{thumbnail_hash}.png"
+            )
+
+            if (
+                dep.location_map_url
+                != f"{settings.GC_DOCUMENT_BUCKET_PATH}{upload_location}"
+            ):
+                outdated_deps.append((dep, upload_location))
+
+        return outdated_deps
+
     def handle(self, *args, **options):
         gs = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
-        deps = Department.objects.filter(location_map_url__isnull=True)
-        for dep in tqdm(deps):
-            location = dep.location
-            if location:
-                try:
-                    image = generate_map_thumbnail(location[0], location[1])
-                    current_time = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    upload_location = (
-                        f"{MAP_IMAGES_SUB_DIR}/{current_time}-{dep.agency_slug}.png"
+        updated_deps = []
+
+        with ProcessPoolExecutor(max_workers=options["workers"]) as render_executor:
+            render_futures = {
+                render_executor.submit(generate_map_thumbnail, *dep.location): (
+                    dep,
+                    upload_location,
+                )
+                for dep, upload_location in self.get_outdated_deps()
+            }
+
+            with ThreadPoolExecutor(
+                max_workers=MAP_IMAGES_UPLOAD_THREAD_COUNT
+            ) as upload_executor:
+                upload_futures = {}
+
+                for future in tqdm(
+                    as_completed(render_futures), total=len(render_futures)
+                ):
+                    dep, upload_location = render_futures[future]
+
+                    try:
+                        image = future.result()
+                    except ValueError as ex:
+                        logger.error(
+                            "Error when update department map, at department"
+                            f" {dep.id}, {dep.agency_slug}: {str(ex)}"
+                        )
+                        continue
+
+                    upload_future = upload_executor.submit(
+                        gs.upload_file_from_string, upload_location, image, "image/png"
                     )
-                    gs.upload_file_from_string(upload_location, image, "image/png")
+                    upload_futures[upload_future] = (dep, upload_location)
+
+                for future in as_completed(upload_futures):
+                    dep, upload_location = upload_futures[future]
+
+                    try:
+                        future.result()
+                    except Exception as ex:
+                        logger.error(
+                            "Error when upload department map, at department"
+                            f" {dep.id}, {dep.agency_slug}: {str(ex)}"
+                        )
+                        continue
+
                     dep.location_map_url = (
                         f"{settings.GC_DOCUMENT_BUCKET_PATH}{upload_location}"
                     )
-                except ValueError as ex:
-                    logger.error(
-                        f"Error when update department map, at department {dep.id},"
-                        f" {dep.agency_slug}: {str(ex)}"
-                    )
+                    updated_deps.append(dep)
 
-        Department.objects.bulk_update(deps, ["location_map_url"])
+        Department.objects.bulk_update(updated_deps, ["location_map_url"])
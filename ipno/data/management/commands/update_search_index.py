@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+
+from utils.search_index import (
+    rebuild_search_index,
+    update_search_index,
+    warm_search_cache,
+)
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild every search index from scratch",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            rebuild_search_index()
+        else:
+            update_search_index()
+
+        warm_search_cache()
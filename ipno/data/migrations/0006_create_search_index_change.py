@@ -0,0 +1,26 @@
+# Generated by Django 3.1.13 on 2026-10-19 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0005_delete_wrglrepo'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('index_name', models.CharField(db_index=True, max_length=255)),
+                ('object_id', models.IntegerField()),
+            ],
+            options={
+                'unique_together': {('index_name', 'object_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.13 on 2026-10-19 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0006_create_search_index_change'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchindexchange',
+            name='object_id',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -1,3 +1,4 @@
 from .import_log import ImportLog
+from .search_index_change import SearchIndexChange
 
-__all__ = ["ImportLog"]
+__all__ = ["ImportLog", "SearchIndexChange"]
@@ -0,0 +1,14 @@
+from django.db import models
+
+from utils.models import TimeStampsModel
+
+
+class SearchIndexChange(TimeStampsModel):
+    index_name = models.CharField(max_length=255, db_index=True)
+    object_id = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("index_name", "object_id")
+
+    def __str__(self):
+        return f"{self.index_name} - {self.object_id}"
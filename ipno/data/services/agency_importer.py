@@ -1,5 +1,4 @@
 import ast
-from datetime import datetime
 
 from django.conf import settings
 
@@ -11,7 +10,7 @@ from data.services import BaseImporter
 from data.services.data_reconciliation import DataReconciliation
 from departments.models import Department
 from utils.google_cloud import GoogleCloudService
-from utils.image_generator import generate_map_thumbnail
+from utils.image_generator import generate_map_thumbnail, get_map_thumbnail_hash
 
 logger = structlog.get_logger("IPNO")
 
@@ -78,9 +77,9 @@ class AgencyImporter(BaseImporter):
         if should_update_location:
             try:
                 image = generate_map_thumbnail(location[0], location[1])
-                current_time = datetime.now().strftime("%Y%m%d-%H%M%S")
+                thumbnail_hash = get_map_thumbnail_hash(location[0], location[1])
                 upload_location = (
-                    f"{MAP_IMAGES_SUB_DIR}/{current_time}-{agency_slug}.png"
+                    f"{MAP_IMAGES_SUB_DIR}/{agency_slug}-{thumbnail_hash}.png"
                 )
                 location_map_url = self.upload_file(upload_location, image)
             except ValueError as ex:
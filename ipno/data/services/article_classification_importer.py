@@ -4,6 +4,7 @@ from data.constants import NEWS_ARTICLE_CLASSIFICATION_MODEL_NAME
 from data.services.base_importer import BaseImporter
 from data.services.data_reconciliation import DataReconciliation
 from news_articles.models import NewsArticle, NewsArticleClassification
+from news_articles.services import ProcessPublishableArticles
 
 
 class ArticleClassificationImporter(BaseImporter):  # pragma: no cover
@@ -75,13 +76,17 @@ class ArticleClassificationImporter(BaseImporter):  # pragma: no cover
         ):
             self.handle_record_data(row)
 
-        return self.bulk_import(
+        import_results = self.bulk_import(
             NewsArticleClassification,
             self.new_classifications_attrs,
             self.update_classifications_attrs,
             self.delete_classification_ids,
         )
 
+        ProcessPublishableArticles().process()
+
+        return import_results
+
     def get_article_classification_mappings(self):
         return {
             article_classification.article_id: article_classification.id
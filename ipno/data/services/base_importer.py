@@ -19,6 +19,7 @@ from departments.models import Department
 from officers.models import Officer
 from use_of_forces.models import UseOfForce
 from utils.parse_utils import parse_int
+from utils.search_index import record_search_index_changes
 
 
 class BaseImporter(object):
@@ -112,14 +113,20 @@ class BaseImporter(object):
         if cleanup_action:
             cleanup_action(list(delete_items.values()))
 
+        record_search_index_changes(klass, delete_items_ids)
+
         delete_items_count = delete_items.count()
         delete_items.delete()
 
+        new_items_ids = []
+
         for i in range(0, len(new_items_attrs), self.BATCH_SIZE):
             new_objects = [
                 klass(**attrs) for attrs in new_items_attrs[i : i + self.BATCH_SIZE]
             ]
-            klass.objects.bulk_create(new_objects)
+            new_items_ids.extend(
+                new_object.id for new_object in klass.objects.bulk_create(new_objects)
+            )
 
         for i in range(0, len(update_items_attrs), self.BATCH_SIZE):
             update_objects = [
@@ -127,6 +134,10 @@ class BaseImporter(object):
             ]
             klass.objects.bulk_update(update_objects, self.UPDATE_ATTRIBUTES)
 
+        record_search_index_changes(
+            klass, [*new_items_ids, *[attrs["id"] for attrs in update_items_attrs]]
+        )
+
         return {
             "created_rows": len(new_items_attrs),
             "updated_rows": len(update_items_attrs),
@@ -21,6 +21,7 @@ from data.services import (
     UofImporter,
 )
 from data.services.schema_validation import SchemaValidation
+from departments.services import MigratoryGraphBuilder
 from ipno.data.constants import (
     AGENCY_MODEL_NAME,
     APPEAL_MODEL_NAME,
@@ -34,15 +35,17 @@ from ipno.data.constants import (
     POST_OFFICE_HISTORY_MODEL_NAME,
     USE_OF_FORCE_MODEL_NAME,
 )
-from news_articles.services import ProcessRematchOfficers
+from news_articles.services import ProcessPublishableArticles, ProcessRematchOfficers
+from utils.cache_utils import bump_data_version
 from utils.count_data import (
     calculate_complaint_fraction,
     calculate_officer_fraction,
+    compute_person_cards,
     count_complaints,
 )
 from utils.data_utils import compute_department_data_period
 from utils.google_cloud import GoogleCloudService
-from utils.search_index import rebuild_search_index
+from utils.search_index import update_search_index, warm_search_cache
 
 logger = structlog.get_logger("IPNO")
 
@@ -88,6 +91,7 @@ class DataImporter:
             person_imported = PersonImporter(data_mapping[PERSON_MODEL_NAME]).process()
 
             ProcessRematchOfficers(start_time).process()
+            ProcessPublishableArticles().process()
 
             if any(
                 [
@@ -111,6 +115,21 @@ class DataImporter:
                 logger.info("Migrate officer movements")
                 MigrateOfficerMovement().process()
 
+                logger.info("Build migratory graphs")
+                MigratoryGraphBuilder().build_all()
+
+            if any(
+                [
+                    agency_imported,
+                    officer_imported,
+                    uof_imported,
+                    event_imported,
+                    person_imported,
+                ]
+            ):
+                logger.info("Compute person cards")
+                compute_person_cards()
+
             if any(
                 [
                     agency_imported,
@@ -140,11 +159,15 @@ class DataImporter:
                     brady_imported,
                 ]
             ):
-                logger.info("Rebuilding search index")
-                rebuild_search_index()
+                logger.info("Updating search index")
+                update_search_index()
 
                 logger.info("Flushing cache table")
                 cache.clear()
+                bump_data_version()
+
+                logger.info("Pre-warming search cache")
+                warm_search_cache()
         except Exception as e:
             logger.error("Failed to import data", error=str(e))
         finally:
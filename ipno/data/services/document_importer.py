@@ -15,8 +15,8 @@ from data.services.data_reconciliation import DataReconciliation
 from documents.models import Document
 from utils.dropbox_utils import DropboxService
 from utils.google_cloud import GoogleCloudService
-from utils.image_generator import generate_from_blob
 from utils.parse_utils import parse_date
+from utils.preview_renderer import PreviewRenderer
 
 BATCH_SIZE = 1000
 
@@ -60,6 +60,8 @@ class DocumentImporter(BaseImporter):
         self.delete_documents_ids = []
         self.document_mappings = {}
         self.uploaded_files = {}
+        self.preview_image_urls = {}
+        self.preview_renderer = None
         self.data_reconciliation = DataReconciliation(
             DOCUMENT_MODEL_NAME, csv_file_path
         )
@@ -188,16 +190,24 @@ class DocumentImporter(BaseImporter):
             officer_relation_objs, batch_size=BATCH_SIZE
         )
 
-    def generate_preview_image(self, image_blob, upload_url):
+    def upload_preview_image(self, key, preview_image_blob):
+        pdf_db_path, upload_url = key
         preview_url_location = upload_url.replace(".pdf", "-preview.jpeg").replace(
             ".PDF", "-preview.jpeg"
         )
-        preview_image_blob = generate_from_blob(image_blob)
 
-        if preview_image_blob:
-            return self.upload_file(
-                preview_url_location, preview_image_blob, "image/jpeg"
-            )
+        self.preview_image_urls[pdf_db_path] = (
+            self.upload_file(preview_url_location, preview_image_blob, "image/jpeg")
+            if preview_image_blob
+            else None
+        )
+
+    def update_preview_image_urls(self):
+        for document in chain(self.new_documents, self.update_documents):
+            pdf_db_path = document.get("pdf_db_path")
+
+            if pdf_db_path in self.preview_image_urls:
+                document["preview_image_url"] = self.preview_image_urls[pdf_db_path]
 
     def upload_file(self, upload_location, file_blob, file_type):
         try:
@@ -236,13 +246,12 @@ class DocumentImporter(BaseImporter):
         if not document_url:
             return {}
 
-        document_preview_url = None
         if content_type == "application/pdf":
-            document_preview_url = self.generate_preview_image(image_blob, upload_url)
+            self.preview_renderer.submit((pdf_db_path, upload_url), image_blob)
 
         uploaded_url = {
             "document_url": document_url,
-            "document_preview_url": document_preview_url,
+            "document_preview_url": None,
             "document_type": content_type,
         }
 
@@ -331,25 +340,28 @@ class DocumentImporter(BaseImporter):
     def import_data(self, data):
         self.document_mappings = self.get_document_mappings()
 
-        for row in tqdm(data.get("added_rows"), desc="Create new documents"):
-            self.handle_record_data(row)
+        with PreviewRenderer(self.upload_preview_image) as self.preview_renderer:
+            for row in tqdm(data.get("added_rows"), desc="Create new documents"):
+                self.handle_record_data(row)
 
-        for row in tqdm(data.get("deleted_rows"), desc="Delete removed documents"):
-            document_data = self.parse_row_data(row, self.old_column_mappings)
-            docid = document_data.get("docid")
-            hrg_no = document_data.get("hrg_no")
-            matched_uid = document_data.get("matched_uid")
-            agency = document_data.get("agency")
+            for row in tqdm(data.get("deleted_rows"), desc="Delete removed documents"):
+                document_data = self.parse_row_data(row, self.old_column_mappings)
+                docid = document_data.get("docid")
+                hrg_no = document_data.get("hrg_no")
+                matched_uid = document_data.get("matched_uid")
+                agency = document_data.get("agency")
 
-            old_document = self.document_mappings.get(
-                (docid, hrg_no, matched_uid, agency)
-            )
+                old_document = self.document_mappings.get(
+                    (docid, hrg_no, matched_uid, agency)
+                )
 
-            if old_document:
-                self.delete_documents_ids.append(old_document.get("id"))
+                if old_document:
+                    self.delete_documents_ids.append(old_document.get("id"))
+
+            for row in tqdm(data.get("updated_rows"), desc="Update modified documents"):
+                self.handle_record_data(row)
 
-        for row in tqdm(data.get("updated_rows"), desc="Update modified documents"):
-            self.handle_record_data(row)
+        self.update_preview_image_urls()
 
         import_result = self.bulk_import(
             Document,
@@ -7,6 +7,7 @@ from data.constants import EVENT_MODEL_NAME
 from data.services.base_importer import BaseImporter
 from data.services.data_reconciliation import DataReconciliation
 from officers.models import Event
+from officers.services import left_reason_vocabulary
 
 
 class EventImporter(BaseImporter):
@@ -152,4 +153,6 @@ class EventImporter(BaseImporter):
 
         self.update_relations()
 
+        left_reason_vocabulary.refresh()
+
         return import_result
@@ -7,6 +7,7 @@ from data.services import BaseImporter
 from data.services.data_reconciliation import DataReconciliation
 from officers.models import Officer
 from people.models import Person
+from utils.search_index import record_search_index_changes
 
 
 class PersonImporter(BaseImporter):
@@ -69,6 +70,10 @@ class PersonImporter(BaseImporter):
             ]
             Officer.objects.bulk_update(update_objects, ["person_id"])
 
+        record_search_index_changes(
+            Officer, [attrs["id"] for attrs in update_officers_attrs]
+        )
+
         return len(update_officers_attrs)
 
     def handle_record_data(self, row):
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from mock import patch
+
+
+@patch("utils.preview_renderer.ProcessPoolExecutor", ThreadPoolExecutor)
+class BenchmarkDocumentPreviewsCommandTestCase(SimpleTestCase):
+    @patch("utils.preview_renderer.generate_from_blob")
+    @patch("data.management.commands.benchmark_document_previews.generate_from_blob")
+    def test_call_command(self, mock_generate_from_blob, mock_pool_generate_from_blob):
+        mock_generate_from_blob.side_effect = [b"preview", None]
+        mock_pool_generate_from_blob.side_effect = lambda blob: (
+            b"preview" if blob == b"pdf-1" else None
+        )
+        out = StringIO()
+
+        with TemporaryDirectory() as corpus_dir:
+            for name, content in [
+                ("1.pdf", b"pdf-1"),
+                ("2.PDF", b"pdf-2"),
+                ("notes.txt", b"notes"),
+            ]:
+                with open(f"{corpus_dir}/{name}", "wb") as file:
+                    file.write(content)
+
+            call_command("benchmark_document_previews", corpus_dir, stdout=out)
+
+        assert mock_generate_from_blob.call_count == 2
+        assert mock_pool_generate_from_blob.call_count == 2
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("2 files")
+        assert lines[1].startswith("sequential:")
+        assert lines[1].endswith("failed 1")
+        assert lines[2].startswith("pool:")
+        assert lines[2].endswith("failed 1")
+
+    def test_call_command_empty_corpus(self):
+        out = StringIO()
+
+        with TemporaryDirectory() as corpus_dir:
+            call_command("benchmark_document_previews", corpus_dir, stdout=out)
+
+        assert out.getvalue().strip() == "No PDF files found"
@@ -0,0 +1,45 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import MagicMock, patch
+
+from shared.constants import SEARCH_BENCHMARK_QUERIES
+
+
+class BenchmarkSearchIndexCommandTestCase(TestCase):
+    def test_call_command(self):
+        connection = MagicMock()
+        connection.indices.stats.return_value = {
+            "_all": {
+                "primaries": {
+                    "docs": {"count": 10},
+                    "store": {"size_in_bytes": 2 * 1024 * 1024},
+                }
+            }
+        }
+        search_patches = [
+            patch(f"{query_path}.search")
+            for query_path in [
+                "search.queries.departments_search_query.DepartmentsSearchQuery",
+                "search.queries.officers_search_query.OfficersSearchQuery",
+                "search.queries.documents_search_query.DocumentsSearchQuery",
+                "search.queries.news_articles_search_query.NewsArticlesSearchQuery",
+            ]
+        ]
+        search_mocks = [search_patch.start() for search_patch in search_patches]
+        self.addCleanup(patch.stopall)
+        patch("utils.es_doc.ESDoc._get_connection", return_value=connection).start()
+        out = StringIO()
+
+        call_command("benchmark_search_index", "--runs", "2", stdout=out)
+
+        for search_mock in search_mocks:
+            assert search_mock.call_count == 2 * len(SEARCH_BENCHMARK_QUERIES)
+
+        lines = out.getvalue().splitlines()
+        assert ["test_departments", "10", "2.00"] in [
+            line.split() for line in lines[1:5]
+        ]
+        assert len(lines) == 1 + 4 + 1 + 4 * len(SEARCH_BENCHMARK_QUERIES)
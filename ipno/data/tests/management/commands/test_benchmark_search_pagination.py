@@ -0,0 +1,36 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import Mock, patch
+
+
+class BenchmarkSearchPaginationCommandTestCase(TestCase):
+    @patch("data.management.commands.benchmark_search_pagination.ESPagination")
+    def test_call_command(self, mock_es_pagination):
+        paginator = Mock()
+        paginator.get_next_link.side_effect = [
+            "http://testserver/api/search/?limit=2&offset=2",
+            None,
+            "http://testserver/api/search/?limit=2&cursor=abc",
+            None,
+        ]
+        mock_es_pagination.return_value = paginator
+        out = StringIO()
+
+        call_command(
+            "benchmark_search_pagination", "keyword", "--limit", "2", stdout=out
+        )
+
+        assert paginator.paginate_es_query.call_count == 4
+        requests = [
+            call_args[0][1] for call_args in paginator.paginate_es_query.call_args_list
+        ]
+        assert requests[1].query_params["offset"] == "2"
+        assert requests[2].query_params["pagination"] == "cursor"
+        assert requests[3].query_params["cursor"] == "abc"
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].split() == ["page", "offset", "(ms)", "cursor", "(ms)"]
+        assert [line.split()[0] for line in lines[1:]] == ["1", "2"]
@@ -0,0 +1,12 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import patch
+
+
+class CheckSearchIndexCommandTestCase(TestCase):
+    @patch("data.management.commands.check_search_index.check_search_index_consistency")
+    def test_call_command(self, mock_check_search_index_consistency):
+        call_command("check_search_index", "--size", "20")
+
+        mock_check_search_index_consistency.assert_called_with(20)
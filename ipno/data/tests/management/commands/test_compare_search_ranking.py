@@ -0,0 +1,31 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import Mock, patch
+
+from shared.constants import SEARCH_BENCHMARK_QUERIES
+
+
+class CompareSearchRankingCommandTestCase(TestCase):
+    @patch("search.queries.officers_search_query.OfficersSearchQuery.search")
+    @patch("search.queries.departments_search_query.DepartmentsSearchQuery.search")
+    @patch(
+        "data.management.commands.compare_search_ranking.Command.get_legacy_ids",
+    )
+    def test_call_command(
+        self, mock_get_legacy_ids, mock_departments_search, mock_officers_search
+    ):
+        mock_get_legacy_ids.return_value = [1, 2, 3, 4]
+        mock_departments_search.return_value = [Mock(id=id) for id in [1, 2, 3, 4]]
+        mock_officers_search.return_value = [Mock(id=id) for id in [2, 1, 3, 5]]
+        out = StringIO()
+
+        call_command("compare_search_ranking", "--top", "4", stdout=out)
+
+        mock_officers_search.assert_called_with(4)
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 1 + 2 * len(SEARCH_BENCHMARK_QUERIES)
+        assert lines[1].split()[-2:] == ["yes", "100%"]
+        assert lines[-1].split()[-2:] == ["no", "75%"]
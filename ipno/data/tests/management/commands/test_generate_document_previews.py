@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import Mock, patch
+
+from data.models import SearchIndexChange
+from documents.factories import DocumentFactory
+
+
+@patch("utils.preview_renderer.ProcessPoolExecutor", ThreadPoolExecutor)
+class GenerateDocumentPreviewsCommandTestCase(TestCase):
+    @patch("data.management.commands.generate_document_previews.bump_data_version")
+    @patch("data.management.commands.generate_document_previews.GoogleCloudService")
+    @patch("data.management.commands.generate_document_previews.requests.get")
+    @patch("utils.preview_renderer.generate_from_blob")
+    def test_call_command(
+        self,
+        mock_generate_from_blob,
+        mock_get,
+        mock_google_cloud_service,
+        mock_bump_data_version,
+    ):
+        document_1 = DocumentFactory(
+            url=f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file%201.pdf",
+            document_type="application/pdf",
+            preview_image_url=None,
+        )
+        document_2 = DocumentFactory(
+            url=f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file-2.pdf",
+            document_type="application/pdf",
+            preview_image_url=None,
+        )
+        document_3 = DocumentFactory(
+            url=f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file-3.pdf",
+            document_type="application/pdf",
+            preview_image_url="preview.jpeg",
+        )
+        document_4 = DocumentFactory(
+            url=f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file-4.doc",
+            document_type="application/msword",
+            preview_image_url=None,
+        )
+
+        mock_get.side_effect = lambda url: Mock(content=url.encode())
+        mock_generate_from_blob.side_effect = lambda blob: (
+            None if blob.endswith(b"file-2.pdf") else b"preview"
+        )
+        mock_upload_file_from_string = (
+            mock_google_cloud_service.return_value.upload_file_from_string
+        )
+        out = StringIO()
+
+        call_command("generate_document_previews", "--batch-size", "1", stdout=out)
+
+        mock_upload_file_from_string.assert_called_once_with(
+            "path/to/file 1-preview.jpeg", b"preview", "image/jpeg"
+        )
+
+        document_1.refresh_from_db()
+        document_2.refresh_from_db()
+        document_3.refresh_from_db()
+        document_4.refresh_from_db()
+        assert (
+            document_1.preview_image_url
+            == f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file%201-preview.jpeg"
+        )
+        assert document_2.preview_image_url is None
+        assert document_3.preview_image_url == "preview.jpeg"
+        assert document_4.preview_image_url is None
+
+        assert list(
+            SearchIndexChange.objects.filter(index_name="test_documents").values_list(
+                "object_id", flat=True
+            )
+        ) == [document_1.id]
+        mock_bump_data_version.assert_called()
+        assert out.getvalue().strip() == "Generated 1 document preview images"
@@ -1,4 +1,4 @@
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 from django.conf import settings
@@ -10,8 +10,13 @@ from structlog.testing import capture_logs
 
 from data.constants import MAP_IMAGES_SUB_DIR
 from departments.factories import DepartmentFactory
+from utils.image_generator import get_map_thumbnail_hash
 
 
+@patch(
+    "data.management.commands.update_location_img.ProcessPoolExecutor",
+    ThreadPoolExecutor,
+)
 class UpdateLocationImageCommandTestCase(TestCase):
     @patch("data.management.commands.update_location_img.generate_map_thumbnail")
     @patch("data.management.commands.update_location_img.GoogleCloudService")
@@ -34,18 +39,31 @@ class UpdateLocationImageCommandTestCase(TestCase):
 
         dep_location = (-93.9737925, 32.7565316)
         dep_err_location = (-150.2050293, 35.7555316)
+        dep_unchanged_location = (-91.2440566, 30.385919)
         dep = DepartmentFactory(location=dep_location, location_map_url=None)
         DepartmentFactory(location=None)
         dep_3 = DepartmentFactory(location=dep_err_location)
+        unchanged_location_map_url = (
+            f"{settings.GC_DOCUMENT_BUCKET_PATH}{MAP_IMAGES_SUB_DIR}/"
+            f"unchanged-pd-{get_map_thumbnail_hash(*dep_unchanged_location)}.png"
+        )
+        DepartmentFactory(
+            agency_slug="unchanged-pd",
+            location=dep_unchanged_location,
+            location_map_url=unchanged_location_map_url,
+        )
 
-        current_time = datetime.now().strftime("%Y%m%d-%H%M%S")
         with capture_logs() as cap_logs:
             call_command("update_location_img")
 
-        upload_location = f"{MAP_IMAGES_SUB_DIR}/{current_time}-{dep.agency_slug}.png"
-        mock_gcs_object.upload_file_from_string.assert_called_with(
+        upload_location = (
+            f"{MAP_IMAGES_SUB_DIR}/{dep.agency_slug}-"
+            f"{get_map_thumbnail_hash(*dep_location)}.png"
+        )
+        mock_gcs_object.upload_file_from_string.assert_called_once_with(
             upload_location, "generated-image", "image/png"
         )
+        assert mock_generate_map_thumbnail.call_count == 2
         expected_location_map_url = (
             f"{settings.GC_DOCUMENT_BUCKET_PATH}{upload_location}"
         )
@@ -60,3 +78,42 @@ class UpdateLocationImageCommandTestCase(TestCase):
             f" {dep_3.agency_slug}: Invalid lng -150.2050293"
         )
         assert cap_logs[0]["log_level"] == "error"
+
+    @patch(
+        "data.management.commands.update_location_img.generate_map_thumbnail",
+        return_value="generated-image",
+    )
+    @patch("data.management.commands.update_location_img.GoogleCloudService")
+    def test_call_command_with_upload_error(self, mock_gcs, _):
+        dep = DepartmentFactory(
+            location=(-93.9737925, 32.7565316), location_map_url=None
+        )
+        dep_err = DepartmentFactory(
+            location=(-150.2050293, 35.7555316), location_map_url=None
+        )
+
+        def upload_file_from_string(upload_location, image, content_type):
+            if upload_location.startswith(
+                f"{MAP_IMAGES_SUB_DIR}/{dep_err.agency_slug}-"
+            ):
+                raise Exception("Upload failed")
+
+        mock_gcs.return_value.upload_file_from_string.side_effect = (
+            upload_file_from_string
+        )
+
+        with capture_logs() as cap_logs:
+            call_command("update_location_img")
+
+        dep.refresh_from_db()
+        dep_err.refresh_from_db()
+
+        assert dep.location_map_url.startswith(
+            f"{settings.GC_DOCUMENT_BUCKET_PATH}{MAP_IMAGES_SUB_DIR}/{dep.agency_slug}-"
+        )
+        assert dep_err.location_map_url is None
+        assert (
+            cap_logs[0]["event"]
+            == f"Error when upload department map, at department {dep_err.id},"
+            f" {dep_err.agency_slug}: Upload failed"
+        )
@@ -0,0 +1,36 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import patch
+
+
+class UpdateSearchIndexCommandTestCase(TestCase):
+    @patch("data.management.commands.update_search_index.warm_search_cache")
+    @patch("data.management.commands.update_search_index.rebuild_search_index")
+    @patch("data.management.commands.update_search_index.update_search_index")
+    def test_call_command(
+        self,
+        mock_update_search_index,
+        mock_rebuild_search_index,
+        mock_warm_search_cache,
+    ):
+        call_command("update_search_index")
+
+        mock_update_search_index.assert_called()
+        mock_rebuild_search_index.assert_not_called()
+        mock_warm_search_cache.assert_called()
+
+    @patch("data.management.commands.update_search_index.warm_search_cache")
+    @patch("data.management.commands.update_search_index.rebuild_search_index")
+    @patch("data.management.commands.update_search_index.update_search_index")
+    def test_call_command_with_rebuild(
+        self,
+        mock_update_search_index,
+        mock_rebuild_search_index,
+        mock_warm_search_cache,
+    ):
+        call_command("update_search_index", "--rebuild")
+
+        mock_rebuild_search_index.assert_called()
+        mock_update_search_index.assert_not_called()
+        mock_warm_search_cache.assert_called()
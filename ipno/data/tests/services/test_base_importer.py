@@ -12,10 +12,11 @@ from data.constants import (
     IMPORT_LOG_STATUS_FINISHED,
     IMPORT_LOG_STATUS_NO_NEW_DATA,
 )
-from data.models import ImportLog
+from data.models import ImportLog, SearchIndexChange
 from data.services import BaseImporter
 from data.util import MockDataReconciliation
 from departments.factories import DepartmentFactory
+from documents.factories import DocumentFactory
 from officers.factories import OfficerFactory
 from officers.models import Officer
 from use_of_forces.factories import UseOfForceFactory
@@ -200,6 +201,32 @@ class BaseImporterTestCase(TestCase):
 
         assert result == expected_result
 
+    def test_bulk_import_record_search_index_changes(self):
+        officer_1 = OfficerFactory()
+        officer_2 = OfficerFactory()
+        document = DocumentFactory()
+        document.officers.add(officer_1)
+
+        self.tbi.UPDATE_ATTRIBUTES = ["first_name"]
+
+        self.tbi.bulk_import(
+            Officer,
+            [{"uid": "abc", "first_name": "test_1"}],
+            [{"id": officer_2.id, "first_name": "test_2"}],
+            [officer_1.id],
+        )
+
+        new_officer = Officer.objects.get(uid="abc")
+
+        assert set(
+            SearchIndexChange.objects.values_list("index_name", "object_id")
+        ) == {
+            ("test_officers", officer_1.id),
+            ("test_officers", officer_2.id),
+            ("test_officers", new_officer.id),
+            ("test_documents", document.id),
+        }
+
     def test_bulk_import_with_cleanup_action(self):
         OfficerFactory()
         officer_2 = OfficerFactory()
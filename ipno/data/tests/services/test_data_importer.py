@@ -24,17 +24,20 @@ class DataImporterTestCase(TestCase):
         patch("data.services.document_importer.GoogleCloudService").start()
         self.data_importer = DataImporter()
 
+    @patch("data.services.data_importer.compute_person_cards")
+    @patch("data.services.data_importer.warm_search_cache")
     @patch("data.services.data_importer.rmtree")
     @patch("data.services.data_importer.GoogleCloudService")
     @patch("data.services.data_importer.PostOfficerHistoryImporter.process")
     @patch("data.services.data_importer.BradyImporter.process")
     @patch("data.services.data_importer.cache.clear")
     @patch("data.services.data_importer.compute_department_data_period")
+    @patch("data.services.data_importer.MigratoryGraphBuilder.build_all")
     @patch("data.services.data_importer.MigrateOfficerMovement.process")
     @patch("data.services.data_importer.calculate_complaint_fraction")
     @patch("data.services.data_importer.calculate_officer_fraction")
     @patch("data.services.data_importer.count_complaints")
-    @patch("data.services.data_importer.rebuild_search_index")
+    @patch("data.services.data_importer.update_search_index")
     @patch("data.services.data_importer.EventImporter.process")
     @patch("data.services.data_importer.ComplaintImporter.process")
     @patch("data.services.data_importer.UofImporter.process")
@@ -60,17 +63,20 @@ class DataImporterTestCase(TestCase):
         citizen_process_mock,
         complaint_process_mock,
         event_process_mock,
-        rebuild_search_index_mock,
+        update_search_index_mock,
         count_complaints_mock,
         calculate_officer_fraction_mock,
         calculate_complaint_fraction_mock,
         migrate_officer_movement_mock,
+        build_migratory_graphs_mock,
         compute_department_data_period_mock,
         cache_clear_mock,
         brady_process_mock,
         post_officer_history_process_mock,
         mock_google_cloud_service,
         rmtree_mock,
+        warm_search_cache_mock,
+        compute_person_cards_mock,
     ):
         mock_google_cloud_service.return_value.download_csv_data_sequentially.return_value = {
             AGENCY_MODEL_NAME: "data_agency.csv",
@@ -108,27 +114,33 @@ class DataImporterTestCase(TestCase):
         citizen_process_mock.assert_called()
         complaint_process_mock.assert_called()
         event_process_mock.assert_called()
-        rebuild_search_index_mock.assert_called()
+        update_search_index_mock.assert_called()
         count_complaints_mock.assert_called()
         calculate_officer_fraction_mock.assert_called()
         calculate_complaint_fraction_mock.assert_called()
         migrate_officer_movement_mock.assert_called()
+        build_migratory_graphs_mock.assert_called()
         compute_department_data_period_mock.assert_called()
         cache_clear_mock.assert_called()
+        warm_search_cache_mock.assert_called()
+        compute_person_cards_mock.assert_called()
 
         rmtree_mock.assert_called()
 
+    @patch("data.services.data_importer.compute_person_cards")
+    @patch("data.services.data_importer.warm_search_cache")
     @patch("data.services.data_importer.rmtree")
     @patch("data.services.data_importer.GoogleCloudService")
     @patch("data.services.data_importer.PostOfficerHistoryImporter.process")
     @patch("data.services.data_importer.BradyImporter.process")
     @patch("data.services.data_importer.cache.clear")
     @patch("data.services.data_importer.compute_department_data_period")
+    @patch("data.services.data_importer.MigratoryGraphBuilder.build_all")
     @patch("data.services.data_importer.MigrateOfficerMovement.process")
     @patch("data.services.data_importer.calculate_complaint_fraction")
     @patch("data.services.data_importer.calculate_officer_fraction")
     @patch("data.services.data_importer.count_complaints")
-    @patch("data.services.data_importer.rebuild_search_index")
+    @patch("data.services.data_importer.update_search_index")
     @patch("data.services.data_importer.EventImporter.process")
     @patch("data.services.data_importer.ComplaintImporter.process")
     @patch("data.services.data_importer.UofImporter.process")
@@ -154,17 +166,20 @@ class DataImporterTestCase(TestCase):
         citizen_process_mock,
         complaint_process_mock,
         event_process_mock,
-        rebuild_search_index_mock,
+        update_search_index_mock,
         count_complaints_mock,
         calculate_officer_fraction_mock,
         calculate_complaint_fraction_mock,
         migrate_officer_movement_mock,
+        build_migratory_graphs_mock,
         compute_department_data_period_mock,
         cache_clear_mock,
         brady_process_mock,
         post_officer_history_process_mock,
         mock_google_cloud_service,
         rmtree_mock,
+        warm_search_cache_mock,
+        compute_person_cards_mock,
     ):
         mock_google_cloud_service.return_value.download_csv_data_sequentially.return_value = {
             AGENCY_MODEL_NAME: "data_agency.csv",
@@ -201,27 +216,33 @@ class DataImporterTestCase(TestCase):
         citizen_process_mock.assert_called()
         complaint_process_mock.assert_called()
         event_process_mock.assert_called()
-        rebuild_search_index_mock.assert_not_called()
+        update_search_index_mock.assert_not_called()
         count_complaints_mock.assert_not_called()
         calculate_officer_fraction_mock.assert_not_called()
         calculate_complaint_fraction_mock.assert_not_called()
         migrate_officer_movement_mock.assert_not_called()
+        build_migratory_graphs_mock.assert_not_called()
         compute_department_data_period_mock.assert_not_called()
         cache_clear_mock.assert_not_called()
+        warm_search_cache_mock.assert_not_called()
+        compute_person_cards_mock.assert_not_called()
 
         rmtree_mock.assert_called()
 
+    @patch("data.services.data_importer.compute_person_cards")
+    @patch("data.services.data_importer.warm_search_cache")
     @patch("data.services.data_importer.rmtree")
     @patch("data.services.data_importer.GoogleCloudService")
     @patch("data.services.data_importer.PostOfficerHistoryImporter.process")
     @patch("data.services.data_importer.BradyImporter.process")
     @patch("data.services.data_importer.cache.clear")
     @patch("data.services.data_importer.compute_department_data_period")
+    @patch("data.services.data_importer.MigratoryGraphBuilder.build_all")
     @patch("data.services.data_importer.MigrateOfficerMovement.process")
     @patch("data.services.data_importer.calculate_complaint_fraction")
     @patch("data.services.data_importer.calculate_officer_fraction")
     @patch("data.services.data_importer.count_complaints")
-    @patch("data.services.data_importer.rebuild_search_index")
+    @patch("data.services.data_importer.update_search_index")
     @patch("data.services.data_importer.EventImporter.process")
     @patch("data.services.data_importer.ComplaintImporter.process")
     @patch("data.services.data_importer.UofImporter.process")
@@ -247,17 +268,20 @@ class DataImporterTestCase(TestCase):
         citizen_process_mock,
         complaint_process_mock,
         event_process_mock,
-        rebuild_search_index_mock,
+        update_search_index_mock,
         count_complaints_mock,
         calculate_officer_fraction_mock,
         calculate_complaint_fraction_mock,
         migrate_officer_movement_mock,
+        build_migratory_graphs_mock,
         compute_department_data_period_mock,
         cache_clear_mock,
         brady_process_mock,
         post_officer_history_process_mock,
         mock_google_cloud_service,
         rmtree_mock,
+        warm_search_cache_mock,
+        compute_person_cards_mock,
     ):
         mock_google_cloud_service.return_value.download_csv_data_sequentially.return_value = {
             AGENCY_MODEL_NAME: "data_agency.csv",
@@ -283,13 +307,16 @@ class DataImporterTestCase(TestCase):
         citizen_process_mock.assert_not_called()
         complaint_process_mock.assert_not_called()
         event_process_mock.assert_not_called()
-        rebuild_search_index_mock.assert_not_called()
+        update_search_index_mock.assert_not_called()
         count_complaints_mock.assert_not_called()
         calculate_officer_fraction_mock.assert_not_called()
         calculate_complaint_fraction_mock.assert_not_called()
         migrate_officer_movement_mock.assert_not_called()
+        build_migratory_graphs_mock.assert_not_called()
         compute_department_data_period_mock.assert_not_called()
         cache_clear_mock.assert_not_called()
+        warm_search_cache_mock.assert_not_called()
+        compute_person_cards_mock.assert_not_called()
         brady_process_mock.assert_not_called()
         post_officer_history_process_mock.assert_not_called()
 
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from inspect import cleandoc
 from unittest.mock import ANY, call
 
@@ -319,9 +320,8 @@ class DocumentImporterTestCase(TestCase):
         assert download_url is None
 
     @patch("data.services.document_importer.requests.get")
-    @patch(
-        "data.services.document_importer.generate_from_blob", return_value="image_blob"
-    )
+    @patch("utils.preview_renderer.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("utils.preview_renderer.generate_from_blob", return_value="image_blob")
     def test_process_successfully(self, generate_from_blob_mock, get_mock):
         department_1 = DepartmentFactory(agency_name="New Orleans PD")
         department_2 = DepartmentFactory(agency_name="Baton Rouge PD")
@@ -550,49 +550,60 @@ class DocumentImporterTestCase(TestCase):
 
         assert mock_upload_file.call_count == 6
 
-    @patch(
-        "data.services.document_importer.generate_from_blob",
-        return_value="preview_image_blob",
-    )
-    def test_generate_preview_image_success(self, _):
-        image_blob = "image_blob"
-        upload_url = "path/to/file.pdf"
-
+    def test_upload_preview_image_success(self):
         mock_upload_file_from_string = MagicMock()
         document_importer = DocumentImporter("csv_file_path")
         document_importer.gs = MagicMock(
             upload_file_from_string=mock_upload_file_from_string
         )
 
-        preview_image_url = document_importer.generate_preview_image(
-            image_blob, upload_url
+        document_importer.upload_preview_image(
+            ("/PPACT/path/to/file.pdf", "path/to/file.pdf"), "preview_image_blob"
         )
 
         mock_upload_file_from_string.assert_called_with(
             "path/to/file-preview.jpeg", "preview_image_blob", "image/jpeg"
         )
-        assert (
-            preview_image_url
-            == f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file-preview.jpeg"
-        )
-
-    @patch("data.services.document_importer.generate_from_blob", return_value=None)
-    def test_generate_preview_image_fail(self, _):
-        image_blob = "image_blob"
-        upload_url = "path/to/file.pdf"
+        assert document_importer.preview_image_urls == {
+            "/PPACT/path/to/file.pdf": (
+                f"{settings.GC_DOCUMENT_BUCKET_PATH}path/to/file-preview.jpeg"
+            )
+        }
 
+    def test_upload_preview_image_fail(self):
         mock_upload_file_from_string = MagicMock()
         document_importer = DocumentImporter("csv_file_path")
         document_importer.gs = MagicMock(
             upload_file_from_string=mock_upload_file_from_string
         )
 
-        preview_image_url = document_importer.generate_preview_image(
-            image_blob, upload_url
+        document_importer.upload_preview_image(
+            ("/PPACT/path/to/file.pdf", "path/to/file.pdf"), None
         )
 
         mock_upload_file_from_string.assert_not_called()
-        assert preview_image_url is None
+        assert document_importer.preview_image_urls == {"/PPACT/path/to/file.pdf": None}
+
+    def test_update_preview_image_urls(self):
+        document_importer = DocumentImporter("csv_file_path")
+        document_importer.preview_image_urls = {"/PPACT/a.pdf": "a-preview.jpeg"}
+        document_importer.new_documents = [
+            {"pdf_db_path": "/PPACT/a.pdf", "preview_image_url": None},
+        ]
+        document_importer.update_documents = [
+            {"pdf_db_path": "/PPACT/a.pdf", "preview_image_url": None},
+            {"pdf_db_path": "/PPACT/b.pdf", "preview_image_url": "b-preview.jpeg"},
+        ]
+
+        document_importer.update_preview_image_urls()
+
+        assert document_importer.new_documents == [
+            {"pdf_db_path": "/PPACT/a.pdf", "preview_image_url": "a-preview.jpeg"},
+        ]
+        assert document_importer.update_documents == [
+            {"pdf_db_path": "/PPACT/a.pdf", "preview_image_url": "a-preview.jpeg"},
+            {"pdf_db_path": "/PPACT/b.pdf", "preview_image_url": "b-preview.jpeg"},
+        ]
 
     @patch("data.services.document_importer.requests.get")
     def test_get_ocr_text_success(self, get_mock):
@@ -642,20 +653,21 @@ class DocumentImporterTestCase(TestCase):
 
         document_importer = DocumentImporter("csv_file_path")
         document_importer.ds = mock_dropbox
-        document_importer.generate_preview_image = Mock(
-            return_value="preview_image_blob"
-        )
+        document_importer.preview_renderer = Mock()
 
         pdf_db_path = "pdf_db_path"
         uploaded_url = document_importer.handle_file_process(pdf_db_path)
 
         mock_get_temporary_link_from_path.assert_called_with(pdf_db_path)
         get_mock.assert_called_with("temp_link")
+        document_importer.preview_renderer.submit.assert_called_with(
+            (pdf_db_path, pdf_db_path), get_mock_return.content
+        )
         assert uploaded_url == {
             "document_url": (
                 "https://storage.googleapis.com/llead-documents-test/pdf_db_path"
             ),
-            "document_preview_url": "preview_image_blob",
+            "document_preview_url": None,
             "document_type": "application/pdf",
         }
 
@@ -671,15 +683,14 @@ class DocumentImporterTestCase(TestCase):
 
         document_importer = DocumentImporter("csv_file_path")
         document_importer.ds = mock_dropbox
-        document_importer.generate_preview_image = Mock(
-            return_value="preview_image_blob"
-        )
+        document_importer.preview_renderer = Mock()
 
         pdf_db_path = "pdf_db_path"
         uploaded_url = document_importer.handle_file_process(pdf_db_path)
 
         mock_get_temporary_link_from_path.assert_called_with(pdf_db_path)
         get_mock.assert_called_with("temp_link")
+        document_importer.preview_renderer.submit.assert_not_called()
         assert uploaded_url == {
             "document_url": (
                 "https://storage.googleapis.com/llead-documents-test/pdf_db_path"
@@ -701,9 +712,7 @@ class DocumentImporterTestCase(TestCase):
 
         document_importer = DocumentImporter("csv_file_path")
         document_importer.ds = mock_dropbox
-        document_importer.generate_preview_image = Mock(
-            return_value="preview_image_blob"
-        )
+        document_importer.preview_renderer = Mock()
 
         pdf_db_path = ""
         uploaded_url = document_importer.handle_file_process(pdf_db_path)
@@ -1 +1,5 @@
 DEPARTMENTS_LIMIT = 20
+
+MIGRATORY_GRAPH_COMPACT_ENCODING = "compact"
+
+DEPARTMENT_DATAFILE_EXPORT_PATH = "exports/departments"
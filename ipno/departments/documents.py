@@ -2,7 +2,9 @@ from django.conf import settings
 
 from django_elasticsearch_dsl import fields
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch_dsl import SearchAsYouType
 
+from search.serializers.es_serializers import DepartmentsESSerializer
 from utils.analyzers import autocomplete_analyzer, search_analyzer
 from utils.es_doc import ESDoc
 from utils.es_index import ESIndex
@@ -19,13 +21,22 @@ class DepartmentESDoc(ESDoc):
         model = Department
         ignore_signals = True
 
+    search_serializer = DepartmentsESSerializer
+
     id = fields.IntegerField()
     agency_name = fields.TextField(
-        analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
+        analyzer=autocomplete_analyzer,
+        search_analyzer=search_analyzer,
+        fields={"prefix": SearchAsYouType()},
     )
+    agency_name_suggest = fields.CompletionField()
     aliases = fields.ListField(
         fields.TextField(
             analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
         )
     )
     officer_fraction = fields.FloatField()
+    search_result = fields.ObjectField(enabled=False)
+
+    def prepare_agency_name_suggest(self, instance):
+        return {"input": [instance.agency_name, *(instance.aliases or [])]}
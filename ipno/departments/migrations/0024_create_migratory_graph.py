@@ -0,0 +1,30 @@
+# Generated by Django 3.1.13 on 2026-10-19 09:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0023_rename_fields_name_and_slug'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MigratoryGraph',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('payload', models.BinaryField()),
+                ('etag', models.CharField(max_length=255)),
+                ('compact_payload', models.BinaryField()),
+                ('compact_etag', models.CharField(max_length=255)),
+                ('department', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='migratory_graph', to='departments.department')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
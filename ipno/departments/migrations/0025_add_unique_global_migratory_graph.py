@@ -0,0 +1,38 @@
+# Generated by Django 3.1.13 on 2026-10-19 17:20
+
+from django.db import migrations, models
+
+
+def mark_global_migratory_graph(apps, _):
+    MigratoryGraph = apps.get_model("departments", "MigratoryGraph")
+
+    global_graphs = MigratoryGraph.objects.filter(department__isnull=True)
+    latest_graph = global_graphs.order_by("-updated_at", "-id").first()
+
+    if latest_graph:
+        global_graphs.exclude(id=latest_graph.id).delete()
+        global_graphs.update(is_global=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0024_create_migratory_graph"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="migratorygraph",
+            name="is_global",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(mark_global_migratory_graph, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="migratorygraph",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_global", True)),
+                fields=("is_global",),
+                name="unique_global_migratory_graph",
+            ),
+        ),
+    ]
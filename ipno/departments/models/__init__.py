@@ -1,4 +1,5 @@
 from .department import Department
+from .migratory_graph import MigratoryGraph
 from .officer_movement import OfficerMovement
 from .wrgl_file import WrglFile
 
@@ -6,4 +7,5 @@ __all__ = [
     "Department",
     "WrglFile",
     "OfficerMovement",
+    "MigratoryGraph",
 ]
@@ -0,0 +1,31 @@
+from django.db import models
+from django.db.models import Q
+
+from utils.models import TimeStampsModel
+
+
+class MigratoryGraph(TimeStampsModel):
+    department = models.OneToOneField(
+        "departments.Department",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="migratory_graph",
+    )
+    is_global = models.BooleanField(default=False)
+    payload = models.BinaryField()
+    etag = models.CharField(max_length=255)
+    compact_payload = models.BinaryField()
+    compact_etag = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["is_global"],
+                condition=Q(is_global=True),
+                name="unique_global_migratory_graph",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.department or 'All departments'} - {self.etag}"
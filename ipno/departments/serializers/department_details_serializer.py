@@ -5,8 +5,8 @@ from rest_framework import serializers
 
 import pytz
 
-from app_config.constants import DEFAULT_RECENT_DAYS
-from app_config.models import AppValueConfig
+from app_config.constants import ANALYTIC_RECENT_DAYS_CONFIG, DEFAULT_RECENT_DAYS
+from app_config.services import get_app_value_config
 from complaints.constants import ALLEGATION_DISPOSITION_SUSTAINED
 from news_articles.models import MatchedSentence, NewsArticle
 from officers.constants import UOF_OCCUR
@@ -36,11 +36,8 @@ class DepartmentDetailsSerializer(serializers.Serializer):
 
     @cached_property
     def _get_recent_day(self):
-        recent_date_config = AppValueConfig.objects.filter(
-            name="ANALYTIC_RECENT_DAYS"
-        ).first()
-        recent_date = (
-            int(recent_date_config.value) if recent_date_config else DEFAULT_RECENT_DAYS
+        recent_date = int(
+            get_app_value_config(ANALYTIC_RECENT_DAYS_CONFIG, DEFAULT_RECENT_DAYS)
         )
 
         return datetime.datetime.now(pytz.utc) - datetime.timedelta(days=recent_date)
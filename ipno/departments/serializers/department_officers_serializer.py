@@ -7,13 +7,16 @@ class DepartmentOfficerSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     name = serializers.CharField()
     is_starred = serializers.BooleanField(default=False)
-    use_of_forces_count = serializers.IntegerField()
+    use_of_forces_count = serializers.SerializerMethodField()
 
     badges = serializers.SerializerMethodField()
     complaints_count = serializers.SerializerMethodField()
     department = serializers.SerializerMethodField()
     latest_rank = serializers.SerializerMethodField()
 
+    def _has_card(self, obj):
+        return obj.person.card_departments is not None
+
     def _get_person_officers(self, obj):
         if not hasattr(obj, "person_officers"):
             person_officers = obj.person.officers.all()
@@ -42,6 +45,9 @@ class DepartmentOfficerSerializer(serializers.Serializer):
         return obj.all_events
 
     def get_badges(self, obj):
+        if self._has_card(obj):
+            return obj.person.card_badges
+
         events = self._get_all_events(obj)
 
         events = list(
@@ -50,6 +56,12 @@ class DepartmentOfficerSerializer(serializers.Serializer):
 
         return events
 
+    def get_use_of_forces_count(self, obj):
+        if self._has_card(obj):
+            return obj.person.all_use_of_forces_count
+
+        return obj.use_of_forces.count()
+
     def get_complaints_count(self, obj):
         return obj.person.all_complaints_count
 
@@ -59,6 +71,9 @@ class DepartmentOfficerSerializer(serializers.Serializer):
         )
 
     def get_latest_rank(self, obj):
+        if self._has_card(obj):
+            return obj.person.card_latest_rank
+
         events = self._get_all_events(obj)
 
         rank_events = [rank for rank in events if rank.rank_desc]
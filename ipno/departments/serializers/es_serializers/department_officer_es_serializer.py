@@ -1,5 +1,3 @@
-from django.db.models import Count
-
 from departments.serializers.department_officers_serializer import (
     DepartmentOfficerSerializer,
 )
@@ -12,10 +10,6 @@ class DepartmentOfficersESSerializer(BaseESSerializer):
     model_klass = Officer
 
     def get_queryset(self, ids):
-        return (
-            self.model_klass.objects.prefetch_events()
-            .filter(
-                id__in=ids,
-            )
-            .annotate(use_of_forces_count=Count("use_of_forces"))
+        return self.model_klass.objects.select_related("person", "department").filter(
+            id__in=ids
         )
@@ -0,0 +1,7 @@
+from .department_datafile_exporter import DepartmentDatafileExporter
+from .migratory_graph_builder import MigratoryGraphBuilder
+
+__all__ = [
+    "DepartmentDatafileExporter",
+    "MigratoryGraphBuilder",
+]
@@ -0,0 +1,73 @@
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from django.db import connection
+
+from citizens.models import Citizen
+from complaints.models import Complaint
+from departments.constants import DEPARTMENT_DATAFILE_EXPORT_PATH
+from documents.models import Document
+from officers.constants import (
+    OFFICER_CITIZEN_FIELDS,
+    OFFICER_COMPLAINT_FIELDS,
+    OFFICER_DOC_FIELDS,
+    OFFICER_INCIDENT_FIELDS,
+    OFFICER_PROFILE_FIELDS,
+    OFFICER_UOF_FIELDS,
+)
+from officers.models import Event, Officer
+from use_of_forces.models import UseOfForce
+from utils.datafile_exporter import DatafileExporter
+
+
+class DepartmentDatafileExporter(DatafileExporter):
+    export_path = DEPARTMENT_DATAFILE_EXPORT_PATH
+    file_extension = "zip"
+    content_type = "application/zip"
+
+    def __init__(self, department):
+        self.department = department
+        super().__init__()
+
+    @property
+    def filename(self):
+        return f"{self.department.agency_slug}.zip"
+
+    def get_file_key(self):
+        return self.department.agency_slug
+
+    def get_datasets(self):
+        department = self.department
+
+        return {
+            "officers.csv": Officer.objects.filter(department=department)
+            .order_by("id")
+            .values_list(*OFFICER_PROFILE_FIELDS),
+            "events.csv": Event.objects.filter(department=department)
+            .order_by("id")
+            .values_list(*OFFICER_INCIDENT_FIELDS),
+            "complaints.csv": Complaint.objects.filter(departments=department)
+            .order_by("id")
+            .values_list(*OFFICER_COMPLAINT_FIELDS),
+            "use_of_forces.csv": UseOfForce.objects.filter(department=department)
+            .order_by("id")
+            .values_list(*OFFICER_UOF_FIELDS),
+            "citizens.csv": Citizen.objects.filter(department=department)
+            .order_by("id")
+            .values_list(*OFFICER_CITIZEN_FIELDS),
+            "documents.csv": Document.objects.filter(departments=department)
+            .order_by("id")
+            .values_list(*OFFICER_DOC_FIELDS),
+        }
+
+    def copy_to_csv(self, cursor, queryset, csv_file):
+        sql, params = queryset.query.sql_with_params()
+        query = cursor.mogrify(sql, params).decode()
+
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH CSV HEADER", csv_file)
+
+    def write_file(self, file_name):
+        with ZipFile(file_name, "w", ZIP_DEFLATED) as zip_file:
+            with connection.cursor() as cursor:
+                for csv_name, queryset in self.get_datasets().items():
+                    with zip_file.open(csv_name, "w") as csv_file:
+                        self.copy_to_csv(cursor, queryset, csv_file)
@@ -0,0 +1,129 @@
+import gzip
+from hashlib import md5
+
+from django.db.models import Q
+
+from rest_framework.renderers import JSONRenderer
+
+from departments.models import MigratoryGraph, OfficerMovement
+from departments.serializers import OfficerMovementSerializer
+
+
+class MigratoryGraphBuilder:
+    def __init__(self):
+        self.renderer = JSONRenderer()
+
+    def _get_graphs(self, department=None):
+        officer_movements = (
+            OfficerMovement.objects.select_related(
+                "start_department",
+                "end_department",
+                "officer",
+            )
+            .filter(
+                start_department__location__isnull=False,
+                end_department__location__isnull=False,
+            )
+            .order_by(
+                "date",
+            )
+        )
+
+        if department:
+            officer_movements = officer_movements.filter(
+                Q(start_department=department) | Q(end_department=department)
+            )
+
+        departments = {}
+        for officer_movement in officer_movements:
+            for department in [
+                officer_movement.start_department,
+                officer_movement.end_department,
+            ]:
+                departments[department.agency_slug] = department
+
+        graphs = OfficerMovementSerializer(officer_movements, many=True).data
+
+        return graphs, departments
+
+    def _get_nodes(self, graphs, departments):
+        department_slugs = set()
+        for graph in graphs:
+            department_slugs.add(graph["start_node"])
+            department_slugs.add(graph["end_node"])
+
+        nodes = {}
+
+        for agency_slug in sorted(department_slugs):
+            department = departments[agency_slug]
+            nodes[agency_slug] = {
+                "name": department.agency_name,
+                "location": department.location,
+            }
+
+        return nodes
+
+    def _get_compact_data(self, nodes, graphs):
+        node_indexes = {agency_slug: index for index, agency_slug in enumerate(nodes)}
+
+        return {
+            "nodes": {
+                "slugs": list(nodes),
+                "names": [node["name"] for node in nodes.values()],
+                "locations": [node["location"] for node in nodes.values()],
+            },
+            "graphs": {
+                "start_nodes": [node_indexes[graph["start_node"]] for graph in graphs],
+                "end_nodes": [node_indexes[graph["end_node"]] for graph in graphs],
+                "dates": [graph["date"] for graph in graphs],
+                "officer_names": [graph["officer_name"] for graph in graphs],
+                "officer_ids": [graph["officer_id"] for graph in graphs],
+                "left_reasons": [graph["left_reason"] for graph in graphs],
+                "is_left": [graph["is_left"] for graph in graphs],
+            },
+        }
+
+    def _save(self, department, nodes, graphs):
+        content = self.renderer.render({"nodes": nodes, "graphs": graphs})
+        compact_content = self.renderer.render(self._get_compact_data(nodes, graphs))
+
+        migratory_graph, _ = MigratoryGraph.objects.update_or_create(
+            department=department,
+            is_global=department is None,
+            defaults={
+                "payload": gzip.compress(content),
+                "etag": md5(content).hexdigest(),
+                "compact_payload": gzip.compress(compact_content),
+                "compact_etag": md5(compact_content).hexdigest(),
+            },
+        )
+
+        return migratory_graph
+
+    def _build_department_graph(self, department, graphs, departments):
+        department_graphs = [
+            dict(graph, is_left=graph["start_node"] == department.agency_slug)
+            for graph in graphs
+            if department.agency_slug in [graph["start_node"], graph["end_node"]]
+        ]
+        nodes = self._get_nodes(department_graphs, departments)
+
+        return self._save(department, nodes, department_graphs)
+
+    def build(self, department=None):
+        graphs, departments = self._get_graphs(department)
+
+        if department:
+            return self._build_department_graph(department, graphs, departments)
+
+        return self._save(None, self._get_nodes(graphs, departments), graphs)
+
+    def build_all(self):
+        graphs, departments = self._get_graphs()
+
+        MigratoryGraph.objects.all().delete()
+
+        self._save(None, self._get_nodes(graphs, departments), graphs)
+
+        for department in departments.values():
+            self._build_department_graph(department, graphs, departments)
@@ -1,10 +1,40 @@
 from django.core.cache import cache
+from django.db.models import Q
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from departments.models import Department
+from departments.models import Department, MigratoryGraph
+from people.models import Person
+from utils.count_data import compute_person_cards
 
 
 @receiver(post_save, sender=Department)
 def department_cache(*args, **kwargs):
     cache.clear()
+
+
+@receiver(post_save, sender=Department)
+def department_migratory_graph(*args, **kwargs):
+    MigratoryGraph.objects.all().delete()
+
+
+@receiver(post_save, sender=Department)
+def department_person_cards(sender, instance, created, **kwargs):
+    if created:
+        return
+
+    stale_people = (
+        Person.objects.filter(
+            Q(officers__events__department=instance)
+            | Q(canonical_officer__department=instance),
+            card_departments__isnull=False,
+        )
+        .exclude(
+            card_departments__contains=[
+                {"id": instance.agency_slug, "name": instance.agency_name}
+            ]
+        )
+        .values("id")
+    )
+
+    compute_person_cards(stale_people)
@@ -2,6 +2,7 @@ from celery import shared_task
 
 from departments.documents import DepartmentESDoc
 from departments.models import Department
+from departments.services import DepartmentDatafileExporter
 from utils.task_utils import run_task
 
 
@@ -11,3 +12,10 @@ def rebuild_department_index(doc_id):
     department = Department.objects.get(id=doc_id)
     es_doc = DepartmentESDoc.get(id=doc_id)
     es_doc.update(department)
+
+
+@run_task
+@shared_task
+def export_department_datafile(department_id):
+    department = Department.objects.get(id=department_id)
+    DepartmentDatafileExporter(department).export()
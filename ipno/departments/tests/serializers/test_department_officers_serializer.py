@@ -9,6 +9,7 @@ from officers.factories import EventFactory, OfficerFactory
 from officers.models import Officer
 from people.factories import PersonFactory
 from use_of_forces.factories import UseOfForceFactory
+from utils.count_data import compute_person_cards
 
 
 class DepartmentOfficerSerializerTestCase(TestCase):
@@ -117,3 +118,16 @@ class DepartmentOfficerSerializerTestCase(TestCase):
             },
             "latest_rank": "captain",
         }
+
+        compute_person_cards()
+
+        card_officer = (
+            Officer.objects.select_related("person", "department")
+            .annotate(is_starred=Value(True, output_field=BooleanField()))
+            .get(id=officer_1.id)
+        )
+
+        with self.assertNumQueries(0):
+            card_result = DepartmentOfficerSerializer(card_officer).data
+
+        assert card_result == result
@@ -0,0 +1,89 @@
+import csv
+import io
+from zipfile import ZipFile
+
+from django.test import TestCase
+
+from mock import patch
+
+from citizens.factory import CitizenFactory
+from complaints.factories import ComplaintFactory
+from departments.factories import DepartmentFactory
+from departments.services import DepartmentDatafileExporter
+from documents.factories import DocumentFactory
+from officers.constants import OFFICER_PROFILE_FIELDS
+from officers.factories import EventFactory, OfficerFactory
+from use_of_forces.factories import UseOfForceFactory
+
+
+@patch("utils.datafile_exporter.GoogleCloudService")
+class DepartmentDatafileExporterTestCase(TestCase):
+    def read_csv(self, zip_file, name):
+        with zip_file.open(name) as csv_file:
+            return list(csv.DictReader(io.TextIOWrapper(csv_file, encoding="utf-8")))
+
+    def test_file_path(self, _):
+        department = DepartmentFactory(agency_slug="new-orleans-pd")
+
+        exporter = DepartmentDatafileExporter(department)
+
+        assert exporter.file_path == "exports/departments/new-orleans-pd-0.zip"
+        assert exporter.filename == "new-orleans-pd.zip"
+
+    def test_export(self, google_cloud_service_mock):
+        department = DepartmentFactory()
+        other_department = DepartmentFactory()
+        officer = OfficerFactory(department=department, first_name="David, Jr.")
+        OfficerFactory(department=other_department)
+        event = EventFactory(department=department, officer=officer)
+        complaint = ComplaintFactory()
+        complaint.departments.add(department)
+        uof = UseOfForceFactory(department=department, officer=officer)
+        citizen = CitizenFactory(department=department, use_of_force=uof)
+        document = DocumentFactory()
+        document.departments.add(department)
+        DocumentFactory()
+
+        exported_files = {}
+
+        def upload_file_from_filename(file_path, filename, content_type):
+            with ZipFile(filename) as zip_file:
+                exported_files.update(
+                    {
+                        name: self.read_csv(zip_file, name)
+                        for name in zip_file.namelist()
+                    }
+                )
+
+        gcs = google_cloud_service_mock.return_value
+        gcs.upload_file_from_filename.side_effect = upload_file_from_filename
+
+        DepartmentDatafileExporter(department).export()
+
+        assert gcs.upload_file_from_filename.call_args[0][2] == "application/zip"
+        assert sorted(exported_files) == [
+            "citizens.csv",
+            "complaints.csv",
+            "documents.csv",
+            "events.csv",
+            "officers.csv",
+            "use_of_forces.csv",
+        ]
+        assert list(exported_files["officers.csv"][0]) == OFFICER_PROFILE_FIELDS
+        assert [row["uid"] for row in exported_files["officers.csv"]] == [officer.uid]
+        assert exported_files["officers.csv"][0]["first_name"] == "David, Jr."
+        assert [row["event_uid"] for row in exported_files["events.csv"]] == [
+            event.event_uid
+        ]
+        assert [row["allegation_uid"] for row in exported_files["complaints.csv"]] == [
+            complaint.allegation_uid
+        ]
+        assert [row["uof_uid"] for row in exported_files["use_of_forces.csv"]] == [
+            uof.uof_uid
+        ]
+        assert [row["citizen_uid"] for row in exported_files["citizens.csv"]] == [
+            citizen.citizen_uid
+        ]
+        assert [row["docid"] for row in exported_files["documents.csv"]] == [
+            document.docid
+        ]
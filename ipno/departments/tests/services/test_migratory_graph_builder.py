@@ -0,0 +1,118 @@
+import gzip
+import json
+from datetime import datetime
+from hashlib import md5
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from departments.factories import DepartmentFactory, OfficerMovementFactory
+from departments.models import MigratoryGraph
+from departments.services import MigratoryGraphBuilder
+from officers.factories import OfficerFactory
+
+
+class MigratoryGraphBuilderTestCase(TestCase):
+    def setUp(self):
+        self.department_1 = DepartmentFactory()
+        self.department_2 = DepartmentFactory()
+        self.department_3 = DepartmentFactory()
+        self.department_4 = DepartmentFactory(location=None)
+
+        self.officer_movement_1 = OfficerMovementFactory(
+            start_department=self.department_1,
+            end_department=self.department_2,
+            officer=OfficerFactory(),
+            date=datetime(2021, 1, 2),
+        )
+        self.officer_movement_2 = OfficerMovementFactory(
+            start_department=self.department_2,
+            end_department=self.department_3,
+            officer=OfficerFactory(),
+            date=datetime(2021, 1, 1),
+        )
+        OfficerMovementFactory(
+            start_department=self.department_3,
+            end_department=self.department_4,
+            officer=OfficerFactory(),
+        )
+
+    def test_build(self):
+        migratory_graph = MigratoryGraphBuilder().build()
+
+        content = gzip.decompress(migratory_graph.payload)
+        data = json.loads(content)
+
+        assert migratory_graph.department is None
+        assert migratory_graph.etag == md5(content).hexdigest()
+        assert list(data["nodes"]) == sorted(
+            [
+                self.department_1.agency_slug,
+                self.department_2.agency_slug,
+                self.department_3.agency_slug,
+            ]
+        )
+        assert [graph["officer_id"] for graph in data["graphs"]] == [
+            self.officer_movement_2.officer.id,
+            self.officer_movement_1.officer.id,
+        ]
+        assert [graph["is_left"] for graph in data["graphs"]] == [None, None]
+
+    def test_build_keeps_single_global_graph(self):
+        migratory_graph = MigratoryGraphBuilder().build()
+
+        assert MigratoryGraphBuilder().build().id == migratory_graph.id
+        assert MigratoryGraph.objects.filter(is_global=True).count() == 1
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            MigratoryGraph.objects.create(
+                is_global=True,
+                payload=b"",
+                etag="",
+                compact_payload=b"",
+                compact_etag="",
+            )
+
+    def test_build_department(self):
+        migratory_graph = MigratoryGraphBuilder().build(self.department_3)
+
+        data = json.loads(gzip.decompress(migratory_graph.payload))
+
+        assert migratory_graph.department == self.department_3
+        assert list(data["nodes"]) == sorted(
+            [self.department_2.agency_slug, self.department_3.agency_slug]
+        )
+        assert len(data["graphs"]) == 1
+        assert data["graphs"][0]["end_node"] == self.department_3.agency_slug
+        assert data["graphs"][0]["is_left"] is False
+
+    def test_build_compact_payload(self):
+        migratory_graph = MigratoryGraphBuilder().build(self.department_2)
+
+        content = gzip.decompress(migratory_graph.compact_payload)
+        data = json.loads(content)
+        slugs = data["nodes"]["slugs"]
+
+        assert migratory_graph.compact_etag == md5(content).hexdigest()
+        assert [slugs[index] for index in data["graphs"]["start_nodes"]] == [
+            self.department_2.agency_slug,
+            self.department_1.agency_slug,
+        ]
+        assert [slugs[index] for index in data["graphs"]["end_nodes"]] == [
+            self.department_3.agency_slug,
+            self.department_2.agency_slug,
+        ]
+        assert data["graphs"]["dates"] == ["2021-01-01", "2021-01-02"]
+        assert data["graphs"]["is_left"] == [True, False]
+
+    def test_build_all(self):
+        MigratoryGraphBuilder().build(self.department_4)
+
+        MigratoryGraphBuilder().build_all()
+
+        assert set(MigratoryGraph.objects.values_list("department", flat=True)) == {
+            None,
+            self.department_1.id,
+            self.department_2.id,
+            self.department_3.id,
+        }
@@ -3,6 +3,11 @@ from django.test.testcases import TestCase
 from mock import patch
 
 from departments.factories import DepartmentFactory
+from departments.models import MigratoryGraph
+from departments.services import MigratoryGraphBuilder
+from officers.factories import EventFactory, OfficerFactory
+from people.factories import PersonFactory
+from utils.count_data import compute_person_cards
 
 
 class DepartmentTestCase(TestCase):
@@ -13,3 +18,46 @@ class DepartmentTestCase(TestCase):
         department.save()
 
         mock_clear_cache.assert_called()
+
+    def test_delete_migratory_graphs_when_Department_model_is_saved(self):
+        department = DepartmentFactory()
+        MigratoryGraphBuilder().build()
+        MigratoryGraphBuilder().build(department)
+
+        department.save()
+
+        assert not MigratoryGraph.objects.exists()
+
+    def test_recompute_person_cards_when_Department_model_is_renamed(self):
+        department = DepartmentFactory(agency_name="Orleans PD")
+        officer = OfficerFactory(department=department)
+        person = PersonFactory(canonical_officer=officer)
+        person.officers.add(officer)
+        EventFactory(officer=officer, department=department)
+        other_person = PersonFactory()
+        compute_person_cards()
+
+        department.agency_name = "New Orleans PD"
+        department.save()
+
+        person.refresh_from_db()
+        other_person.refresh_from_db()
+
+        assert person.card_departments == [
+            {"id": department.agency_slug, "name": "New Orleans PD"}
+        ]
+        assert other_person.card_departments == []
+
+    @patch("departments.signals.compute_person_cards")
+    def test_skip_person_cards_when_Department_model_is_unchanged(
+        self, mock_compute_person_cards
+    ):
+        department = DepartmentFactory()
+        officer = OfficerFactory(department=department)
+        person = PersonFactory(canonical_officer=officer)
+        person.officers.add(officer)
+        compute_person_cards()
+
+        department.save()
+
+        assert not list(mock_compute_person_cards.call_args[0][0])
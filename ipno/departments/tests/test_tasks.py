@@ -1,9 +1,11 @@
 from django.test.testcases import TestCase
 
+from mock import patch
+
 from config.celery import app
 from departments.documents import DepartmentESDoc
 from departments.factories import DepartmentFactory
-from departments.tasks import rebuild_department_index
+from departments.tasks import export_department_datafile, rebuild_department_index
 from utils.search_index import rebuild_search_index
 
 
@@ -23,3 +25,13 @@ class DepartmentTaskTestCase(TestCase):
 
         es_doc = DepartmentESDoc.get(id=1)
         assert es_doc.agency_name == "Alex"
+
+    @patch("utils.task_utils.check_app_ping", return_value=False)
+    @patch("departments.tasks.DepartmentDatafileExporter")
+    def test_export_department_datafile(self, department_datafile_exporter_mock, _):
+        department = DepartmentFactory()
+
+        export_department_datafile(department.id)
+
+        department_datafile_exporter_mock.assert_called_with(department)
+        department_datafile_exporter_mock.return_value.export.assert_called()
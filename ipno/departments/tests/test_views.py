@@ -1,3 +1,5 @@
+import gzip
+import json
 from datetime import date, datetime
 from operator import itemgetter
 from unittest.mock import patch
@@ -15,6 +17,7 @@ from departments.factories import (
     OfficerMovementFactory,
     WrglFileFactory,
 )
+from departments.services import MigratoryGraphBuilder
 from documents.factories import DocumentFactory
 from news_articles.factories import NewsArticleFactory, NewsArticleSourceFactory
 from news_articles.factories.matched_sentence_factory import MatchedSentenceFactory
@@ -317,6 +320,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
                 ],
                 "text_content": document_2.text_content,
                 "text_content_highlight": None,
+                "text_content_pages": [],
             },
             {
                 "id": document_3.id,
@@ -334,6 +338,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
                 ],
                 "text_content": document_3.text_content,
                 "text_content_highlight": "Text content <em>keyword</em> 4",
+                "text_content_pages": [1],
             },
         ]
 
@@ -402,6 +407,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
                 ],
                 "text_content": document_2.text_content,
                 "text_content_highlight": None,
+                "text_content_pages": [],
             },
         ]
 
@@ -663,6 +669,55 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
 
         assert response.data == expected_result
 
+    def test_download_datasets_not_found(self):
+        response = self.client.get(
+            reverse("api:departments-download-datasets", kwargs={"pk": "slug"})
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @patch("departments.views.export_department_datafile")
+    @patch("utils.datafile_exporter.GoogleCloudService")
+    def test_download_datasets_success(
+        self, google_cloud_service_mock, export_department_datafile_mock
+    ):
+        department = DepartmentFactory(agency_slug="new-orleans-pd")
+
+        gcs = google_cloud_service_mock.return_value
+        gcs.is_object_exists.return_value = True
+        gcs.generate_signed_url.return_value = "https://storage/new-orleans-pd.zip"
+
+        response = self.client.get(
+            reverse(
+                "api:departments-download-datasets",
+                kwargs={"pk": department.agency_slug},
+            )
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "url": "https://storage/new-orleans-pd.zip",
+            "filename": "new-orleans-pd.zip",
+        }
+        export_department_datafile_mock.assert_not_called()
+
+    @patch("departments.views.export_department_datafile")
+    @patch("utils.datafile_exporter.GoogleCloudService")
+    def test_download_datasets_schedule_export(
+        self, google_cloud_service_mock, export_department_datafile_mock
+    ):
+        department = DepartmentFactory()
+
+        google_cloud_service_mock.return_value.is_object_exists.return_value = False
+
+        url = reverse(
+            "api:departments-download-datasets", kwargs={"pk": department.agency_slug}
+        )
+        response = self.client.get(url)
+        self.client.get(url)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        export_department_datafile_mock.assert_called_once_with(department.id)
+
     def test_officers_not_found(self):
         response = self.client.get(
             reverse("api:departments-officers", kwargs={"pk": "slug"})
@@ -1997,23 +2052,23 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
             "nodes": {
                 department_1.agency_slug: {
                     "name": department_1.agency_name,
-                    "location": department_1.location,
+                    "location": list(department_1.location),
                 },
                 department_2.agency_slug: {
                     "name": department_2.agency_name,
-                    "location": department_2.location,
+                    "location": list(department_2.location),
                 },
                 department_3.agency_slug: {
                     "name": department_3.agency_name,
-                    "location": department_3.location,
+                    "location": list(department_3.location),
                 },
             },
             "graphs": [
                 {
                     "start_node": department_2.agency_slug,
                     "end_node": department_3.agency_slug,
-                    "start_location": department_2.location,
-                    "end_location": department_3.location,
+                    "start_location": list(department_2.location),
+                    "end_location": list(department_3.location),
                     "year": officer_movement_2.date.year,
                     "date": officer_movement_2.date.strftime("%Y-%m-%d"),
                     "officer_name": officer_2.name,
@@ -2024,8 +2079,8 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
                 {
                     "start_node": department_1.agency_slug,
                     "end_node": department_2.agency_slug,
-                    "start_location": department_1.location,
-                    "end_location": department_2.location,
+                    "start_location": list(department_1.location),
+                    "end_location": list(department_2.location),
                     "year": officer_movement_1.date.year,
                     "date": officer_movement_1.date.strftime("%Y-%m-%d"),
                     "officer_name": officer_1.name,
@@ -2039,7 +2094,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
         response = self.client.get(reverse("api:departments-migratory"))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == expected_result
+        assert response.json() == expected_result
 
     def test_migratory_list_empty(self):
         expected_result = {"nodes": {}, "graphs": []}
@@ -2047,7 +2102,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
         response = self.client.get(reverse("api:departments-migratory"))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == expected_result
+        assert response.json() == expected_result
 
     def test_migratory_list_with_no_department_location(self):
         department_1 = DepartmentFactory()
@@ -2086,19 +2141,19 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
             "nodes": {
                 department_1.agency_slug: {
                     "name": department_1.agency_name,
-                    "location": department_1.location,
+                    "location": list(department_1.location),
                 },
                 department_2.agency_slug: {
                     "name": department_2.agency_name,
-                    "location": department_2.location,
+                    "location": list(department_2.location),
                 },
             },
             "graphs": [
                 {
                     "start_node": department_1.agency_slug,
                     "end_node": department_2.agency_slug,
-                    "start_location": department_1.location,
-                    "end_location": department_2.location,
+                    "start_location": list(department_1.location),
+                    "end_location": list(department_2.location),
                     "year": officer_movement_1.date.year,
                     "date": officer_movement_1.date.strftime("%Y-%m-%d"),
                     "officer_name": officer_1.name,
@@ -2112,7 +2167,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
         response = self.client.get(reverse("api:departments-migratory"))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == expected_result
+        assert response.json() == expected_result
 
     def test_migratory_by_department_success(self):
         start_department = DepartmentFactory()
@@ -2156,23 +2211,23 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
             "nodes": {
                 start_department.agency_slug: {
                     "name": start_department.agency_name,
-                    "location": start_department.location,
+                    "location": list(start_department.location),
                 },
                 department.agency_slug: {
                     "name": department.agency_name,
-                    "location": department.location,
+                    "location": list(department.location),
                 },
                 end_department.agency_slug: {
                     "name": end_department.agency_name,
-                    "location": end_department.location,
+                    "location": list(end_department.location),
                 },
             },
             "graphs": [
                 {
                     "start_node": department.agency_slug,
                     "end_node": end_department.agency_slug,
-                    "start_location": department.location,
-                    "end_location": end_department.location,
+                    "start_location": list(department.location),
+                    "end_location": list(end_department.location),
                     "year": officer_movement_2.date.year,
                     "date": officer_movement_2.date.strftime("%Y-%m-%d"),
                     "officer_name": officer_2.name,
@@ -2183,8 +2238,8 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
                 {
                     "start_node": start_department.agency_slug,
                     "end_node": department.agency_slug,
-                    "start_location": start_department.location,
-                    "end_location": department.location,
+                    "start_location": list(start_department.location),
+                    "end_location": list(department.location),
                     "year": officer_movement_1.date.year,
                     "date": officer_movement_1.date.strftime("%Y-%m-%d"),
                     "officer_name": officer_1.name,
@@ -2203,7 +2258,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == expected_result
+        assert response.json() == expected_result
 
     def test_migratory_by_department_with_no_location(self):
         start_department = DepartmentFactory(location=None)
@@ -2247,19 +2302,19 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
             "nodes": {
                 department.agency_slug: {
                     "name": department.agency_name,
-                    "location": department.location,
+                    "location": list(department.location),
                 },
                 end_department.agency_slug: {
                     "name": end_department.agency_name,
-                    "location": end_department.location,
+                    "location": list(end_department.location),
                 },
             },
             "graphs": [
                 {
                     "start_node": department.agency_slug,
                     "end_node": end_department.agency_slug,
-                    "start_location": department.location,
-                    "end_location": end_department.location,
+                    "start_location": list(department.location),
+                    "end_location": list(end_department.location),
                     "year": officer_movement_2.date.year,
                     "date": officer_movement_2.date.strftime("%Y-%m-%d"),
                     "officer_name": officer_2.name,
@@ -2278,7 +2333,7 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == expected_result
+        assert response.json() == expected_result
 
     def test_migratory_by_department_empty(self):
         department = DepartmentFactory()
@@ -2293,4 +2348,115 @@ class DepartmentsViewSetTestCase(AuthAPITestCase):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == expected_result
+        assert response.json() == expected_result
+
+    def test_migratory_not_modified(self):
+        OfficerMovementFactory(
+            start_department=DepartmentFactory(),
+            end_department=DepartmentFactory(),
+            officer=OfficerFactory(),
+        )
+
+        response = self.client.get(reverse("api:departments-migratory"))
+        etag = response["ETag"]
+
+        not_modified_response = self.client.get(
+            reverse("api:departments-migratory"), HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified_response["ETag"] == etag
+        assert not not_modified_response.content
+
+    def test_migratory_gzip_encoded(self):
+        OfficerMovementFactory(
+            start_department=DepartmentFactory(),
+            end_department=DepartmentFactory(),
+            officer=OfficerFactory(),
+        )
+
+        response = self.client.get(reverse("api:departments-migratory"))
+        gzip_response = self.client.get(
+            reverse("api:departments-migratory"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        assert gzip_response.status_code == status.HTTP_200_OK
+        assert gzip_response["Content-Encoding"] == "gzip"
+        assert gzip_response["ETag"] == response["ETag"]
+        assert json.loads(gzip.decompress(gzip_response.content)) == response.json()
+
+    def test_migratory_compact_encoding(self):
+        department_1 = DepartmentFactory()
+        department_2 = DepartmentFactory()
+        officer = OfficerFactory()
+
+        officer_movement = OfficerMovementFactory(
+            start_department=department_1,
+            end_department=department_2,
+            officer=officer,
+            date=datetime(2021, 1, 2),
+        )
+
+        slugs = sorted([department_1.agency_slug, department_2.agency_slug])
+        departments = {
+            department_1.agency_slug: department_1,
+            department_2.agency_slug: department_2,
+        }
+
+        expected_result = {
+            "nodes": {
+                "slugs": slugs,
+                "names": [departments[slug].agency_name for slug in slugs],
+                "locations": [list(departments[slug].location) for slug in slugs],
+            },
+            "graphs": {
+                "start_nodes": [slugs.index(department_1.agency_slug)],
+                "end_nodes": [slugs.index(department_2.agency_slug)],
+                "dates": ["2021-01-02"],
+                "officer_names": [officer.name],
+                "officer_ids": [officer.id],
+                "left_reasons": [officer_movement.left_reason],
+                "is_left": [True],
+            },
+        }
+
+        response = self.client.get(
+            reverse(
+                "api:departments-migratory-by-department",
+                kwargs={"pk": department_1.agency_slug},
+            ),
+            {"encoding": "compact"},
+        )
+        default_response = self.client.get(
+            reverse(
+                "api:departments-migratory-by-department",
+                kwargs={"pk": department_1.agency_slug},
+            )
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == expected_result
+        assert response["ETag"] != default_response["ETag"]
+
+    def test_migratory_serves_precomputed_graph(self):
+        start_department = DepartmentFactory()
+        end_department = DepartmentFactory()
+        OfficerMovementFactory(
+            start_department=start_department,
+            end_department=end_department,
+            officer=OfficerFactory(),
+        )
+        MigratoryGraphBuilder().build_all()
+
+        OfficerMovementFactory(
+            start_department=start_department,
+            end_department=end_department,
+            officer=OfficerFactory(),
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("api:departments-migratory"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["graphs"]) == 1
@@ -1,23 +1,25 @@
+import gzip
 from itertools import chain
 
-from django.db.models import Count, Prefetch, Q
-from django.db.models.expressions import Case, Value, When
+from django.db.models import Count
+from django.db.models.expressions import Value
 from django.db.models.fields import BooleanField
+from django.http import HttpResponse, HttpResponseNotModified
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
 
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.status import HTTP_202_ACCEPTED, HTTP_400_BAD_REQUEST
 
-from departments.constants import DEPARTMENTS_LIMIT
-from departments.models import Department, OfficerMovement
+from departments.constants import DEPARTMENTS_LIMIT, MIGRATORY_GRAPH_COMPACT_ENCODING
+from departments.models import Department, MigratoryGraph
 from departments.serializers import (
     DepartmentDetailsSerializer,
     DepartmentDocumentSerializer,
     DepartmentNewsArticleSerializer,
     DepartmentOfficerSerializer,
-    OfficerMovementSerializer,
     WrglFileSerializer,
 )
 from departments.serializers.es_serializers import (
@@ -25,6 +27,8 @@ from departments.serializers.es_serializers import (
     DepartmentNewsArticlesESSerializer,
     DepartmentOfficersESSerializer,
 )
+from departments.services import DepartmentDatafileExporter, MigratoryGraphBuilder
+from departments.tasks import export_department_datafile
 from documents.models import Document
 from news_articles.models import MatchedSentence, NewsArticle
 from officers.models import Officer
@@ -34,7 +38,7 @@ from search.queries import (
     OfficersSearchQuery,
 )
 from shared.serializers import DepartmentSerializer
-from utils.cache_utils import custom_cache
+from utils.cache_utils import custom_cache, search_cache
 from utils.es_pagination import ESPagination
 
 
@@ -62,6 +66,7 @@ class DepartmentsViewSet(viewsets.ViewSet):
         return Response(serializer.data)
 
     @action(detail=True, methods=["get"], url_path="search")
+    @search_cache
     def search(self, request, pk):
         q = self.request.query_params.get("q", "")
         kind = self.request.query_params.get("kind", "")
@@ -135,14 +140,9 @@ class DepartmentsViewSet(viewsets.ViewSet):
     def officers(self, request, pk):
         department = get_object_or_404(Department, agency_slug=pk)
 
-        other_prefetches = (Prefetch("department"),)
-
         starred_officers = (
-            department.starred_officers.prefetch_events(other_prefetches)
-            .annotate(
-                is_starred=Value(True, output_field=BooleanField()),
-                use_of_forces_count=Count("use_of_forces"),
-            )
+            department.starred_officers.select_related("person", "department")
+            .annotate(is_starred=Value(True, output_field=BooleanField()))
             .all()[:DEPARTMENTS_LIMIT]
         )
 
@@ -157,12 +157,9 @@ class DepartmentsViewSet(viewsets.ViewSet):
             )
 
             sorted_featured_officers = (
-                Officer.objects.prefetch_events(other_prefetches)
+                Officer.objects.select_related("person", "department")
                 .filter(id__in=featured_officers)
-                .annotate(
-                    is_starred=Value(False, output_field=BooleanField()),
-                    use_of_forces_count=Count("use_of_forces"),
-                )
+                .annotate(is_starred=Value(False, output_field=BooleanField()))
                 .order_by("-person__all_complaints_count")[
                     : DEPARTMENTS_LIMIT - starred_officers_count
                 ]
@@ -235,88 +232,61 @@ class DepartmentsViewSet(viewsets.ViewSet):
 
         return Response(wrgl_serializers.data)
 
-    @action(detail=False, methods=["get"], url_path="migratory")
-    @custom_cache
-    def migratory(self, request):
-        officer_movements = (
-            OfficerMovement.objects.select_related(
-                "start_department",
-                "end_department",
-                "officer",
-            )
-            .filter(
-                start_department__location__isnull=False,
-                end_department__location__isnull=False,
-            )
-            .order_by(
-                "date",
-            )
-        )
+    @action(detail=True, methods=["get"], url_path="download-datasets")
+    def download_datasets(self, request, pk):
+        department = get_object_or_404(Department, agency_slug=pk)
+        exporter = DepartmentDatafileExporter(department)
 
-        graphs = OfficerMovementSerializer(officer_movements, many=True).data
-        nodes = self._get_nodes(officer_movements)
+        if not exporter.ensure_exported(export_department_datafile, department.id):
+            return Response(
+                {"detail": "The data file is being generated"},
+                status=HTTP_202_ACCEPTED,
+            )
 
         return Response(
-            {
-                "nodes": nodes,
-                "graphs": graphs,
-            }
+            {"url": exporter.get_download_url(), "filename": exporter.filename}
         )
 
+    @action(detail=False, methods=["get"], url_path="migratory")
+    def migratory(self, request):
+        migratory_graph = MigratoryGraph.objects.filter(is_global=True).first()
+
+        if not migratory_graph:
+            migratory_graph = MigratoryGraphBuilder().build()
+
+        return self._get_migratory_response(request, migratory_graph)
+
     @action(detail=True, methods=["get"], url_path="migratory-by-department")
-    @custom_cache
     def migratory_by_department(self, request, pk):
         department = get_object_or_404(Department, agency_slug=pk)
-
-        officer_movements = (
-            OfficerMovement.objects.select_related(
-                "start_department",
-                "end_department",
-                "officer",
-            )
-            .filter(
-                Q(start_department__location__isnull=False),
-                Q(end_department__location__isnull=False),
-                Q(start_department=department) | Q(end_department=department),
-            )
-            .annotate(
-                is_left=Case(
-                    When(start_department=department, then=True),
-                    output_field=BooleanField(),
-                    default=False,
-                )
+        migratory_graph = MigratoryGraph.objects.filter(department=department).first()
+
+        if not migratory_graph:
+            migratory_graph = MigratoryGraphBuilder().build(department)
+
+        return self._get_migratory_response(request, migratory_graph)
+
+    def _get_migratory_response(self, request, migratory_graph):
+        encoding = request.query_params.get("encoding")
+
+        if encoding == MIGRATORY_GRAPH_COMPACT_ENCODING:
+            payload = migratory_graph.compact_payload
+            etag = f'"{migratory_graph.compact_etag}"'
+        else:
+            payload = migratory_graph.payload
+            etag = f'"{migratory_graph.etag}"'
+
+        if request.META.get("HTTP_IF_NONE_MATCH") == etag:
+            response = HttpResponseNotModified()
+        elif "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+            response = HttpResponse(bytes(payload), content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(
+                gzip.decompress(payload), content_type="application/json"
             )
-            .order_by(
-                "date",
-            )
-        )
-
-        graphs = OfficerMovementSerializer(officer_movements, many=True).data
-        nodes = self._get_nodes(officer_movements)
-
-        return Response(
-            {
-                "nodes": nodes,
-                "graphs": graphs,
-            }
-        )
-
-    def _get_nodes(self, officer_movements):
-        start_departments = officer_movements.values_list(
-            "start_department__id", flat=True
-        )
-        end_departments = officer_movements.values_list("end_department__id", flat=True)
-        department_ids = list(set(chain(start_departments, end_departments)))
-        departments = Department.objects.filter(id__in=department_ids).order_by(
-            "agency_slug"
-        )
-
-        nodes = {}
 
-        for department in departments:
-            nodes[department.agency_slug] = {
-                "name": department.agency_name,
-                "location": department.location,
-            }
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
 
-        return nodes
+        return response
@@ -1 +1,4 @@
 DOCUMENTS_LIMIT = 20
+DOCUMENTS_BROWSE_ORDERING = ["docid", "id"]
+DOCUMENT_TEXT_CHUNK_SIZE = 2000
+DOCUMENT_TEXT_CHUNK_HITS_LIMIT = 3
@@ -1,11 +1,18 @@
+from collections import defaultdict
+
 from django.conf import settings
 
 from django_elasticsearch_dsl import fields
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch_dsl import SearchAsYouType
 
+from documents.constants import DOCUMENT_TEXT_CHUNK_SIZE
+from officers.documents import OfficerESDoc
+from shared.serializers.es_serializers import DocumentsESSerializer
 from utils.analyzers import autocomplete_analyzer, search_analyzer, text_analyzer
 from utils.es_doc import ESDoc
 from utils.es_index import ESIndex
+from utils.parse_utils import split_text_chunks
 
 from .models import Document
 
@@ -19,18 +26,68 @@ class DocumentESDoc(ESDoc):
         model = Document
         ignore_signals = True
 
-    def get_indexing_queryset(self):
-        return self.get_queryset().prefetch_related(
-            "officers",
-            "departments",
+    search_serializer = DocumentsESSerializer
+
+    related_lookups = {
+        "officers.Officer": "officers__in",
+        "departments.Department": "departments__in",
+        "officers.Event": "officers__events__in",
+    }
+
+    def get_chunk_data(self, ids):
+        officers = defaultdict(list)
+        officer_relations = (
+            Document.officers.through.objects.filter(document_id__in=ids)
+            .select_related("officer")
+            .order_by("id")
+        )
+
+        for relation in officer_relations:
+            officers[relation.document_id].append(relation.officer)
+
+        officer_ids = {
+            officer.id
+            for document_officers in officers.values()
+            for officer in document_officers
+        }
+        badges = OfficerESDoc.get_badges(officer_ids)
+
+        departments = defaultdict(list)
+        department_relations = (
+            Document.departments.through.objects.filter(document_id__in=ids)
+            .select_related("department")
+            .order_by("id")
         )
 
+        for relation in department_relations:
+            departments[relation.document_id].append(relation.department)
+
+        return {
+            **super().get_chunk_data(ids),
+            "officers": officers,
+            "badges": badges,
+            "departments": departments,
+        }
+
+    def get_officers(self, instance):
+        return self.get_chunk_value("officers", instance, [])
+
+    def get_departments(self, instance):
+        return self.get_chunk_value("departments", instance, [])
+
     id = fields.IntegerField()
     title = fields.TextField(
-        analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
+        analyzer=autocomplete_analyzer,
+        search_analyzer=search_analyzer,
+        fields={"prefix": SearchAsYouType()},
     )
-    text_content = fields.TextField(
-        analyzer=text_analyzer, search_analyzer=search_analyzer
+    text_chunks = fields.NestedField(
+        properties={
+            "page": fields.IntegerField(),
+            "text": fields.TextField(
+                analyzer=text_analyzer, search_analyzer=search_analyzer
+            ),
+        }
     )
     officer_names = fields.TextField(
         analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
@@ -41,18 +98,24 @@ class DocumentESDoc(ESDoc):
         analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
     )
     department_slugs = fields.TextField()
+    search_result = fields.ObjectField(enabled=False)
+
+    def prepare_text_chunks(self, instance):
+        return split_text_chunks(instance.text_content, DOCUMENT_TEXT_CHUNK_SIZE)
 
     def prepare_officer_names(self, instance):
-        return [officer.name for officer in instance.officers.all()]
+        return [officer.name for officer in self.get_officers(instance)]
 
     def prepare_officer_badges(self, instance):
-        return [officer.badges for officer in instance.officers.all()]
+        badges = self.chunk_data.get("badges", {})
+
+        return [badges.get(officer.id, []) for officer in self.get_officers(instance)]
 
     def prepare_department_names(self, instance):
-        return [department.agency_name for department in instance.departments.all()]
+        return [department.agency_name for department in self.get_departments(instance)]
 
     def prepare_department_ids(self, instance):
-        return [department.id for department in instance.departments.all()]
+        return [department.id for department in self.get_departments(instance)]
 
     def prepare_department_slugs(self, instance):
-        return [department.agency_slug for department in instance.departments.all()]
+        return [department.agency_slug for department in self.get_departments(instance)]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.13 on 2026-10-19 16:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0016_add_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['docid', 'id'], name='document_docid_id_idx'),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.db import models
+from django.db.models import OuterRef, Subquery
 
 from utils.models import APITemplateModel, TimeStampsModel
 
@@ -9,6 +11,23 @@ class DocumentManager(models.Manager):
             "departments",
         )
 
+    def annotate_card_data(self):
+        DocumentDepartment = self.model.departments.through
+
+        def department_aggregate(field):
+            return Subquery(
+                DocumentDepartment.objects.filter(document=OuterRef("pk"))
+                .order_by()
+                .values("document")
+                .annotate(aggregate=ArrayAgg(f"department__{field}", ordering="id"))
+                .values("aggregate")
+            )
+
+        return self.get_queryset().annotate(
+            card_department_slugs=department_aggregate("agency_slug"),
+            card_department_names=department_aggregate("agency_name"),
+        )
+
 
 class Document(TimeStampsModel, APITemplateModel):
     CUSTOM_FIELDS = {
@@ -56,6 +75,9 @@ class Document(TimeStampsModel, APITemplateModel):
 
     class Meta:
         unique_together = ("docid", "hrg_no", "matched_uid", "agency")
+        indexes = [
+            models.Index(fields=["docid", "id"], name="document_docid_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.id} - {self.title[:50]}..."
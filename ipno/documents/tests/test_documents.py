@@ -0,0 +1,82 @@
+from django.test.testcases import TestCase
+
+from mock import patch
+
+from departments.factories import DepartmentFactory
+from documents.documents import DocumentESDoc
+from documents.factories import DocumentFactory
+from officers.factories import EventFactory, OfficerFactory
+
+
+class DocumentESDocTestCase(TestCase):
+    def test_get_chunk_data(self):
+        department_1 = DepartmentFactory()
+        department_2 = DepartmentFactory()
+        officer_1 = OfficerFactory(first_name="David", last_name="Jonesworth")
+        officer_2 = OfficerFactory(first_name="Anthony", last_name="Joseph")
+        EventFactory(officer=officer_1, badge_no="12435", year=2020)
+        EventFactory(officer=officer_1, badge_no="67893", year=2017)
+        EventFactory(officer=officer_2, badge_no="5432", year=2018)
+
+        document_1 = DocumentFactory()
+        document_1.officers.add(officer_1)
+        document_1.officers.add(officer_2)
+        document_1.departments.add(department_1)
+        document_1.departments.add(department_2)
+        document_2 = DocumentFactory()
+        document_2.officers.add(officer_2)
+        document_3 = DocumentFactory()
+
+        es_doc = DocumentESDoc()
+
+        with self.assertNumQueries(5):
+            es_doc.chunk_data = es_doc.get_chunk_data(
+                [document_1.id, document_2.id, document_3.id]
+            )
+
+        with self.assertNumQueries(0):
+            assert es_doc.prepare_officer_names(document_1) == [
+                "David Jonesworth",
+                "Anthony Joseph",
+            ]
+            assert es_doc.prepare_officer_badges(document_1) == [
+                ["12435", "67893"],
+                ["5432"],
+            ]
+            assert es_doc.prepare_department_ids(document_1) == [
+                department_1.id,
+                department_2.id,
+            ]
+            assert es_doc.prepare_department_names(document_1) == [
+                department_1.agency_name,
+                department_2.agency_name,
+            ]
+            assert es_doc.prepare_department_slugs(document_1) == [
+                department_1.agency_slug,
+                department_2.agency_slug,
+            ]
+            assert es_doc.prepare_officer_names(document_2) == ["Anthony Joseph"]
+            assert es_doc.prepare_officer_badges(document_2) == [["5432"]]
+            assert es_doc.prepare_department_slugs(document_2) == []
+            assert es_doc.prepare_officer_names(document_3) == []
+            assert es_doc.prepare_search_result(document_1)["id"] == document_1.id
+            assert es_doc.prepare_search_result(document_1)["departments"] == [
+                {"id": department.agency_slug, "name": department.agency_name}
+                for department in [department_1, department_2]
+            ]
+
+    def test_prepare_text_chunks(self):
+        document = DocumentFactory(
+            text_content="Hearing transcript page one\fPage two of the hearing"
+        )
+
+        with patch("documents.documents.DOCUMENT_TEXT_CHUNK_SIZE", 16):
+            text_chunks = DocumentESDoc().prepare_text_chunks(document)
+
+        assert text_chunks == [
+            {"page": 1, "text": "Hearing"},
+            {"page": 1, "text": "transcript page"},
+            {"page": 1, "text": "one"},
+            {"page": 2, "text": "Page two of the"},
+            {"page": 2, "text": "hearing"},
+        ]
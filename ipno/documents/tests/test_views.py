@@ -66,3 +66,52 @@ class DocumentsViewSetTestCase(AuthAPITestCase):
         ]
 
         assert response.data == expected_data
+
+    def test_browse_success(self):
+        department = DepartmentFactory()
+
+        document_1 = DocumentFactory(docid="docid-2")
+        document_2 = DocumentFactory(docid="docid-1")
+        DocumentFactory(docid="docid-2")
+        document_3 = DocumentFactory(docid="docid-3")
+        DocumentFactory(docid=None)
+        document_1.departments.add(department)
+
+        response = self.client.get(reverse("api:documents-browse"), {"limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+
+        assert response.data["results"] == [
+            {
+                "id": document_2.id,
+                "document_type": document_2.document_type,
+                "title": document_2.title,
+                "url": document_2.url,
+                "preview_image_url": document_2.preview_image_url,
+                "incident_date": str(document_2.incident_date),
+                "pages_count": document_2.pages_count,
+                "departments": [],
+            },
+            {
+                "id": document_1.id,
+                "document_type": document_1.document_type,
+                "title": document_1.title,
+                "url": document_1.url,
+                "preview_image_url": document_1.preview_image_url,
+                "incident_date": str(document_1.incident_date),
+                "pages_count": document_1.pages_count,
+                "departments": [
+                    {
+                        "id": department.agency_slug,
+                        "name": department.agency_name,
+                    }
+                ],
+            },
+        ]
+        assert response.data["previous"] is None
+
+        response = self.client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [document_3.id]
+        assert response.data["next"] is None
+        assert response.data["previous"] is not None
@@ -1,20 +1,41 @@
+from django.db.models import Exists, OuterRef
+
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from documents.constants import DOCUMENTS_LIMIT
+from documents.constants import DOCUMENTS_BROWSE_ORDERING, DOCUMENTS_LIMIT
 from documents.models import Document
+from shared.queries import get_document_cards
 from shared.serializers import DocumentSerializer
 from utils.cache_utils import custom_cache
+from utils.keyset_pagination import KeysetPagination
 
 
 class DocumentsViewSet(viewsets.ViewSet):
     @custom_cache
     def list(self, request):
         documents = (
-            Document.objects.prefetch_departments()
+            get_document_cards()
             .order_by("docid", "id")
             .distinct("docid")[:DOCUMENTS_LIMIT]
         )
 
         serializer = DocumentSerializer(documents, many=True)
         return Response(serializer.data)
+
+    @action(detail=False, methods=["get"], url_path="browse")
+    @custom_cache
+    def browse(self, request):
+        duplicated_documents = Document.objects.filter(
+            docid=OuterRef("docid"), id__lt=OuterRef("id")
+        )
+        documents = get_document_cards().filter(
+            ~Exists(duplicated_documents), docid__isnull=False
+        )
+
+        paginator = KeysetPagination(DOCUMENTS_BROWSE_ORDERING)
+        page = paginator.paginate_queryset(documents, request)
+
+        serializer = DocumentSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
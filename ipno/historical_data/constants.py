@@ -2,3 +2,16 @@ RECENT_DEPARTMENT_TYPE = "DEPARTMENT"
 RECENT_OFFICER_TYPE = "OFFICER"
 RECENT_DOCUMENT_TYPE = "DOCUMENT"
 RECENT_NEWS_ARTICLE_TYPE = "NEWS_ARTICLE"
+
+RECENT_ITEMS_KIND = "items"
+RECENT_QUERIES_KIND = "queries"
+RECENT_HISTORY_ANONYMOUS_SCOPE = "anonymous"
+RECENT_HISTORY_LIMIT = 10
+
+RECENT_HISTORY_ADD_ACTION = "add"
+RECENT_HISTORY_REMOVE_ACTION = "remove"
+
+RECENT_HISTORY_BUFFER_KEY_PREFIX = "recent_history"
+RECENT_HISTORY_BUFFER_READ_SIZE = 100
+RECENT_HISTORY_FLUSH_BATCH_SIZE = 10000
+RECENT_HISTORY_FLUSH_LOCK_TIMEOUT = 10 * 60
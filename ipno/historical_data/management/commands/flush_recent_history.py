@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+import structlog
+
+from historical_data.services import RecentHistoryBuffer
+
+logger = structlog.get_logger("IPNO")
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options):
+        flushed_count = RecentHistoryBuffer().flush()
+
+        logger.info(f"Flushed {flushed_count} recent history events")
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.13 on 2026-10-19 16:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('historical_data', '0002_create_anonymous_query'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='anonymousquery',
+            name='visit_count',
+            field=models.PositiveIntegerField(db_index=True, default=1),
+        ),
+    ]
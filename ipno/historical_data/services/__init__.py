@@ -0,0 +1,9 @@
+from historical_data.services.recent_history_buffer import (
+    RecentHistoryBuffer,
+    merge_recent_history,
+)
+
+__all__ = [
+    "RecentHistoryBuffer",
+    "merge_recent_history",
+]
@@ -0,0 +1,217 @@
+import json
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from authentication.models import User
+from historical_data.constants import (
+    RECENT_HISTORY_ADD_ACTION,
+    RECENT_HISTORY_ANONYMOUS_SCOPE,
+    RECENT_HISTORY_BUFFER_KEY_PREFIX,
+    RECENT_HISTORY_BUFFER_READ_SIZE,
+    RECENT_HISTORY_FLUSH_BATCH_SIZE,
+    RECENT_HISTORY_FLUSH_LOCK_TIMEOUT,
+    RECENT_HISTORY_LIMIT,
+    RECENT_ITEMS_KIND,
+    RECENT_QUERIES_KIND,
+)
+from historical_data.models import AnonymousItem, AnonymousQuery
+from utils.redis_utils import get_redis_client
+
+
+def merge_recent_history(recent_history, events, limit=RECENT_HISTORY_LIMIT):
+    recent_history = list(recent_history or [])
+
+    for event in events:
+        value = event["value"]
+
+        if value in recent_history:
+            recent_history.remove(value)
+
+        if event["action"] == RECENT_HISTORY_ADD_ACTION:
+            recent_history.insert(0, value)
+
+    return recent_history[:limit]
+
+
+class RecentHistoryBuffer:
+    def __init__(self):
+        self.client = get_redis_client()
+        self.keys_key = f"{RECENT_HISTORY_BUFFER_KEY_PREFIX}:keys"
+        self.flush_lock_key = f"{RECENT_HISTORY_BUFFER_KEY_PREFIX}:flush_lock"
+
+    def get_scope(self, user):
+        return str(user.id) if user.is_authenticated else RECENT_HISTORY_ANONYMOUS_SCOPE
+
+    def get_key(self, kind, scope):
+        return f"{RECENT_HISTORY_BUFFER_KEY_PREFIX}:{kind}:{scope}"
+
+    def push(self, kind, scope, value, action=RECENT_HISTORY_ADD_ACTION):
+        key = self.get_key(kind, scope)
+        event = {
+            "action": action,
+            "value": value,
+            "visited_at": timezone.now().isoformat(),
+        }
+
+        pipeline = self.client.pipeline()
+        pipeline.rpush(key, json.dumps(event))
+        pipeline.sadd(self.keys_key, key)
+        pipeline.execute()
+
+    def get_pending(self, kind, scope):
+        events = self.client.lrange(
+            self.get_key(kind, scope), -RECENT_HISTORY_BUFFER_READ_SIZE, -1
+        )
+
+        return [json.loads(event) for event in events]
+
+    def merge_pending(self, kind, scope, recent_history):
+        return merge_recent_history(recent_history, self.get_pending(kind, scope))
+
+    def save_anonymous_items(self, events):
+        visits = {}
+        for event in events:
+            item = event["value"]
+            visits[(str(item["id"]), item["type"])] = parse_datetime(
+                event["visited_at"]
+            )
+
+        if not visits:
+            return
+
+        items = {}
+        existing_items = AnonymousItem.objects.filter(
+            item_id__in={item_id for item_id, _ in visits},
+            item_type__in={item_type for _, item_type in visits},
+        )
+        for item in existing_items:
+            key = (item.item_id, item.item_type)
+            if key in visits:
+                items.setdefault(key, item)
+
+        new_items = AnonymousItem.objects.bulk_create(
+            [
+                AnonymousItem(item_id=item_id, item_type=item_type)
+                for item_id, item_type in visits
+                if (item_id, item_type) not in items
+            ]
+        )
+        items.update({(item.item_id, item.item_type): item for item in new_items})
+
+        for key, item in items.items():
+            item.last_visited = visits[key]
+
+        AnonymousItem.objects.bulk_update(items.values(), ["last_visited"])
+
+    def save_anonymous_queries(self, events):
+        visits = {}
+        visit_counts = Counter()
+        for event in events:
+            visits[event["value"]] = parse_datetime(event["visited_at"])
+            visit_counts[event["value"]] += 1
+
+        if not visits:
+            return
+
+        queries = {}
+        for query in AnonymousQuery.objects.filter(query__in=visits):
+            queries.setdefault(query.query, query)
+
+        new_queries = AnonymousQuery.objects.bulk_create(
+            [
+                AnonymousQuery(query=query, visit_count=0)
+                for query in visits
+                if query not in queries
+            ]
+        )
+        queries.update({query.query: query for query in new_queries})
+
+        for key, query in queries.items():
+            query.last_visited = visits[key]
+            query.visit_count = F("visit_count") + visit_counts[key]
+
+        AnonymousQuery.objects.bulk_update(
+            queries.values(), ["last_visited", "visit_count"]
+        )
+
+    def save_user_histories(self, items_events, queries_events):
+        users = User.objects.in_bulk(
+            [int(scope) for scope in {*items_events, *queries_events}]
+        )
+
+        if not users:
+            return
+
+        for user in users.values():
+            scope = str(user.id)
+
+            if scope in items_events:
+                user.recent_items = merge_recent_history(
+                    user.recent_items, items_events[scope]
+                )
+            if scope in queries_events:
+                user.recent_queries = merge_recent_history(
+                    user.recent_queries, queries_events[scope]
+                )
+
+        User.objects.bulk_update(users.values(), ["recent_items", "recent_queries"])
+
+    def flush(self):
+        if not self.client.set(
+            self.flush_lock_key, 1, nx=True, ex=RECENT_HISTORY_FLUSH_LOCK_TIMEOUT
+        ):
+            return 0
+
+        try:
+            return self._flush()
+        finally:
+            self.client.delete(self.flush_lock_key)
+
+    def _flush(self):
+        keys = self.client.smembers(self.keys_key)
+
+        if not keys:
+            return 0
+
+        self.client.srem(self.keys_key, *keys)
+
+        pending = {
+            key: self.client.lrange(key, 0, RECENT_HISTORY_FLUSH_BATCH_SIZE - 1)
+            for key in keys
+        }
+        events = {RECENT_ITEMS_KIND: {}, RECENT_QUERIES_KIND: {}}
+        for key, raw_events in pending.items():
+            _, kind, scope = key.split(":", 2)
+            events[kind][scope] = [json.loads(event) for event in raw_events]
+
+        items_events = events[RECENT_ITEMS_KIND]
+        queries_events = events[RECENT_QUERIES_KIND]
+
+        try:
+            with transaction.atomic():
+                self.save_anonymous_items(
+                    items_events.pop(RECENT_HISTORY_ANONYMOUS_SCOPE, [])
+                )
+                self.save_anonymous_queries(
+                    queries_events.pop(RECENT_HISTORY_ANONYMOUS_SCOPE, [])
+                )
+                self.save_user_histories(items_events, queries_events)
+        except Exception:
+            self.client.sadd(self.keys_key, *keys)
+            raise
+
+        pipeline = self.client.pipeline()
+        for key, raw_events in pending.items():
+            pipeline.ltrim(key, len(raw_events), -1)
+            pipeline.llen(key)
+        remaining_counts = pipeline.execute()[1::2]
+
+        remaining_keys = [key for key, count in zip(pending, remaining_counts) if count]
+        if remaining_keys:
+            self.client.sadd(self.keys_key, *remaining_keys)
+
+        return sum(len(raw_events) for raw_events in pending.values())
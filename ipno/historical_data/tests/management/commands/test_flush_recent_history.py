@@ -0,0 +1,16 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from mock import patch
+
+
+class FlushRecentHistoryCommandTestCase(TestCase):
+    @patch(
+        "historical_data.management.commands.flush_recent_history.RecentHistoryBuffer"
+    )
+    def test_call_command(self, recent_history_buffer_mock):
+        recent_history_buffer_mock.return_value.flush.return_value = 3
+
+        call_command("flush_recent_history")
+
+        recent_history_buffer_mock.return_value.flush.assert_called_once()
@@ -0,0 +1,190 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from fakeredis import FakeRedis
+from freezegun import freeze_time
+from mock import patch
+
+from authentication.factories import UserFactory
+from historical_data.constants import (
+    RECENT_DEPARTMENT_TYPE,
+    RECENT_HISTORY_ANONYMOUS_SCOPE,
+    RECENT_HISTORY_REMOVE_ACTION,
+    RECENT_ITEMS_KIND,
+    RECENT_OFFICER_TYPE,
+    RECENT_QUERIES_KIND,
+)
+from historical_data.factories import AnonymousItemFactory, AnonymousQueryFactory
+from historical_data.models import AnonymousItem, AnonymousQuery
+from historical_data.services import RecentHistoryBuffer, merge_recent_history
+
+
+class RecentHistoryBufferTestCase(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis(decode_responses=True)
+        self.redis.flushall()
+
+        redis_patcher = patch(
+            "historical_data.services.recent_history_buffer.get_redis_client",
+            return_value=self.redis,
+        )
+        redis_patcher.start()
+        self.addCleanup(redis_patcher.stop)
+
+        self.buffer = RecentHistoryBuffer()
+
+    def test_merge_recent_history(self):
+        events = [
+            {"action": "add", "value": "query 3"},
+            {"action": "add", "value": "query 1"},
+            {"action": RECENT_HISTORY_REMOVE_ACTION, "value": "query 2"},
+        ]
+
+        result = merge_recent_history(["query 2", "query 1", "query 0"], events, 3)
+
+        assert result == ["query 1", "query 3", "query 0"]
+
+    def test_merge_pending(self):
+        self.buffer.push(RECENT_QUERIES_KIND, "1", "query 2")
+        self.buffer.push(RECENT_QUERIES_KIND, "2", "query 3")
+
+        result = self.buffer.merge_pending(RECENT_QUERIES_KIND, "1", ["query 1"])
+
+        assert result == ["query 2", "query 1"]
+
+    def test_flush_anonymous_items(self):
+        with freeze_time("2021-09-03 8:00:00"):
+            existing_item = AnonymousItemFactory(
+                item_id="1", item_type=RECENT_OFFICER_TYPE
+            )
+
+        with freeze_time("2021-09-04 8:00:00"):
+            self.buffer.push(
+                RECENT_ITEMS_KIND,
+                RECENT_HISTORY_ANONYMOUS_SCOPE,
+                {"id": "slug", "type": RECENT_DEPARTMENT_TYPE},
+            )
+        with freeze_time("2021-09-05 8:00:00"):
+            self.buffer.push(
+                RECENT_ITEMS_KIND,
+                RECENT_HISTORY_ANONYMOUS_SCOPE,
+                {"id": "1", "type": RECENT_OFFICER_TYPE},
+            )
+        with freeze_time("2021-09-06 8:00:00"):
+            self.buffer.push(
+                RECENT_ITEMS_KIND,
+                RECENT_HISTORY_ANONYMOUS_SCOPE,
+                {"id": "slug", "type": RECENT_DEPARTMENT_TYPE},
+            )
+
+        flushed_count = self.buffer.flush()
+
+        items = AnonymousItem.objects.order_by("-last_visited")
+
+        assert flushed_count == 3
+        assert [(item.item_id, item.item_type) for item in items] == [
+            ("slug", RECENT_DEPARTMENT_TYPE),
+            ("1", RECENT_OFFICER_TYPE),
+        ]
+        assert items[0].last_visited == timezone.datetime(
+            2021, 9, 6, 8, tzinfo=timezone.utc
+        )
+        assert items[1].id == existing_item.id
+        assert not self.redis.exists(
+            self.buffer.get_key(RECENT_ITEMS_KIND, RECENT_HISTORY_ANONYMOUS_SCOPE)
+        )
+        assert not self.redis.smembers(self.buffer.keys_key)
+
+    def test_flush_anonymous_queries(self):
+        AnonymousQueryFactory(query="query 1", visit_count=3)
+
+        for query in ["query 1", "query 2", "query 1"]:
+            self.buffer.push(RECENT_QUERIES_KIND, RECENT_HISTORY_ANONYMOUS_SCOPE, query)
+
+        self.buffer.flush()
+
+        assert AnonymousQuery.objects.count() == 2
+        assert AnonymousQuery.objects.get(query="query 1").visit_count == 5
+        assert AnonymousQuery.objects.get(query="query 2").visit_count == 1
+
+    def test_flush_user_histories(self):
+        user_1 = UserFactory(email="user1@email.com", recent_queries=["query 1"])
+        user_2 = UserFactory(
+            email="user2@email.com",
+            recent_items=[{"id": 1, "type": RECENT_OFFICER_TYPE}],
+        )
+
+        self.buffer.push(RECENT_QUERIES_KIND, str(user_1.id), "query 2")
+        self.buffer.push(
+            RECENT_ITEMS_KIND,
+            str(user_2.id),
+            {"id": "slug", "type": RECENT_DEPARTMENT_TYPE},
+        )
+        self.buffer.push(
+            RECENT_ITEMS_KIND,
+            str(user_2.id),
+            {"id": 1, "type": RECENT_OFFICER_TYPE},
+            action=RECENT_HISTORY_REMOVE_ACTION,
+        )
+
+        self.buffer.flush()
+
+        user_1.refresh_from_db()
+        user_2.refresh_from_db()
+
+        assert user_1.recent_queries == ["query 2", "query 1"]
+        assert user_2.recent_items == [{"id": "slug", "type": RECENT_DEPARTMENT_TYPE}]
+
+    @patch(
+        (
+            "historical_data.services.recent_history_buffer."
+            "RECENT_HISTORY_FLUSH_BATCH_SIZE"
+        ),
+        2,
+    )
+    def test_flush_keeps_remaining_events(self):
+        for query in ["query 1", "query 2", "query 3"]:
+            self.buffer.push(RECENT_QUERIES_KIND, RECENT_HISTORY_ANONYMOUS_SCOPE, query)
+
+        assert self.buffer.flush() == 2
+        assert AnonymousQuery.objects.count() == 2
+        pending = self.buffer.get_pending(
+            RECENT_QUERIES_KIND, RECENT_HISTORY_ANONYMOUS_SCOPE
+        )
+        assert [event["value"] for event in pending] == ["query 3"]
+        assert self.redis.smembers(self.buffer.keys_key)
+
+        assert self.buffer.flush() == 1
+        assert AnonymousQuery.objects.count() == 3
+        assert self.buffer.flush() == 0
+
+    def test_flush_keeps_keys_when_saving_fails(self):
+        user = UserFactory()
+        self.buffer.push(RECENT_QUERIES_KIND, RECENT_HISTORY_ANONYMOUS_SCOPE, "query")
+        self.buffer.push(RECENT_QUERIES_KIND, str(user.id), "query")
+
+        with patch.object(
+            self.buffer, "save_user_histories", side_effect=Exception("Failed")
+        ):
+            with self.assertRaises(Exception):
+                self.buffer.flush()
+
+        assert not AnonymousQuery.objects.exists()
+        assert len(self.redis.smembers(self.buffer.keys_key)) == 2
+
+        assert self.buffer.flush() == 2
+        assert AnonymousQuery.objects.count() == 1
+        user.refresh_from_db()
+        assert user.recent_queries == ["query"]
+
+    def test_flush_skips_when_another_flush_is_running(self):
+        self.buffer.push(RECENT_QUERIES_KIND, RECENT_HISTORY_ANONYMOUS_SCOPE, "query")
+        self.redis.set(self.buffer.flush_lock_key, 1)
+
+        assert self.buffer.flush() == 0
+        assert not AnonymousQuery.objects.exists()
+
+        self.redis.delete(self.buffer.flush_lock_key)
+
+        assert self.buffer.flush() == 1
+        assert not self.redis.exists(self.buffer.flush_lock_key)
@@ -5,7 +5,9 @@ from django.urls import reverse
 
 from rest_framework import status
 
+from fakeredis import FakeRedis
 from freezegun import freeze_time
+from mock import patch
 
 from authentication.models import User
 from departments.factories import DepartmentFactory
@@ -18,13 +20,28 @@ from historical_data.constants import (
 )
 from historical_data.factories import AnonymousItemFactory, AnonymousQueryFactory
 from historical_data.models import AnonymousItem, AnonymousQuery
+from historical_data.services import RecentHistoryBuffer
 from news_articles.factories import NewsArticleFactory, NewsArticleSourceFactory
 from officers.factories import EventFactory, OfficerFactory
 from people.factories import PersonFactory
 from test_utils.auth_api_test_case import AuthAPITestCase
+from utils.count_data import compute_person_cards
 
 
 class HistoricalDataViewSetTestCase(AuthAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.redis = FakeRedis(decode_responses=True)
+        self.redis.flushall()
+
+        redis_patcher = patch(
+            "historical_data.services.recent_history_buffer.get_redis_client",
+            return_value=self.redis,
+        )
+        redis_patcher.start()
+        self.addCleanup(redis_patcher.stop)
+
     def test_recent_items(self):
         department_1 = DepartmentFactory(agency_name="Baton Rouge PD")
         department_2 = DepartmentFactory(agency_name="New Orleans PD")
@@ -159,6 +176,39 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert result == expected_data
 
+    def test_recent_items_num_queries(self):
+        department = DepartmentFactory()
+        officers = OfficerFactory.create_batch(3, department=department)
+        for officer in officers:
+            person = PersonFactory(canonical_officer=officer)
+            person.officers.add(officer)
+            EventFactory.create_batch(3, officer=officer, department=department)
+        documents = DocumentFactory.create_batch(3)
+        for document in documents:
+            document.departments.add(department)
+        news_articles = NewsArticleFactory.create_batch(3)
+
+        self.user.recent_items = [
+            {"type": RECENT_DEPARTMENT_TYPE, "id": department.agency_slug},
+            *[{"type": RECENT_OFFICER_TYPE, "id": officer.id} for officer in officers],
+            *[
+                {"type": RECENT_DOCUMENT_TYPE, "id": document.id}
+                for document in documents
+            ],
+            *[
+                {"type": RECENT_NEWS_ARTICLE_TYPE, "id": news_article.id}
+                for news_article in news_articles
+            ],
+        ]
+        self.user.save()
+        compute_person_cards()
+
+        with self.assertNumQueries(5):
+            response = self.auth_client.get(reverse("api:historical-data-recent-items"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 10
+
     def test_no_recent_items(self):
         response = self.auth_client.get(reverse("api:historical-data-recent-items"))
         result = response.data
@@ -203,6 +253,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
 
         result = response.data
 
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -246,6 +297,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
 
         result = response.data
 
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -287,6 +339,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
 
         result = response.data
 
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -307,6 +360,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
 
         result = response.data
 
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -345,6 +399,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         expected_data = {"detail": "deleted user recent item"}
 
         result = response.data
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -390,6 +445,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         expected_data = {"detail": "deleted user recent item"}
 
         result = response.data
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -435,6 +491,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         expected_data = {"detail": "deleted user recent item"}
 
         result = response.data
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -483,6 +540,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         expected_data = {"detail": "deleted user recent item"}
 
         result = response.data
+        RecentHistoryBuffer().flush()
         user = User.objects.first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -832,6 +890,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         expected_data = {"detail": "updated anonymous user recent items"}
 
         result = response.data
+        RecentHistoryBuffer().flush()
         latest_item = AnonymousItem.objects.order_by("-last_visited").first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -878,6 +937,7 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
         expected_data = {"detail": "updated anonymous user recent items"}
 
         result = response.data
+        RecentHistoryBuffer().flush()
         latest_item = AnonymousItem.objects.order_by("-last_visited").first()
 
         assert response.status_code == status.HTTP_200_OK
@@ -1018,11 +1078,13 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
             reverse("api:historical-data-recent-queries"), data, format="json"
         )
 
+        RecentHistoryBuffer().flush()
         latest_query = AnonymousQuery.objects.order_by("-last_visited").first()
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {"detail": "updated anonymous user recent queries"}
         assert latest_query.query == "query 2"
+        assert latest_query.visit_count == 2
 
     def test_update_recent_queries_not_existed_of_anonymous_user(self):
         with freeze_time("2021-09-03 8:00:00"):
@@ -1041,8 +1103,76 @@ class HistoricalDataViewSetTestCase(AuthAPITestCase):
             reverse("api:historical-data-recent-queries"), data, format="json"
         )
 
+        RecentHistoryBuffer().flush()
         latest_query = AnonymousQuery.objects.order_by("-last_visited").first()
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {"detail": "updated anonymous user recent queries"}
         assert latest_query.query == "query 4"
+        assert latest_query.visit_count == 1
+
+    def test_recent_queries_with_pending_queries(self):
+        self.user.recent_queries = ["query 2", "query 1"]
+        self.user.save()
+
+        for query in ["query 3", "query 1"]:
+            self.auth_client.post(
+                reverse("api:historical-data-recent-queries"),
+                {"q": query},
+                format="json",
+            )
+
+        response = self.auth_client.get(reverse("api:historical-data-recent-queries"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == ["query 1", "query 3", "query 2"]
+        assert User.objects.first().recent_queries == ["query 2", "query 1"]
+
+    def test_delete_pending_recent_item(self):
+        department = DepartmentFactory()
+        officer = OfficerFactory()
+
+        self.user.recent_items = [{"type": RECENT_OFFICER_TYPE, "id": officer.id}]
+        self.user.save()
+
+        data = {"type": RECENT_DEPARTMENT_TYPE, "id": department.agency_slug}
+
+        self.auth_client.post(
+            reverse("api:historical-data-recent-items"), data, format="json"
+        )
+
+        delete_url = reverse("api:historical-data-recent-items")
+        response = self.auth_client.delete(f"{delete_url}?{urlencode(data)}")
+
+        RecentHistoryBuffer().flush()
+        user = User.objects.first()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert user.recent_items == [{"type": RECENT_OFFICER_TYPE, "id": officer.id}]
+
+    def test_recent_queries_of_anonymous_user_with_pending_queries(self):
+        with freeze_time("2021-09-03 8:00:00"):
+            AnonymousQueryFactory(query="query 1")
+        with freeze_time("2021-09-03 9:00:00"):
+            AnonymousQueryFactory(query="query 2")
+
+        for query in ["query 3", "query 1", "query 3"]:
+            self.client.post(
+                reverse("api:historical-data-recent-queries"),
+                {"q": query},
+                format="json",
+            )
+
+        response = self.client.get(reverse("api:historical-data-recent-queries"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == ["query 3", "query 1", "query 2"]
+        assert AnonymousQuery.objects.count() == 2
+
+        RecentHistoryBuffer().flush()
+
+        response = self.client.get(reverse("api:historical-data-recent-queries"))
+
+        assert response.data == ["query 3", "query 1", "query 2"]
+        assert AnonymousQuery.objects.get(query="query 3").visit_count == 2
+        assert AnonymousQuery.objects.get(query="query 1").visit_count == 2
@@ -1,20 +1,29 @@
+from collections import defaultdict
+
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
-from departments.models import Department
-from documents.models import Document
 from historical_data.constants import (
     RECENT_DEPARTMENT_TYPE,
     RECENT_DOCUMENT_TYPE,
+    RECENT_HISTORY_LIMIT,
+    RECENT_HISTORY_REMOVE_ACTION,
+    RECENT_ITEMS_KIND,
     RECENT_NEWS_ARTICLE_TYPE,
     RECENT_OFFICER_TYPE,
+    RECENT_QUERIES_KIND,
 )
 from historical_data.models import AnonymousItem, AnonymousQuery
-from news_articles.models import NewsArticle
-from officers.models import Officer
+from historical_data.services import RecentHistoryBuffer
+from shared.queries import (
+    get_department_cards,
+    get_document_cards,
+    get_news_article_cards,
+    get_officer_cards,
+)
 from shared.serializers import (
     DepartmentSerializer,
     DocumentSerializer,
@@ -29,83 +38,81 @@ class HistoricalDataViewSet(ViewSet):
     @action(detail=False, methods=["get"], url_path="recent-items")
     def recent_items(self, request):
         user = request.user
+        recent_history_buffer = RecentHistoryBuffer()
+        scope = recent_history_buffer.get_scope(user)
 
         if not user.is_authenticated:
-            anonymous_items = AnonymousItem.objects.order_by("-last_visited")[:10]
+            anonymous_items = AnonymousItem.objects.order_by("-last_visited")[
+                :RECENT_HISTORY_LIMIT
+            ]
+            anonymous_items = recent_history_buffer.merge_pending(
+                RECENT_ITEMS_KIND,
+                scope,
+                [
+                    {"id": anonymous_item.item_id, "type": anonymous_item.item_type}
+                    for anonymous_item in anonymous_items
+                ],
+            )
             recent_items = [
                 {
-                    "id": int(anonymous_item.item_id)
-                    if anonymous_item.item_id.isdecimal()
-                    else anonymous_item.item_id,
-                    "type": anonymous_item.item_type,
+                    "id": int(anonymous_item["id"])
+                    if anonymous_item["id"].isdecimal()
+                    else anonymous_item["id"],
+                    "type": anonymous_item["type"],
                 }
                 for anonymous_item in anonymous_items
             ]
         else:
-            recent_items = user.recent_items
+            recent_items = recent_history_buffer.merge_pending(
+                RECENT_ITEMS_KIND, scope, user.recent_items
+            )
 
         recent_search_data = []
 
         if recent_items:
-            department_ids = []
-            officer_ids = []
-            document_ids = []
-            news_article_ids = []
-
-            ids_type_mapping = {
-                RECENT_DEPARTMENT_TYPE: department_ids,
-                RECENT_OFFICER_TYPE: officer_ids,
-                RECENT_DOCUMENT_TYPE: document_ids,
-                RECENT_NEWS_ARTICLE_TYPE: news_article_ids,
-            }
-
+            recent_ids = defaultdict(list)
             for recent_item in recent_items:
-                ids_type_mapping[recent_item["type"]].append(recent_item["id"])
-
-            departments = Department.objects.filter(agency_slug__in=department_ids)
-            officers = Officer.objects.prefetch_events().filter(id__in=officer_ids)
-            documents = Document.objects.prefetch_departments().filter(
-                id__in=document_ids
-            )
-            news_articles = NewsArticle.objects.prefetch_related("source").filter(
-                id__in=news_article_ids, is_hidden=False
-            )
-
-            recent_objects_mapping = {
-                RECENT_DEPARTMENT_TYPE: {
-                    "query": {
-                        department.agency_slug: department for department in departments
-                    },
-                    "serializer": DepartmentSerializer,
-                },
-                RECENT_OFFICER_TYPE: {
-                    "query": {officer.id: officer for officer in officers},
-                    "serializer": OfficerSerializer,
-                },
-                RECENT_DOCUMENT_TYPE: {
-                    "query": {document.id: document for document in documents},
-                    "serializer": DocumentSerializer,
-                },
-                RECENT_NEWS_ARTICLE_TYPE: {
-                    "query": {
-                        news_article.id: news_article for news_article in news_articles
-                    },
-                    "serializer": NewsArticleSerializer,
-                },
+                recent_ids[recent_item["type"]].append(recent_item["id"])
+
+            recent_cards_mapping = {
+                RECENT_DEPARTMENT_TYPE: (
+                    get_department_cards(),
+                    "agency_slug",
+                    DepartmentSerializer,
+                ),
+                RECENT_OFFICER_TYPE: (get_officer_cards(), "id", OfficerSerializer),
+                RECENT_DOCUMENT_TYPE: (get_document_cards(), "id", DocumentSerializer),
+                RECENT_NEWS_ARTICLE_TYPE: (
+                    get_news_article_cards().filter(is_hidden=False),
+                    "id",
+                    NewsArticleSerializer,
+                ),
             }
 
+            recent_cards = defaultdict(dict)
+            for item_type, (
+                queryset,
+                id_field,
+                serializer,
+            ) in recent_cards_mapping.items():
+                if not recent_ids[item_type]:
+                    continue
+
+                items = list(
+                    queryset.filter(**{f"{id_field}__in": recent_ids[item_type]})
+                )
+                recent_cards[item_type] = {
+                    getattr(item, id_field): item_data
+                    for item, item_data in zip(items, serializer(items, many=True).data)
+                }
+
             for recent_item in recent_items:
                 item_type = recent_item["type"]
-                recent_object = recent_objects_mapping.get(item_type)
-
                 item_id = recent_item.get("id")
-                item = recent_object["query"].get(item_id) if item_id else None
-
-                if item:
-                    recent_data = recent_object["serializer"](item).data
-                    recent_data["type"] = item_type
+                recent_data = recent_cards[item_type].get(item_id) if item_id else None
 
-                    recent_search_data.append(recent_data)
+                if recent_data:
+                    recent_search_data.append({**recent_data, "type": item_type})
 
         return Response(recent_search_data)
 
@@ -114,26 +121,17 @@ class HistoricalDataViewSet(ViewSet):
         recent_item = request.data
         new_item = {"id": recent_item.get("id"), "type": recent_item.get("type")}
         user = request.user
+        recent_history_buffer = RecentHistoryBuffer()
+        scope = recent_history_buffer.get_scope(user)
 
         if not user.is_authenticated:
-            item, created = AnonymousItem.objects.get_or_create(
-                item_id=new_item["id"], item_type=new_item["type"]
-            )
+            new_item["id"] = str(new_item["id"])
 
-            if not created:
-                item.save()
+        recent_history_buffer.push(RECENT_ITEMS_KIND, scope, new_item)
 
+        if not user.is_authenticated:
             return Response({"detail": "updated anonymous user recent items"})
 
-        recent_items = user.recent_items or []
-
-        if new_item in recent_items:
-            recent_items.remove(new_item)
-        recent_items.insert(0, new_item)
-
-        user.recent_items = recent_items[:10]
-        user.save()
-
         return Response({"detail": "updated user recent items"})
 
     @recent_items.mapping.delete
@@ -157,25 +155,37 @@ class HistoricalDataViewSet(ViewSet):
         }
 
         user = request.user
-        user_recent_items = user.recent_items or []
+        recent_history_buffer = RecentHistoryBuffer()
+        scope = recent_history_buffer.get_scope(user)
+        user_recent_items = recent_history_buffer.merge_pending(
+            RECENT_ITEMS_KIND, scope, user.recent_items
+        )
 
         if new_item not in user_recent_items:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        user_recent_items.remove(new_item)
-        user.save()
+        recent_history_buffer.push(
+            RECENT_ITEMS_KIND, scope, new_item, action=RECENT_HISTORY_REMOVE_ACTION
+        )
         return Response({"detail": "deleted user recent item"})
 
     @action(detail=False, methods=["get"], url_path="recent-queries")
     def recent_queries(self, request):
         user = request.user
+        recent_history_buffer = RecentHistoryBuffer()
 
         if not user.is_authenticated:
-            anonymous_queries = AnonymousQuery.objects.order_by("-last_visited")[:10]
+            anonymous_queries = AnonymousQuery.objects.order_by("-last_visited")[
+                :RECENT_HISTORY_LIMIT
+            ]
             recent_queries = [o.query for o in anonymous_queries]
         else:
             recent_queries = user.recent_queries
 
+        recent_queries = recent_history_buffer.merge_pending(
+            RECENT_QUERIES_KIND, recent_history_buffer.get_scope(user), recent_queries
+        )
+
         return Response(recent_queries)
 
     @recent_queries.mapping.post
@@ -183,21 +193,12 @@ class HistoricalDataViewSet(ViewSet):
         recent_query = request.data["q"]
 
         user = request.user
+        recent_history_buffer = RecentHistoryBuffer()
+        recent_history_buffer.push(
+            RECENT_QUERIES_KIND, recent_history_buffer.get_scope(user), recent_query
+        )
 
         if not user.is_authenticated:
-            query, created = AnonymousQuery.objects.get_or_create(query=recent_query)
-            if not created:
-                query.save()
-
             return Response({"detail": "updated anonymous user recent queries"})
 
-        user_recent_queries = user.recent_queries or []
-
-        if recent_query in user_recent_queries:
-            user_recent_queries.remove(recent_query)
-        user_recent_queries.insert(0, recent_query)
-
-        user.recent_queries = user_recent_queries[:10]
-        user.save()
-
         return Response({"detail": "updated user recent queries"})
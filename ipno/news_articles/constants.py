@@ -150,5 +150,8 @@ APP_NEWS_ARTICLE_NAMES = [
 ]
 
 NEWS_ARTICLES_LIMIT = 20
+NEWS_ARTICLES_BROWSE_ORDERING = ["-published_date", "-id"]
+
+NEWS_ARTICLE_PDF_BATCH_SIZE = 20
 
 NEWS_ARTICLE_OFFICER_WRGL_COLUMNS = ["uid", "officer_id", "newsarticle_id", "id"]
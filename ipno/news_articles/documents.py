@@ -1,15 +1,17 @@
+from collections import defaultdict
+
 from django.conf import settings
 
 from django_elasticsearch_dsl import fields
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch_dsl import SearchAsYouType
 
-from departments.models import Department
-from officers.models import Officer
+from shared.serializers.es_serializers import NewsArticlesESSerializer
 from utils.analyzers import autocomplete_analyzer, search_analyzer, text_analyzer
 from utils.es_doc import ESDoc
 from utils.es_index import ESIndex
 
-from .models import NewsArticle
+from .models import MatchedSentence, NewsArticle
 
 
 @registry.register_document
@@ -21,6 +23,17 @@ class NewsArticleESDoc(ESDoc):
         model = NewsArticle
         ignore_signals = True
 
+    search_serializer = NewsArticlesESSerializer
+
+    related_lookups = {
+        "news_articles.MatchedSentence": "matched_sentences__in",
+        "officers.Officer": "matched_sentences__officers__person__officers__in",
+        "people.Person": "matched_sentences__officers__person__in",
+        "departments.Department": (
+            "matched_sentences__officers__person__officers__department__in"
+        ),
+    }
+
     def get_queryset(self):
         return (
             self.django.model.objects.filter(matched_sentences__officers__isnull=False)
@@ -37,7 +50,9 @@ class NewsArticleESDoc(ESDoc):
     id = fields.IntegerField()
     published_date = fields.DateField()
     title = fields.TextField(
-        analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
+        analyzer=autocomplete_analyzer,
+        search_analyzer=search_analyzer,
+        fields={"prefix": SearchAsYouType()},
     )
     content = fields.TextField(analyzer=text_analyzer, search_analyzer=search_analyzer)
     author = fields.TextField(analyzer=text_analyzer, search_analyzer=search_analyzer)
@@ -46,13 +61,29 @@ class NewsArticleESDoc(ESDoc):
     )
     is_hidden = fields.BooleanField()
     department_slugs = fields.TextField()
+    search_result = fields.ObjectField(enabled=False)
 
     def prepare_source_name(self, instance):
         return instance.source.source_display_name if instance.source else ""
 
-    def prepare_department_slugs(self, instance):
-        matched_officers = instance.matched_sentences.all().values_list("officers")
-        officers = Officer.objects.filter(person__officers__in=matched_officers)
-        departments = Department.objects.filter(officers__in=officers).distinct()
+    def get_chunk_data(self, ids):
+        department_slugs = defaultdict(list)
+        article_departments = (
+            MatchedSentence.objects.filter(
+                article_id__in=ids,
+                officers__person__officers__department__isnull=False,
+            )
+            .values_list(
+                "article_id", "officers__person__officers__department__agency_slug"
+            )
+            .order_by("article_id", "officers__person__officers__department__id")
+            .distinct()
+        )
 
-        return [department.agency_slug for department in departments]
+        for article_id, agency_slug in article_departments:
+            department_slugs[article_id].append(agency_slug)
+
+        return {**super().get_chunk_data(ids), "department_slugs": department_slugs}
+
+    def prepare_department_slugs(self, instance):
+        return self.get_chunk_value("department_slugs", instance, [])
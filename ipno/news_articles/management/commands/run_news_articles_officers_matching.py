@@ -1,9 +1,13 @@
 from django.core.management import BaseCommand
 from django.utils import timezone
 
-from news_articles.services import ProcessExcludeArticleOfficer, ProcessMatchingArticle
+from news_articles.services import (
+    ProcessExcludeArticleOfficer,
+    ProcessMatchingArticle,
+    ProcessPublishableArticles,
+)
 from utils.cache_utils import flush_news_article_related_caches
-from utils.search_index import rebuild_search_index
+from utils.search_index import update_search_index, warm_search_cache
 
 
 class Command(BaseCommand):
@@ -13,7 +17,9 @@ class Command(BaseCommand):
         has_exclude_officer = ProcessExcludeArticleOfficer().process()
 
         if has_news_article or has_exclude_officer:
-            rebuild_search_index()
+            ProcessPublishableArticles().process()
+            update_search_index()
+            warm_search_cache()
 
         if has_news_article:
             flush_news_article_related_caches(start_time)
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.13 on 2026-10-19 16:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_articles', '0024_create_news_article_classification'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['published_date', 'id'], name='news_article_published_id_idx'),
+        ),
+    ]
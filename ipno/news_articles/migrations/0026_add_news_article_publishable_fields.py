@@ -0,0 +1,86 @@
+# Generated by Django 3.1.13 on 2026-10-19 16:56
+
+from django.db import migrations, models
+from django.db.models import Case, Exists, OuterRef, Q, When
+
+DEFAULT_NEWS_ARTICLE_THRESHOLD = 0.5
+
+
+def generate_publishable_data(apps, _):
+    AppValueConfig = apps.get_model("app_config", "AppValueConfig")
+    MatchedSentence = apps.get_model("news_articles", "MatchedSentence")
+    NewsArticle = apps.get_model("news_articles", "NewsArticle")
+    NewsArticleClassification = apps.get_model(
+        "news_articles", "NewsArticleClassification"
+    )
+
+    threshold_config = AppValueConfig.objects.filter(
+        name="NEWS_ARTICLE_THRESHOLD"
+    ).first()
+    threshold = float(
+        threshold_config.value if threshold_config else DEFAULT_NEWS_ARTICLE_THRESHOLD
+    )
+
+    matched_sentences = MatchedSentence.objects.filter(
+        article=OuterRef("id"), officers__isnull=False
+    )
+    classifications = NewsArticleClassification.objects.filter(
+        news_article=OuterRef("id")
+    )
+
+    NewsArticle.objects.update(
+        has_matched_officers=Exists(matched_sentences),
+        is_publishable=Case(
+            When(
+                Q(Exists(matched_sentences))
+                & (
+                    ~Exists(classifications)
+                    | Exists(classifications.filter(score__gte=threshold))
+                ),
+                then=True,
+            ),
+            default=False,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_config", "0007_allow_app_content_nullable"),
+        ("news_articles", "0025_add_news_article_published_date_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="newsarticle",
+            name="news_article_published_id_idx",
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="has_matched_officers",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="is_publishable",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="newsarticle",
+            index=models.Index(
+                condition=models.Q(("has_matched_officers", True), ("is_hidden", False)),
+                fields=["published_date", "id"],
+                name="news_article_matched_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newsarticle",
+            index=models.Index(
+                condition=models.Q(("is_hidden", False), ("is_publishable", True)),
+                fields=["published_date", "id"],
+                name="news_article_publishable_idx",
+            ),
+        ),
+        migrations.RunPython(generate_publishable_data, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 
 from utils.models import TimeStampsModel
 
@@ -14,6 +15,8 @@ class NewsArticle(TimeStampsModel):
     is_hidden = models.BooleanField(default=False)
 
     is_processed = models.BooleanField(default=False)
+    has_matched_officers = models.BooleanField(default=False)
+    is_publishable = models.BooleanField(default=False)
     source = models.ForeignKey(
         "news_articles.NewsArticleSource",
         null=True,
@@ -21,5 +24,19 @@ class NewsArticle(TimeStampsModel):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["published_date", "id"],
+                name="news_article_matched_idx",
+                condition=Q(has_matched_officers=True, is_hidden=False),
+            ),
+            models.Index(
+                fields=["published_date", "id"],
+                name="news_article_publishable_idx",
+                condition=Q(is_publishable=True, is_hidden=False),
+            ),
+        ]
+
     def __str__(self):
         return f'{self.title[:50]}{"..." if len(self.title) > 50 else ""}'
@@ -1,9 +1,11 @@
 from .process_exclude_article_officer import ProcessExcludeArticleOfficer
 from .process_matching_article import ProcessMatchingArticle
+from .process_publishable_articles import ProcessPublishableArticles
 from .process_rematch_officers import ProcessRematchOfficers
 
 __all__ = [
     "ProcessMatchingArticle",
     "ProcessExcludeArticleOfficer",
     "ProcessRematchOfficers",
+    "ProcessPublishableArticles",
 ]
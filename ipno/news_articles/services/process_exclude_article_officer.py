@@ -1,6 +1,7 @@
 from django.utils import timezone
 
-from news_articles.models import ExcludeOfficer, MatchedSentence
+from news_articles.models import ExcludeOfficer, MatchedSentence, NewsArticle
+from utils.search_index import record_search_index_changes
 
 
 class ProcessExcludeArticleOfficer:
@@ -30,6 +31,7 @@ class ProcessExcludeArticleOfficer:
         deleted_officers = self.last_run_exclude - self.latest_exclude_officers
         sentences = MatchedSentence.objects.all()
         updated_sents = False
+        updated_article_ids = set()
 
         for sent in sentences:
             common_inserted_officers = set(inserted_officers) & set(sent.officers.all())
@@ -39,16 +41,20 @@ class ProcessExcludeArticleOfficer:
 
             if common_inserted_officers:
                 updated_sents = True
+                updated_article_ids.add(sent.article_id)
                 sent.officers.remove(*common_inserted_officers)
                 sent.excluded_officers.add(*common_inserted_officers)
 
             if common_deleted_officers:
                 updated_sents = True
+                updated_article_ids.add(sent.article_id)
                 sent.excluded_officers.remove(*common_deleted_officers)
                 sent.officers.add(*common_deleted_officers)
 
             sent.save()
 
+        record_search_index_changes(NewsArticle, updated_article_ids)
+
         self.update_status()
         return updated_sents
 
@@ -11,11 +11,13 @@ from news_articles.models import (
 )
 from officers.models import Officer
 from utils.nlp import NLP
+from utils.search_index import record_search_index_changes
 
 
 class ProcessMatchingArticle:
     def __init__(self):
         self.start_time = timezone.now()
+        self.updated_article_ids = set()
         self.nlp = NLP()
         self.officers = self.get_officer_data()
         self.latest_keywords_obj = MatchingKeyword.objects.order_by(
@@ -53,6 +55,8 @@ class ProcessMatchingArticle:
 
         self.update_status()
 
+        record_search_index_changes(NewsArticle, self.updated_article_ids)
+
         MatchedSentenceOfficer = MatchedSentence.officers.through
         data = (
             MatchedSentenceOfficer.objects.order_by(
@@ -103,6 +107,7 @@ class ProcessMatchingArticle:
             extracted_keywords = set(sentence.extracted_keywords)
             remained_keywords = extracted_keywords - deleted_keywords
             sentence.extracted_keywords = list(remained_keywords)
+            self.updated_article_ids.add(sentence.article_id)
 
             if not remained_keywords:
                 sentence.delete()
@@ -135,6 +140,9 @@ class ProcessMatchingArticle:
                 old_matched_sentence.keys()
             )
 
+            if update_sentences or create_sentences:
+                self.updated_article_ids.add(article.id)
+
             for old_sentence in update_sentences:
                 matched_new_keywords = matched_sentences.get(old_sentence)
 
@@ -202,6 +210,9 @@ class ProcessMatchingArticle:
             article.is_processed = True
             article.save()
 
+            if matched_sentences:
+                self.updated_article_ids.add(article.id)
+
     def get_officer_data(self):
         officers = Officer.objects.all()
         officers_data = defaultdict(list)
@@ -0,0 +1,68 @@
+from django.db.models import Case, Exists, F, OuterRef, Q, When
+
+from app_config.constants import (
+    DEFAULT_NEWS_ARTICLE_THRESHOLD,
+    NEWS_ARTICLE_THRESHOLD_CONFIG,
+)
+from app_config.services import get_app_value_config
+from news_articles.models import MatchedSentence, NewsArticle, NewsArticleClassification
+
+
+class ProcessPublishableArticles:
+    def __init__(self, article_ids=None):
+        self.article_ids = article_ids
+        self.threshold = float(
+            get_app_value_config(
+                NEWS_ARTICLE_THRESHOLD_CONFIG, DEFAULT_NEWS_ARTICLE_THRESHOLD
+            )
+        )
+
+    def get_publishable_expressions(self):
+        matched_sentences = MatchedSentence.objects.filter(
+            article=OuterRef("id"), officers__isnull=False
+        )
+        classifications = NewsArticleClassification.objects.filter(
+            news_article=OuterRef("id")
+        )
+
+        has_matched_officers = Exists(matched_sentences)
+        is_publishable = Case(
+            When(
+                Q(has_matched_officers)
+                & (
+                    ~Exists(classifications)
+                    | Exists(classifications.filter(score__gte=self.threshold))
+                ),
+                then=True,
+            ),
+            default=False,
+        )
+
+        return {
+            "has_matched_officers": has_matched_officers,
+            "is_publishable": is_publishable,
+        }
+
+    def process(self):
+        articles = NewsArticle.objects.all()
+
+        if self.article_ids is not None:
+            articles = articles.filter(id__in=self.article_ids)
+
+        expressions = self.get_publishable_expressions()
+        changed_article_ids = list(
+            articles.annotate(
+                new_has_matched_officers=expressions["has_matched_officers"],
+                new_is_publishable=expressions["is_publishable"],
+            )
+            .exclude(
+                has_matched_officers=F("new_has_matched_officers"),
+                is_publishable=F("new_is_publishable"),
+            )
+            .values_list("id", flat=True)
+        )
+
+        if changed_article_ids:
+            NewsArticle.objects.filter(id__in=changed_article_ids).update(**expressions)
+
+        return len(changed_article_ids)
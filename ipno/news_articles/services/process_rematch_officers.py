@@ -4,9 +4,10 @@ from django.db.models import Q
 
 from tqdm import tqdm
 
-from news_articles.models import ExcludeOfficer, MatchedSentence
+from news_articles.models import ExcludeOfficer, MatchedSentence, NewsArticle
 from officers.models import Officer
 from utils.nlp import NLP
+from utils.search_index import record_search_index_changes
 
 
 class ProcessRematchOfficers:
@@ -28,6 +29,12 @@ class ProcessRematchOfficers:
 
     def get_updated_officers(self):
         updated_officers = Officer.objects.filter(is_name_changed=True)
+        record_search_index_changes(
+            NewsArticle,
+            NewsArticle.objects.filter(
+                matched_sentences__officers__in=updated_officers
+            ).values_list("id", flat=True),
+        )
         for officer in updated_officers:
             officer.matched_sentences.clear()
             officer.is_name_changed = False
@@ -46,6 +53,7 @@ class ProcessRematchOfficers:
     def process(self):
         if len(self.officers):
             matched_sentences = MatchedSentence.objects.all()
+            updated_article_ids = set()
 
             for matched_sentence in tqdm(
                 matched_sentences, desc="Match officers with existed sentences"
@@ -64,4 +72,9 @@ class ProcessRematchOfficers:
                 matched_sentence.excluded_officers.add(*exclude_matched_officers_obj)
                 matched_sentence.save()
 
+                if matched_officers:
+                    updated_article_ids.add(matched_sentence.article_id)
+
+            record_search_index_changes(NewsArticle, updated_article_ids)
+
         return False
@@ -3,6 +3,7 @@ import re
 from html import escape
 
 from django.conf import settings
+from django.db import transaction
 from django.utils.text import slugify
 
 import scrapy
@@ -16,6 +17,7 @@ from news_articles.constants import (
     CRAWL_STATUS_FINISHED,
     CRAWL_STATUS_OPENED,
     NEWS_ARTICLE_CLOUD_SPACES,
+    NEWS_ARTICLE_PDF_BATCH_SIZE,
     TAG_STYLE_MAPPINGS,
     UNPARSED_TAGS,
 )
@@ -26,7 +28,9 @@ from news_articles.models import (
     NewsArticle,
     NewsArticleSource,
 )
+from utils.constants import FILE_TYPES
 from utils.google_cloud import GoogleCloudService
+from utils.pdf_creator import build_pdfs, render_article_pdf
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +54,7 @@ class ScrapyRssSpider(scrapy.Spider):
     guid_post = ""
     guid_special_cases = []
     rss_has_content = False
+    unique_article_link = False
     custom_settings = {
         "LOG_LEVEL": "INFO",
         "USER_AGENT": (
@@ -60,6 +65,7 @@ class ScrapyRssSpider(scrapy.Spider):
 
     def __init__(self):
         self.gcloud = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
+        self.pending_articles = []
         if self.name:
             self.source = NewsArticleSource.objects.get(source_name=self.name)
 
@@ -74,6 +80,12 @@ class ScrapyRssSpider(scrapy.Spider):
     def spider_closed(self, spider, reason):
         crawler_log = CrawlerLog.objects.filter(source__source_name=spider.name).last()
 
+        try:
+            spider.flush_articles()
+        except Exception as e:
+            logger.error(f"Failed to flush pending articles: {e}")
+            crawler_log.status = CRAWL_STATUS_ERROR
+
         news_article_count = NewsArticle.objects.filter(
             source__source_name=spider.name, created_at__gte=crawler_log.created_at
         ).count()
@@ -168,6 +180,98 @@ class ScrapyRssSpider(scrapy.Spider):
         except Exception as e:
             logger.error(e)
 
+    def enqueue_article(self, article):
+        self.pending_articles.append(article)
+
+        if len(self.pending_articles) >= NEWS_ARTICLE_PDF_BATCH_SIZE:
+            self.flush_articles()
+
+    def save_article(self, article, uploaded_url):
+        article_data = {
+            "source": self.source,
+            "title": article["title"],
+            "content": article["text_content"],
+            "guid": article["guid"],
+            "author": article["author"],
+            "published_date": article["published_date"],
+            "url": uploaded_url,
+        }
+
+        with transaction.atomic():
+            if self.unique_article_link:
+                NewsArticle.objects.get_or_create(
+                    link=article["link"], defaults=article_data
+                )
+            else:
+                NewsArticle.objects.create(link=article["link"], **article_data)
+
+            CrawledPost.objects.create(source=self.source, post_guid=article["guid"])
+
+    def render_article_pdfs(self, articles):
+        pdf_articles = [
+            {
+                "title": article["title"],
+                "author": article["author"],
+                "date": article["published_date"],
+                "content": article["paragraphs"],
+                "link": article["link"],
+            }
+            for article in articles
+        ]
+
+        try:
+            return build_pdfs(pdf_articles)
+        except Exception as e:
+            logger.error(f"Failed to render article PDFs in batch: {e}")
+
+        rendered_pdfs = []
+        for pdf_article in pdf_articles:
+            try:
+                rendered_pdfs.append(render_article_pdf(pdf_article))
+            except Exception as e:
+                logger.error(
+                    f"Failed to render article PDF for {pdf_article['link']}: {e}"
+                )
+                rendered_pdfs.append((None, 0))
+
+        return rendered_pdfs
+
+    def store_article(self, article, pdf_buffer):
+        pdf_location = self.get_upload_pdf_location(
+            article["published_date"], article["title"]
+        )
+        uploaded_url = self.upload_file_to_gcloud(
+            pdf_buffer, pdf_location, FILE_TYPES["PDF"]
+        )
+
+        if not uploaded_url:
+            return
+
+        try:
+            self.save_article(article, uploaded_url)
+        except Exception:
+            self.gcloud.delete_file_from_url(pdf_location)
+            raise
+
+    def flush_articles(self):
+        articles, self.pending_articles = self.pending_articles, []
+
+        if not articles:
+            return
+
+        rendered_pdfs = self.render_article_pdfs(articles)
+
+        for article, (pdf_buffer, render_time) in zip(articles, rendered_pdfs):
+            logger.info(
+                f"Rendered article PDF for {article['link']} in "
+                f"{render_time * 1000:.1f} ms"
+            )
+
+            try:
+                self.store_article(article, pdf_buffer)
+            except Exception as e:
+                logger.error(f"Failed to store article {article['link']}: {e}")
+
     def parse_guid(self, guid):
         parsed_guid = guid.replace(self.guid_pre, "").replace(self.guid_post, "")
 
@@ -1,10 +1,7 @@
 from scrapy.loader import ItemLoader
 
 from news_articles.constants import CAPITALCITYNEWS_SOURCE
-from news_articles.models import CrawledPost, NewsArticle
 from news_articles.spiders.base_scrapy_rss import RSSItem, ScrapyRssSpider
-from utils.constants import FILE_TYPES
-from utils.pdf_creator import ArticlePdfCreator
 
 
 class CapitalCityNewsScrapyRssSpider(ScrapyRssSpider):
@@ -44,39 +41,16 @@ class CapitalCityNewsScrapyRssSpider(ScrapyRssSpider):
 
         paragraphs = [self.parse_section(content)]
 
-        save_crawled_post = True
-
         text_content = " ".join([paragraph["content"] for paragraph in paragraphs])
 
-        pdf_buffer = ArticlePdfCreator(
-            title=title,
-            author=author,
-            date=published_date,
-            content=paragraphs,
-            link=link,
-        ).build_pdf()
-
-        pdf_location = self.get_upload_pdf_location(published_date, title)
-
-        uploaded_url = self.upload_file_to_gcloud(
-            pdf_buffer, pdf_location, FILE_TYPES["PDF"]
+        self.enqueue_article(
+            {
+                "title": title,
+                "link": link,
+                "guid": guid,
+                "author": author,
+                "published_date": published_date,
+                "paragraphs": paragraphs,
+                "text_content": text_content,
+            }
         )
-
-        if uploaded_url:
-            news_article_data = NewsArticle(
-                source=self.source,
-                link=link,
-                title=title,
-                content=text_content,
-                guid=guid,
-                author=author,
-                published_date=published_date,
-                url=uploaded_url,
-            )
-            news_article_data.save()
-        else:
-            save_crawled_post = False
-
-        if save_crawled_post:
-            crawled_post = CrawledPost(source=self.source, post_guid=guid)
-            crawled_post.save()
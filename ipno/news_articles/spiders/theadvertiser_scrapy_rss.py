@@ -1,14 +1,12 @@
 from scrapy.loader import ItemLoader
 
 from news_articles.constants import THEADVERTISER_SOURCE
-from news_articles.models import CrawledPost, NewsArticle
 from news_articles.spiders.base_scrapy_rss import RSSItem, ScrapyRssSpider
-from utils.constants import FILE_TYPES
-from utils.pdf_creator import ArticlePdfCreator
 
 
 class DailyAdvertiserScrapyRssSpider(ScrapyRssSpider):
     name = THEADVERTISER_SOURCE
+    unique_article_link = True
     allowed_domains = [
         "theadvertiser.com",
         "thenewsstar.com",
@@ -49,43 +47,19 @@ class DailyAdvertiserScrapyRssSpider(ScrapyRssSpider):
         ).getall()
         paragraphs = self.parse_paragraphs(content_paragraphs)
 
-        save_crawled_post = True
-
         text_content = " ".join([paragraph["content"] for paragraph in paragraphs])
 
-        pdf_buffer = ArticlePdfCreator(
-            title=title,
-            author=author,
-            date=published_date,
-            content=paragraphs,
-            link=link,
-        ).build_pdf()
-
-        pdf_location = self.get_upload_pdf_location(published_date, title)
-
-        uploaded_url = self.upload_file_to_gcloud(
-            pdf_buffer, pdf_location, FILE_TYPES["PDF"]
+        self.enqueue_article(
+            {
+                "title": title,
+                "link": link,
+                "guid": guid,
+                "author": author,
+                "published_date": published_date,
+                "paragraphs": paragraphs,
+                "text_content": text_content,
+            }
         )
 
-        if uploaded_url:
-            NewsArticle.objects.get_or_create(
-                link=link,
-                defaults={
-                    "source": self.source,
-                    "title": title,
-                    "content": text_content,
-                    "guid": guid,
-                    "author": author,
-                    "published_date": published_date,
-                    "url": uploaded_url,
-                },
-            )
-        else:
-            save_crawled_post = False
-
-        if save_crawled_post:
-            crawled_post = CrawledPost(source=self.source, post_guid=guid)
-            crawled_post.save()
-
     def parse_guid(self, guid):
         return "-".join(guid.split("/")[-3:-1])
@@ -11,6 +11,12 @@ class CommandTestCase(TestCase):
     def setUp(self):
         self.command = Command()
 
+    @patch(
+        "news_articles.management.commands.run_news_articles_officers_matching.ProcessPublishableArticles.process"
+    )
+    @patch(
+        "news_articles.management.commands.run_news_articles_officers_matching.warm_search_cache"
+    )
     @patch(
         "news_articles.management.commands.run_news_articles_officers_matching.ProcessMatchingArticle.process"
     )
@@ -18,7 +24,7 @@ class CommandTestCase(TestCase):
         "news_articles.management.commands.run_news_articles_officers_matching.ProcessExcludeArticleOfficer.process"
     )
     @patch(
-        "news_articles.management.commands.run_news_articles_officers_matching.rebuild_search_index"
+        "news_articles.management.commands.run_news_articles_officers_matching.update_search_index"
     )
     @patch(
         "news_articles.management.commands.run_news_articles_officers_matching.flush_news_article_related_caches"
@@ -26,9 +32,11 @@ class CommandTestCase(TestCase):
     def test_handle(
         self,
         mock_flush_news_article_related_caches,
-        mock_rebuild_search_index,
+        mock_update_search_index,
         mock_matching_keywords_process,
         mock_process_exclude_article_officer,
+        mock_warm_search_cache,
+        mock_process_publishable_articles,
     ):
         mock_matching_keywords_process.return_value = True
         mock_process_exclude_article_officer.return_value = True
@@ -37,9 +45,17 @@ class CommandTestCase(TestCase):
 
         mock_matching_keywords_process.assert_called()
         mock_process_exclude_article_officer.assert_called()
-        mock_rebuild_search_index.assert_called()
+        mock_process_publishable_articles.assert_called()
+        mock_update_search_index.assert_called()
+        mock_warm_search_cache.assert_called()
         mock_flush_news_article_related_caches.assert_called()
 
+    @patch(
+        "news_articles.management.commands.run_news_articles_officers_matching.ProcessPublishableArticles.process"
+    )
+    @patch(
+        "news_articles.management.commands.run_news_articles_officers_matching.warm_search_cache"
+    )
     @patch(
         "news_articles.management.commands.run_news_articles_officers_matching.ProcessMatchingArticle.process"
     )
@@ -47,7 +63,7 @@ class CommandTestCase(TestCase):
         "news_articles.management.commands.run_news_articles_officers_matching.ProcessExcludeArticleOfficer.process"
     )
     @patch(
-        "news_articles.management.commands.run_news_articles_officers_matching.rebuild_search_index"
+        "news_articles.management.commands.run_news_articles_officers_matching.update_search_index"
     )
     @patch(
         "news_articles.management.commands.run_news_articles_officers_matching.flush_news_article_related_caches"
@@ -55,9 +71,11 @@ class CommandTestCase(TestCase):
     def test_handle_not_rebuild_index_and_flush_cache(
         self,
         mock_flush_news_article_related_caches,
-        mock_rebuild_search_index,
+        mock_update_search_index,
         mock_matching_keywords_process,
         mock_process_exclude_article_officer,
+        mock_warm_search_cache,
+        mock_process_publishable_articles,
     ):
         mock_matching_keywords_process.return_value = False
         mock_process_exclude_article_officer.return_value = False
@@ -66,5 +84,7 @@ class CommandTestCase(TestCase):
 
         mock_matching_keywords_process.assert_called()
         mock_process_exclude_article_officer.assert_called()
-        mock_rebuild_search_index.assert_not_called()
+        mock_process_publishable_articles.assert_not_called()
+        mock_update_search_index.assert_not_called()
+        mock_warm_search_cache.assert_not_called()
         mock_flush_news_article_related_caches.assert_not_called()
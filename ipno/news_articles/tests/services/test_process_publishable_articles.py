@@ -0,0 +1,84 @@
+from django.test import TestCase
+
+from app_config.factories import AppValueConfigFactory
+from news_articles.factories import NewsArticleFactory
+from news_articles.factories.matched_sentence_factory import MatchedSentenceFactory
+from news_articles.factories.news_article_classification_factory import (
+    NewsArticleClassificationFactory,
+)
+from news_articles.models import NewsArticle
+from news_articles.services import ProcessPublishableArticles
+from officers.factories import OfficerFactory
+
+
+class ProcessPublishableArticlesTestCase(TestCase):
+    def setUp(self):
+        AppValueConfigFactory(name="NEWS_ARTICLE_THRESHOLD", value="0.5")
+
+    def create_matched_article(self, score=None):
+        news_article = NewsArticleFactory()
+        matched_sentence = MatchedSentenceFactory(article=news_article)
+        matched_sentence.officers.add(OfficerFactory())
+
+        if score is not None:
+            NewsArticleClassificationFactory(
+                article_id=news_article.id,
+                news_article=news_article,
+                score=score,
+            )
+
+        return news_article
+
+    def test_process(self):
+        unclassified_article = self.create_matched_article()
+        relevant_article = self.create_matched_article(score=0.8)
+        irrelevant_article = self.create_matched_article(score=0.3)
+        unmatched_article = NewsArticleFactory()
+        MatchedSentenceFactory(article=unmatched_article)
+
+        assert ProcessPublishableArticles().process() == 3
+
+        flags = dict(NewsArticle.objects.values_list("id", "is_publishable"))
+        matched_ids = set(
+            NewsArticle.objects.filter(has_matched_officers=True).values_list(
+                "id", flat=True
+            )
+        )
+
+        assert matched_ids == {
+            unclassified_article.id,
+            relevant_article.id,
+            irrelevant_article.id,
+        }
+        assert flags == {
+            unclassified_article.id: True,
+            relevant_article.id: True,
+            irrelevant_article.id: False,
+            unmatched_article.id: False,
+        }
+        assert ProcessPublishableArticles().process() == 0
+
+    def test_process_with_article_ids(self):
+        news_article_1 = self.create_matched_article()
+        news_article_2 = self.create_matched_article()
+
+        assert ProcessPublishableArticles([news_article_1.id]).process() == 1
+
+        news_article_1.refresh_from_db()
+        news_article_2.refresh_from_db()
+
+        assert news_article_1.is_publishable
+        assert not news_article_2.is_publishable
+
+    def test_process_removed_matches(self):
+        news_article = self.create_matched_article()
+        ProcessPublishableArticles().process()
+
+        news_article.matched_sentences.all().delete()
+
+        assert ProcessPublishableArticles().process() == 1
+
+        news_article.refresh_from_db()
+
+        assert not news_article.has_matched_officers
+        assert not news_article.is_publishable
@@ -22,8 +22,9 @@ from news_articles.factories import (
     NewsArticleFactory,
     NewsArticleSourceFactory,
 )
-from news_articles.models import CrawlerError, CrawlerLog
+from news_articles.models import CrawledPost, CrawlerError, CrawlerLog, NewsArticle
 from news_articles.spiders import ScrapyRssSpider
+from utils.constants import FILE_TYPES
 
 
 class ScrapyRssSpiderTestCase(TestCase):
@@ -403,6 +404,134 @@ class ScrapyRssSpiderTestCase(TestCase):
         with self.assertRaises(NotImplementedError):
             self.spider.create_article("data")
 
+    def get_article(self, guid="guid"):
+        return {
+            "title": "title",
+            "link": f"link-{guid}",
+            "guid": guid,
+            "author": "author",
+            "published_date": datetime(2022, 1, 2).date(),
+            "paragraphs": [{"style": "BodyText", "content": "content"}],
+            "text_content": "content",
+        }
+
+    @patch("news_articles.spiders.base_scrapy_rss.NEWS_ARTICLE_PDF_BATCH_SIZE", 2)
+    def test_enqueue_article(self):
+        self.spider.flush_articles = Mock()
+
+        self.spider.enqueue_article(self.get_article("guid-1"))
+        self.spider.flush_articles.assert_not_called()
+
+        self.spider.enqueue_article(self.get_article("guid-2"))
+        self.spider.flush_articles.assert_called_once()
+        assert self.spider.pending_articles == [
+            self.get_article("guid-1"),
+            self.get_article("guid-2"),
+        ]
+
+    @patch("news_articles.spiders.base_scrapy_rss.build_pdfs")
+    def test_flush_articles(self, mock_build_pdfs):
+        mock_build_pdfs.return_value = [("pdf-1", 0.1), ("pdf-2", 0.2)]
+        self.spider.upload_file_to_gcloud = Mock(side_effect=["pdf_url.pdf", None])
+        self.spider.pending_articles = [
+            self.get_article("guid-1"),
+            self.get_article("guid-2"),
+        ]
+
+        self.spider.flush_articles()
+
+        mock_build_pdfs.assert_called_with(
+            [
+                {
+                    "title": "title",
+                    "author": "author",
+                    "date": datetime(2022, 1, 2).date(),
+                    "content": [{"style": "BodyText", "content": "content"}],
+                    "link": f"link-{guid}",
+                }
+                for guid in ["guid-1", "guid-2"]
+            ]
+        )
+        pdf_location = self.spider.get_upload_pdf_location(
+            datetime(2022, 1, 2).date(), "title"
+        )
+        self.spider.upload_file_to_gcloud.assert_has_calls(
+            [
+                call("pdf-1", pdf_location, FILE_TYPES["PDF"]),
+                call("pdf-2", pdf_location, FILE_TYPES["PDF"]),
+            ]
+        )
+        assert self.spider.pending_articles == []
+
+        news_article = NewsArticle.objects.get()
+        assert news_article.source == self.source
+        assert news_article.link == "link-guid-1"
+        assert news_article.title == "title"
+        assert news_article.content == "content"
+        assert news_article.guid == "guid-1"
+        assert news_article.author == "author"
+        assert news_article.published_date == datetime(2022, 1, 2).date()
+        assert news_article.url == "pdf_url.pdf"
+
+        crawled_post = CrawledPost.objects.get()
+        assert crawled_post.source == self.source
+        assert crawled_post.post_guid == "guid-1"
+
+    @patch("news_articles.spiders.base_scrapy_rss.build_pdfs")
+    def test_flush_articles_without_pending_articles(self, mock_build_pdfs):
+        self.spider.flush_articles()
+
+        mock_build_pdfs.assert_not_called()
+
+    @patch("news_articles.spiders.base_scrapy_rss.logger.error")
+    @patch("news_articles.spiders.base_scrapy_rss.render_article_pdf")
+    @patch("news_articles.spiders.base_scrapy_rss.build_pdfs")
+    def test_flush_articles_isolates_failures(
+        self, mock_build_pdfs, mock_render_article_pdf, mock_logger_error
+    ):
+        mock_build_pdfs.side_effect = Exception("broken process pool")
+        mock_render_article_pdf.side_effect = [("pdf-1", 0.1), ("pdf-2", 0.2)]
+        self.spider.upload_file_to_gcloud = Mock(
+            side_effect=["pdf_url_1.pdf", "pdf_url_2.pdf"]
+        )
+        self.spider.save_article = Mock(side_effect=[Exception("duplicated"), None])
+        self.spider.pending_articles = [
+            self.get_article("guid-1"),
+            self.get_article("guid-2"),
+        ]
+
+        self.spider.flush_articles()
+
+        assert mock_render_article_pdf.call_count == 2
+        self.spider.save_article.assert_has_calls(
+            [
+                call(self.get_article("guid-1"), "pdf_url_1.pdf"),
+                call(self.get_article("guid-2"), "pdf_url_2.pdf"),
+            ]
+        )
+        self.spider.gcloud.delete_file_from_url.assert_called_once_with(
+            self.spider.get_upload_pdf_location(datetime(2022, 1, 2).date(), "title")
+        )
+        assert mock_logger_error.call_count == 2
+
+    @patch("news_articles.spiders.base_scrapy_rss.logger.error")
+    def test_spider_closed_when_flush_articles_fails(self, mock_logger_error):
+        CrawlerLogFactory(source=self.spider.source, status=CRAWL_STATUS_OPENED)
+        self.spider.flush_articles = Mock(side_effect=Exception("flush error"))
+
+        self.spider.spider_closed(self.spider, "reason")
+
+        mock_logger_error.assert_called_once()
+        assert CrawlerLog.objects.get().status == CRAWL_STATUS_ERROR
+
+    def test_spider_closed_flush_articles(self):
+        CrawlerLogFactory(source=self.spider.source, status=CRAWL_STATUS_OPENED)
+        self.spider.flush_articles = Mock()
+
+        self.spider.spider_closed(self.spider, "reason")
+
+        self.spider.flush_articles.assert_called()
+
     def test_remove_by_in_author(self):
         result_1 = self.spider.remove_by_in_author("By tester")
         result_2 = self.spider.remove_by_in_author("Not by tester")
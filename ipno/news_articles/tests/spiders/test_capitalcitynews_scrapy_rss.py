@@ -9,10 +9,8 @@ from scrapy.http import Request, XmlResponse
 
 from news_articles.constants import CAPITALCITYNEWS_SOURCE
 from news_articles.factories import NewsArticleSourceFactory
-from news_articles.models import CrawledPost, NewsArticle
 from news_articles.spiders import CapitalCityNewsScrapyRssSpider
 from officers.factories import OfficerFactory
-from utils.constants import FILE_TYPES
 
 
 class CapitalCityNewsScrapyRssSpiderTestCase(TestCase):
@@ -90,15 +88,9 @@ class CapitalCityNewsScrapyRssSpiderTestCase(TestCase):
         mock_item_loader_instance.add_xpath.assert_has_calls(add_xpath_calls_expected)
         mock_item_loader_instance.load_item.assert_called()
 
-    @patch("news_articles.spiders.capitalcitynews_scrapy_rss.ArticlePdfCreator")
-    def test_create_article(self, mock_article_pdf_creator):
+    def test_create_article(self):
         officer = OfficerFactory()
 
-        mock_adc_instance = MagicMock()
-        mocked_pdf_built = "pdf-buffer"
-        mock_adc_instance.build_pdf.return_value = mocked_pdf_built
-        mock_article_pdf_creator.return_value = mock_adc_instance
-
         published_date = datetime.now().date()
         article_data = {
             "title": "response title",
@@ -118,12 +110,8 @@ class CapitalCityNewsScrapyRssSpiderTestCase(TestCase):
         mock_parse_section.return_value = mocked_section
         self.spider.parse_section = mock_parse_section
 
-        mocked_pdf_location = "pdf_location.pdf"
-        mock_get_upload_pdf_location = Mock(return_value=mocked_pdf_location)
-        self.spider.get_upload_pdf_location = mock_get_upload_pdf_location
-
-        mock_upload_file_to_gcloud = Mock(return_value="pdf_url.pdf")
-        self.spider.upload_file_to_gcloud = mock_upload_file_to_gcloud
+        mock_enqueue_article = Mock()
+        self.spider.enqueue_article = mock_enqueue_article
 
         officers_data = defaultdict(list)
         officers_data[officer.name].append(officer.id)
@@ -134,104 +122,14 @@ class CapitalCityNewsScrapyRssSpiderTestCase(TestCase):
 
         mock_parse_section.assert_called_with("body content")
 
-        mock_article_pdf_creator.assert_called_with(
-            title="response title",
-            author="response author",
-            date=published_date,
-            content=[mocked_section],
-            link="response link",
-        )
-
-        mock_get_upload_pdf_location.assert_called_with(
-            published_date, "response title"
+        mock_enqueue_article.assert_called_with(
+            {
+                "title": "response title",
+                "link": "response link",
+                "guid": "response guid",
+                "author": "response author",
+                "published_date": published_date,
+                "paragraphs": [mocked_section],
+                "text_content": "body content",
+            }
         )
-
-        mock_upload_file_to_gcloud.assert_called_with(
-            mocked_pdf_built, mocked_pdf_location, FILE_TYPES["PDF"]
-        )
-
-        new_article = NewsArticle.objects.first()
-        assert new_article.source.source_name == "capitalcitynews"
-        assert new_article.link == "response link"
-        assert new_article.title == "response title"
-        assert new_article.content == "body content"
-        assert new_article.guid == "response guid"
-        assert new_article.author == "response author"
-        assert new_article.published_date == published_date
-        assert new_article.url == "pdf_url.pdf"
-
-        count_news_article = NewsArticle.objects.count()
-        assert count_news_article == 1
-
-        crawled_post = CrawledPost.objects.first()
-        assert crawled_post.source.source_name == "capitalcitynews"
-        assert crawled_post.post_guid == "response guid"
-
-        count_crawled_post = CrawledPost.objects.count()
-        assert count_crawled_post == 1
-
-    @patch("news_articles.spiders.capitalcitynews_scrapy_rss.ArticlePdfCreator")
-    def test_create_article_not_upload_file(self, mock_article_pdf_creator):
-        officer = OfficerFactory()
-
-        mock_adc_instance = MagicMock()
-        mocked_pdf_built = "pdf-buffer"
-        mock_adc_instance.build_pdf.return_value = mocked_pdf_built
-        mock_article_pdf_creator.return_value = mock_adc_instance
-
-        published_date = datetime.now().date()
-        article_data = {
-            "title": "response title",
-            "link": "response link",
-            "guid": "response guid",
-            "author": "response author",
-            "published_date": published_date,
-            "content": "body content",
-        }
-
-        mock_parse_section = Mock()
-        mocked_section = {
-            "style": "BodyText",
-            "content": "body content",
-        }
-
-        mock_parse_section.return_value = mocked_section
-        self.spider.parse_section = mock_parse_section
-
-        mocked_pdf_location = "pdf_location.pdf"
-        mock_get_upload_pdf_location = Mock(return_value=mocked_pdf_location)
-        self.spider.get_upload_pdf_location = mock_get_upload_pdf_location
-
-        mock_upload_file_to_gcloud = Mock(return_value="")
-        self.spider.upload_file_to_gcloud = mock_upload_file_to_gcloud
-
-        officers_data = defaultdict(list)
-        officers_data[officer.name].append(officer.id)
-
-        self.spider.officers = officers_data
-
-        self.spider.create_article(article_data)
-
-        mock_parse_section.assert_called_with("body content")
-
-        mock_article_pdf_creator.assert_called_with(
-            title="response title",
-            author="response author",
-            date=published_date,
-            content=[mocked_section],
-            link="response link",
-        )
-
-        mock_get_upload_pdf_location.assert_called_with(
-            published_date, "response title"
-        )
-
-        mock_upload_file_to_gcloud.assert_called_with(
-            mocked_pdf_built, mocked_pdf_location, FILE_TYPES["PDF"]
-        )
-
-        count_news_article = NewsArticle.objects.count()
-        assert count_news_article == 0
-
-        count_crawled_post = CrawledPost.objects.count()
-        assert count_crawled_post == 0
@@ -0,0 +1,49 @@
+from django.test.testcases import TestCase
+
+from departments.factories import DepartmentFactory
+from news_articles.documents import NewsArticleESDoc
+from news_articles.factories import NewsArticleFactory
+from news_articles.factories.matched_sentence_factory import MatchedSentenceFactory
+from officers.factories import OfficerFactory
+from people.factories import PersonFactory
+
+
+class NewsArticleESDocTestCase(TestCase):
+    def test_get_chunk_data(self):
+        department_1 = DepartmentFactory()
+        department_2 = DepartmentFactory()
+        department_3 = DepartmentFactory()
+        officer_1 = OfficerFactory(department=department_1)
+        officer_2 = OfficerFactory(department=department_2)
+        officer_3 = OfficerFactory(department=department_3)
+        person = PersonFactory(canonical_officer=officer_1)
+        person.officers.add(officer_1, officer_2)
+        other_person = PersonFactory(canonical_officer=officer_3)
+        other_person.officers.add(officer_3)
+
+        news_article_1 = NewsArticleFactory()
+        matched_sentence_1 = MatchedSentenceFactory(article=news_article_1)
+        matched_sentence_1.officers.add(officer_1)
+        news_article_2 = NewsArticleFactory()
+        matched_sentence_2 = MatchedSentenceFactory(article=news_article_2)
+        matched_sentence_2.officers.add(officer_3)
+        news_article_3 = NewsArticleFactory()
+
+        es_doc = NewsArticleESDoc()
+
+        with self.assertNumQueries(2):
+            es_doc.chunk_data = es_doc.get_chunk_data(
+                [news_article_1.id, news_article_2.id, news_article_3.id]
+            )
+
+        assert es_doc.prepare_department_slugs(news_article_1) == [
+            department_1.agency_slug,
+            department_2.agency_slug,
+        ]
+        assert es_doc.prepare_department_slugs(news_article_2) == [
+            department_3.agency_slug
+        ]
+        assert es_doc.prepare_department_slugs(news_article_3) == []
+        assert es_doc.prepare_search_result(news_article_1)["title"] == (
+            news_article_1.title
+        )
@@ -13,6 +13,7 @@ from news_articles.factories.matched_sentence_factory import MatchedSentenceFact
 from news_articles.factories.news_article_classification_factory import (
     NewsArticleClassificationFactory,
 )
+from news_articles.services import ProcessPublishableArticles
 from officers.factories import OfficerFactory
 from test_utils.auth_api_test_case import AuthAPITestCase
 from utils.search_index import rebuild_search_index
@@ -78,6 +79,8 @@ class NewsArticlesViewSetTestCase(AuthAPITestCase):
             relevant="not_relevant",
         )
 
+        ProcessPublishableArticles().process()
+
         response = self.client.get(reverse("api:news-articles-list"))
         assert response.status_code == status.HTTP_200_OK
 
@@ -167,6 +170,8 @@ class NewsArticlesViewSetTestCase(AuthAPITestCase):
             relevant="not_relevant",
         )
 
+        ProcessPublishableArticles().process()
+
         response = self.admin_client.get(reverse("api:news-articles-list"))
         assert response.status_code == status.HTTP_200_OK
 
@@ -207,6 +212,81 @@ class NewsArticlesViewSetTestCase(AuthAPITestCase):
 
         assert response.data == expected_data
 
+    def test_browse_success(self):
+        create_app_config = APP_CONFIG[2]
+
+        AppValueConfigFactory(
+            name=create_app_config["name"],
+            value=create_app_config["value"],
+            description=create_app_config["description"],
+        )
+
+        officer = OfficerFactory()
+        news_article_1 = NewsArticleFactory()
+        news_article_2 = NewsArticleFactory(
+            published_date=news_article_1.published_date - datetime.timedelta(days=1),
+        )
+        news_article_3 = NewsArticleFactory(
+            published_date=news_article_1.published_date - datetime.timedelta(days=1),
+        )
+        news_article_4 = NewsArticleFactory(
+            published_date=news_article_1.published_date - datetime.timedelta(days=2),
+        )
+        news_article_5 = NewsArticleFactory(is_hidden=True)
+        NewsArticleFactory()
+
+        for news_article in [
+            news_article_1,
+            news_article_2,
+            news_article_3,
+            news_article_4,
+            news_article_5,
+        ]:
+            matched_sentence = MatchedSentenceFactory(article=news_article)
+            matched_sentence.officers.add(officer)
+
+        NewsArticleClassificationFactory(
+            article_id=news_article_2.id,
+            news_article=news_article_2,
+            score=0.8,
+            relevant="relevant",
+        )
+        NewsArticleClassificationFactory(
+            article_id=news_article_4.id,
+            news_article=news_article_4,
+            score=0.4,
+            relevant="not_relevant",
+        )
+
+        ProcessPublishableArticles().process()
+
+        response = self.client.get(reverse("api:news-articles-browse"), {"limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [
+            news_article_1.id,
+            news_article_3.id,
+        ]
+        assert response.data["previous"] is None
+
+        response = self.client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [news_article_2.id]
+        assert response.data["next"] is None
+
+        response = self.admin_client.get(
+            reverse("api:news-articles-browse"), {"limit": 5}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [
+            news_article_1.id,
+            news_article_3.id,
+            news_article_2.id,
+            news_article_4.id,
+        ]
+
     @patch("news_articles.views.flush_news_article_related_caches")
     def test_hide_success(self, mock_flush_news_article_related_caches):
         officer = OfficerFactory()
@@ -1,4 +1,3 @@
-from django.db.models import Q
 from django.shortcuts import get_object_or_404
 
 from rest_framework import viewsets
@@ -6,51 +5,42 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
-from app_config.models import AppValueConfig
-from news_articles.constants import NEWS_ARTICLES_LIMIT
+from news_articles.constants import NEWS_ARTICLES_BROWSE_ORDERING, NEWS_ARTICLES_LIMIT
 from news_articles.documents import NewsArticleESDoc
 from news_articles.models import NewsArticle
+from shared.queries import get_news_article_cards
 from shared.serializers import NewsArticleSerializer
 from utils.cache_utils import flush_news_article_related_caches
+from utils.keyset_pagination import KeysetPagination
 
 
 class NewsArticlesViewSet(viewsets.ViewSet):
-    def list(self, request):
+    def get_publishable_articles(self, request):
         if not request.user.is_anonymous and request.user.is_admin:
-            news_articles = (
-                NewsArticle.objects.select_related("source")
-                .filter(
-                    matched_sentences__officers__isnull=False,
-                    is_hidden=False,
-                )
-                .order_by(
-                    "-published_date",
-                )
-                .distinct()[:NEWS_ARTICLES_LIMIT]
-            )
-        else:
-            threshold = float(
-                AppValueConfig.objects.get(name="NEWS_ARTICLE_THRESHOLD").value
+            return get_news_article_cards().filter(
+                has_matched_officers=True, is_hidden=False
             )
 
-            news_articles = (
-                NewsArticle.objects.select_related("source")
-                .prefetch_related("news_article_classifications")
-                .filter(
-                    Q(matched_sentences__officers__isnull=False),
-                    Q(is_hidden=False),
-                    Q(news_article_classifications__isnull=True)
-                    | Q(news_article_classifications__score__gte=threshold),
-                )
-                .order_by(
-                    "-published_date",
-                )
-                .distinct()[:NEWS_ARTICLES_LIMIT]
-            )
+        return get_news_article_cards().filter(is_publishable=True, is_hidden=False)
+
+    def list(self, request):
+        news_articles = self.get_publishable_articles(request).order_by(
+            "-published_date", "-id"
+        )[:NEWS_ARTICLES_LIMIT]
 
         serializer = NewsArticleSerializer(news_articles, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"], url_path="browse")
+    def browse(self, request):
+        news_articles = self.get_publishable_articles(request)
+
+        paginator = KeysetPagination(NEWS_ARTICLES_BROWSE_ORDERING)
+        page = paginator.paginate_queryset(news_articles, request)
+
+        serializer = NewsArticleSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
     @action(detail=True, methods=["post"], permission_classes=[IsAdminUser])
     def hide(self, request, pk=None):
         queryset = NewsArticle.objects.all()
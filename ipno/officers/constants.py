@@ -1,4 +1,5 @@
 OFFICERS_LIMIT = 20
+OFFICERS_BROWSE_ORDERING = ["-all_complaints_count", "-id"]
 
 JOINED_TIMELINE_KIND = "JOINED"
 LEFT_TIMELINE_KIND = "LEFT"
@@ -17,6 +18,21 @@ PC_12_QUALIFICATION_TIMELINE_KIND = "PC_12_QUALIFICATION"
 BRADY_LIST_TIMELINE_KIND = "BRADY_LIST"
 POST_DECERTIFICATION_TIMELINE_KIND = "POST_DECERTIFICATION"
 
+LEFT_REASON_TERMINATED = "terminated"
+LEFT_REASON_RESIGNED = "resigned"
+
+LEFT_REASON_CATEGORIES = (
+    (LEFT_REASON_TERMINATED, "Terminated"),
+    (LEFT_REASON_RESIGNED, "Resigned"),
+)
+
+LEFT_REASON_CATEGORY_PATTERNS = {
+    LEFT_REASON_TERMINATED: "terminat",
+    LEFT_REASON_RESIGNED: "resign",
+}
+
+LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY = "left_reason_vocabulary_version"
+
 OFFICER_LEVEL_1_CERT = "officer_level_1_cert"
 OFFICER_PC_12_QUALIFICATION = "officer_pc_12_qualification"
 OFFICER_POST_DECERTIFICATION = "officer_post_decertification"
@@ -199,3 +215,6 @@ EVENT_KINDS = [
     AWARD_RECEIVE,
     BRADY_LIST,
 ]
+
+OFFICER_DATAFILE_CHUNK_SIZE = 2000
+OFFICER_DATAFILE_EXPORT_PATH = "exports/officers"
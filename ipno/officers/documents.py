@@ -1,13 +1,18 @@
+from collections import defaultdict
+
 from django.conf import settings
+from django.db.models import F
 
 from django_elasticsearch_dsl import fields
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch_dsl import SearchAsYouType
 
+from search.serializers.es_serializers import OfficersESSerializer
 from utils.analyzers import autocomplete_analyzer, search_analyzer
 from utils.es_doc import ESDoc
 from utils.es_index import ESIndex
 
-from .models import Officer
+from .models import Event, Officer
 
 
 @registry.register_document
@@ -19,6 +24,14 @@ class OfficerESDoc(ESDoc):
         model = Officer
         ignore_signals = True
 
+    search_serializer = OfficersESSerializer
+
+    related_lookups = {
+        "departments.Department": "department__in",
+        "people.Person": "person__in",
+        "officers.Event": "events__in",
+    }
+
     def get_indexing_queryset(self):
         return (
             self.get_queryset()
@@ -28,8 +41,11 @@ class OfficerESDoc(ESDoc):
 
     id = fields.IntegerField()
     name = fields.TextField(
-        analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
+        analyzer=autocomplete_analyzer,
+        search_analyzer=search_analyzer,
+        fields={"prefix": SearchAsYouType()},
     )
+    name_suggest = fields.CompletionField()
     badges = fields.TextField()
     department_name = fields.TextField(
         analyzer=autocomplete_analyzer, search_analyzer=search_analyzer
@@ -41,6 +57,36 @@ class OfficerESDoc(ESDoc):
         )
     )
     complaint_fraction = fields.FloatField()
+    search_result = fields.ObjectField(enabled=False)
+
+    @staticmethod
+    def get_badges(officer_ids):
+        badges = defaultdict(list)
+        events = (
+            Event.objects.filter(officer_id__in=officer_ids, badge_no__isnull=False)
+            .exclude(badge_no="")
+            .order_by(
+                F("year").desc(nulls_last=True),
+                F("month").desc(nulls_last=True),
+                F("day").desc(nulls_last=True),
+            )
+            .values_list("officer_id", "badge_no")
+        )
+
+        for officer_id, badge_no in events:
+            if badge_no not in badges[officer_id]:
+                badges[officer_id].append(badge_no)
+
+        return badges
+
+    def get_chunk_data(self, ids):
+        return {**super().get_chunk_data(ids), "badges": self.get_badges(ids)}
+
+    def prepare_name_suggest(self, instance):
+        return {"input": [instance.name, *(instance.aliases or [])]}
+
+    def prepare_badges(self, instance):
+        return self.get_chunk_value("badges", instance, [])
 
     def prepare_department_name(self, instance):
         return instance.department.agency_name if instance.department else None
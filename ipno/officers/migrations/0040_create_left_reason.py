@@ -0,0 +1,42 @@
+# Generated by Django 3.1.13 on 2026-10-19 15:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("officers", "0039_add_brady_to_event"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeftReason",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("left_reason", models.CharField(max_length=255)),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("terminated", "Terminated"),
+                            ("resigned", "Resigned"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("left_reason", "category")},
+            },
+        ),
+    ]
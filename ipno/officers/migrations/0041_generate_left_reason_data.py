@@ -0,0 +1,36 @@
+from django.db import migrations
+
+LEFT_REASON_CATEGORY_PATTERNS = {
+    "terminated": "terminat",
+    "resigned": "resign",
+}
+
+
+def generate_left_reason_data(apps, _):
+    Event = apps.get_model("officers", "Event")
+    LeftReason = apps.get_model("officers", "LeftReason")
+
+    left_reasons = {
+        (left_reason, category)
+        for category, pattern in LEFT_REASON_CATEGORY_PATTERNS.items()
+        for left_reason in Event.objects.filter(left_reason__icontains=pattern)
+        .values_list("left_reason", flat=True)
+        .distinct()
+    }
+
+    LeftReason.objects.bulk_create(
+        [
+            LeftReason(left_reason=left_reason, category=category)
+            for left_reason, category in left_reasons
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("officers", "0040_create_left_reason"),
+    ]
+
+    operations = [
+        migrations.RunPython(generate_left_reason_data, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,9 @@
 from .event import Event
+from .left_reason import LeftReason
 from .officer import Officer
 
 __all__ = [
     "Officer",
     "Event",
+    "LeftReason",
 ]
@@ -0,0 +1,15 @@
+from django.db import models
+
+from officers.constants import LEFT_REASON_CATEGORIES
+from utils.models import TimeStampsModel
+
+
+class LeftReason(TimeStampsModel):
+    left_reason = models.CharField(max_length=255)
+    category = models.CharField(max_length=32, choices=LEFT_REASON_CATEGORIES)
+
+    class Meta:
+        unique_together = ("left_reason", "category")
+
+    def __str__(self):
+        return f"{self.category} - {self.left_reason}"
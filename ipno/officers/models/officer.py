@@ -1,8 +1,20 @@
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
-from django.db.models import F, Prefetch
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce, ExtractYear
 from django.utils.functional import cached_property
 
+from complaints.constants import ALLEGATION_DISPOSITION_SUSTAINED
 from officers.models.event import Event
 from utils.models import APITemplateModel, TimeStampsModel
 
@@ -21,6 +33,80 @@ class OfficerManager(models.Manager):
             *other_prefetches,
         )
 
+    def annotate_person_aggregates(self):
+        DocumentOfficer = self.model.documents.through
+        MatchedSentenceOfficer = self.model.matched_sentences.through
+        ComplaintOfficer = self.model.complaints.through
+        ComplaintEvent = Event.complaints.through
+
+        def person_aggregate(queryset, person_field, aggregate):
+            return Subquery(
+                queryset.filter(**{person_field: OuterRef("person")})
+                .order_by()
+                .values(person_field)
+                .annotate(aggregate=aggregate)
+                .values("aggregate")
+            )
+
+        complaint_events = Event.objects.filter(
+            Exists(ComplaintEvent.objects.filter(event=OuterRef("pk"))),
+            year__isnull=False,
+        )
+
+        return self.get_queryset().annotate(
+            person_documents_count=Coalesce(
+                person_aggregate(
+                    DocumentOfficer.objects, "officer__person", Count("id")
+                ),
+                Value(0),
+            ),
+            person_documents_years=person_aggregate(
+                DocumentOfficer.objects.filter(document__year__isnull=False),
+                "officer__person",
+                ArrayAgg("document__year", distinct=True),
+            ),
+            person_articles_count=Coalesce(
+                person_aggregate(
+                    MatchedSentenceOfficer.objects,
+                    "officer__person",
+                    Count("matchedsentence__article", distinct=True),
+                ),
+                Value(0),
+            ),
+            person_articles_years=person_aggregate(
+                MatchedSentenceOfficer.objects,
+                "officer__person",
+                ArrayAgg(
+                    Cast(
+                        ExtractYear("matchedsentence__article__published_date"),
+                        output_field=IntegerField(),
+                    ),
+                    distinct=True,
+                ),
+            ),
+            person_sustained_complaints_count=Coalesce(
+                person_aggregate(
+                    ComplaintOfficer.objects.filter(
+                        complaint__disposition=ALLEGATION_DISPOSITION_SUSTAINED
+                    ),
+                    "officer__person",
+                    Count("id"),
+                ),
+                Value(0),
+            ),
+            person_complaint_years=person_aggregate(
+                complaint_events, "officer__person", ArrayAgg("year")
+            ),
+            person_termination_count=Coalesce(
+                person_aggregate(
+                    Event.objects.filter(left_reason__icontains="terminat"),
+                    "officer__person",
+                    Count("id"),
+                ),
+                Value(0),
+            ),
+        )
+
 
 class Officer(TimeStampsModel, APITemplateModel):
     CUSTOM_FIELDS = {
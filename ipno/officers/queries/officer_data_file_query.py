@@ -1,6 +1,8 @@
 from io import BytesIO as IO
 
-import pandas as pd
+from django.db.models import Count
+
+import xlsxwriter
 
 from citizens.models import Citizen
 from complaints.models import Complaint
@@ -12,6 +14,7 @@ from officers.constants import (
     OFFICER_CITIZEN_SHEET,
     OFFICER_COMPLAINT_FIELDS,
     OFFICER_COMPLAINT_SHEET,
+    OFFICER_DATAFILE_CHUNK_SIZE,
     OFFICER_DOC_FIELDS,
     OFFICER_DOC_SHEET,
     OFFICER_INCIDENT_FIELDS,
@@ -30,94 +33,92 @@ class OfficerDatafileQuery(object):
         self.officer = officer
         self.all_officers = officer.person.officers.all()
 
-    def _generate_officer_sheet(self):
-        officer_profile_fields = OFFICER_PROFILE_FIELDS
-        officer_sheet = [
-            {field: getattr(related_officer, field) for field in officer_profile_fields}
-            for related_officer in self.all_officers
-        ]
-
-        return pd.DataFrame(officer_sheet)
+    def _get_officer_sheet(self):
+        return self.all_officers, OFFICER_PROFILE_FIELDS
 
-    def _generate_officer_incident_sheet(self):
-        incidents = (
-            Event.objects.filter(officer__in=self.all_officers)
-            .exclude(kind__in=OFFICER_CAREER_KINDS)
-            .values(*OFFICER_INCIDENT_FIELDS)
+    def _get_officer_incident_sheet(self):
+        incidents = Event.objects.filter(officer__in=self.all_officers).exclude(
+            kind__in=OFFICER_CAREER_KINDS
         )
 
-        return pd.DataFrame(incidents)
+        return incidents, OFFICER_INCIDENT_FIELDS
 
-    def _generate_officer_complaint_sheet(self):
-        complaints = Complaint.objects.filter(officers__in=self.all_officers).values(
-            *OFFICER_COMPLAINT_FIELDS
-        )
+    def _get_officer_complaint_sheet(self):
+        complaints = Complaint.objects.filter(officers__in=self.all_officers)
 
-        return pd.DataFrame(complaints)
+        return complaints, OFFICER_COMPLAINT_FIELDS
 
-    def _generate_officer_uof_sheet(self):
-        uofs = UseOfForce.objects.filter(officer__in=self.all_officers).values(
-            *OFFICER_UOF_FIELDS
-        )
+    def _get_officer_uof_sheet(self):
+        uofs = UseOfForce.objects.filter(officer__in=self.all_officers)
 
-        return pd.DataFrame(uofs)
+        return uofs, OFFICER_UOF_FIELDS
 
-    def _generate_officer_citizen_sheet(self):
+    def _get_officer_citizen_sheet(self):
         uofs = UseOfForce.objects.filter(officer__in=self.all_officers)
 
-        citizens = Citizen.objects.filter(use_of_force__in=uofs).values(
-            *OFFICER_CITIZEN_FIELDS
-        )
+        citizens = Citizen.objects.filter(use_of_force__in=uofs)
 
-        return pd.DataFrame(citizens)
+        return citizens, OFFICER_CITIZEN_FIELDS
 
-    def _generate_officer_career_sheet(self):
+    def _get_officer_career_sheet(self):
         career = Event.objects.filter(
             officer__in=self.all_officers, kind__in=OFFICER_CAREER_KINDS
-        ).values(*OFFICER_INCIDENT_FIELDS)
+        )
 
-        return pd.DataFrame(career)
+        return career, OFFICER_INCIDENT_FIELDS
 
-    def _generate_officer_doc_sheet(self):
-        doc = Document.objects.filter(officers__in=self.all_officers).values(
-            *OFFICER_DOC_FIELDS
+    def _get_officer_doc_sheet(self):
+        doc = Document.objects.filter(officers__in=self.all_officers)
+
+        return doc, OFFICER_DOC_FIELDS
+
+    def _get_non_empty_fields(self, queryset, fields):
+        counts = queryset.order_by().aggregate(
+            rows_count=Count("*"),
+            **{f"{field}_count": Count(field) for field in fields},
         )
 
-        return pd.DataFrame(doc)
+        if not counts["rows_count"]:
+            return []
+
+        return [field for field in fields if counts[f"{field}_count"]]
 
-    def _write_to_sheet(self, xlsx_writer, sheet_name, dataframe):
-        if not dataframe.empty:
-            dataframe.dropna(how="all", axis=1, inplace=True)
-            dataframe.to_excel(xlsx_writer, sheet_name, index=False)
+    def _write_to_sheet(self, workbook, sheet_name, queryset, fields):
+        fields = self._get_non_empty_fields(queryset, fields)
 
-            worksheet = xlsx_writer.sheets[sheet_name]
-            worksheet.set_column("A:Z", 25)
+        if not fields:
+            return
 
-    def generate_sheets_file(self):
-        df_officer = self._generate_officer_sheet()
-        df_incident = self._generate_officer_incident_sheet()
-        df_complaint = self._generate_officer_complaint_sheet()
-        df_uof = self._generate_officer_uof_sheet()
-        df_citizen = self._generate_officer_citizen_sheet()
-        df_career = self._generate_officer_career_sheet()
-        df_doc = self._generate_officer_doc_sheet()
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.set_column("A:Z", 25)
+        worksheet.write_row(0, 0, fields, workbook.add_format({"bold": True}))
 
+        rows = queryset.values_list(*fields).iterator(
+            chunk_size=OFFICER_DATAFILE_CHUNK_SIZE
+        )
+        for row_index, row in enumerate(rows, start=1):
+            worksheet.write_row(row_index, 0, row)
+
+    def generate_sheets_file(self, excel_file=None):
         datasheet_mapping = {
-            OFFICER_PROFILE_SHEET: df_officer,
-            OFFICER_INCIDENT_SHEET: df_incident,
-            OFFICER_COMPLAINT_SHEET: df_complaint,
-            OFFICER_UOF_SHEET: df_uof,
-            OFFICER_CITIZEN_SHEET: df_citizen,
-            OFFICER_CAREER_SHEET: df_career,
-            OFFICER_DOC_SHEET: df_doc,
+            OFFICER_PROFILE_SHEET: self._get_officer_sheet(),
+            OFFICER_INCIDENT_SHEET: self._get_officer_incident_sheet(),
+            OFFICER_COMPLAINT_SHEET: self._get_officer_complaint_sheet(),
+            OFFICER_UOF_SHEET: self._get_officer_uof_sheet(),
+            OFFICER_CITIZEN_SHEET: self._get_officer_citizen_sheet(),
+            OFFICER_CAREER_SHEET: self._get_officer_career_sheet(),
+            OFFICER_DOC_SHEET: self._get_officer_doc_sheet(),
         }
 
-        excel_file = IO()
-        xlsx_writer = pd.ExcelWriter(excel_file, engine="xlsxwriter")
+        excel_file = excel_file if excel_file is not None else IO()
+        workbook = xlsxwriter.Workbook(
+            excel_file,
+            {"constant_memory": True, "strings_to_formulas": False},
+        )
 
-        for sheet_name, dataframe in datasheet_mapping.items():
-            self._write_to_sheet(xlsx_writer, sheet_name, dataframe)
+        for sheet_name, (queryset, fields) in datasheet_mapping.items():
+            self._write_to_sheet(workbook, sheet_name, queryset, fields)
 
-        xlsx_writer.save()
+        workbook.close()
 
         return excel_file
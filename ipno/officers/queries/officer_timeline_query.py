@@ -9,6 +9,8 @@ from news_articles.models import MatchedSentence, NewsArticle
 from officers.constants import (
     BRADY_LIST,
     COMPLAINT_ALL_EVENTS,
+    LEFT_REASON_RESIGNED,
+    LEFT_REASON_TERMINATED,
     OFFICER_DEPT,
     OFFICER_HIRE,
     OFFICER_LEFT,
@@ -39,6 +41,7 @@ from officers.serializers.officer_timeline_serializers import (
     ResignLeftTimelineSerializer,
     TerminatedLeftTimelineSerializer,
 )
+from officers.services import left_reason_vocabulary
 from use_of_forces.models import UseOfForce
 from utils.data_utils import format_data_period, sort_items
 
@@ -46,16 +49,10 @@ from utils.data_utils import format_data_period, sort_items
 class OfficerTimelineQuery(object):
     def __init__(self, officer):
         self.all_officers = officer.person.officers.all()
-        self.termination_left_reasons = set(
-            Event.objects.filter(left_reason__icontains="terminat").values_list(
-                "left_reason", flat=True
-            )
-        )
-        self.resign_left_reasons = set(
-            Event.objects.filter(left_reason__icontains="resign").values_list(
-                "left_reason", flat=True
-            )
+        self.termination_left_reasons = left_reason_vocabulary.get(
+            LEFT_REASON_TERMINATED
         )
+        self.resign_left_reasons = left_reason_vocabulary.get(LEFT_REASON_RESIGNED)
         self.popular_left_reasons = (
             self.termination_left_reasons | self.resign_left_reasons
         )
@@ -1,9 +1,6 @@
 from rest_framework import serializers
 
-from documents.models import Document
-from news_articles.models import MatchedSentence, NewsArticle
 from officers.constants import UOF_OCCUR
-from officers.models import Event
 from shared.serializers import SimpleDepartmentSerializer
 
 
@@ -29,15 +26,6 @@ class OfficerDetailsSerializer(serializers.Serializer):
     termination_count = serializers.SerializerMethodField()
     latest_rank = serializers.SerializerMethodField()
 
-    def _termination_left_reason(self, obj):
-        if not hasattr(obj, "termination"):
-            termination = Event.objects.filter(
-                left_reason__icontains="terminat"
-            ).values_list("left_reason", flat=True)
-            setattr(obj, "termination", set(termination))
-
-        return obj.termination
-
     def _get_person_officers(self, obj):
         if not hasattr(obj, "person_officers"):
             person_officers = obj.person.officers.all()
@@ -114,41 +102,21 @@ class OfficerDetailsSerializer(serializers.Serializer):
         return salary_event.salary_freq if salary_event else None
 
     def get_documents_count(self, obj):
-        officers = self._get_person_officers(obj)
-
-        return sum([obj.documents.count() for obj in officers])
+        return obj.person_documents_count
 
     def get_articles_count(self, obj):
-        officers = self._get_person_officers(obj)
-        matched_sentences = []
-
-        for officer in officers:
-            if officer.matched_sentences.count() > 0:
-                matched_sentences.extend(officer.matched_sentences.all())
-
-        return (
-            NewsArticle.objects.filter(matched_sentences__in=matched_sentences)
-            .distinct()
-            .count()
-        )
+        return obj.person_articles_count
 
     def get_complaints_count(self, obj):
         return obj.person.all_complaints_count
 
     def get_sustained_complaints_count(self, obj):
-        officers = self._get_person_officers(obj)
-
-        return sum([len(officer.sustained_complaints) for officer in officers])
+        return obj.person_sustained_complaints_count
 
     def get_complaints_year_count(self, obj):
-        all_events = self._get_all_events(obj)
-        years = [
-            event.year
-            for event in all_events
-            if event.year and event.complaints.count() > 0
-        ]
+        years = obj.person_complaint_years or []
 
-        return years[0] - years[-1] if len(years) > 1 else len(years)
+        return max(years) - min(years) if len(years) > 1 else len(years)
 
     def get_incident_force_count(self, obj):
         all_events = self._get_all_events(obj)
@@ -160,10 +128,7 @@ class OfficerDetailsSerializer(serializers.Serializer):
         return len(incident_forces)
 
     def get_termination_count(self, obj):
-        all_events = self._get_all_events(obj)
-        terminations = self._termination_left_reason(obj)
-
-        return len([event for event in all_events if event.left_reason in terminations])
+        return obj.person_termination_count
 
     def get_latest_rank(self, obj):
         events = self._get_all_events(obj)
@@ -173,22 +138,10 @@ class OfficerDetailsSerializer(serializers.Serializer):
         return rank_events[0].rank_desc if rank_events else None
 
     def get_articles_documents_years(self, obj):
-        officers = self._get_person_officers(obj)
-        years = []
-
-        matched_sentences = MatchedSentence.objects.filter(officers__in=officers)
-        articles = NewsArticle.objects.filter(matched_sentences__in=matched_sentences)
-        if articles:
-            articles_dates = articles.values_list("published_date", flat=True)
-            articles_years = [date.year for date in articles_dates]
-            years.extend(articles_years)
-
-        documents = Document.objects.filter(officers__in=officers)
-        if documents:
-            documents_years = documents.filter(year__isnull=False).values_list(
-                "year", flat=True
-            )
-            years.extend(list(documents_years))
+        years = [
+            *(obj.person_articles_years or []),
+            *(obj.person_documents_years or []),
+        ]
 
         return sorted(list(set(years)))
 
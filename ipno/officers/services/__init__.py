@@ -0,0 +1,8 @@
+from .left_reason_vocabulary import LeftReasonVocabulary, left_reason_vocabulary
+from .officer_datafile_exporter import OfficerDatafileExporter
+
+__all__ = [
+    "LeftReasonVocabulary",
+    "OfficerDatafileExporter",
+    "left_reason_vocabulary",
+]
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+
+from officers.constants import (
+    LEFT_REASON_CATEGORY_PATTERNS,
+    LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY,
+)
+from officers.models import Event, LeftReason
+
+
+class LeftReasonVocabulary:
+    def __init__(self):
+        self.version = None
+        self.categories = {}
+
+    def _get_version(self):
+        version = cache.get(LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY)
+
+        if version is None:
+            stats = LeftReason.objects.aggregate(
+                count=Count("id"), last_updated_at=Max("updated_at")
+            )
+            version = f'{stats["count"]}:{stats["last_updated_at"]}'
+            cache.set(LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY, version, None)
+
+        return version
+
+    def load(self):
+        version = self._get_version()
+
+        if version != self.version:
+            categories = {category: set() for category in LEFT_REASON_CATEGORY_PATTERNS}
+            for left_reason, category in LeftReason.objects.values_list(
+                "left_reason", "category"
+            ):
+                categories[category].add(left_reason)
+
+            self.categories = categories
+            self.version = version
+
+        return self.categories
+
+    def get(self, category):
+        return self.load()[category]
+
+    def refresh(self):
+        left_reasons = {
+            (left_reason, category)
+            for category, pattern in LEFT_REASON_CATEGORY_PATTERNS.items()
+            for left_reason in Event.objects.filter(left_reason__icontains=pattern)
+            .values_list("left_reason", flat=True)
+            .distinct()
+        }
+        current_left_reasons = set(
+            LeftReason.objects.values_list("left_reason", "category")
+        )
+
+        if left_reasons == current_left_reasons:
+            return False
+
+        with transaction.atomic():
+            LeftReason.objects.all().delete()
+            LeftReason.objects.bulk_create(
+                [
+                    LeftReason(left_reason=left_reason, category=category)
+                    for left_reason, category in left_reasons
+                ]
+            )
+        cache.delete(LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY)
+
+        return True
+
+
+left_reason_vocabulary = LeftReasonVocabulary()
@@ -0,0 +1,23 @@
+from officers.constants import OFFICER_DATAFILE_EXPORT_PATH
+from officers.queries.officer_data_file_query import OfficerDatafileQuery
+from utils.datafile_exporter import DatafileExporter
+
+
+class OfficerDatafileExporter(DatafileExporter):
+    export_path = OFFICER_DATAFILE_EXPORT_PATH
+    file_extension = "xlsx"
+    content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def __init__(self, officer):
+        self.officer = officer
+        super().__init__()
+
+    @property
+    def filename(self):
+        return f"officer-{self.officer.id}.xlsx"
+
+    def get_file_key(self):
+        return f"person-{self.officer.person_id}"
+
+    def write_file(self, file_name):
+        OfficerDatafileQuery(self.officer).generate_sheets_file(file_name)
@@ -2,6 +2,7 @@ from celery import shared_task
 
 from officers.documents import OfficerESDoc
 from officers.models import Officer
+from officers.services import OfficerDatafileExporter
 from utils.task_utils import run_task
 
 
@@ -11,3 +12,10 @@ def rebuild_officer_index(doc_id):
     officer = Officer.objects.get(id=doc_id)
     es_doc = OfficerESDoc.get(id=doc_id)
     es_doc.update(officer)
+
+
+@run_task
+@shared_task
+def export_officer_datafile(officer_id):
+    officer = Officer.objects.get(id=officer_id)
+    OfficerDatafileExporter(officer).export()
@@ -1,11 +1,9 @@
 from datetime import date
 
-from django.db.models import Prefetch
 from django.test import TestCase
 
 from complaints.constants import ALLEGATION_DISPOSITION_SUSTAINED
 from complaints.factories import ComplaintFactory
-from complaints.models import Complaint
 from departments.factories import DepartmentFactory
 from documents.factories import DocumentFactory
 from news_articles.factories import NewsArticleFactory
@@ -196,19 +194,11 @@ class OfficerDetailsSerializerTestCase(TestCase):
             award="commendation",
         )
 
-        officer = Officer.objects.filter(person=person).prefetch_related(
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        officer = (
+            Officer.objects.annotate_person_aggregates()
+            .filter(person=person)
+            .prefetch_related("person__officers__events__department")[0]
+        )
 
         result = OfficerDetailsSerializer(officer).data
         assert result == {
@@ -269,19 +259,11 @@ class OfficerDetailsSerializerTestCase(TestCase):
             day=6,
         )
 
-        officer = Officer.objects.filter(person=person).prefetch_related(
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        officer = (
+            Officer.objects.annotate_person_aggregates()
+            .filter(person=person)
+            .prefetch_related("person__officers__events__department")[0]
+        )
 
         result = OfficerDetailsSerializer(officer).data
         assert result["salary"] == "57000.14"
@@ -318,19 +300,11 @@ class OfficerDetailsSerializerTestCase(TestCase):
             day=6,
         )
 
-        officer = Officer.objects.filter(person=person).prefetch_related(
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        officer = (
+            Officer.objects.annotate_person_aggregates()
+            .filter(person=person)
+            .prefetch_related("person__officers__events__department")[0]
+        )
 
         result = OfficerDetailsSerializer(officer).data
         assert result["salary"] is None
@@ -367,19 +341,11 @@ class OfficerDetailsSerializerTestCase(TestCase):
             day=6,
         )
 
-        officer = Officer.objects.filter(person=person).prefetch_related(
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        officer = (
+            Officer.objects.annotate_person_aggregates()
+            .filter(person=person)
+            .prefetch_related("person__officers__events__department")[0]
+        )
 
         result = OfficerDetailsSerializer(officer).data
         assert result["salary"] is None
@@ -423,19 +389,11 @@ class OfficerDetailsSerializerTestCase(TestCase):
         matched_sentence_2.officers.add(officer)
         matched_sentence_2.save()
 
-        officer = Officer.objects.filter(person=person).prefetch_related(
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        officer = (
+            Officer.objects.annotate_person_aggregates()
+            .filter(person=person)
+            .prefetch_related("person__officers__events__department")[0]
+        )
 
         result = OfficerDetailsSerializer(officer).data
         assert result == {
@@ -638,19 +596,11 @@ class OfficerDetailsSerializerTestCase(TestCase):
             award="commendation 2",
         )
 
-        officer = Officer.objects.filter(person=person).prefetch_related(
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        officer = (
+            Officer.objects.annotate_person_aggregates()
+            .filter(person=person)
+            .prefetch_related("person__officers__events__department")[0]
+        )
 
         result = OfficerDetailsSerializer(officer).data
         assert result == {
@@ -683,3 +633,44 @@ class OfficerDetailsSerializerTestCase(TestCase):
             "termination_count": 4,
             "award_count": 2,
         }
+
+    def test_data_num_queries(self):
+        department = DepartmentFactory()
+        officer = OfficerFactory(department=department)
+        related_officer = OfficerFactory(department=department)
+        person = PersonFactory(canonical_officer=officer)
+        person.officers.add(officer)
+        person.officers.add(related_officer)
+        person.save()
+
+        for related in [officer, related_officer]:
+            event = EventFactory(officer=related, department=department, year=2020)
+            complaint = ComplaintFactory(disposition=ALLEGATION_DISPOSITION_SUSTAINED)
+            complaint.officers.add(related)
+            complaint.events.add(event)
+
+            document = DocumentFactory(year=2019)
+            document.officers.add(related)
+
+            matched_sentence = MatchedSentenceFactory(
+                article=NewsArticleFactory(published_date=date(2021, 5, 4))
+            )
+            matched_sentence.officers.add(related)
+
+            EventFactory(officer=related, left_reason="terminated")
+
+        with self.assertNumQueries(4):
+            officer = (
+                Officer.objects.annotate_person_aggregates()
+                .select_related("person__canonical_officer__department")
+                .filter(id=officer.id)
+                .prefetch_related("person__officers__events__department")[0]
+            )
+            result = OfficerDetailsSerializer(officer).data
+
+        assert result["documents_count"] == 2
+        assert result["articles_count"] == 2
+        assert result["articles_documents_years"] == [2019, 2021]
+        assert result["sustained_complaints_count"] == 2
+        assert result["complaints_year_count"] == 0
+        assert result["termination_count"] == 2
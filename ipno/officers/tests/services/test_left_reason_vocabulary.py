@@ -0,0 +1,93 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from mock import patch
+
+from officers.constants import (
+    LEFT_REASON_RESIGNED,
+    LEFT_REASON_TERMINATED,
+    LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY,
+    OFFICER_LEFT,
+)
+from officers.factories import EventFactory
+from officers.models import LeftReason
+from officers.services import LeftReasonVocabulary
+
+
+class LeftReasonVocabularyTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_refresh(self):
+        EventFactory(kind=OFFICER_LEFT, left_reason="Terminated")
+        EventFactory(kind=OFFICER_LEFT, left_reason="involuntary termination")
+        EventFactory(kind=OFFICER_LEFT, left_reason="Resigned")
+        EventFactory(kind=OFFICER_LEFT, left_reason="Retired")
+
+        vocabulary = LeftReasonVocabulary()
+
+        assert vocabulary.refresh()
+        assert set(LeftReason.objects.values_list("left_reason", "category")) == {
+            ("Terminated", LEFT_REASON_TERMINATED),
+            ("involuntary termination", LEFT_REASON_TERMINATED),
+            ("Resigned", LEFT_REASON_RESIGNED),
+        }
+        assert vocabulary.get(LEFT_REASON_TERMINATED) == {
+            "Terminated",
+            "involuntary termination",
+        }
+        assert vocabulary.get(LEFT_REASON_RESIGNED) == {"Resigned"}
+
+    def test_refresh_keeps_vocabulary_when_failing(self):
+        EventFactory(kind=OFFICER_LEFT, left_reason="Terminated")
+        vocabulary = LeftReasonVocabulary()
+        vocabulary.refresh()
+        EventFactory(kind=OFFICER_LEFT, left_reason="Resigned")
+
+        with patch.object(
+            LeftReason.objects, "bulk_create", side_effect=Exception("Failed")
+        ):
+            with self.assertRaises(Exception):
+                vocabulary.refresh()
+
+        assert set(LeftReason.objects.values_list("left_reason", "category")) == {
+            ("Terminated", LEFT_REASON_TERMINATED)
+        }
+
+    def test_refresh_without_changes(self):
+        EventFactory(kind=OFFICER_LEFT, left_reason="Terminated")
+
+        vocabulary = LeftReasonVocabulary()
+        vocabulary.refresh()
+        vocabulary.load()
+        version = cache.get(LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY)
+
+        assert not vocabulary.refresh()
+        assert cache.get(LEFT_REASON_VOCABULARY_VERSION_CACHE_KEY) == version
+
+    def test_load_reloads_on_version_change(self):
+        EventFactory(kind=OFFICER_LEFT, left_reason="Terminated")
+
+        vocabulary = LeftReasonVocabulary()
+        other_vocabulary = LeftReasonVocabulary()
+        vocabulary.refresh()
+
+        assert other_vocabulary.get(LEFT_REASON_TERMINATED) == {"Terminated"}
+
+        EventFactory(kind=OFFICER_LEFT, left_reason="terminated|arrest")
+        vocabulary.refresh()
+
+        assert other_vocabulary.get(LEFT_REASON_TERMINATED) == {
+            "Terminated",
+            "terminated|arrest",
+        }
+
+    def test_load_uses_memory_while_version_unchanged(self):
+        vocabulary = LeftReasonVocabulary()
+        vocabulary.load()
+
+        LeftReason.objects.create(
+            left_reason="Terminated", category=LEFT_REASON_TERMINATED
+        )
+
+        assert vocabulary.get(LEFT_REASON_TERMINATED) == set()
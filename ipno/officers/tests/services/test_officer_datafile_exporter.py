@@ -0,0 +1,116 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+import pandas as pd
+from mock import Mock, patch
+
+from data.constants import IMPORT_LOG_STATUS_ERROR, IMPORT_LOG_STATUS_FINISHED
+from data.models import ImportLog
+from officers.constants import OFFICER_PROFILE_SHEET
+from officers.factories import OfficerFactory
+from officers.services import OfficerDatafileExporter
+from people.factories import PersonFactory
+from utils.cache_utils import bump_data_version
+
+
+@patch("utils.datafile_exporter.GoogleCloudService")
+class OfficerDatafileExporterTestCase(TestCase):
+    def setUp(self):
+        person = PersonFactory()
+        self.officer = OfficerFactory(person=person)
+        person.canonical_officer = self.officer
+        person.save()
+
+    def test_file_path_per_person_and_import_version(self, _):
+        related_officer = OfficerFactory(person=self.officer.person)
+        import_log = ImportLog.objects.create(
+            data_model="officer", status=IMPORT_LOG_STATUS_FINISHED
+        )
+
+        exporter = OfficerDatafileExporter(self.officer)
+
+        assert (
+            exporter.file_path
+            == f"exports/officers/person-{self.officer.person_id}-{import_log.id}.xlsx"
+        )
+        assert OfficerDatafileExporter(related_officer).file_path == exporter.file_path
+
+        bump_data_version()
+        ImportLog.objects.create(data_model="officer", status=IMPORT_LOG_STATUS_ERROR)
+
+        assert OfficerDatafileExporter(self.officer).file_path == exporter.file_path
+
+        ImportLog.objects.create(
+            data_model="officer", status=IMPORT_LOG_STATUS_FINISHED
+        )
+
+        assert OfficerDatafileExporter(self.officer).file_path != exporter.file_path
+
+    def test_ensure_exported(self, google_cloud_service_mock):
+        gcs = google_cloud_service_mock.return_value
+        gcs.is_object_exists.return_value = False
+        export_task = Mock()
+
+        exporter = OfficerDatafileExporter(self.officer)
+
+        assert not exporter.ensure_exported(export_task, self.officer.id)
+        export_task.assert_called_once_with(self.officer.id)
+        assert gcs.is_object_exists.call_count == 2
+
+        gcs.is_object_exists.reset_mock()
+
+        assert not exporter.ensure_exported(export_task, self.officer.id)
+        export_task.assert_called_once()
+        gcs.is_object_exists.assert_called_once()
+
+    def test_acquire_export_lock(self, _):
+        exporter = OfficerDatafileExporter(self.officer)
+
+        assert exporter.acquire_export_lock()
+        assert not exporter.acquire_export_lock()
+
+    def test_export(self, google_cloud_service_mock):
+        uploaded_files = []
+
+        def upload_file_from_filename(file_path, filename, content_type):
+            uploaded_files.append(
+                pd.read_excel(filename, sheet_name=OFFICER_PROFILE_SHEET, dtype=str)
+            )
+
+        gcs = google_cloud_service_mock.return_value
+        gcs.upload_file_from_filename.side_effect = upload_file_from_filename
+
+        ImportLog.objects.create(
+            data_model="officer", status=IMPORT_LOG_STATUS_FINISHED
+        )
+        exporter = OfficerDatafileExporter(self.officer)
+        outdated_file_path = f"{exporter.file_prefix}{exporter.import_version - 1}.xlsx"
+        newer_file_path = f"{exporter.file_prefix}{exporter.import_version + 1}.xlsx"
+        gcs.list_object_names.return_value = [
+            outdated_file_path,
+            exporter.file_path,
+            newer_file_path,
+        ]
+
+        exporter.acquire_export_lock()
+        exporter.export()
+
+        gcs.upload_file_from_filename.assert_called_once()
+        assert gcs.upload_file_from_filename.call_args[0][0] == exporter.file_path
+        assert uploaded_files[0]["uid"].tolist() == [self.officer.uid]
+        assert cache.get(exporter.lock_key) is None
+        gcs.list_object_names.assert_called_with(
+            f"exports/officers/person-{self.officer.person_id}-"
+        )
+        gcs.delete_file_from_url.assert_called_once_with(outdated_file_path)
+
+    def test_get_download_url(self, google_cloud_service_mock):
+        gcs = google_cloud_service_mock.return_value
+        gcs.generate_signed_url.return_value = "signed_url"
+
+        exporter = OfficerDatafileExporter(self.officer)
+
+        assert exporter.get_download_url() == "signed_url"
+        gcs.generate_signed_url.assert_called_with(
+            exporter.file_path, 15 * 60, filename=f"officer-{self.officer.id}.xlsx"
+        )
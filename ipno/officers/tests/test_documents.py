@@ -0,0 +1,37 @@
+from django.test.testcases import TestCase
+
+from officers.documents import OfficerESDoc
+from officers.factories import EventFactory, OfficerFactory
+from people.factories import PersonFactory
+
+
+class OfficerESDocTestCase(TestCase):
+    def test_get_chunk_data(self):
+        officer_1 = OfficerFactory()
+        officer_2 = OfficerFactory()
+        officer_3 = OfficerFactory()
+        for officer in [officer_1, officer_2, officer_3]:
+            person = PersonFactory(canonical_officer=officer)
+            person.officers.add(officer)
+        EventFactory(officer=officer_1, badge_no="12435", year=2020, month=5, day=4)
+        EventFactory(officer=officer_1, badge_no="67893", year=2017)
+        EventFactory(officer=officer_1, badge_no="5432", year=None)
+        EventFactory(officer=officer_1, badge_no="12435", year=2015, month=7, day=20)
+        EventFactory(officer=officer_1, badge_no=None, year=2016)
+        EventFactory(officer=officer_2, badge_no="1234", year=2018)
+        EventFactory(officer=officer_3, badge_no="9876", year=2018)
+
+        es_doc = OfficerESDoc()
+
+        es_doc.chunk_data = es_doc.get_chunk_data([officer_1.id, officer_2.id])
+
+        assert es_doc.prepare_badges(officer_1) == ["12435", "67893", "5432"]
+        assert es_doc.prepare_badges(officer_2) == ["1234"]
+        assert es_doc.prepare_badges(officer_3) == []
+        assert es_doc.prepare_search_result(officer_1)["badges"] == [
+            "12435",
+            "67893",
+            "5432",
+        ]
+        assert es_doc.prepare_search_result(officer_2)["name"] == officer_2.name
+        assert es_doc.prepare_search_result(officer_3) is None
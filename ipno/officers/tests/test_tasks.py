@@ -1,10 +1,12 @@
 from django.test.testcases import TestCase
 
+from mock import patch
+
 from config.celery import app
 from departments.factories import DepartmentFactory
 from officers.documents import OfficerESDoc
 from officers.factories import OfficerFactory
-from officers.tasks import rebuild_officer_index
+from officers.tasks import export_officer_datafile, rebuild_officer_index
 from people.factories import PersonFactory
 from utils.search_index import rebuild_search_index
 
@@ -29,3 +31,13 @@ class OfficerTaskTestCase(TestCase):
 
         es_doc = OfficerESDoc.get(id=1)
         assert es_doc.aliases == ["def"]
+
+    @patch("utils.task_utils.check_app_ping", return_value=False)
+    @patch("officers.tasks.OfficerDatafileExporter")
+    def test_export_officer_datafile(self, officer_datafile_exporter_mock, _):
+        officer = OfficerFactory()
+
+        export_officer_datafile(officer.id)
+
+        officer_datafile_exporter_mock.assert_called_with(officer)
+        officer_datafile_exporter_mock.return_value.export.assert_called()
@@ -1,13 +1,10 @@
 from datetime import date
-from io import BytesIO as IO
 from unittest.mock import patch
 
 from django.urls import reverse
 
 from rest_framework import status
 
-import pandas as pd
-
 from citizens.factory import CitizenFactory
 from complaints.constants import ALLEGATION_DISPOSITION_SUSTAINED
 from complaints.factories import ComplaintFactory
@@ -161,6 +158,45 @@ class OfficersViewSetTestCase(AuthAPITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_browse_success(self):
+        officers = [OfficerFactory() for _ in range(4)]
+        people = []
+        for officer, count in zip(officers, [4, 4, 2, None]):
+            person = PersonFactory(
+                canonical_officer=officer,
+                all_complaints_count=count,
+            )
+            person.officers.add(officer)
+            people.append(person)
+
+        response = self.client.get(reverse("api:officers-browse"), {"limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [
+            officers[1].id,
+            officers[0].id,
+        ]
+        assert response.data["previous"] is None
+
+        response = self.client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [officers[2].id]
+        assert response.data["next"] is None
+
+        response = self.client.get(response.data["previous"])
+        assert response.status_code == status.HTTP_200_OK
+
+        assert [item["id"] for item in response.data["results"]] == [
+            officers[1].id,
+            officers[0].id,
+        ]
+        assert response.data["previous"] is None
+
+    def test_browse_invalid_cursor(self):
+        response = self.client.get(reverse("api:officers-browse"), {"cursor": "abc"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_retrieve_success(self):
         department = DepartmentFactory()
 
@@ -652,38 +688,53 @@ class OfficersViewSetTestCase(AuthAPITestCase):
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    @patch(
-        "officers.queries.officer_data_file_query.OfficerDatafileQuery.generate_sheets_file"
-    )
-    def test_download_xlsx_success(self, generate_sheets_file_mock):
+    @patch("officers.views.export_officer_datafile")
+    @patch("utils.datafile_exporter.GoogleCloudService")
+    def test_download_xlsx_success(
+        self, google_cloud_service_mock, export_officer_datafile_mock
+    ):
         person = PersonFactory()
         officer = OfficerFactory(person=person)
         person.canonical_officer = officer
         person.save()
 
-        data = pd.DataFrame([{"a": 1, "b": 2}])
+        gcs = google_cloud_service_mock.return_value
+        gcs.is_object_exists.return_value = True
+        gcs.generate_signed_url.return_value = "https://storage/officer.xlsx"
 
-        excel_file = IO()
-        xlwriter = pd.ExcelWriter(excel_file, engine="xlsxwriter")
+        response = self.client.get(
+            reverse("api:officers-download-xlsx", kwargs={"pk": officer.id})
+        )
 
-        data.to_excel(xlwriter, "Test", index=False)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "url": "https://storage/officer.xlsx",
+            "filename": f"officer-{officer.id}.xlsx",
+        }
+        export_officer_datafile_mock.assert_not_called()
+
+    @patch("officers.views.export_officer_datafile")
+    @patch("utils.datafile_exporter.GoogleCloudService")
+    def test_download_xlsx_schedule_export(
+        self, google_cloud_service_mock, export_officer_datafile_mock
+    ):
+        person = PersonFactory()
+        officer = OfficerFactory(person=person)
+        person.canonical_officer = officer
+        person.save()
 
-        xlwriter.save()
+        google_cloud_service_mock.return_value.is_object_exists.return_value = False
 
-        generate_sheets_file_mock.return_value = excel_file
+        url = reverse("api:officers-download-xlsx", kwargs={"pk": officer.id})
+        response = self.client.get(url)
 
-        expected_content_disposition = f"attachment; filename=officer-{officer.id}.xlsx"
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        export_officer_datafile_mock.assert_called_once_with(officer.id)
 
-        response = self.client.get(
-            reverse("api:officers-download-xlsx", kwargs={"pk": officer.id})
-        )
-        content = response.content
-        data_file = IO(content)
-        xlsx_data = pd.read_excel(data_file, sheet_name="Test")
+        response = self.client.get(url)
 
-        assert response.status_code == status.HTTP_200_OK
-        assert response["Content-Disposition"] == expected_content_disposition
-        pd.testing.assert_frame_equal(xlsx_data, data)
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        export_officer_datafile_mock.assert_called_once_with(officer.id)
 
     def test_retrieve_success_with_related_officer(self):
         department = DepartmentFactory()
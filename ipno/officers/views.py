@@ -1,28 +1,32 @@
-from django.db.models import Count, Prefetch
-from django.http import HttpResponse
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from complaints.constants import ALLEGATION_DISPOSITION_SUSTAINED
-from complaints.models import Complaint
 from officers.constants import (
     OFFICER_DEPT,
     OFFICER_HIRE,
     OFFICER_LEFT,
     OFFICER_PAY_EFFECTIVE,
     OFFICER_RANK,
+    OFFICERS_BROWSE_ORDERING,
     OFFICERS_LIMIT,
 )
 from officers.models import Officer
-from officers.queries import OfficerDatafileQuery, OfficerTimelineQuery
+from officers.queries import OfficerTimelineQuery
 from officers.serializers import OfficerDetailsSerializer
+from officers.services import OfficerDatafileExporter
+from officers.tasks import export_officer_datafile
+from people.models import Person
+from shared.constants import OFFICER_CARD_FIELDS
+from shared.queries import get_officer_cards
 from shared.serializers import OfficerSerializer
 from utils.cache_utils import custom_cache
 from utils.decorators import test_util_api
+from utils.keyset_pagination import KeysetPagination
 
 
 class OfficersViewSet(viewsets.ViewSet):
@@ -31,8 +35,7 @@ class OfficersViewSet(viewsets.ViewSet):
     @custom_cache
     def list(self, request):
         officers = (
-            Officer.objects.prefetch_events()
-            .select_related("person__canonical_officer__department")
+            get_officer_cards()
             .filter(canonical_person__isnull=False)
             .order_by("-person__all_complaints_count")[:OFFICERS_LIMIT]
         )
@@ -40,24 +43,38 @@ class OfficersViewSet(viewsets.ViewSet):
         serializer = OfficerSerializer(officers, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"], url_path="browse")
+    @custom_cache
+    def browse(self, request):
+        people = (
+            Person.objects.filter(all_complaints_count__isnull=False)
+            .select_related("canonical_officer__person")
+            .only(
+                "id",
+                "all_complaints_count",
+                "canonical_officer",
+                *[f"canonical_officer__{field}" for field in OFFICER_CARD_FIELDS],
+            )
+        )
+
+        paginator = KeysetPagination(OFFICERS_BROWSE_ORDERING)
+        page = paginator.paginate_queryset(people, request)
+
+        serializer = OfficerSerializer(
+            [person.canonical_officer for person in page], many=True
+        )
+        return paginator.get_paginated_response(serializer.data)
+
     @custom_cache
     def retrieve(self, request, pk):
         get_object_or_404(Officer, id=pk)
 
-        optimized_officer = Officer.objects.filter(id=pk).prefetch_related(
-            "person__canonical_officer",
-            "person__officers__documents",
-            "person__officers__matched_sentences",
-            "person__officers__events__department",
-            "person__officers__events__complaints",
-            Prefetch(
-                "person__officers__complaints",
-                queryset=Complaint.objects.filter(
-                    disposition=ALLEGATION_DISPOSITION_SUSTAINED
-                ),
-                to_attr="sustained_complaints",
-            ),
-        )[0]
+        optimized_officer = (
+            Officer.objects.annotate_person_aggregates()
+            .select_related("person__canonical_officer__department")
+            .filter(id=pk)
+            .prefetch_related("person__officers__events__department")[0]
+        )
         serializer = OfficerDetailsSerializer(optimized_officer)
 
         return Response(serializer.data)
@@ -74,19 +91,17 @@ class OfficersViewSet(viewsets.ViewSet):
     @action(detail=True, methods=["get"], url_path="download-xlsx")
     def download_xlsx(self, request, pk):
         officer = get_object_or_404(Officer, id=pk)
+        exporter = OfficerDatafileExporter(officer)
 
-        excel_file = OfficerDatafileQuery(officer).generate_sheets_file()
-        filename = f"officer-{pk}.xlsx"
+        if not exporter.ensure_exported(export_officer_datafile, officer.id):
+            return Response(
+                {"detail": "The data file is being generated"},
+                status=status.HTTP_202_ACCEPTED,
+            )
 
-        response = HttpResponse(
-            excel_file.getvalue(),
-            content_type=(
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            ),
+        return Response(
+            {"url": exporter.get_download_url(), "filename": exporter.filename}
         )
-        response["Content-Disposition"] = f"attachment; filename={filename}"
-
-        return response
 
     @test_util_api
     @action(detail=False, methods=["get"], url_path="testing-officer-timelines")
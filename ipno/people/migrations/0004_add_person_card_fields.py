@@ -0,0 +1,39 @@
+# Generated by Django 3.1.13 on 2026-10-19 16:45
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0003_add_uid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='all_use_of_forces_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='card_badges',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, null=True, size=None),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='card_departments',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='card_latest_rank',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='person',
+            name='all_complaints_count',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
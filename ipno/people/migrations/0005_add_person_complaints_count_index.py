@@ -0,0 +1,22 @@
+# Generated by Django 3.1.13 on 2026-10-19 16:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0004_add_person_card_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='person',
+            name='all_complaints_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['all_complaints_count', 'id'], name='person_complaints_count_id_idx'),
+        ),
+    ]
@@ -1,15 +1,27 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
 from utils.models import APITemplateModel, TimeStampsModel
 
 
 class Person(TimeStampsModel, APITemplateModel):
-    CUSTOM_FIELDS = {"all_complaints_count", "canonical_officer"}
+    CUSTOM_FIELDS = {
+        "all_complaints_count",
+        "all_use_of_forces_count",
+        "canonical_officer",
+        "card_badges",
+        "card_departments",
+        "card_latest_rank",
+    }
 
     person_id = models.CharField(max_length=255, null=True, blank=True)
     canonical_uid = models.CharField(max_length=255, null=True, blank=True)
     uids = models.CharField(max_length=255, null=True, blank=True)
     all_complaints_count = models.IntegerField(null=True, blank=True)
+    all_use_of_forces_count = models.IntegerField(null=True, blank=True)
+    card_badges = ArrayField(models.CharField(max_length=255), null=True, blank=True)
+    card_departments = models.JSONField(null=True, blank=True)
+    card_latest_rank = models.CharField(max_length=255, null=True, blank=True)
 
     canonical_officer = models.ForeignKey(
         "officers.Officer",
@@ -17,5 +29,13 @@ class Person(TimeStampsModel, APITemplateModel):
         related_name="canonical_person",
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["all_complaints_count", "id"],
+                name="person_complaints_count_id_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.id} - {self.canonical_officer.uid[:5]}"
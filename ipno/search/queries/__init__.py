@@ -3,6 +3,7 @@ from .documents_search_query import DocumentsSearchQuery
 from .news_articles_search_query import NewsArticlesSearchQuery
 from .officers_search_query import OfficersSearchQuery
 from .search_all_query import SearchAllQuery
+from .suggest_query import SuggestQuery
 
 __all__ = [
     "SearchAllQuery",
@@ -10,4 +11,5 @@ __all__ = [
     "OfficersSearchQuery",
     "DocumentsSearchQuery",
     "NewsArticlesSearchQuery",
+    "SuggestQuery",
 ]
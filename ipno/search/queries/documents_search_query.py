@@ -1,3 +1,6 @@
+from elasticsearch_dsl.query import Bool, MultiMatch, Nested
+
+from documents.constants import DOCUMENT_TEXT_CHUNK_HITS_LIMIT
 from documents.documents import DocumentESDoc
 from shared.queries.base_search_query import BaseSearchQuery
 
@@ -6,11 +9,26 @@ class DocumentsSearchQuery(BaseSearchQuery):
     document_klass = DocumentESDoc
     fields = [
         "title",
-        "text_content",
         "officer_names",
         "officer_badges",
         "department_names",
     ]
+    prefix_fields = ["title"]
+
+    def text_query(self):
+        text_chunks_query = Nested(
+            path="text_chunks",
+            score_mode="max",
+            query=MultiMatch(query=self.q, operator="and", fields=["text_chunks.text"]),
+            inner_hits={
+                "size": DOCUMENT_TEXT_CHUNK_HITS_LIMIT,
+                "_source": False,
+                "docvalue_fields": ["text_chunks.page"],
+                "highlight": {"fields": {"text_chunks.text": {}}},
+            },
+        )
 
-    def query(self):
-        return super(DocumentsSearchQuery, self).query().highlight("text_content")
+        return Bool(
+            should=[super().text_query(), text_chunks_query],
+            minimum_should_match=1,
+        )
@@ -5,6 +5,7 @@ from shared.queries.base_search_query import BaseSearchQuery
 class NewsArticlesSearchQuery(BaseSearchQuery):
     document_klass = NewsArticleESDoc
     fields = ["title", "content", "author", "source_name"]
+    prefix_fields = ["title"]
 
     def query(self, order=None, pre_term_query=None):
         return (
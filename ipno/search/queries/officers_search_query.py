@@ -1,6 +1,3 @@
-from elasticsearch_dsl.function import ScriptScore
-from elasticsearch_dsl.query import FunctionScore, MultiMatch
-
 from officers.documents import OfficerESDoc
 from shared.queries.base_search_query import BaseSearchQuery
 
@@ -8,6 +5,7 @@ from shared.queries.base_search_query import BaseSearchQuery
 class OfficersSearchQuery(BaseSearchQuery):
     document_klass = OfficerESDoc
     fields = ["name", "aliases", "badges"]
+    prefix_fields = ["name"]
     impact_factors = ["complaint_fraction"]
 
     def query(self, order=None):
@@ -16,16 +14,7 @@ class OfficersSearchQuery(BaseSearchQuery):
         if self.department:
             search = search.query("match_phrase", department_slug=self.department)
 
-        impact_factor_list = list(
-            map(lambda x: "doc['" + x + "'].value", self.impact_factors)
-        )
-        impact_factor_list.append("_score")
-        script = " * ".join(impact_factor_list)
-
-        multi_match = MultiMatch(query=self.q, fields=self.fields, operator="and")
-        script = ScriptScore(script=script)
-
-        q = FunctionScore(query=multi_match, functions=[script])
+        q = self.scored_query()
 
         if not order:
             return search.query(q)
@@ -1,3 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+from elasticsearch_dsl import MultiSearch
+
 from search.queries.departments_search_query import DepartmentsSearchQuery
 from search.queries.documents_search_query import DocumentsSearchQuery
 from search.queries.news_articles_search_query import NewsArticlesSearchQuery
@@ -32,27 +39,73 @@ SEARCH_MAPPINGS = {
 }
 
 
+def hydrate_section(serializer, search_result):
+    try:
+        return serializer(search_result).data
+    finally:
+        connections.close_all()
+
+
 class SearchAllQuery(object):
     def __init__(self, request):
         self.request = request
 
     def search(self, query, doc_type, department=None):
-        results = {}
-
         doc_section = SEARCH_MAPPINGS.get(doc_type)
         sections = {doc_type: doc_section} if doc_section else SEARCH_MAPPINGS
-        paginator = ESPagination()
+        paginators = {}
+        search_results = {}
+        multi_search = MultiSearch()
+        multi_search_keys = []
 
         for search_key, search_mapping in sections.items():
+            paginator = ESPagination()
+            paginator.init_pagination(self.request)
+            paginators[search_key] = paginator
+
             search_query = search_mapping["search_query"](query, department)
-            search_result = paginator.paginate_es_query(search_query, self.request)
-
-            data = search_mapping["serializer"](search_result).data
-            results[search_key] = {
-                "count": paginator.count,
-                "next": paginator.get_next_link(),
-                "previous": paginator.get_previous_link(),
-                "results": data,
+
+            if doc_section and paginator.use_cursor:
+                search_results[search_key] = paginator.paginate_es_query_by_cursor(
+                    search_query
+                )
+                continue
+
+            paginator.use_cursor = False
+            multi_search = multi_search.add(
+                search_query.paginated_query(paginator.limit, paginator.offset)
+            )
+            multi_search_keys.append(search_key)
+
+        if multi_search_keys:
+            for search_key, search_result in zip(
+                multi_search_keys, multi_search.execute()
+            ):
+                paginators[search_key].set_es_response(search_result)
+                search_results[search_key] = search_result
+
+        workers = min(settings.SEARCH_HYDRATION_WORKERS, len(sections))
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    search_key: executor.submit(
+                        hydrate_section,
+                        sections[search_key]["serializer"],
+                        search_result,
+                    )
+                    for search_key, search_result in search_results.items()
+                }
+            data = {
+                search_key: future.result() for search_key, future in futures.items()
+            }
+        else:
+            data = {
+                search_key: sections[search_key]["serializer"](search_result).data
+                for search_key, search_result in search_results.items()
             }
 
-        return results
+        return {
+            search_key: paginators[search_key].get_paginated_data(data[search_key])
+            for search_key in sections
+        }
@@ -0,0 +1,48 @@
+from elasticsearch_dsl import MultiSearch
+
+from departments.documents import DepartmentESDoc
+from officers.documents import OfficerESDoc
+from shared.constants import SUGGEST_LIMIT
+
+SUGGEST_MAPPINGS = {
+    "agencies": {
+        "document_klass": DepartmentESDoc,
+        "field": "agency_name_suggest",
+    },
+    "officers": {
+        "document_klass": OfficerESDoc,
+        "field": "name_suggest",
+    },
+}
+
+
+class SuggestQuery(object):
+    def __init__(self, q):
+        self.q = q
+
+    def suggest(self, size=SUGGEST_LIMIT):
+        if not self.q:
+            return {suggest_key: [] for suggest_key in SUGGEST_MAPPINGS}
+
+        multi_search = MultiSearch()
+
+        for suggest_mapping in SUGGEST_MAPPINGS.values():
+            multi_search = multi_search.add(
+                suggest_mapping["document_klass"]
+                .search()
+                .source(["search_result.id", "search_result.name"])
+                .extra(size=0)
+                .suggest(
+                    "names",
+                    self.q,
+                    completion={"field": suggest_mapping["field"], "size": size},
+                )
+            )
+
+        return {
+            suggest_key: [
+                option._source.search_result.to_dict()
+                for option in response.suggest.names[0].options
+            ]
+            for suggest_key, response in zip(SUGGEST_MAPPINGS, multi_search.execute())
+        }
@@ -1,8 +1,12 @@
 from departments.models import Department
+from shared.queries import get_department_cards
 from shared.serializers import DepartmentSerializer
-from shared.serializers.es_serializers import BaseESSerializer
+from shared.serializers.es_serializers import SourceESSerializer
 
 
-class DepartmentsESSerializer(BaseESSerializer):
+class DepartmentsESSerializer(SourceESSerializer):
     serializer = DepartmentSerializer
     model_klass = Department
+
+    def get_queryset(self, ids):
+        return get_department_cards().filter(id__in=ids)
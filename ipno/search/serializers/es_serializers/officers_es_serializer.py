@@ -1,17 +1,12 @@
 from officers.models import Officer
+from shared.queries import get_officer_cards
 from shared.serializers import OfficerSerializer
-from shared.serializers.es_serializers import BaseESSerializer
+from shared.serializers.es_serializers import SourceESSerializer
 
 
-class OfficersESSerializer(BaseESSerializer):
+class OfficersESSerializer(SourceESSerializer):
     serializer = OfficerSerializer
     model_klass = Officer
 
     def get_queryset(self, ids):
-        return (
-            self.model_klass.objects.prefetch_events()
-            .select_related(
-                "person__canonical_officer__department",
-            )
-            .filter(id__in=ids)
-        )
+        return get_officer_cards().filter(id__in=ids)
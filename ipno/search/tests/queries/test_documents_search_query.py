@@ -103,3 +103,39 @@ class DocumentsSearchQueryTestCase(TestCase):
         document_ids = {item["id"] for item in result}
 
         assert document_ids == {document_1.id, document_2.id, document_5.id}
+
+    def test_cursor_query(self):
+        search = DocumentsSearchQuery("keyword").cursor_query(21, "pit-id", [1.5, 10])
+
+        assert search._index is None
+        assert search.to_dict()["sort"] == ["_score", {"id": "asc"}]
+        assert search.to_dict()["pit"] == {"id": "pit-id", "keep_alive": "1m"}
+        assert search.to_dict()["search_after"] == [1.5, 10]
+        assert search.to_dict()["size"] == 21
+        assert search.to_dict()["_source"] == ["id", "search_result"]
+
+    def test_cursor_query_without_point_in_time(self):
+        search = DocumentsSearchQuery("keyword").cursor_query(21)
+
+        assert search._index == ["test_documents"]
+        assert search.to_dict()["sort"] == ["_score", {"id": "asc"}]
+        assert "pit" not in search.to_dict()
+        assert "search_after" not in search.to_dict()
+        assert search.to_dict()["size"] == 21
+
+    def test_text_query_searches_text_chunks(self):
+        text_query = DocumentsSearchQuery("hearing").text_query().to_dict()
+
+        nested_query = text_query["bool"]["should"][1]["nested"]
+
+        assert text_query["bool"]["minimum_should_match"] == 1
+        assert nested_query["path"] == "text_chunks"
+        assert nested_query["query"] == {
+            "multi_match": {
+                "query": "hearing",
+                "operator": "and",
+                "fields": ["text_chunks.text"],
+            }
+        }
+        assert nested_query["inner_hits"]["docvalue_fields"] == ["text_chunks.page"]
+        assert "text_chunks.text" in nested_query["inner_hits"]["highlight"]["fields"]
@@ -1,11 +1,15 @@
 import datetime
+from urllib.parse import parse_qs, urlparse
 
 from django.test import TestCase
 
+from mock import Mock
+
 from news_articles.factories import NewsArticleFactory, NewsArticleSourceFactory
 from news_articles.factories.matched_sentence_factory import MatchedSentenceFactory
 from officers.factories import OfficerFactory
 from search.queries import NewsArticlesSearchQuery
+from utils.es_pagination import ESPagination
 from utils.search_index import rebuild_search_index
 
 
@@ -58,3 +62,66 @@ class NewsArticlesSearchQueryTestCase(TestCase):
         assert result[0]["id"] == news_article_1.id
         assert result[1]["id"] == news_article_2.id
         assert result[2]["id"] == news_article_3.id
+
+    def test_cursor_query(self):
+        search = NewsArticlesSearchQuery("keyword").cursor_query(21, "pit-id")
+
+        assert search.to_dict()["sort"] == [
+            {"published_date": {"order": "desc"}},
+            {"id": "asc"},
+        ]
+        assert "search_after" not in search.to_dict()
+
+    def test_reversed_cursor_query(self):
+        search = NewsArticlesSearchQuery("keyword").cursor_query(
+            21, "pit-id", ["2021-01-01", 10], reverse=True
+        )
+
+        assert search.to_dict()["sort"] == [
+            {"published_date": {"order": "asc"}},
+            {"id": {"order": "desc"}},
+        ]
+        assert search.to_dict()["search_after"] == ["2021-01-01", 10]
+
+    def test_cursor_pagination(self):
+        officer = OfficerFactory()
+        news_articles = [
+            NewsArticleFactory(
+                title=f"News article keyword {index}",
+                published_date=datetime.date(2021, 1, 1),
+            )
+            for index in range(3)
+        ]
+        for news_article in news_articles:
+            matched_sentence = MatchedSentenceFactory(article=news_article)
+            matched_sentence.officers.add(officer)
+
+        rebuild_search_index()
+
+        search_query = NewsArticlesSearchQuery("keyword")
+
+        def paginate(query_params):
+            request = Mock()
+            request.query_params = {"limit": 2, **query_params}
+            request.build_absolute_uri.return_value = "http://testserver/search/"
+            paginator = ESPagination()
+            page = paginator.paginate_es_query(search_query, request)
+
+            return [hit.id for hit in page], paginator
+
+        def get_cursor(link):
+            return parse_qs(urlparse(link).query)["cursor"][0]
+
+        ids, paginator = paginate({"pagination": "cursor"})
+
+        assert ids == [news_articles[0].id, news_articles[1].id]
+
+        ids, paginator = paginate({"cursor": get_cursor(paginator.get_next_link())})
+
+        assert ids == [news_articles[2].id]
+        assert paginator.get_next_link() is None
+
+        ids, paginator = paginate({"cursor": get_cursor(paginator.get_previous_link())})
+
+        assert ids == [news_articles[0].id, news_articles[1].id]
+        assert paginator.get_previous_link() is None
@@ -301,3 +301,11 @@ class OfficersSearchQueryTestCase(TestCase):
         officer_ids = [item["id"] for item in result]
 
         assert officer_ids == [officer_3.id, officer_2.id, officer_1.id]
+
+    def test_scored_query(self):
+        query = OfficersSearchQuery("keyword").scored_query().to_dict()
+
+        assert query["function_score"]["functions"] == [
+            {"field_value_factor": {"field": "complaint_fraction", "missing": 0}}
+        ]
+        assert "script_score" not in str(query)
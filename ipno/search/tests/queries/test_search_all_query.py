@@ -1,8 +1,8 @@
 from datetime import date
 from operator import itemgetter
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from departments.factories import DepartmentFactory
 from documents.factories import DocumentFactory
@@ -11,7 +11,7 @@ from news_articles.factories.matched_sentence_factory import MatchedSentenceFact
 from officers.constants import OFFICER_HIRE, OFFICER_LEFT
 from officers.factories import EventFactory, OfficerFactory
 from people.factories import PersonFactory
-from search.queries.search_all_query import SearchAllQuery
+from search.queries.search_all_query import SEARCH_MAPPINGS, SearchAllQuery
 from utils.search_index import rebuild_search_index
 
 
@@ -146,6 +146,7 @@ class OfficersSearchQueryTestCase(TestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -163,6 +164,7 @@ class OfficersSearchQueryTestCase(TestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -270,6 +272,7 @@ class OfficersSearchQueryTestCase(TestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -422,6 +425,7 @@ class OfficersSearchQueryTestCase(TestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -439,6 +443,7 @@ class OfficersSearchQueryTestCase(TestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -585,6 +590,7 @@ class OfficersSearchQueryTestCase(TestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -627,3 +633,106 @@ class OfficersSearchQueryTestCase(TestCase):
             )
 
         assert result == expected_data
+
+    @override_settings(SEARCH_HYDRATION_WORKERS=4)
+    @patch("search.queries.search_all_query.MultiSearch")
+    def test_search_with_multi_search(self, multi_search_mock):
+        request = Mock(
+            query_params={"limit": 2, "offset": 2},
+            build_absolute_uri=Mock(return_value="http://testserver/search/"),
+        )
+        multi_search = multi_search_mock.return_value
+        multi_search.add.return_value = multi_search
+        multi_search.execute.return_value = [
+            Mock(hits=Mock(total=Mock(value=count))) for count in [1, 5, 3, 0]
+        ]
+
+        serializers = {
+            search_key: Mock(return_value=Mock(data=[search_key]))
+            for search_key in SEARCH_MAPPINGS
+        }
+        search_mappings = {
+            search_key: {
+                **search_mapping,
+                "serializer": serializers[search_key],
+            }
+            for search_key, search_mapping in SEARCH_MAPPINGS.items()
+        }
+
+        with patch.dict(SEARCH_MAPPINGS, search_mappings):
+            result = SearchAllQuery(request).search("keyword", None)
+
+        multi_search.execute.assert_called_once()
+        assert multi_search.add.call_count == 4
+        assert result == {
+            "agencies": {
+                "count": 1,
+                "next": None,
+                "previous": "http://testserver/search/?limit=2",
+                "results": ["agencies"],
+            },
+            "officers": {
+                "count": 5,
+                "next": "http://testserver/search/?limit=2&offset=4",
+                "previous": "http://testserver/search/?limit=2",
+                "results": ["officers"],
+            },
+            "documents": {
+                "count": 3,
+                "next": None,
+                "previous": "http://testserver/search/?limit=2",
+                "results": ["documents"],
+            },
+            "articles": {
+                "count": 0,
+                "next": None,
+                "previous": "http://testserver/search/?limit=2",
+                "results": ["articles"],
+            },
+        }
+        for search_key, search_result in zip(
+            SEARCH_MAPPINGS, multi_search.execute.return_value
+        ):
+            serializers[search_key].assert_called_with(search_result)
+
+    @patch("search.queries.search_all_query.MultiSearch")
+    def test_search_with_doc_type_multi_search(self, multi_search_mock):
+        request = Mock(query_params={"limit": 2, "offset": 0})
+        multi_search = multi_search_mock.return_value
+        multi_search.add.return_value = multi_search
+        multi_search.execute.return_value = [Mock(hits=Mock(total=Mock(value=0)))]
+        serializer = Mock(return_value=Mock(data=[]))
+
+        with patch.dict(
+            SEARCH_MAPPINGS,
+            {"officers": {**SEARCH_MAPPINGS["officers"], "serializer": serializer}},
+        ):
+            result = SearchAllQuery(request).search("keyword", "officers")
+
+        assert multi_search.add.call_count == 1
+        assert result == {
+            "officers": {"count": 0, "next": None, "previous": None, "results": []}
+        }
+
+    @patch("search.queries.search_all_query.MultiSearch")
+    @patch("search.queries.search_all_query.ESPagination.paginate_es_query_by_cursor")
+    def test_search_with_doc_type_cursor(
+        self, paginate_es_query_by_cursor_mock, multi_search_mock
+    ):
+        request = Mock(query_params={"limit": 2, "pagination": "cursor"})
+        docs = [Mock(id=1)]
+        paginate_es_query_by_cursor_mock.return_value = docs
+        serializer = Mock(return_value=Mock(data=[{"id": 1}]))
+
+        with patch.dict(
+            SEARCH_MAPPINGS,
+            {"documents": {**SEARCH_MAPPINGS["documents"], "serializer": serializer}},
+        ), patch(
+            "search.queries.search_all_query.ESPagination.get_paginated_data",
+            side_effect=lambda data: {"results": data},
+        ):
+            result = SearchAllQuery(request).search("keyword", "documents")
+
+        multi_search_mock.return_value.execute.assert_not_called()
+        serializer.assert_called_with(docs)
+        assert result == {"documents": {"results": [{"id": 1}]}}
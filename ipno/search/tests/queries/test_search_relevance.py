@@ -0,0 +1,95 @@
+from django.test import TestCase
+
+from departments.factories import DepartmentFactory
+from documents.factories import DocumentFactory
+from officers.factories import OfficerFactory
+from people.factories import PersonFactory
+from search.queries import (
+    DepartmentsSearchQuery,
+    DocumentsSearchQuery,
+    OfficersSearchQuery,
+)
+from utils.search_index import rebuild_search_index
+
+DEPARTMENT_NAMES = [
+    "New Orleans PD",
+    "Orleans Parish Sheriff's Office",
+    "Baton Rouge PD",
+    "West Baton Rouge Sheriff's Office",
+    "Lafayette PD",
+]
+
+OFFICER_NAMES = [
+    ("David", "Jonesworth"),
+    ("Davis", "Jones"),
+    ("Anthony", "Davidson"),
+    ("Kenneth", "Anderson"),
+]
+
+DOCUMENT_TITLES = [
+    "Use of force report",
+    "Force majeure clause",
+    "Internal affairs investigation",
+    "Investigation of use of deadly force",
+]
+
+DEPARTMENT_QUERIES = [
+    ("orleans", ["New Orleans PD", "Orleans Parish Sheriff's Office"]),
+    ("new orl", ["New Orleans PD"]),
+    ("baton r", ["Baton Rouge PD", "West Baton Rouge Sheriff's Office"]),
+    (
+        "sheriffs",
+        ["Orleans Parish Sheriff's Office", "West Baton Rouge Sheriff's Office"],
+    ),
+    ("lafay", ["Lafayette PD"]),
+]
+
+OFFICER_QUERIES = [
+    ("jones", ["Davis Jones", "David Jonesworth"]),
+    ("david jonesworth", ["David Jonesworth"]),
+    ("davi", ["David Jonesworth", "Davis Jones", "Anthony Davidson"]),
+    ("ander", ["Kenneth Anderson"]),
+]
+
+DOCUMENT_QUERIES = [
+    ("use of force", ["Use of force report", "Investigation of use of deadly force"]),
+    (
+        "investigation",
+        ["Internal affairs investigation", "Investigation of use of deadly force"],
+    ),
+    ("force maj", ["Force majeure clause"]),
+]
+
+
+class SearchRelevanceTestCase(TestCase):
+    def setUp(self):
+        for agency_name in DEPARTMENT_NAMES:
+            DepartmentFactory(agency_name=agency_name, officer_fraction=1.0)
+
+        for first_name, last_name in OFFICER_NAMES:
+            officer = OfficerFactory(
+                first_name=first_name, last_name=last_name, complaint_fraction=1.0
+            )
+            person = PersonFactory(canonical_officer=officer)
+            person.officers.add(officer)
+
+        for title in DOCUMENT_TITLES:
+            DocumentFactory(title=title, text_content="")
+
+        rebuild_search_index()
+
+    def assert_results(self, search_query_klass, queries, result_field):
+        for query, expected_results in queries:
+            result = search_query_klass(query).search()
+            names = [item.search_result[result_field] for item in result]
+
+            assert sorted(names) == sorted(expected_results), query
+
+    def test_departments_relevance(self):
+        self.assert_results(DepartmentsSearchQuery, DEPARTMENT_QUERIES, "name")
+
+    def test_officers_relevance(self):
+        self.assert_results(OfficersSearchQuery, OFFICER_QUERIES, "name")
+
+    def test_documents_relevance(self):
+        self.assert_results(DocumentsSearchQuery, DOCUMENT_QUERIES, "title")
@@ -0,0 +1,75 @@
+from django.test import TestCase
+
+from elasticsearch_dsl.utils import AttrDict
+from mock import Mock, patch
+
+from departments.factories import DepartmentFactory
+from officers.factories import OfficerFactory
+from people.factories import PersonFactory
+from search.queries import SuggestQuery
+from utils.search_index import rebuild_search_index
+
+
+class SuggestQueryTestCase(TestCase):
+    def test_suggest(self):
+        DepartmentFactory(agency_name="Baton Rouge PD")
+        department = DepartmentFactory(
+            agency_name="New Orleans PD", aliases=["Orleans Parish PD"]
+        )
+        officer_1 = OfficerFactory(first_name="David", last_name="Jonesworth")
+        officer_2 = OfficerFactory(
+            first_name="Kenneth", last_name="Anderson", aliases=["Davey Anderson"]
+        )
+        OfficerFactory(first_name="Anthony", last_name="Davis")
+        for officer in [officer_1, officer_2]:
+            person = PersonFactory(canonical_officer=officer)
+            person.officers.add(officer)
+
+        rebuild_search_index()
+
+        result = SuggestQuery("Dav").suggest()
+
+        assert result["agencies"] == []
+        assert sorted(result["officers"], key=lambda item: item["id"]) == [
+            {"id": officer_1.id, "name": "David Jonesworth"},
+            {"id": officer_2.id, "name": "Kenneth Anderson"},
+        ]
+        assert SuggestQuery("Orleans").suggest()["agencies"] == [
+            {"id": department.agency_slug, "name": "New Orleans PD"},
+        ]
+
+    @patch("search.queries.suggest_query.MultiSearch")
+    def test_suggest_response(self, multi_search_mock):
+        multi_search = multi_search_mock.return_value
+        multi_search.add.return_value = multi_search
+        multi_search.execute.return_value = [
+            Mock(suggest=AttrDict({"names": [{"options": []}]})),
+            Mock(
+                suggest=AttrDict(
+                    {
+                        "names": [
+                            {
+                                "options": [
+                                    {
+                                        "_source": {
+                                            "search_result": {"id": 1, "name": "David"}
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                )
+            ),
+        ]
+
+        result = SuggestQuery("Dav").suggest()
+
+        assert multi_search.add.call_count == 2
+        assert result == {"agencies": [], "officers": [{"id": 1, "name": "David"}]}
+
+    @patch("search.queries.suggest_query.MultiSearch")
+    def test_suggest_empty_query(self, multi_search_mock):
+        assert SuggestQuery("").suggest() == {"agencies": [], "officers": []}
+
+        multi_search_mock.assert_not_called()
@@ -136,6 +136,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -153,6 +154,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -249,6 +251,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -385,6 +388,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -402,6 +406,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -535,6 +540,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -552,6 +558,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_2.pages_count,
                         "text_content": document_2.text_content,
                         "text_content_highlight": "Text content <em>keywo</em>",
+                        "text_content_pages": [1],
                         "departments": [],
                     },
                 ],
@@ -694,6 +701,7 @@ class SearchViewSetTestCase(AuthAPITestCase):
                         "pages_count": document_1.pages_count,
                         "text_content": document_1.text_content,
                         "text_content_highlight": None,
+                        "text_content_pages": [],
                         "departments": [
                             {
                                 "id": department_1.agency_slug,
@@ -1,13 +1,22 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from search.queries import SearchAllQuery
+from search.queries import SearchAllQuery, SuggestQuery
+from utils.cache_utils import search_cache
 
 
 class SearchViewSet(viewsets.ViewSet):
+    @search_cache
     def list(self, request):
         query = self.request.query_params.get("q")
         doc_type = self.request.query_params.get("doc_type")
         department = self.request.query_params.get("department")
 
         return Response(SearchAllQuery(request).search(query, doc_type, department))
+
+    @action(detail=False, methods=["get"], url_path="suggest")
+    def suggest(self, request):
+        query = self.request.query_params.get("q")
+
+        return Response(SuggestQuery(query).suggest())
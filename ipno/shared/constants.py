@@ -1,2 +1,53 @@
 SEARCH_LIMIT = 20
 TEXT_CONTENT_LIMIT = 300
+# Every cursor request renews the point in time, so abandoned searches are released
+# by Elasticsearch shortly after the last page a client fetched.
+SEARCH_POINT_IN_TIME_KEEP_ALIVE = "1m"
+SUGGEST_LIMIT = 5
+SEARCH_BENCHMARK_QUERIES = [
+    "orleans",
+    "new orl",
+    "baton rouge",
+    "sheriff",
+    "jones",
+    "david",
+    "use of force",
+    "investigation",
+    "shooting",
+    "12345",
+]
+
+DEPARTMENT_CARD_FIELDS = [
+    "id",
+    "agency_slug",
+    "agency_name",
+    "city",
+    "parish",
+    "location_map_url",
+]
+OFFICER_CARD_FIELDS = [
+    "id",
+    "first_name",
+    "last_name",
+    "person",
+    "person__card_badges",
+    "person__card_departments",
+    "person__card_latest_rank",
+]
+DOCUMENT_CARD_FIELDS = [
+    "id",
+    "document_type",
+    "title",
+    "url",
+    "incident_date",
+    "preview_image_url",
+    "pages_count",
+]
+NEWS_ARTICLE_CARD_FIELDS = [
+    "id",
+    "title",
+    "url",
+    "published_date",
+    "author",
+    "source__source_display_name",
+]
@@ -1,3 +1,15 @@
 from .base_search_query import BaseSearchQuery
+from .card_queries import (
+    get_department_cards,
+    get_document_cards,
+    get_news_article_cards,
+    get_officer_cards,
+)
 
-__all__ = ["BaseSearchQuery"]
+__all__ = [
+    "BaseSearchQuery",
+    "get_department_cards",
+    "get_document_cards",
+    "get_news_article_cards",
+    "get_officer_cards",
+]
@@ -1,14 +1,52 @@
-from shared.constants import SEARCH_LIMIT
+from elasticsearch_dsl.function import FieldValueFactor
+from elasticsearch_dsl.query import Bool, FunctionScore, MultiMatch
+
+from shared.constants import SEARCH_LIMIT, SEARCH_POINT_IN_TIME_KEEP_ALIVE
 
 
 class BaseSearchQuery(object):
     document_klass = None
     fields = []
+    prefix_fields = []
+    impact_factors = []
+    source_fields = ["id", "search_result"]
 
     def __init__(self, q, department=None, **kwargs):
         self.q = q
         self.department = department
 
+    def text_query(self):
+        multi_match = MultiMatch(query=self.q, operator="and", fields=self.fields)
+
+        if not self.prefix_fields:
+            return multi_match
+
+        prefix_match = MultiMatch(
+            query=self.q,
+            type="bool_prefix",
+            fields=[
+                f"{field}.prefix{suffix}"
+                for field in self.prefix_fields
+                for suffix in ["", "._2gram", "._3gram"]
+            ],
+        )
+
+        return Bool(must=[multi_match], should=[prefix_match])
+
+    def scored_query(self):
+        text_query = self.text_query()
+
+        if not self.impact_factors:
+            return text_query
+
+        return FunctionScore(
+            query=text_query,
+            functions=[
+                FieldValueFactor(field=impact_factor, missing=0)
+                for impact_factor in self.impact_factors
+            ],
+        )
+
     def query(self, order=None, pre_term_query=None):
         search = self.document_klass().search()
         if pre_term_query:
@@ -16,13 +54,59 @@ class BaseSearchQuery(object):
         if self.department:
             search = search.query("match_phrase", department_slugs=self.department)
         if not order:
-            return search.query(
-                "multi_match", query=self.q, operator="and", fields=self.fields
-            )
+            return search.query(self.text_query())
         else:
-            return search.sort(order).query(
-                "multi_match", query=self.q, operator="and", fields=self.fields
-            )
+            return search.sort(order).query(self.text_query())
+
+    def paginated_query(self, size=SEARCH_LIMIT, begin=0):
+        return self.query().source(self.source_fields)[begin : begin + size]
 
     def search(self, size=SEARCH_LIMIT, begin=0):
-        return self.query()[begin : begin + size].execute()
+        return self.paginated_query(size, begin).execute()
+
+    def open_point_in_time(self):
+        es_doc = self.document_klass()
+
+        return es_doc._get_connection().open_point_in_time(
+            index=es_doc._index._name, keep_alive=SEARCH_POINT_IN_TIME_KEEP_ALIVE
+        )["id"]
+
+    def close_point_in_time(self, pit_id):
+        self.document_klass()._get_connection().close_point_in_time(
+            body={"id": pit_id}, ignore=404
+        )
+
+    def reverse_sort(self, sort):
+        reversed_sort = []
+        for field in sort:
+            if isinstance(field, dict):
+                [(name, options)] = field.items()
+                options = options if isinstance(options, dict) else {"order": options}
+            else:
+                name = field.lstrip("-")
+                is_descending = field.startswith("-") or field == "_score"
+                options = {"order": "desc" if is_descending else "asc"}
+
+            order = "asc" if options.get("order", "asc") == "desc" else "desc"
+            reversed_sort.append({name: {**options, "order": order}})
+
+        return reversed_sort
+
+    def cursor_query(self, size, pit_id=None, search_after=None, reverse=False):
+        search = self.query().source(self.source_fields)
+        sort = [*(search._sort or ["_score"]), {"id": "asc"}]
+
+        if reverse:
+            sort = self.reverse_sort(sort)
+
+        search = search.sort(*sort).extra(size=size)
+
+        if pit_id:
+            search = search.index().extra(
+                pit={"id": pit_id, "keep_alive": SEARCH_POINT_IN_TIME_KEEP_ALIVE}
+            )
+
+        if search_after:
+            search = search.extra(search_after=search_after)
+
+        return search
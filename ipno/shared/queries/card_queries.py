@@ -0,0 +1,26 @@
+from departments.models import Department
+from documents.models import Document
+from news_articles.models import NewsArticle
+from officers.models import Officer
+from shared.constants import (
+    DEPARTMENT_CARD_FIELDS,
+    DOCUMENT_CARD_FIELDS,
+    NEWS_ARTICLE_CARD_FIELDS,
+    OFFICER_CARD_FIELDS,
+)
+
+
+def get_department_cards():
+    return Department.objects.only(*DEPARTMENT_CARD_FIELDS)
+
+
+def get_officer_cards():
+    return Officer.objects.select_related("person").only(*OFFICER_CARD_FIELDS)
+
+
+def get_document_cards():
+    return Document.objects.annotate_card_data().only(*DOCUMENT_CARD_FIELDS)
+
+
+def get_news_article_cards():
+    return NewsArticle.objects.select_related("source").only(*NEWS_ARTICLE_CARD_FIELDS)
@@ -5,11 +5,36 @@ from shared.serializers.document_with_text_content_serializer import (
 )
 
 
+def get_text_chunk_hits(es_doc):
+    try:
+        return list(es_doc.meta.inner_hits.text_chunks)
+    except AttributeError:
+        return []
+
+
+def get_text_content_highlight(es_doc):
+    for text_chunk_hit in get_text_chunk_hits(es_doc):
+        try:
+            return text_chunk_hit.meta.highlight["text_chunks.text"][0]
+        except (AttributeError, KeyError):
+            continue
+
+
+def get_text_content_pages(es_doc):
+    pages = [
+        text_chunk_hit.meta.fields["text_chunks.page"][0]
+        for text_chunk_hit in get_text_chunk_hits(es_doc)
+    ]
+
+    return list(dict.fromkeys(pages))
+
+
 class DocumentSearchSerializer(DocumentWithTextContentSerializer):
     text_content_highlight = serializers.SerializerMethodField()
+    text_content_pages = serializers.SerializerMethodField()
 
     def get_text_content_highlight(self, obj):
-        try:
-            return obj.es_doc.meta.highlight.text_content[0]
-        except AttributeError:
-            return
+        return get_text_content_highlight(getattr(obj, "es_doc", None))
+
+    def get_text_content_pages(self, obj):
+        return get_text_content_pages(getattr(obj, "es_doc", None))
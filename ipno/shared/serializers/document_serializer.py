@@ -1,6 +1,9 @@
 from rest_framework import serializers
 
-from shared.serializers.simple_department_serializer import SimpleDepartmentSerializer
+from shared.serializers.simple_department_serializer import (
+    SimpleDepartmentSerializer,
+    serialize_card_departments,
+)
 
 
 class DocumentSerializer(serializers.Serializer):
@@ -11,4 +14,12 @@ class DocumentSerializer(serializers.Serializer):
     incident_date = serializers.DateField()
     preview_image_url = serializers.CharField()
     pages_count = serializers.IntegerField()
-    departments = SimpleDepartmentSerializer(many=True)
+    departments = serializers.SerializerMethodField()
+
+    def get_departments(self, obj):
+        if hasattr(obj, "card_department_slugs"):
+            return serialize_card_departments(
+                obj.card_department_slugs, obj.card_department_names
+            )
+
+        return SimpleDepartmentSerializer(obj.departments.all(), many=True).data
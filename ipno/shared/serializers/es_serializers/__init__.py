@@ -2,8 +2,11 @@ from .base_es_serializer import BaseESSerializer
 from .documents_es_serializer import DocumentsESSerializer
 from .news_articles_es_serializer import NewsArticlesESSerializer
 
+from .source_es_serializer import SourceESSerializer  # isort: skip
+
 __all__ = [
     "BaseESSerializer",
+    "SourceESSerializer",
     "DocumentsESSerializer",
     "NewsArticlesESSerializer",
 ]
@@ -1,11 +1,22 @@
 from documents.models import Document
 from shared.serializers import DocumentSearchSerializer
-from shared.serializers.es_serializers.base_es_serializer import BaseESSerializer
+from shared.serializers.document_search_serializer import (
+    get_text_content_highlight,
+    get_text_content_pages,
+)
+from shared.serializers.es_serializers.source_es_serializer import SourceESSerializer
 
 
-class DocumentsESSerializer(BaseESSerializer):
+class DocumentsESSerializer(SourceESSerializer):
     serializer = DocumentSearchSerializer
     model_klass = Document
+    highlight_fields = {
+        "text_content_highlight": get_text_content_highlight,
+        "text_content_pages": get_text_content_pages,
+    }
 
     def get_queryset(self, ids):
         return self.model_klass.objects.prefetch_departments().filter(id__in=ids)
+
+    def get_highlight(self, doc, highlight_field):
+        return highlight_field(doc)
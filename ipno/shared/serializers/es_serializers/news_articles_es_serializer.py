@@ -1,11 +1,15 @@
 from news_articles.models import NewsArticle
 from shared.serializers import NewsArticleSearchSerializer
-from shared.serializers.es_serializers.base_es_serializer import BaseESSerializer
+from shared.serializers.es_serializers.source_es_serializer import SourceESSerializer
 
 
-class NewsArticlesESSerializer(BaseESSerializer):
+class NewsArticlesESSerializer(SourceESSerializer):
     serializer = NewsArticleSearchSerializer
     model_klass = NewsArticle
+    highlight_fields = {
+        "content_highlight": "content",
+        "author_highlight": "author",
+    }
 
     def get_queryset(self, ids):
         return self.model_klass.objects.select_related("source").filter(id__in=ids)
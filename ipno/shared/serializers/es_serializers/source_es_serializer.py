@@ -0,0 +1,44 @@
+from elasticsearch_dsl.utils import AttrDict
+
+from shared.serializers.es_serializers.base_es_serializer import BaseESSerializer
+
+
+class SourceESSerializer(BaseESSerializer):
+    source_field = "search_result"
+    highlight_fields = {}
+
+    def get_source_data(self, ids):
+        items = list(self.get_queryset(ids))
+        data = self.serializer(items, many=True).data
+
+        source_data = {}
+        for item, item_data in zip(items, data):
+            for field_name in self.highlight_fields:
+                item_data.pop(field_name, None)
+            source_data[item.id] = item_data
+
+        return source_data
+
+    def get_highlight(self, doc, highlight_field):
+        try:
+            return getattr(doc.meta.highlight, highlight_field)[0]
+        except AttributeError:
+            return
+
+    def get_item_data(self, doc):
+        data = getattr(doc, self.source_field).to_dict()
+
+        for field_name, highlight_field in self.highlight_fields.items():
+            data[field_name] = self.get_highlight(doc, highlight_field)
+
+        return data
+
+    @property
+    def data(self):
+        if not all(
+            isinstance(getattr(doc, self.source_field, None), AttrDict)
+            for doc in self.docs
+        ):
+            return super().data
+
+        return [self.get_item_data(doc) for doc in self.docs]
@@ -10,6 +10,9 @@ class OfficerSerializer(serializers.Serializer):
     departments = serializers.SerializerMethodField()
     latest_rank = serializers.SerializerMethodField()
 
+    def _has_card(self, obj):
+        return obj.person.card_departments is not None
+
     def _get_all_events(self, obj):
         if not hasattr(obj, "all_events"):
             all_officers = obj.person.officers.all()
@@ -31,6 +34,9 @@ class OfficerSerializer(serializers.Serializer):
         return obj.all_events
 
     def get_badges(self, obj):
+        if self._has_card(obj):
+            return obj.person.card_badges
+
         events = self._get_all_events(obj)
 
         events = list(
@@ -40,6 +46,9 @@ class OfficerSerializer(serializers.Serializer):
         return events
 
     def get_departments(self, obj):
+        if self._has_card(obj):
+            return obj.person.card_departments
+
         canonical_dep = obj.person.canonical_officer.department
 
         all_events = self._get_all_events(obj)
@@ -53,6 +62,9 @@ class OfficerSerializer(serializers.Serializer):
         return SimpleDepartmentSerializer(departments, many=True).data
 
     def get_latest_rank(self, obj):
+        if self._has_card(obj):
+            return obj.person.card_latest_rank
+
         events = self._get_all_events(obj)
 
         rank_events = [rank for rank in events if rank.rank_desc]
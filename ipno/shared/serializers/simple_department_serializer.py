@@ -4,3 +4,9 @@ from rest_framework import serializers
 class SimpleDepartmentSerializer(serializers.Serializer):
     id = serializers.CharField(source="agency_slug")
     name = serializers.CharField(source="agency_name")
+
+
+def serialize_card_departments(slugs, names):
+    departments = dict.fromkeys(zip(slugs or [], names or []))
+
+    return [{"id": slug, "name": name} for slug, name in departments if slug]
@@ -28,7 +28,24 @@ class DocumentsESSerializerTestCase(TestCase):
             Mock(
                 id=document_1.id,
                 meta=Mock(
-                    highlight=AttrDict({"text_content": ["<em>text</em> content"]}),
+                    inner_hits=AttrDict(
+                        {
+                            "text_chunks": [
+                                Mock(
+                                    meta=AttrDict(
+                                        {
+                                            "fields": {"text_chunks.page": [3]},
+                                            "highlight": {
+                                                "text_chunks.text": [
+                                                    "<em>text</em> content"
+                                                ]
+                                            },
+                                        }
+                                    )
+                                )
+                            ]
+                        }
+                    ),
                 ),
             ),
             Mock(id=document_3.id, meta=None),
@@ -44,6 +61,7 @@ class DocumentsESSerializerTestCase(TestCase):
                 "pages_count": document_2.pages_count,
                 "text_content": document_2.text_content,
                 "text_content_highlight": None,
+                "text_content_pages": [],
                 "departments": [],
             },
             {
@@ -56,6 +74,7 @@ class DocumentsESSerializerTestCase(TestCase):
                 "pages_count": document_1.pages_count,
                 "text_content": document_1.text_content,
                 "text_content_highlight": "<em>text</em> content",
+                "text_content_pages": [3],
                 "departments": [
                     {
                         "id": department_1.agency_slug,
@@ -77,6 +96,7 @@ class DocumentsESSerializerTestCase(TestCase):
                 "pages_count": document_3.pages_count,
                 "text_content": document_3.text_content,
                 "text_content_highlight": None,
+                "text_content_pages": [],
                 "departments": [],
             },
         ]
@@ -69,3 +69,52 @@ class NewsArticlesESSerializerTestCase(TestCase):
 
         result = NewsArticlesESSerializer(docs).data
         assert result == expected_result
+
+    def test_get_source_data(self):
+        source = NewsArticleSourceFactory(source_display_name="Source")
+        news_article = NewsArticleFactory(author="Writer Staff", source=source)
+
+        result = NewsArticlesESSerializer([]).get_source_data([news_article.id])
+
+        assert result == {
+            news_article.id: {
+                "id": news_article.id,
+                "source_name": "Source",
+                "title": news_article.title,
+                "url": news_article.url,
+                "date": str(news_article.published_date),
+                "author": news_article.author,
+                "content": news_article.content,
+            }
+        }
+
+    def test_serialize_from_source(self):
+        search_result = {
+            "id": 1,
+            "source_name": "Source",
+            "title": "Title",
+            "url": "http://example.com/1",
+            "date": "2021-01-01",
+            "author": "Writer Staff",
+            "content": "Text content keywo",
+        }
+        docs = [
+            Mock(
+                id=1,
+                search_result=AttrDict(search_result),
+                meta=Mock(
+                    highlight=AttrDict({"content": ["Text content <em>keywo</em>"]}),
+                ),
+            ),
+        ]
+
+        with self.assertNumQueries(0):
+            result = NewsArticlesESSerializer(docs).data
+
+        assert result == [
+            {
+                **search_result,
+                "content_highlight": "Text content <em>keywo</em>",
+                "author_highlight": None,
+            }
+        ]
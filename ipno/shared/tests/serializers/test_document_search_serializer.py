@@ -17,7 +17,34 @@ class DocumentSearchSerializerTestCase(TestCase):
         es_doc = Mock(
             id=document.id,
             meta=Mock(
-                highlight=AttrDict({"text_content": ["<em>text</em> content"]}),
+                inner_hits=AttrDict(
+                    {
+                        "text_chunks": [
+                            Mock(
+                                meta=AttrDict(
+                                    {
+                                        "fields": {"text_chunks.page": [2]},
+                                        "highlight": {
+                                            "text_chunks.text": [
+                                                "<em>text</em> content"
+                                            ]
+                                        },
+                                    }
+                                )
+                            ),
+                            Mock(
+                                meta=AttrDict(
+                                    {
+                                        "fields": {"text_chunks.page": [5]},
+                                        "highlight": {
+                                            "text_chunks.text": ["<em>text</em>"]
+                                        },
+                                    }
+                                )
+                            ),
+                        ]
+                    }
+                ),
             ),
         )
         setattr(document, "es_doc", es_doc)
@@ -40,4 +67,13 @@ class DocumentSearchSerializerTestCase(TestCase):
             ],
             "text_content": document.text_content,
             "text_content_highlight": "<em>text</em> content",
+            "text_content_pages": [2, 5],
         }
+
+    def test_data_without_es_doc(self):
+        document = DocumentFactory(text_content="Text content")
+
+        result = DocumentSearchSerializer(document).data
+
+        assert result["text_content_highlight"] is None
+        assert result["text_content_pages"] == []
@@ -4,6 +4,7 @@ from django.test import TestCase
 
 from departments.factories import DepartmentFactory
 from documents.factories import DocumentFactory
+from shared.queries import get_document_cards
 from shared.serializers import DocumentSerializer
 
 
@@ -17,6 +18,13 @@ class DocumentSerializerTestCase(TestCase):
         result = DocumentSerializer(document).data
         result["departments"] = sorted(result["departments"], key=itemgetter("id"))
 
+        card_result = DocumentSerializer(get_document_cards().get(id=document.id)).data
+        card_result["departments"] = sorted(
+            card_result["departments"], key=itemgetter("id")
+        )
+
+        assert card_result == result
+
         assert result == {
             "id": document.id,
             "document_type": document.document_type,
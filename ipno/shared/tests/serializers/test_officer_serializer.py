@@ -3,7 +3,9 @@ from django.test import TestCase
 from departments.factories import DepartmentFactory
 from officers.factories import EventFactory, OfficerFactory
 from people.factories import PersonFactory
+from shared.queries import get_officer_cards
 from shared.serializers import OfficerSerializer
+from utils.count_data import compute_person_cards
 
 
 class OfficerSerializerTestCase(TestCase):
@@ -105,3 +107,9 @@ class OfficerSerializerTestCase(TestCase):
             ],
             "latest_rank": "captain",
         }
+
+        compute_person_cards()
+
+        assert (
+            OfficerSerializer(get_officer_cards().get(id=officer_1.id)).data == result
+        )
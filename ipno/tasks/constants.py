@@ -20,3 +20,34 @@ APP_TASKS = [
     },
     {"task_name": "Pre-warm APIs", "command": "pre_warm_api", "task_type": DAILY_TASK},
 ]
+
+PRE_WARM_MAX_WORKERS = 8
+PRE_WARM_TIME_BUDGET = 60 * 60
+PRE_WARM_REQUEST_TIMEOUT = 120
+PRE_WARM_RECENT_ITEMS_LIMIT = 50
+PRE_WARM_TOP_DEPARTMENTS_LIMIT = 20
+PRE_WARM_TOP_OFFICERS_LIMIT = 200
+PRE_WARM_TOP_SEARCH_QUERIES_LIMIT = 50
+
+PRE_WARM_FRONT_PAGE_URL_NAMES = [
+    "api:analytics-summary",
+    "api:front-page-cards-list",
+    "api:front-page-orders-list",
+    "api:departments-list",
+    "api:departments-migratory",
+    "api:officers-list",
+    "api:documents-list",
+    "api:news-articles-list",
+]
+PRE_WARM_DEPARTMENT_URL_NAMES = [
+    "api:departments-detail",
+    "api:departments-officers",
+    "api:departments-documents",
+    "api:departments-news-articles",
+    "api:departments-datasets",
+    "api:departments-migratory-by-department",
+]
+PRE_WARM_OFFICER_URL_NAMES = [
+    "api:officers-detail",
+    "api:officers-timeline",
+]
@@ -12,13 +12,17 @@ class Command(BaseCommand):
         task_log.finished_at = timezone.now()
         task_log.save()
 
-        pre_warm_api = APIPreWarmer()
-        pre_warm_fp_errors = pre_warm_api.pre_warm_front_page_api()
-        pre_warm_dp_errors = pre_warm_api.pre_warm_department_api()
+        pre_warm_stats, pre_warm_errors = APIPreWarmer().pre_warm()
 
         task_log.finished_at = timezone.now()
+        task_log.stats = pre_warm_stats
 
-        error_mgs = "\n".join([*pre_warm_fp_errors, *pre_warm_dp_errors])
+        if pre_warm_stats["skipped"]:
+            pre_warm_errors.append(
+                f"{pre_warm_stats['skipped']} APIs skipped: time budget exceeded"
+            )
+
+        error_mgs = "\n".join(pre_warm_errors)
         if error_mgs:
             task_log.error_message = error_mgs
 
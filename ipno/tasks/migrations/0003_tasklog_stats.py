@@ -0,0 +1,18 @@
+# Generated by Django 3.1.13 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_tasklog_error_message'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tasklog',
+            name='stats',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
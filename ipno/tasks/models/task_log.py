@@ -9,6 +9,7 @@ class TaskLog(TimeStampsModel):
     )
     finished_at = models.DateTimeField(null=True, blank=True)
     error_message = models.TextField(null=True, blank=True)
+    stats = models.JSONField(null=True, blank=True)
 
     def __str__(self):
         return f"{self.task.task_name} run on {str(self.created_at.date())}"
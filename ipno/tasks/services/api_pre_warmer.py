@@ -1,72 +1,174 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
+from django.db.models import Count
+from django.urls import reverse
+from django.utils.http import urlencode
 
 import requests
-from tqdm import tqdm
 
 from departments.models import Department
+from historical_data.constants import RECENT_DEPARTMENT_TYPE, RECENT_OFFICER_TYPE
+from historical_data.models import AnonymousItem, AnonymousQuery
+from officers.models import Officer
+from tasks.constants import (
+    PRE_WARM_DEPARTMENT_URL_NAMES,
+    PRE_WARM_FRONT_PAGE_URL_NAMES,
+    PRE_WARM_MAX_WORKERS,
+    PRE_WARM_OFFICER_URL_NAMES,
+    PRE_WARM_RECENT_ITEMS_LIMIT,
+    PRE_WARM_REQUEST_TIMEOUT,
+    PRE_WARM_TIME_BUDGET,
+    PRE_WARM_TOP_DEPARTMENTS_LIMIT,
+    PRE_WARM_TOP_OFFICERS_LIMIT,
+    PRE_WARM_TOP_SEARCH_QUERIES_LIMIT,
+)
+from utils.cache_utils import normalize_search_query
 
 
 class APIPreWarmer:
-    def __init__(self):
-        self.url = settings.SERVER_URL + "/api/"
-
-    def pre_warm_front_page_api(self):
-        summary_api = self.url + "analytics/summary/"
-        front_page_card_api = self.url + "front-page-cards/"
-        front_page_order_api = self.url + "front-page-orders/"
-        department_list_api = self.url + "departments/"
-        migratory_api = self.url + "departments/migratory/"
-        officer_list_api = self.url + "officers/"
-        document_list_api = self.url + "documents/"
-        news_article_list_api = self.url + "news-articles/"
-
-        front_page_apis = [
-            summary_api,
-            front_page_card_api,
-            front_page_order_api,
-            department_list_api,
-            migratory_api,
-            officer_list_api,
-            document_list_api,
-            news_article_list_api,
+    def __init__(
+        self, max_workers=PRE_WARM_MAX_WORKERS, time_budget=PRE_WARM_TIME_BUDGET
+    ):
+        self.url = settings.SERVER_URL
+        self.max_workers = max_workers
+        self.time_budget = time_budget
+
+    def get_front_page_urls(self):
+        return [reverse(url_name) for url_name in PRE_WARM_FRONT_PAGE_URL_NAMES]
+
+    def get_department_urls(self, agency_slug):
+        return [
+            reverse(url_name, kwargs={"pk": agency_slug})
+            for url_name in PRE_WARM_DEPARTMENT_URL_NAMES
+        ]
+
+    def get_officer_urls(self, officer_id):
+        return [
+            reverse(url_name, kwargs={"pk": officer_id})
+            for url_name in PRE_WARM_OFFICER_URL_NAMES
+        ]
+
+    def get_recent_item_urls(self):
+        recent_items = AnonymousItem.objects.filter(
+            item_type__in=[RECENT_DEPARTMENT_TYPE, RECENT_OFFICER_TYPE]
+        ).order_by("-last_visited")[:PRE_WARM_RECENT_ITEMS_LIMIT]
+
+        urls = []
+        for recent_item in recent_items:
+            if recent_item.item_type == RECENT_DEPARTMENT_TYPE:
+                urls.extend(self.get_department_urls(recent_item.item_id))
+            elif recent_item.item_id.isdecimal():
+                urls.extend(self.get_officer_urls(recent_item.item_id))
+
+        return urls
+
+    def get_top_officer_urls(self):
+        officer_ids = (
+            Officer.objects.filter(canonical_person__isnull=False)
+            .order_by("-person__all_complaints_count")
+            .values_list("id", flat=True)[:PRE_WARM_TOP_OFFICERS_LIMIT]
+        )
+
+        return [
+            url
+            for officer_id in officer_ids
+            for url in self.get_officer_urls(officer_id)
+        ]
+
+    def get_search_urls(self):
+        queries = AnonymousQuery.objects.order_by(
+            "-visit_count", "-last_visited"
+        ).values_list("query", flat=True)[:PRE_WARM_TOP_SEARCH_QUERIES_LIMIT]
+        search_url = reverse("api:search-list")
+
+        urls = [
+            f"{search_url}?{urlencode({'q': normalize_search_query(query)})}"
+            for query in queries
+            if normalize_search_query(query)
         ]
 
-        error_messages = []
-        for api in tqdm(front_page_apis, desc="Pre-warming front page APIs"):
-            try:
-                requests.get(api)
-            except Exception as e:
-                error_messages.append(str(e))
+        return list(dict.fromkeys(urls))
 
-        return error_messages
+    def get_department_slugs(self):
+        return (
+            Department.objects.annotate(officers_count=Count("officers__id"))
+            .order_by("-officers_count", "agency_slug")
+            .values_list("agency_slug", flat=True)
+        )
 
-    def pre_warm_department_api(self):
-        departments = Department.objects.filter(agency_slug__isnull=False)
+    def get_prioritized_urls(self):
+        department_slugs = list(self.get_department_slugs())
+        top_department_slugs = department_slugs[:PRE_WARM_TOP_DEPARTMENTS_LIMIT]
+        other_department_slugs = department_slugs[PRE_WARM_TOP_DEPARTMENTS_LIMIT:]
 
-        error_messages = []
-        for department in tqdm(departments, desc="Pre-warming department page APIs"):
-            department_detail_api = (
-                self.url + "departments/" + department.agency_slug + "/"
+        urls = [
+            *self.get_front_page_urls(),
+            *self.get_recent_item_urls(),
+            *[
+                url
+                for agency_slug in top_department_slugs
+                for url in self.get_department_urls(agency_slug)
+            ],
+            *self.get_top_officer_urls(),
+            *[
+                url
+                for agency_slug in other_department_slugs
+                for url in self.get_department_urls(agency_slug)
+            ],
+        ]
+
+        return list(dict.fromkeys(urls))
+
+    def _pre_warm_url(self, url, deadline):
+        result = {"url": url, "status_code": None, "latency": None, "error": None}
+
+        if time.monotonic() > deadline:
+            return result
+
+        start_time = time.monotonic()
+        try:
+            response = requests.get(self.url + url, timeout=PRE_WARM_REQUEST_TIMEOUT)
+            result["status_code"] = response.status_code
+            if response.status_code >= 400:
+                result["error"] = f"{url} responded with {response.status_code}"
+        except Exception as e:
+            result["error"] = f"{url}: {e}"
+        result["latency"] = round(time.monotonic() - start_time, 3)
+
+        return result
+
+    def pre_warm(self, urls=None):
+        start_time = time.monotonic()
+        deadline = start_time + self.time_budget
+        urls = self.get_prioritized_urls() if urls is None else urls
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(
+                executor.map(lambda url: self._pre_warm_url(url, deadline), urls)
             )
-            officer_api = department_detail_api + "officers/"
-            document_api = department_detail_api + "documents/"
-            news_article_api = department_detail_api + "news_articles/"
-            dataset_api = department_detail_api + "datasets/"
-            migratory_api = department_detail_api + "migratory-by-department/"
-
-            department_apis = [
-                department_detail_api,
-                officer_api,
-                document_api,
-                news_article_api,
-                dataset_api,
-                migratory_api,
-            ]
-
-            for api in department_apis:
-                try:
-                    requests.get(api)
-                except Exception as e:
-                    error_messages.append(str(e))
-
-        return error_messages
+
+        requested_results = [
+            result for result in results if result["latency"] is not None
+        ]
+        errors = [result["error"] for result in requested_results if result["error"]]
+        latencies = [result["latency"] for result in requested_results]
+
+        stats = {
+            "total": len(results),
+            "succeeded": len(requested_results) - len(errors),
+            "failed": len(errors),
+            "skipped": len(results) - len(requested_results),
+            "duration": round(time.monotonic() - start_time, 3),
+            "average_latency": (
+                round(sum(latencies) / len(latencies), 3) if latencies else None
+            ),
+            "max_latency": max(latencies, default=None),
+            "urls": results,
+        }
+
+        return stats, errors
+
+    def pre_warm_search(self):
+        return self.pre_warm(self.get_search_urls())
@@ -9,20 +9,16 @@ from tasks.models import Task, TaskLog
 
 class PreWarmAPICommandTestCase(TestCase):
     @override_settings(SERVER_URL="http://web:8000")
-    @patch("tasks.services.APIPreWarmer.pre_warm_front_page_api")
-    @patch("tasks.services.APIPreWarmer.pre_warm_department_api")
-    def test_call_command(
-        self, pre_warm_front_page_api_mock, pre_warm_department_api_mock
-    ):
+    @patch("tasks.services.APIPreWarmer.pre_warm")
+    def test_call_command(self, pre_warm_mock):
         TaskFactory(command="pre_warm_api")
 
-        pre_warm_front_page_api_mock.return_value = []
-        pre_warm_department_api_mock.return_value = []
+        stats = {"total": 8, "succeeded": 8, "failed": 0, "skipped": 0, "urls": []}
+        pre_warm_mock.return_value = (stats, [])
 
         call_command("pre_warm_api")
 
-        pre_warm_front_page_api_mock.assert_called()
-        pre_warm_department_api_mock.assert_called()
+        pre_warm_mock.assert_called()
 
         task = Task.objects.get(command="pre_warm_api")
 
@@ -30,23 +26,23 @@ class PreWarmAPICommandTestCase(TestCase):
 
         assert task_logs.count() == 1
         assert task_logs.first().task == task
+        assert task_logs.first().stats == stats
         assert not task_logs.first().error_message
 
     @override_settings(SERVER_URL="http://web:8000")
-    @patch("tasks.services.APIPreWarmer.pre_warm_front_page_api")
-    @patch("tasks.services.APIPreWarmer.pre_warm_department_api")
-    def test_handle_command_error(
-        self, pre_warm_front_page_api_mock, pre_warm_department_api_mock
-    ):
+    @patch("tasks.services.APIPreWarmer.pre_warm")
+    def test_handle_command_error(self, pre_warm_mock):
         TaskFactory(command="pre_warm_api")
 
-        pre_warm_front_page_api_mock.return_value = ["Test front page api error"]
-        pre_warm_department_api_mock.return_value = ["Test department page api error"]
+        stats = {"total": 8, "succeeded": 5, "failed": 2, "skipped": 1, "urls": []}
+        pre_warm_mock.return_value = (
+            stats,
+            ["Test front page api error", "Test department page api error"],
+        )
 
         call_command("pre_warm_api")
 
-        pre_warm_front_page_api_mock.assert_called()
-        pre_warm_department_api_mock.assert_called()
+        pre_warm_mock.assert_called()
 
         task = Task.objects.get(command="pre_warm_api")
 
@@ -54,7 +50,10 @@ class PreWarmAPICommandTestCase(TestCase):
 
         assert task_logs.count() == 1
         assert task_logs.first().task == task
+        assert task_logs.first().stats == stats
         assert (
             task_logs.first().error_message
-            == "Test department page api error\nTest front page api error"
+            == "Test front page api error\n"
+            "Test department page api error\n"
+            "1 APIs skipped: time budget exceeded"
         )
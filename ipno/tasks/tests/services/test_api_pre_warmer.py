@@ -3,52 +3,165 @@ from django.test import TestCase, override_settings
 from mock import patch
 
 from departments.factories import DepartmentFactory
+from historical_data.constants import RECENT_DEPARTMENT_TYPE, RECENT_OFFICER_TYPE
+from historical_data.factories import AnonymousQueryFactory
+from historical_data.models import AnonymousItem
+from officers.factories import OfficerFactory
+from people.factories import PersonFactory
 from tasks.services import APIPreWarmer
 
 
 class APIPreWarmerTestCase(TestCase):
-    @patch("tasks.services.api_pre_warmer.requests.get")
     @override_settings(SERVER_URL="http://web:8000")
-    def test_pre_warm_front_page_api_successfully(self, mock_request_get):
-        mock_request_get.return_value.status_code = 200
-        mock_request_get.return_value.json.return_value = "mock response"
+    def test_get_prioritized_urls(self):
+        department_1 = DepartmentFactory(agency_slug="department-1")
+        department_2 = DepartmentFactory(agency_slug="department-2")
+        department_3 = DepartmentFactory(agency_slug="department-3")
+        OfficerFactory.create_batch(2, department=department_2)
+
+        officer_1 = OfficerFactory(department=department_1)
+        person_1 = PersonFactory(canonical_officer=officer_1, all_complaints_count=1)
+        person_1.officers.add(officer_1)
+
+        officer_2 = OfficerFactory(department=department_1)
+        person_2 = PersonFactory(canonical_officer=officer_2, all_complaints_count=9)
+        person_2.officers.add(officer_2)
+
+        AnonymousItem.objects.create(
+            item_id=department_3.agency_slug, item_type=RECENT_DEPARTMENT_TYPE
+        )
+
+        with patch("tasks.services.api_pre_warmer.PRE_WARM_TOP_DEPARTMENTS_LIMIT", 1):
+            urls = APIPreWarmer().get_prioritized_urls()
+
+        assert urls == [
+            "/api/analytics/summary/",
+            "/api/front-page-cards/",
+            "/api/front-page-orders/",
+            "/api/departments/",
+            "/api/departments/migratory/",
+            "/api/officers/",
+            "/api/documents/",
+            "/api/news-articles/",
+            "/api/departments/department-3/",
+            "/api/departments/department-3/officers/",
+            "/api/departments/department-3/documents/",
+            "/api/departments/department-3/news_articles/",
+            "/api/departments/department-3/datasets/",
+            "/api/departments/department-3/migratory-by-department/",
+            "/api/departments/department-1/",
+            "/api/departments/department-1/officers/",
+            "/api/departments/department-1/documents/",
+            "/api/departments/department-1/news_articles/",
+            "/api/departments/department-1/datasets/",
+            "/api/departments/department-1/migratory-by-department/",
+            f"/api/officers/{officer_2.id}/",
+            f"/api/officers/{officer_2.id}/timeline/",
+            f"/api/officers/{officer_1.id}/",
+            f"/api/officers/{officer_1.id}/timeline/",
+            "/api/departments/department-2/",
+            "/api/departments/department-2/officers/",
+            "/api/departments/department-2/documents/",
+            "/api/departments/department-2/news_articles/",
+            "/api/departments/department-2/datasets/",
+            "/api/departments/department-2/migratory-by-department/",
+        ]
+
+    @override_settings(SERVER_URL="http://web:8000")
+    def test_get_recent_item_urls(self):
+        officer = OfficerFactory()
+        AnonymousItem.objects.create(
+            item_id=str(officer.id), item_type=RECENT_OFFICER_TYPE
+        )
+        AnonymousItem.objects.create(item_id="1", item_type="DOCUMENT")
+
+        urls = APIPreWarmer().get_recent_item_urls()
 
-        api_pre_warmer = APIPreWarmer()
-        pre_warming_errors = api_pre_warmer.pre_warm_front_page_api()
+        assert urls == [
+            f"/api/officers/{officer.id}/",
+            f"/api/officers/{officer.id}/timeline/",
+        ]
 
-        assert len(pre_warming_errors) == 0
+    @override_settings(SERVER_URL="http://web:8000")
+    def test_get_search_urls(self):
+        AnonymousQueryFactory(query="Jones", visit_count=3)
+        AnonymousQueryFactory(query=" NOPD ", visit_count=10)
+        AnonymousQueryFactory(query="nopd", visit_count=2)
+        AnonymousQueryFactory(query="  ", visit_count=20)
+
+        urls = APIPreWarmer().get_search_urls()
+
+        assert urls == ["/api/search/?q=nopd", "/api/search/?q=jones"]
 
     @patch("tasks.services.api_pre_warmer.requests.get")
     @override_settings(SERVER_URL="http://web:8000")
-    def test_pre_warm_front_page_api_fail(self, mock_request_get):
-        mock_request_get.side_effect = Exception()
+    def test_pre_warm_search(self, mock_request_get):
+        AnonymousQueryFactory(query="nopd")
 
-        api_pre_warmer = APIPreWarmer()
-        pre_warming_errors = api_pre_warmer.pre_warm_front_page_api()
+        mock_request_get.return_value.status_code = 200
 
-        assert len(pre_warming_errors) > 0
+        stats, errors = APIPreWarmer().pre_warm_search()
+
+        assert errors == []
+        assert stats["total"] == 1
+        mock_request_get.assert_called_once_with(
+            "http://web:8000/api/search/?q=nopd", timeout=120
+        )
 
     @patch("tasks.services.api_pre_warmer.requests.get")
     @override_settings(SERVER_URL="http://web:8000")
-    def test_pre_warm_department_page_api_successfully(self, mock_request_get):
+    def test_pre_warm_successfully(self, mock_request_get):
         DepartmentFactory()
 
         mock_request_get.return_value.status_code = 200
-        mock_request_get.return_value.json.return_value = "mock response"
 
-        api_pre_warmer = APIPreWarmer()
-        pre_warming_errors = api_pre_warmer.pre_warm_department_api()
+        stats, errors = APIPreWarmer().pre_warm()
 
-        assert len(pre_warming_errors) == 0
+        assert errors == []
+        assert stats["total"] == 14
+        assert stats["succeeded"] == 14
+        assert stats["failed"] == 0
+        assert stats["skipped"] == 0
+        assert stats["urls"][0]["url"] == "/api/analytics/summary/"
+        assert stats["urls"][0]["status_code"] == 200
+        assert stats["urls"][0]["latency"] is not None
+        mock_request_get.assert_any_call(
+            "http://web:8000/api/analytics/summary/", timeout=120
+        )
 
     @patch("tasks.services.api_pre_warmer.requests.get")
     @override_settings(SERVER_URL="http://web:8000")
-    def test_pre_warm_department_api_fail(self, mock_request_get):
+    def test_pre_warm_fail(self, mock_request_get):
         DepartmentFactory()
 
-        mock_request_get.side_effect = Exception()
+        mock_request_get.side_effect = Exception("Connection error")
+
+        stats, errors = APIPreWarmer().pre_warm()
+
+        assert len(errors) == 14
+        assert errors[0] == "/api/analytics/summary/: Connection error"
+        assert stats["succeeded"] == 0
+        assert stats["failed"] == 14
+
+    @patch("tasks.services.api_pre_warmer.requests.get")
+    @override_settings(SERVER_URL="http://web:8000")
+    def test_pre_warm_error_status(self, mock_request_get):
+        mock_request_get.return_value.status_code = 500
+
+        stats, errors = APIPreWarmer().pre_warm()
+
+        assert errors[0] == "/api/analytics/summary/ responded with 500"
+        assert stats["urls"][0]["status_code"] == 500
+        assert stats["failed"] == 8
+
+    @patch("tasks.services.api_pre_warmer.requests.get")
+    @override_settings(SERVER_URL="http://web:8000")
+    def test_pre_warm_exceed_time_budget(self, mock_request_get):
+        DepartmentFactory()
 
-        api_pre_warmer = APIPreWarmer()
-        pre_warming_errors = api_pre_warmer.pre_warm_department_api()
+        stats, errors = APIPreWarmer(time_budget=-1).pre_warm()
 
-        assert len(pre_warming_errors) > 0
+        mock_request_get.assert_not_called()
+        assert errors == []
+        assert stats["skipped"] == 14
+        assert stats["urls"][0]["latency"] is None
@@ -1,8 +1,5 @@
 from elasticsearch_dsl import analysis, analyzer, tokenizer
 
-remove_white_spaces = analysis.char_filter(
-    "remove_white_spaces", "pattern_replace", pattern=" ", replacement=""
-)
 remove_new_lines = analysis.char_filter(
     "remove_new_lines", "pattern_replace", pattern="\n", replacement=" "
 )
@@ -12,17 +9,21 @@ remove_apostrophe = analysis.char_filter(
 
 token_min_length = analysis.token_filter("token_min_length", type="length", min=2)
 
+edge_ngram_filter = analysis.token_filter(
+    "edge_ngram_filter",
+    type="edge_ngram",
+    min_gram=2,
+    max_gram=20,
+    preserve_original=True,
+)
+
+word_tokenizer = tokenizer("word", "pattern", pattern=r"[^\p{L}\p{N}\-]+")
+
 autocomplete_analyzer = analyzer(
-    "autocomplete_analyzer",
-    char_filter=[remove_white_spaces],
-    filter=["lowercase"],
-    tokenizer=tokenizer(
-        "autocomplete",
-        "ngram",
-        min_gram=2,
-        max_gram=20,
-        token_chars=["letter", "digit", "dash_punctuation"],
-    ),
+    "edge_ngram_analyzer",
+    char_filter=[remove_apostrophe],
+    filter=["lowercase", "asciifolding", edge_ngram_filter],
+    tokenizer=word_tokenizer,
 )
 
 text_analyzer = analyzer(
@@ -34,6 +35,7 @@ text_analyzer = analyzer(
 
 search_analyzer = analyzer(
     "search_analyzer",
-    filter=["lowercase", token_min_length],
-    tokenizer=tokenizer("autocomplete_search", "pattern", pattern=r"[^a-zA-Z0-9\-]+"),
+    char_filter=[remove_apostrophe],
+    filter=["lowercase", "asciifolding", token_min_length],
+    tokenizer=word_tokenizer,
 )
@@ -1,19 +1,104 @@
+import hashlib
+import json
+import time
 from functools import wraps
 
 from django.core.cache import cache
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 
 from rest_framework.response import Response
 
 from departments.models import Department
 from news_articles.models import MatchedSentence
 from officers.models import Officer
+from utils.constants import (
+    CACHE_CONTROL_S_MAXAGE,
+    DATA_VERSION_CACHE_KEY,
+    SEARCH_CACHE_QUERY_PARAMS,
+    SEARCH_CACHE_TIMEOUT,
+    SEARCH_INDEX_VERSION_CACHE_KEY,
+)
+from utils.es_pagination import ESPagination
+
+
+def get_data_version():
+    data_version = cache.get(DATA_VERSION_CACHE_KEY)
+
+    if not data_version:
+        data_version = bump_data_version()
+
+    return data_version
+
+
+def bump_data_version():
+    data_version = time.time_ns()
+    cache.set(DATA_VERSION_CACHE_KEY, data_version, None)
+
+    return data_version
+
+
+def get_search_index_version():
+    search_index_version = cache.get(SEARCH_INDEX_VERSION_CACHE_KEY)
+
+    if not search_index_version:
+        search_index_version = bump_search_index_version()
+
+    return search_index_version
+
+
+def bump_search_index_version():
+    search_index_version = time.time_ns()
+    cache.set(SEARCH_INDEX_VERSION_CACHE_KEY, search_index_version, None)
+
+    return search_index_version
+
+
+def normalize_search_query(query):
+    return " ".join((query or "").lower().split())
+
+
+def get_search_cache_key(request):
+    params = {
+        param: request.query_params.get(param)
+        for param in SEARCH_CACHE_QUERY_PARAMS
+        if request.query_params.get(param) is not None
+    }
+    params["q"] = normalize_search_query(params.get("q"))
+    params_hash = hashlib.md5(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    return f"search:{get_search_index_version()}:{request.path}:{params_hash}"
+
+
+def set_validators(request, response, data_version):
+    response["ETag"] = f'W/"{data_version}"'
+    response["Last-Modified"] = http_date(data_version // 10**9)
+
+    if request.META.get("HTTP_AUTHORIZATION"):
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(
+            response, public=True, max_age=0, s_maxage=CACHE_CONTROL_S_MAXAGE
+        )
+
+    return response
 
 
 def custom_cache(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         request = args[1]
+        data_version = get_data_version()
+
+        not_modified_response = get_conditional_response(
+            request,
+            etag=f'W/"{data_version}"',
+            last_modified=data_version // 10**9,
+        )
+        if not_modified_response:
+            return set_validators(request, not_modified_response, data_version)
+
         request_path = request.get_full_path()
         response_data = cache.get(request_path)
 
@@ -22,7 +107,41 @@ def custom_cache(func):
             response_data = response.data
             cache.set(request_path, response_data)
 
-        return Response(response_data)
+        return set_validators(request, Response(response_data), data_version)
+
+    return wrapper
+
+
+def is_cursor_search_request(request):
+    return (
+        request.query_params.get(ESPagination.cursor_query_param) is not None
+        or request.query_params.get(ESPagination.pagination_query_param)
+        == ESPagination.cursor_pagination
+    )
+
+
+def search_cache(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        request = args[1]
+
+        # Cursor responses hold point-in-time ids that expire long before
+        # the search cache does.
+        if is_cursor_search_request(request):
+            return func(*args, **kwargs)
+
+        cache_key = get_search_cache_key(request)
+        response_data = cache.get(cache_key)
+
+        if response_data is not None:
+            return Response(response_data)
+
+        response = func(*args, **kwargs)
+
+        if response.status_code == 200:
+            cache.set(cache_key, response.data, SEARCH_CACHE_TIMEOUT)
+
+        return response
 
     return wrapper
 
@@ -35,19 +154,24 @@ def flush_news_article_related_caches(start_time=None):
     officers = Officer.objects.filter(matched_sentences__in=matched_sentences)
     departments = Department.objects.filter(officers__in=officers).distinct()
 
-    delete_cache("api:analytics-summary")
+    cache_keys = [reverse("api:analytics-summary")]
 
     for officer in officers:
-        delete_cache("api:officers-timeline", url_kwargs={"pk": officer.id})
+        cache_keys.append(reverse("api:officers-timeline", kwargs={"pk": officer.id}))
 
     for department in departments:
-        delete_cache(
-            "api:departments-detail", url_kwargs={"pk": department.agency_slug}
+        cache_keys.append(
+            reverse("api:departments-detail", kwargs={"pk": department.agency_slug})
         )
-        delete_cache(
-            "api:departments-news-articles", url_kwargs={"pk": department.agency_slug}
+        cache_keys.append(
+            reverse(
+                "api:departments-news-articles", kwargs={"pk": department.agency_slug}
+            )
         )
 
+    cache.delete_many(cache_keys)
+    bump_data_version()
+
 
 def delete_cache(pattern, url_kwargs=None):
     cache.delete(reverse(pattern, kwargs=url_kwargs))
@@ -24,3 +24,34 @@ LA_LOC_TOP_LEFT = -94.0693795, 33.0033475
 LA_LOC_BOTTOM_RIGHT = -88.707158, 28.892697
 MAP_DOT_RADIUS = 8
 MAP_DOT_SHARPNESS = 3
+
+PREVIEW_IMAGE_SIZE = (850, 1100)
+PREVIEW_IMAGE_RESOLUTION = 100
+PREVIEW_IMAGE_MAX_FILE_SIZE = 100 * 1024 * 1024
+PREVIEW_IMAGE_TIME_LIMIT = 30
+PREVIEW_RENDER_MAX_PENDING_JOBS = 16
+
+DATA_VERSION_CACHE_KEY = "data_version"
+CACHE_CONTROL_S_MAXAGE = 60
+
+SEARCH_INDEX_VERSION_CACHE_KEY = "search_index_version"
+SEARCH_CACHE_TIMEOUT = 5 * 60
+SEARCH_CACHE_QUERY_PARAMS = [
+    "q",
+    "doc_type",
+    "department",
+    "kind",
+    "limit",
+    "offset",
+]
+
+SEARCH_INDEX_UPDATE_CHUNK_SIZE = 500
+SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE = 200
+SEARCH_INDEX_REBUILD_THRESHOLD = 10000
+
+DATAFILE_EXPORT_LOCK_TIMEOUT = 10 * 60
+DATAFILE_URL_EXPIRATION = 15 * 60
+
+PERSON_CARDS_BATCH_SIZE = 1000
+
+KEYSET_PAGINATION_MAX_LIMIT = 100
@@ -1,10 +1,16 @@
-from django.db.models import Count
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 
 from tqdm import tqdm
 
 from departments.models import Department
-from officers.models import Officer
+from officers.models import Event, Officer
 from people.models import Person
+from shared.serializers.simple_department_serializer import serialize_card_departments
+from use_of_forces.models import UseOfForce
+from utils.constants import PERSON_CARDS_BATCH_SIZE, SEARCH_INDEX_REBUILD_THRESHOLD
+from utils.search_index import record_search_index_changes
 
 
 def count_complaints():
@@ -18,6 +24,103 @@ def count_complaints():
         person.save()
 
 
+def compute_person_cards(person_ids=None):
+    event_ordering = (
+        F("year").desc(nulls_last=True),
+        F("month").desc(nulls_last=True),
+        F("day").desc(nulls_last=True),
+    )
+    person_events = Event.objects.filter(officer__person=OuterRef("pk"))
+    department_events = person_events.filter(department__isnull=False)
+
+    def person_aggregate(queryset, aggregate):
+        return Subquery(
+            queryset.order_by()
+            .values("officer__person")
+            .annotate(aggregate=aggregate)
+            .values("aggregate")
+        )
+
+    people = Person.objects.all()
+
+    if person_ids is not None:
+        people = people.filter(id__in=person_ids)
+
+    people = people.annotate(
+        computed_badges=person_aggregate(
+            person_events.exclude(badge_no__isnull=True).exclude(badge_no=""),
+            ArrayAgg("badge_no", ordering=event_ordering),
+        ),
+        computed_latest_rank=Subquery(
+            person_events.exclude(rank_desc__isnull=True)
+            .exclude(rank_desc="")
+            .order_by(*event_ordering)
+            .values("rank_desc")[:1]
+        ),
+        computed_department_slugs=person_aggregate(
+            department_events,
+            ArrayAgg("department__agency_slug", ordering=event_ordering),
+        ),
+        computed_department_names=person_aggregate(
+            department_events,
+            ArrayAgg("department__agency_name", ordering=event_ordering),
+        ),
+        computed_use_of_forces_count=Coalesce(
+            person_aggregate(
+                UseOfForce.objects.filter(officer__person=OuterRef("pk")), Count("id")
+            ),
+            Value(0),
+        ),
+        canonical_department_slug=F("canonical_officer__department__agency_slug"),
+        canonical_department_name=F("canonical_officer__department__agency_name"),
+    )
+
+    updated_people = []
+
+    for person in tqdm(
+        people.iterator(chunk_size=PERSON_CARDS_BATCH_SIZE),
+        desc="Compute person cards",
+    ):
+        card = {
+            "card_badges": list(dict.fromkeys(person.computed_badges or [])),
+            "card_departments": serialize_card_departments(
+                [
+                    person.canonical_department_slug,
+                    *(person.computed_department_slugs or []),
+                ],
+                [
+                    person.canonical_department_name,
+                    *(person.computed_department_names or []),
+                ],
+            ),
+            "card_latest_rank": person.computed_latest_rank,
+            "all_use_of_forces_count": person.computed_use_of_forces_count,
+        }
+
+        if any(getattr(person, field) != value for field, value in card.items()):
+            for field, value in card.items():
+                setattr(person, field, value)
+            updated_people.append(person)
+
+    Person.objects.bulk_update(
+        updated_people,
+        [
+            "card_badges",
+            "card_departments",
+            "card_latest_rank",
+            "all_use_of_forces_count",
+        ],
+        batch_size=PERSON_CARDS_BATCH_SIZE,
+    )
+
+    if len(updated_people) > SEARCH_INDEX_REBUILD_THRESHOLD:
+        updated_officers = Officer.objects.all()
+    else:
+        updated_officers = Officer.objects.filter(person__in=updated_people)
+
+    record_search_index_changes(Officer, updated_officers.values_list("id", flat=True))
+
+
 def calculate_officer_fraction():
     all_departments = Department.objects.all()
     max_officer_count = (
@@ -27,11 +130,18 @@ def calculate_officer_fraction():
         .officer_count
     )
 
+    updated_department_ids = []
+
     for department in tqdm(all_departments, desc="Update officer fraction"):
         fraction = department.officers.count() / max_officer_count
 
-        department.officer_fraction = fraction
-        department.save()
+        if department.officer_fraction != fraction:
+            Department.objects.filter(id=department.id).update(
+                officer_fraction=fraction
+            )
+            updated_department_ids.append(department.id)
+
+    record_search_index_changes(Department, updated_department_ids)
 
 
 def calculate_complaint_fraction():
@@ -40,6 +150,8 @@ def calculate_complaint_fraction():
         Person.objects.order_by("-all_complaints_count").first().all_complaints_count
     )
 
+    updated_officer_ids = []
+
     for officer in tqdm(all_officers, desc="Update complaint fraction"):
         fraction = (
             officer.person.all_complaints_count / max_complaint_count
@@ -47,5 +159,9 @@ def calculate_complaint_fraction():
             else 0
         )
 
-        officer.complaint_fraction = fraction
-        officer.save()
+        if officer.complaint_fraction != fraction:
+            officer.complaint_fraction = fraction
+            officer.save()
+            updated_officer_ids.append(officer.id)
+
+    record_search_index_changes(Officer, updated_officer_ids)
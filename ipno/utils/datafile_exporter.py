@@ -0,0 +1,83 @@
+from tempfile import NamedTemporaryFile
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+
+from data.constants import IMPORT_LOG_STATUS_FINISHED
+from data.models import ImportLog
+from utils.constants import DATAFILE_EXPORT_LOCK_TIMEOUT, DATAFILE_URL_EXPIRATION
+from utils.google_cloud import GoogleCloudService
+
+
+class DatafileExporter:
+    export_path = None
+    file_extension = None
+    content_type = None
+
+    def __init__(self):
+        self.gcs = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
+        self.import_version = self.get_import_version()
+        self.file_prefix = f"{self.export_path}/{self.get_file_key()}-"
+        self.file_path = (
+            f"{self.file_prefix}{self.import_version}.{self.file_extension}"
+        )
+        self.lock_key = f"datafile_export:{self.file_path}"
+
+    @property
+    def filename(self):
+        raise NotImplementedError
+
+    def get_file_key(self):
+        raise NotImplementedError
+
+    def write_file(self, file_name):
+        raise NotImplementedError
+
+    def get_import_version(self):
+        return (
+            ImportLog.objects.filter(status=IMPORT_LOG_STATUS_FINISHED).aggregate(
+                version=Max("id")
+            )["version"]
+            or 0
+        )
+
+    def is_exported(self):
+        return self.gcs.is_object_exists(self.file_path)
+
+    def acquire_export_lock(self):
+        return cache.add(self.lock_key, True, DATAFILE_EXPORT_LOCK_TIMEOUT)
+
+    def ensure_exported(self, export_task, *args):
+        if self.is_exported():
+            return True
+
+        if not self.acquire_export_lock():
+            return False
+
+        export_task(*args)
+
+        return self.is_exported()
+
+    def delete_outdated_files(self):
+        for object_name in self.gcs.list_object_names(self.file_prefix):
+            version = object_name[len(self.file_prefix) :].split(".")[0]
+
+            if version.isdigit() and int(version) < self.import_version:
+                self.gcs.delete_file_from_url(object_name)
+
+    def export(self):
+        try:
+            with NamedTemporaryFile(suffix=f".{self.file_extension}") as export_file:
+                self.write_file(export_file.name)
+                self.gcs.upload_file_from_filename(
+                    self.file_path, export_file.name, self.content_type
+                )
+            self.delete_outdated_files()
+        finally:
+            cache.delete(self.lock_key)
+
+    def get_download_url(self):
+        return self.gcs.generate_signed_url(
+            self.file_path, DATAFILE_URL_EXPIRATION, filename=self.filename
+        )
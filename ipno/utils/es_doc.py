@@ -1,19 +1,292 @@
+import hashlib
+import json
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.utils import timezone
+
+import structlog
 from django_elasticsearch_dsl import Document
+from elasticsearch.helpers import bulk
+
+from data.models import SearchIndexChange
+from utils.constants import (
+    SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE,
+    SEARCH_INDEX_UPDATE_CHUNK_SIZE,
+)
+
+logger = structlog.get_logger("IPNO")
 
 
 class ESDoc(Document):
-    def create_index(self):
-        self._index.create()
+    target_index = None
+    related_lookups = {}
+    search_serializer = None
+    chunk_data = {}
+    indexed_count = 0
+
+    def get_indexing_queryset(self):
+        return self.get_queryset()
+
+    def get_search_results(self, ids):
+        return self.search_serializer([]).get_source_data(ids)
+
+    def get_chunk_data(self, ids):
+        if not self.search_serializer:
+            return {}
+
+        return {"search_result": self.get_search_results(ids)}
+
+    def get_chunk_value(self, field_name, instance, default=None):
+        return self.chunk_data.get(field_name, {}).get(instance.id, default)
+
+    def prepare_search_result(self, instance):
+        return self.get_chunk_value("search_result", instance)
+
+    def get_drifted_ids(self, size=SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE):
+        response = (
+            self.search()
+            .query("function_score", random_score={})
+            .source(["search_result"])[:size]
+            .execute()
+        )
+        hits = {int(hit.meta.id): hit for hit in response}
+        search_results = self.get_search_results(list(hits))
+
+        return sorted(
+            object_id
+            for object_id, hit in hits.items()
+            if getattr(hit, "search_result", None) is None
+            or hit.search_result.to_dict() != search_results.get(object_id)
+        )
+
+    def is_related_model(self, model):
+        return model is self.django.model or model._meta.label in self.related_lookups
+
+    def get_changed_ids(self, model, ids):
+        if model is self.django.model:
+            return ids
+
+        lookup = self.related_lookups.get(model._meta.label)
+
+        if not lookup:
+            return []
+
+        return (
+            self.django.model.objects.filter(**{lookup: ids})
+            .values_list("id", flat=True)
+            .distinct()
+        )
+
+    def get_live_indices(self):
+        connection = self._get_connection()
+        alias = self._index._name
+
+        if connection.indices.exists_alias(name=alias):
+            return list(connection.indices.get_alias(name=alias))
+
+        if connection.indices.exists(index=alias):
+            return [alias]
+
+        return []
+
+    def get_mapping_hash(self):
+        index = self._index.to_dict()
+        definition = {
+            "mappings": index.get("mappings", {}),
+            "analysis": index.get("settings", {}).get("analysis", {}),
+        }
+
+        return hashlib.md5(json.dumps(definition, sort_keys=True).encode()).hexdigest()
+
+    def create_index(self, index_name):
+        index = self._index.clone(name=index_name)
+        index.settings(number_of_replicas=0, refresh_interval="-1")
+        index.create()
+
+        self._get_connection().indices.put_mapping(
+            index=index_name,
+            body={"_meta": {"mapping_hash": self.get_mapping_hash()}},
+        )
 
     def index_data(self, options={}):
-        parallel = options.get("parallel")
-        qs = self.get_indexing_queryset()
-        self.update(qs, parallel=parallel)
+        parallel = options.get("parallel", True)
+        chunk_size = options.get(
+            "chunk_size", settings.ELASTICSEARCH_INDEXING_CHUNK_SIZE
+        )
+        thread_count = options.get(
+            "thread_count", settings.ELASTICSEARCH_INDEXING_THREAD_COUNT
+        )
+        kwargs = {"chunk_size": chunk_size}
+        batch_size = chunk_size
+
+        if parallel:
+            kwargs["thread_count"] = thread_count
+            batch_size = chunk_size * thread_count
+
+        self.indexed_count = 0
+        start_time = time.monotonic()
+        objects = self.get_indexing_queryset().iterator(chunk_size=chunk_size)
+        batch = list(islice(objects, batch_size))
+
+        while batch:
+            actions = list(self._get_actions(batch, "index"))
+            self._bulk(actions, parallel=parallel, **kwargs)
+            batch = list(islice(objects, batch_size))
+
+        elapsed_time = time.monotonic() - start_time
+        docs_per_second = self.indexed_count / elapsed_time if elapsed_time else 0
+        logger.info(
+            f"Indexed {self.indexed_count} documents into {self._index._name} "
+            f"in {elapsed_time:.2f}s ({docs_per_second:.0f} docs/s)"
+        )
+
+        return {
+            "count": self.indexed_count,
+            "elapsed_time": elapsed_time,
+            "docs_per_second": docs_per_second,
+        }
+
+    def finalize_index(self, index_name):
+        connection = self._get_connection()
+
+        connection.indices.put_settings(
+            index=index_name,
+            body={
+                "index": {
+                    "number_of_replicas": self._index._settings.get(
+                        "number_of_replicas"
+                    ),
+                    "refresh_interval": self._index._settings.get("refresh_interval"),
+                }
+            },
+        )
+        connection.indices.refresh(index=index_name)
+        connection.indices.forcemerge(index=index_name, max_num_segments=1)
+
+    def swap_alias(self, index_name):
+        connection = self._get_connection()
+        alias = self._index._name
+        live_indices = self.get_live_indices()
+
+        if live_indices == [alias]:
+            connection.indices.delete(index=alias)
+            live_indices = []
+
+        connection.indices.update_aliases(
+            body={
+                "actions": [
+                    *[
+                        {"remove": {"index": live_index, "alias": alias}}
+                        for live_index in live_indices
+                    ],
+                    {"add": {"index": index_name, "alias": alias}},
+                ]
+            }
+        )
+
+        if live_indices:
+            connection.indices.delete(index=",".join(live_indices), ignore=404)
 
     def delete_index(self):
-        self._index.delete(ignore=404)
+        live_indices = self.get_live_indices()
+
+        if live_indices:
+            self._get_connection().indices.delete(
+                index=",".join(live_indices), ignore=404
+            )
+
+    def is_mapping_changed(self):
+        live_mappings = self._get_connection().indices.get_mapping(
+            index=self._index._name
+        )
+        mapping_hash = self.get_mapping_hash()
+
+        return any(
+            live_mapping["mappings"].get("_meta", {}).get("mapping_hash")
+            != mapping_hash
+            for live_mapping in live_mappings.values()
+        )
+
+    def update_index(self, options={}):
+        search_index_changes = SearchIndexChange.objects.filter(
+            index_name=self._index._name
+        ).order_by("id")
+        changes = list(search_index_changes.values_list("id", "object_id"))
+
+        if (
+            not self.get_live_indices()
+            or self.is_mapping_changed()
+            or search_index_changes.filter(object_id__isnull=True).exists()
+        ):
+            self.rebuild_index(options)
+            if changes:
+                search_index_changes.filter(id__lte=changes[-1][0]).delete()
+            return
+
+        if not changes:
+            return
+
+        object_ids = sorted({object_id for _, object_id in changes})
+
+        for i in range(0, len(object_ids), SEARCH_INDEX_UPDATE_CHUNK_SIZE):
+            chunk_ids = object_ids[i : i + SEARCH_INDEX_UPDATE_CHUNK_SIZE]
+            instances = list(self.get_indexing_queryset().filter(id__in=chunk_ids))
+            deleted_ids = set(chunk_ids) - {instance.id for instance in instances}
+
+            self.update(instances, refresh=False)
+            bulk(
+                client=self._get_connection(),
+                actions=[
+                    {"_op_type": "delete", "_index": self._index._name, "_id": id}
+                    for id in deleted_ids
+                ],
+                raise_on_error=False,
+            )
+
+        self._get_connection().indices.refresh(index=self._index._name)
+        search_index_changes.filter(id__lte=changes[-1][0]).delete()
+
+    def _get_actions(self, object_list, action):
+        objects = iter(object_list)
+        chunk = list(islice(objects, settings.ELASTICSEARCH_INDEXING_CHUNK_SIZE))
+
+        while chunk:
+            if action != "delete":
+                self.chunk_data = self.get_chunk_data(
+                    [object_instance.id for object_instance in chunk]
+                )
+
+            for object_instance in chunk:
+                self.indexed_count += 1
+                yield self._prepare_action(object_instance, action)
+
+            chunk = list(islice(objects, settings.ELASTICSEARCH_INDEXING_CHUNK_SIZE))
+
+        self.chunk_data = {}
+
+    def _prepare_action(self, object_instance, action):
+        prepared_action = super()._prepare_action(object_instance, action)
+
+        if self.target_index:
+            prepared_action["_index"] = self.target_index
+
+        return prepared_action
 
     def rebuild_index(self, options={}):
-        self.delete_index()
-        self.create_index()
-        self.index_data(options)
+        index_name = f"{self._index._name}_{timezone.now():%Y%m%d%H%M%S%f}"
+
+        self.create_index(index_name)
+        self.target_index = index_name
+
+        try:
+            self.index_data(options)
+            self.finalize_index(index_name)
+        except Exception:
+            self._get_connection().indices.delete(index=index_name, ignore=404)
+            raise
+        finally:
+            self.target_index = None
+
+        self.swap_alias(index_name)
@@ -1,4 +1,2 @@
 class ESIndex:
-    settings = {
-        "max_ngram_diff": 20,
-    }
+    settings = {}
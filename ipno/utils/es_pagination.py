@@ -1,11 +1,144 @@
+import base64
+import json
+
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from elasticsearch import NotFoundError
 
 
 class ESPagination(LimitOffsetPagination):
-    def paginate_es_query(self, search_query, request):
+    cursor_query_param = "cursor"
+    pagination_query_param = "pagination"
+    cursor_pagination = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    expired_cursor_message = "Cursor has expired"
+
+    def init_pagination(self, request):
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
-        response = search_query.search(self.limit, self.offset)
-        self.count = response.hits.total.value
         self.request = request
+        self.cursor = self.decode_cursor(request)
+        self.use_cursor = (
+            self.cursor is not None
+            or request.query_params.get(self.pagination_query_param)
+            == self.cursor_pagination
+        )
+        self.next_cursor = None
+        self.previous_cursor = None
+
+    def set_es_response(self, response):
+        self.count = response.hits.total.value
+
+    def paginate_es_query(self, search_query, request):
+        self.init_pagination(request)
+
+        if self.use_cursor:
+            return self.paginate_es_query_by_cursor(search_query)
+
+        response = search_query.search(self.limit, self.offset)
+        self.set_es_response(response)
         return response
+
+    def paginate_es_query_by_cursor(self, search_query):
+        cursor = self.cursor or {"pit": None, "after": None, "reverse": False}
+        pit_id = cursor["pit"]
+        reverse = cursor["reverse"]
+
+        try:
+            response = search_query.cursor_query(
+                self.limit + 1, pit_id, cursor["after"], reverse
+            ).execute()
+        except NotFoundError:
+            raise NotFound(self.expired_cursor_message)
+
+        self.set_es_response(response)
+        hits = list(response)
+        has_more = len(hits) > self.limit
+        page = hits[: self.limit]
+
+        # A point in time is only held while the walk can continue in its
+        # current direction; turning back starts from the live index again.
+        if pit_id:
+            pit_id = getattr(response, "pit_id", pit_id)
+
+        if has_more and not pit_id:
+            pit_id = search_query.open_point_in_time()
+        elif not has_more and pit_id:
+            search_query.close_point_in_time(pit_id)
+            pit_id = None
+
+        if reverse:
+            page.reverse()
+
+        has_next = bool(page) and (reverse or has_more)
+        has_previous = bool(page) and (has_more if reverse else bool(self.cursor))
+
+        if has_next:
+            self.next_cursor = {
+                "pit": pit_id,
+                "after": list(page[-1].meta.sort),
+                "reverse": False,
+            }
+
+        if has_previous:
+            self.previous_cursor = {
+                "pit": pit_id,
+                "after": list(page[0].meta.sort),
+                "reverse": True,
+            }
+
+        return page
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            not isinstance(cursor, dict)
+            or not isinstance(cursor.get("pit", False), (str, type(None)))
+            or not isinstance(cursor.get("after"), list)
+            or not isinstance(cursor.get("reverse"), bool)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def get_cursor_link(self, cursor):
+        encoded = base64.urlsafe_b64encode(json.dumps(cursor).encode("ascii"))
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.offset_query_param)
+        url = remove_query_param(url, self.pagination_query_param)
+
+        return replace_query_param(url, self.cursor_query_param, encoded.decode())
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+
+        return self.get_cursor_link(self.next_cursor) if self.next_cursor else None
+
+    def get_previous_link(self):
+        if not self.use_cursor:
+            return super().get_previous_link()
+
+        if not self.previous_cursor:
+            return None
+
+        return self.get_cursor_link(self.previous_cursor)
+
+    def get_paginated_data(self, data):
+        return {
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
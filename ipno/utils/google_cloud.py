@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 from shutil import rmtree
 
 from django.conf import settings
@@ -46,6 +47,22 @@ class GoogleCloudService:
         blob = self.bucket.blob(destination_location)
         blob.upload_from_string(file_blob, content_type=content_type)
 
+    def upload_file_from_filename(self, destination_location, filename, content_type):
+        blob = self.bucket.blob(destination_location)
+        blob.upload_from_filename(filename, content_type=content_type)
+
+    def generate_signed_url(self, object_path, expiration, filename=None):
+        blob = self.bucket.blob(object_path)
+
+        return blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=expiration),
+            method="GET",
+            response_disposition=(
+                f"attachment; filename={filename}" if filename else None
+            ),
+        )
+
     def delete_file_from_url(self, file_url):
         blob = self.bucket.blob(file_url)
         blob.delete()
@@ -54,6 +71,9 @@ class GoogleCloudService:
         blob = self.bucket.blob(object_path)
         return blob.exists()
 
+    def list_object_names(self, prefix):
+        return [blob.name for blob in self.bucket.list_blobs(prefix=prefix)]
+
     def move_blob_internally(self, source_blob_name, destination_blob_name):
         """Moves a blob inside a bucket with a new name."""
         source_blob = self.bucket.blob(source_blob_name)
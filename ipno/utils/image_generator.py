@@ -1,4 +1,8 @@
+import hashlib
+import math
+from functools import lru_cache
 from io import BytesIO
+from tempfile import NamedTemporaryFile
 
 from django.conf import settings
 
@@ -6,50 +10,90 @@ from PIL import Image as PILImage
 from PIL import ImageDraw
 from PIL.Image import Resampling
 from wand.image import Image
+from wand.resource import limits
 
 from utils.constants import (
     LA_LOC_BOTTOM_RIGHT,
     LA_LOC_TOP_LEFT,
     MAP_DOT_RADIUS,
     MAP_DOT_SHARPNESS,
+    PREVIEW_IMAGE_MAX_FILE_SIZE,
+    PREVIEW_IMAGE_RESOLUTION,
+    PREVIEW_IMAGE_SIZE,
+    PREVIEW_IMAGE_TIME_LIMIT,
 )
 
 
+def init_preview_worker():
+    limits["time"] = PREVIEW_IMAGE_TIME_LIMIT
+
+
 def generate_from_blob(blob):
+    if len(blob) > PREVIEW_IMAGE_MAX_FILE_SIZE:
+        return None
+
     try:
-        with Image(blob=blob, resolution=500) as pic:
-            with pic.sequence[0] as first_page:
-                with Image(first_page) as fp_img:
-                    fp_img.sample(850, 1100)
-                    return fp_img.make_blob("jpeg")
+        with NamedTemporaryFile(suffix=".pdf") as pdf_file:
+            pdf_file.write(blob)
+            pdf_file.flush()
+
+            # The [0] suffix makes ImageMagick rasterize only the first page.
+            with Image(
+                filename=f"{pdf_file.name}[0]", resolution=PREVIEW_IMAGE_RESOLUTION
+            ) as first_page:
+                first_page.sample(*PREVIEW_IMAGE_SIZE)
+                return first_page.make_blob("jpeg")
     except Exception:
         pass
 
 
-def generate_dot_img(base_img_info, dot_location):
-    img_width, img_height = base_img_info
+def generate_dot_img(dot_location):
     x, y = dot_location
+    left = math.floor(x - MAP_DOT_RADIUS) - 1
+    top = math.floor(y - MAP_DOT_RADIUS) - 1
+    tile_size = 2 * MAP_DOT_RADIUS + 3
 
     dot_image = PILImage.new(
         "RGBA",
-        (img_width * MAP_DOT_SHARPNESS, img_height * MAP_DOT_SHARPNESS),
+        (tile_size * MAP_DOT_SHARPNESS, tile_size * MAP_DOT_SHARPNESS),
         (255, 255, 255, 0),
     )
     draw = ImageDraw.Draw(dot_image)
 
     upper_left_point = (
-        MAP_DOT_SHARPNESS * (x - MAP_DOT_RADIUS),
-        MAP_DOT_SHARPNESS * (y - MAP_DOT_RADIUS),
+        MAP_DOT_SHARPNESS * (x - left - MAP_DOT_RADIUS),
+        MAP_DOT_SHARPNESS * (y - top - MAP_DOT_RADIUS),
     )
     bottom_right_point = (
-        MAP_DOT_SHARPNESS * (x + MAP_DOT_RADIUS),
-        MAP_DOT_SHARPNESS * (y + MAP_DOT_RADIUS),
+        MAP_DOT_SHARPNESS * (x - left + MAP_DOT_RADIUS),
+        MAP_DOT_SHARPNESS * (y - top + MAP_DOT_RADIUS),
     )
 
     draw.ellipse([upper_left_point, bottom_right_point], fill="black")
-    dot_image = dot_image.resize(base_img_info, Resampling.LANCZOS)
+    dot_image = dot_image.resize((tile_size, tile_size), Resampling.LANCZOS)
+
+    return dot_image, (left, top)
+
 
-    return dot_image
+@lru_cache(maxsize=1)
+def get_base_map():
+    with PILImage.open(f"{settings.BASE_DIR}/map.png") as base_image:
+        return base_image.convert("RGBA")
+
+
+@lru_cache(maxsize=1)
+def get_base_map_hash():
+    with open(f"{settings.BASE_DIR}/map.png", "rb") as base_map_file:
+        return hashlib.md5(base_map_file.read()).hexdigest()
+
+
+def get_map_thumbnail_hash(longitude, latitude):
+    content = (
+        f"{get_base_map_hash()}:{longitude}:{latitude}:"
+        f"{MAP_DOT_RADIUS}:{MAP_DOT_SHARPNESS}"
+    )
+
+    return hashlib.md5(content.encode()).hexdigest()
 
 
 def generate_map_thumbnail(longitude, latitude):
@@ -59,28 +103,25 @@ def generate_map_thumbnail(longitude, latitude):
     if latitude > LA_LOC_TOP_LEFT[1] or latitude < LA_LOC_BOTTOM_RIGHT[1]:
         raise ValueError(f"Invalid latitude {latitude}")
 
-    with PILImage.open(f"{settings.BASE_DIR}/map.png") as base_image:
-        img_width = base_image.width
-        img_height = base_image.height
-
-        x = (
-            (longitude - LA_LOC_TOP_LEFT[0])
-            / (LA_LOC_BOTTOM_RIGHT[0] - LA_LOC_TOP_LEFT[0])
-            * img_width
-        )
-        y = (
-            (latitude - LA_LOC_TOP_LEFT[1])
-            / (LA_LOC_BOTTOM_RIGHT[1] - LA_LOC_TOP_LEFT[1])
-            * img_height
-        )
-
-        dot_image = generate_dot_img((img_width, img_height), (x, y))
-
-        image = PILImage.alpha_composite(base_image, dot_image)
-
-        buf = BytesIO()
-        image.save(buf, format="PNG")
-        buffer_value = buf.getvalue()
-        buf.close()
-
-        return buffer_value
+    image = get_base_map().copy()
+
+    x = (
+        (longitude - LA_LOC_TOP_LEFT[0])
+        / (LA_LOC_BOTTOM_RIGHT[0] - LA_LOC_TOP_LEFT[0])
+        * image.width
+    )
+    y = (
+        (latitude - LA_LOC_TOP_LEFT[1])
+        / (LA_LOC_BOTTOM_RIGHT[1] - LA_LOC_TOP_LEFT[1])
+        * image.height
+    )
+
+    dot_image, dot_offset = generate_dot_img((x, y))
+    image.alpha_composite(dot_image, dest=dot_offset)
+
+    buf = BytesIO()
+    image.save(buf, format="PNG")
+    buffer_value = buf.getvalue()
+    buf.close()
+
+    return buffer_value
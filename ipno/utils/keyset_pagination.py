@@ -0,0 +1,137 @@
+import base64
+import json
+from functools import reduce
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from utils.constants import KEYSET_PAGINATION_MAX_LIMIT
+
+
+class KeysetPagination(LimitOffsetPagination):
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    max_limit = KEYSET_PAGINATION_MAX_LIMIT
+
+    def __init__(self, ordering):
+        self.ordering = ordering
+        self.fields = [field.lstrip("-") for field in ordering]
+
+    def get_field_value(self, item, field):
+        return reduce(getattr, field.split("__"), item)
+
+    def get_position(self, item):
+        return [self.get_field_value(item, field) for field in self.fields]
+
+    def get_keyset_filter(self, position, reverse):
+        lookups = []
+        for field in self.ordering:
+            is_descending = field.startswith("-")
+            lookups.append("lt" if is_descending != reverse else "gt")
+
+        keyset_filter = Q()
+        for index, (field, lookup) in enumerate(zip(self.fields, lookups)):
+            keyset_filter |= Q(
+                **dict(zip(self.fields[:index], position[:index])),
+                **{f"{field}__{lookup}": position[index]},
+            )
+
+        leading_bound = Q(**{f"{self.fields[0]}__{lookups[0]}e": position[0]})
+
+        return leading_bound & keyset_filter
+
+    def get_reversed_ordering(self):
+        return [
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.cursor = self.decode_cursor(request)
+        self.next_position = None
+        self.previous_position = None
+
+        reverse = bool(self.cursor and self.cursor["reverse"])
+        ordering = self.get_reversed_ordering() if reverse else self.ordering
+
+        if self.cursor:
+            queryset = queryset.filter(
+                self.get_keyset_filter(self.cursor["position"], reverse)
+            )
+
+        items = list(queryset.order_by(*ordering)[: self.limit + 1])
+        has_more = len(items) > self.limit
+        page = items[: self.limit]
+
+        if reverse:
+            page.reverse()
+            self.next_position = self.get_position(page[-1]) if page else None
+            self.previous_position = self.get_position(page[0]) if has_more else None
+        else:
+            self.next_position = self.get_position(page[-1]) if has_more else None
+            self.previous_position = (
+                self.get_position(page[0]) if page and self.cursor else None
+            )
+
+        return page
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            not isinstance(cursor, dict)
+            or not isinstance(cursor.get("position"), list)
+            or len(cursor["position"]) != len(self.fields)
+            or None in cursor["position"]
+            or not isinstance(cursor.get("reverse"), bool)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def get_cursor_link(self, position, reverse):
+        cursor = json.dumps(
+            {"position": position, "reverse": reverse}, cls=DjangoJSONEncoder
+        )
+        encoded = base64.urlsafe_b64encode(cursor.encode("ascii"))
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.offset_query_param)
+
+        return replace_query_param(url, self.cursor_query_param, encoded.decode())
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+
+        return self.get_cursor_link(self.next_position, False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+
+        return self.get_cursor_link(self.previous_position, True)
+
+    def get_paginated_data(self, data):
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
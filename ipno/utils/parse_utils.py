@@ -18,3 +18,25 @@ def parse_int(value):
         return int(float(value))
     except ValueError:
         return None
+
+
+def split_text_chunks(text, chunk_size):
+    chunks = []
+
+    for page, page_text in enumerate((text or "").split("\f"), start=1):
+        chunk_words = []
+        chunk_length = 0
+
+        for word in page_text.split():
+            if chunk_words and chunk_length + len(word) > chunk_size:
+                chunks.append({"page": page, "text": " ".join(chunk_words)})
+                chunk_words = []
+                chunk_length = 0
+
+            chunk_words.append(word)
+            chunk_length += len(word) + 1
+
+        if chunk_words:
+            chunks.append({"page": page, "text": " ".join(chunk_words)})
+
+    return chunks
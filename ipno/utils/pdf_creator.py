@@ -1,7 +1,10 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
 from utils.constants import (
@@ -13,6 +16,20 @@ from utils.constants import (
 )
 
 
+@lru_cache(maxsize=None)
+def get_paragraph_style(style_name, custom_style_items=()):
+    style = getSampleStyleSheet()[style_name]
+
+    if not custom_style_items:
+        return style
+
+    return ParagraphStyle(
+        f"{style_name}-custom",
+        parent=style,
+        **dict(custom_style_items),
+    )
+
+
 class ArticlePdfCreator:
     def __init__(self, title, author, date, content, link):
         self.title = title
@@ -42,13 +59,7 @@ class ArticlePdfCreator:
         return body
 
     def get_style(self, style_name, custom_style={}):
-        sample_style_sheet = getSampleStyleSheet()
-        style = sample_style_sheet[style_name]
-
-        for key, value in custom_style.items():
-            setattr(style, key, value)
-
-        return style
+        return get_paragraph_style(style_name, tuple(sorted(custom_style.items())))
 
     def build_pdf(self):
         pdf_buffer = BytesIO()
@@ -103,3 +114,15 @@ class ArticlePdfCreator:
             return None
 
         return pdf_value
+
+
+def render_article_pdf(article):
+    start_time = time.monotonic()
+    pdf_buffer = ArticlePdfCreator(**article).build_pdf()
+
+    return pdf_buffer, time.monotonic() - start_time
+
+
+def build_pdfs(articles, max_workers=None):
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render_article_pdf, articles))
@@ -0,0 +1,72 @@
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import current_process
+
+from utils.constants import PREVIEW_RENDER_MAX_PENDING_JOBS
+from utils.image_generator import generate_from_blob, init_preview_worker
+
+
+class PreviewRenderer:
+    def __init__(
+        self,
+        on_rendered,
+        max_workers=None,
+        max_pending_jobs=PREVIEW_RENDER_MAX_PENDING_JOBS,
+    ):
+        self.on_rendered = on_rendered
+        self.max_workers = max_workers
+        self.max_pending_jobs = max_pending_jobs
+        self.executor = None
+        self.jobs = {}
+
+    def __enter__(self):
+        # Daemonic processes such as prefork Celery workers cannot start
+        # children, so previews are rendered in-process there.
+        if not current_process().daemon:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=init_preview_worker
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.join()
+
+        for future in self.jobs:
+            future.cancel()
+
+        if self.executor:
+            self.executor.shutdown(wait=True)
+        self.executor = None
+        self.jobs = {}
+
+    def submit(self, key, blob):
+        if not self.executor:
+            try:
+                preview_blob = generate_from_blob(blob)
+            except Exception:
+                preview_blob = None
+
+            self.on_rendered(key, preview_blob)
+            return
+
+        if len(self.jobs) >= self.max_pending_jobs:
+            self._collect(FIRST_COMPLETED)
+
+        self.jobs[self.executor.submit(generate_from_blob, blob)] = key
+
+    def join(self):
+        if self.jobs:
+            self._collect(ALL_COMPLETED)
+
+    def _collect(self, return_when):
+        done, _ = wait(self.jobs, return_when=return_when)
+
+        for future in done:
+            key = self.jobs.pop(future)
+
+            try:
+                preview_blob = future.result()
+            except Exception:
+                preview_blob = None
+
+            self.on_rendered(key, preview_blob)
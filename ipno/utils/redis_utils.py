@@ -0,0 +1,24 @@
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+import redis
+from redis.sentinel import Sentinel
+
+
+@lru_cache
+def get_redis_client():
+    if not settings.USE_SENTINEL_REDIS:
+        return redis.Redis.from_url(settings.CELERY_BROKER_URL, decode_responses=True)
+
+    urls = [urlparse(url) for url in settings.CELERY_BROKER_URL.split(";")]
+    sentinel = Sentinel(
+        [(url.hostname, url.port) for url in urls],
+        sentinel_kwargs={"password": settings.REDIS_SENTINEL_PASSWORD},
+        password=urls[0].password,
+        db=int(urls[0].path.strip("/") or 0),
+        decode_responses=True,
+    )
+
+    return sentinel.master_for(settings.REDIS_SENTINEL_MASTER_NAME)
@@ -1,8 +1,112 @@
+from django.db.models import QuerySet
+
+import structlog
 from django_elasticsearch_dsl.registries import registry
 
+from data.models import SearchIndexChange
+from tasks.services import APIPreWarmer
+from utils.cache_utils import bump_search_index_version
+from utils.constants import (
+    SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE,
+    SEARCH_INDEX_REBUILD_THRESHOLD,
+)
+
+logger = structlog.get_logger("IPNO")
+
 
 def rebuild_search_index(options={}):
     models = registry.get_models()
 
     for doc in registry.get_documents(models):
         doc().rebuild_index(options)
+
+    bump_search_index_version()
+
+
+def update_search_index(options={}):
+    models = registry.get_models()
+
+    for doc in registry.get_documents(models):
+        doc().update_index(options)
+
+    bump_search_index_version()
+
+
+def warm_search_cache():
+    stats, errors = APIPreWarmer().pre_warm_search()
+    logger.info(f"Pre-warmed {stats['succeeded']} of {stats['total']} search queries")
+
+    for error in errors:
+        logger.warning("Failed to pre-warm search query", error=error)
+
+    return stats
+
+
+def count_ids(ids):
+    return ids.count() if isinstance(ids, QuerySet) else len(ids)
+
+
+def record_search_index_changes(model, ids):
+    if not isinstance(ids, QuerySet):
+        ids = set(ids)
+
+    ids_count = count_ids(ids)
+
+    if not ids_count:
+        return
+
+    search_index_changes = []
+
+    for doc in registry.get_documents(registry.get_models()):
+        es_doc = doc()
+
+        if not es_doc.is_related_model(model):
+            continue
+
+        index_name = es_doc._index._name
+        changed_ids = es_doc.get_changed_ids(model, ids)
+
+        if (
+            ids_count > SEARCH_INDEX_REBUILD_THRESHOLD
+            or count_ids(changed_ids) > SEARCH_INDEX_REBUILD_THRESHOLD
+        ):
+            search_index_changes.append(
+                SearchIndexChange(index_name=index_name, object_id=None)
+            )
+        else:
+            search_index_changes.extend(
+                SearchIndexChange(index_name=index_name, object_id=object_id)
+                for object_id in changed_ids
+            )
+
+    SearchIndexChange.objects.bulk_create(
+        search_index_changes, batch_size=1000, ignore_conflicts=True
+    )
+
+
+def check_search_index_consistency(size=SEARCH_INDEX_CONSISTENCY_SAMPLE_SIZE):
+    drifted_ids = {}
+
+    for doc in registry.get_documents(registry.get_models()):
+        es_doc = doc()
+
+        if not es_doc.search_serializer:
+            continue
+
+        index_name = es_doc._index._name
+        drifted_ids[index_name] = es_doc.get_drifted_ids(size)
+
+        if drifted_ids[index_name]:
+            logger.warning(
+                f"Search index {index_name} has drifted for "
+                f"{len(drifted_ids[index_name])} documents"
+            )
+            SearchIndexChange.objects.bulk_create(
+                [
+                    SearchIndexChange(index_name=index_name, object_id=object_id)
+                    for object_id in drifted_ids[index_name]
+                ],
+                ignore_conflicts=True,
+            )
+
+    return drifted_ids
@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 from django.core.cache import cache
 from django.test.testcases import TestCase
@@ -14,9 +14,15 @@ from news_articles.factories.matched_sentence_factory import MatchedSentenceFact
 from officers.factories import OfficerFactory
 from people.factories import PersonFactory
 from utils.cache_utils import (
+    bump_data_version,
+    bump_search_index_version,
     custom_cache,
     delete_cache,
     flush_news_article_related_caches,
+    get_data_version,
+    get_search_cache_key,
+    get_search_index_version,
+    search_cache,
 )
 
 
@@ -58,6 +64,7 @@ class CacheUtilsTestCase(TestCase):
 
         request = MagicMock()
         request.get_full_path.return_value = url
+        request.META = {}
 
         view = MagicMock()
 
@@ -71,6 +78,184 @@ class CacheUtilsTestCase(TestCase):
         cached_func(view, request)
         mock_func_call.assert_called_once()
 
+    def test_custom_cache_validators(self):
+        response = MagicMock()
+        response.data = "test"
+
+        request = MagicMock()
+        request.get_full_path.return_value = reverse("api:departments-list")
+        request.META = {}
+
+        result = custom_cache(Mock(return_value=response))(MagicMock(), request)
+
+        data_version = get_data_version()
+        assert result["ETag"] == f'W/"{data_version}"'
+        assert result["Last-Modified"]
+        assert "public" in result["Cache-Control"]
+        assert "s-maxage=60" in result["Cache-Control"]
+
+    def test_custom_cache_private_for_authorized_request(self):
+        response = MagicMock()
+        response.data = "test"
+
+        request = MagicMock()
+        request.get_full_path.return_value = reverse("api:departments-list")
+        request.META = {"HTTP_AUTHORIZATION": "Bearer token"}
+
+        result = custom_cache(Mock(return_value=response))(MagicMock(), request)
+
+        assert "private" in result["Cache-Control"]
+        assert "public" not in result["Cache-Control"]
+
+    def test_custom_cache_not_modified(self):
+        data_version = get_data_version()
+
+        request = MagicMock()
+        request.method = "GET"
+        request.META = {"HTTP_IF_NONE_MATCH": f'W/"{data_version}"'}
+
+        mock_func_call = Mock()
+
+        result = custom_cache(mock_func_call)(MagicMock(), request)
+
+        mock_func_call.assert_not_called()
+        request.get_full_path.assert_not_called()
+        assert result.status_code == 304
+        assert result["ETag"] == f'W/"{data_version}"'
+
+    def test_custom_cache_modified_after_data_version_bumped(self):
+        data_version = get_data_version()
+        bump_data_version()
+
+        response = MagicMock()
+        response.data = "test"
+
+        request = MagicMock()
+        request.method = "GET"
+        request.get_full_path.return_value = reverse("api:departments-list")
+        request.META = {"HTTP_IF_NONE_MATCH": f'W/"{data_version}"'}
+
+        result = custom_cache(Mock(return_value=response))(MagicMock(), request)
+
+        assert result.status_code == 200
+        assert result.data == "test"
+        assert result["ETag"] != f'W/"{data_version}"'
+
+    def test_get_data_version_after_cache_cleared(self):
+        data_version = get_data_version()
+
+        cache.clear()
+
+        assert get_data_version() != data_version
+
+    def get_search_request(self, query_params):
+        request = MagicMock()
+        request.path = reverse("api:search-list")
+        request.query_params = query_params
+
+        return request
+
+    def test_get_search_cache_key_normalizes_query(self):
+        key = get_search_cache_key(
+            self.get_search_request({"q": "  NOPD  Officer ", "doc_type": "officers"})
+        )
+
+        assert key == get_search_cache_key(
+            self.get_search_request(
+                {"doc_type": "officers", "q": "nopd officer", "_": "123"}
+            )
+        )
+        assert key != get_search_cache_key(
+            self.get_search_request(
+                {"q": "nopd officer", "doc_type": "officers", "offset": "20"}
+            )
+        )
+
+    def test_get_search_cache_key_changes_with_search_index_version(self):
+        request = self.get_search_request({"q": "nopd"})
+        key = get_search_cache_key(request)
+
+        search_index_version = get_search_index_version()
+        assert str(search_index_version) in key
+
+        bump_search_index_version()
+
+        assert get_search_cache_key(request) != key
+
+    def test_search_cache(self):
+        response = MagicMock()
+        response.status_code = 200
+        response.data = {"officers": []}
+        mock_func_call = Mock(return_value=response)
+        cached_func = search_cache(mock_func_call)
+
+        result = cached_func(MagicMock(), self.get_search_request({"q": "Nopd"}))
+
+        assert result.data == {"officers": []}
+        assert cache.get(
+            get_search_cache_key(self.get_search_request({"q": "nopd"}))
+        ) == {"officers": []}
+
+        result = cached_func(MagicMock(), self.get_search_request({"q": "nopd "}))
+
+        mock_func_call.assert_called_once()
+        assert result.data == {"officers": []}
+
+        bump_search_index_version()
+        cached_func(MagicMock(), self.get_search_request({"q": "nopd"}))
+
+        assert mock_func_call.call_count == 2
+
+    def test_search_cache_skips_error_response(self):
+        response = MagicMock()
+        response.status_code = 400
+        mock_func_call = Mock(return_value=response)
+        cached_func = search_cache(mock_func_call)
+
+        cached_func(MagicMock(), self.get_search_request({"q": "nopd"}))
+        cached_func(MagicMock(), self.get_search_request({"q": "nopd"}))
+
+        assert mock_func_call.call_count == 2
+
+    def test_search_cache_skips_cursor_requests(self):
+        response = MagicMock()
+        response.status_code = 200
+        response.data = {"results": [], "next": "cursor-url"}
+        mock_func_call = Mock(return_value=response)
+        cached_func = search_cache(mock_func_call)
+
+        for query_params in [
+            {"q": "nopd", "pagination": "cursor"},
+            {"q": "nopd", "cursor": "cursor"},
+        ]:
+            cached_func(MagicMock(), self.get_search_request(query_params))
+            cached_func(MagicMock(), self.get_search_request(query_params))
+
+        assert mock_func_call.call_count == 4
+        assert (
+            cache.get(get_search_cache_key(self.get_search_request({"q": "nopd"})))
+            is None
+        )
+
+    def test_delete_cache_keeps_data_version(self):
+        data_version = get_data_version()
+
+        delete_cache("api:departments-list")
+
+        assert get_data_version() == data_version
+
+    @patch("utils.cache_utils.bump_data_version")
+    def test_flush_news_article_related_caches_bumps_data_version_once(
+        self, mock_bump_data_version
+    ):
+        officers = OfficerFactory.create_batch(3)
+        matched_sentence = MatchedSentenceFactory()
+        matched_sentence.officers.add(*officers)
+
+        flush_news_article_related_caches()
+
+        mock_bump_data_version.assert_called_once()
+
     def test_flush_news_article_related_caches_no_start_time(self):
         department = DepartmentFactory(agency_name="New Orleans PD")
         DepartmentFactory()
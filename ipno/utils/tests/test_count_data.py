@@ -1,13 +1,16 @@
 from django.test.testcases import TestCase
 
 from complaints.factories import ComplaintFactory
+from data.models import SearchIndexChange
 from departments.factories import DepartmentFactory
-from officers.factories import OfficerFactory
+from officers.factories import EventFactory, OfficerFactory
 from people.factories import PersonFactory
 from people.models import Person
+from use_of_forces.factories import UseOfForceFactory
 from utils.count_data import (
     calculate_complaint_fraction,
     calculate_officer_fraction,
+    compute_person_cards,
     count_complaints,
 )
 
@@ -114,3 +117,62 @@ class CalculateComplaintFractionTestCase(TestCase):
         assert officer_1.complaint_fraction == 0.25
         assert officer_2.complaint_fraction == 0.5
         assert officer_3.complaint_fraction == 1.0
+
+
+class ComputePersonCardsTestCase(TestCase):
+    def test_compute_person_cards(self):
+        department_1 = DepartmentFactory()
+        department_2 = DepartmentFactory()
+        officer_1 = OfficerFactory(department=department_1)
+        officer_2 = OfficerFactory(department=department_2)
+        person = PersonFactory(canonical_officer=officer_2)
+        person.officers.add(officer_1, officer_2)
+
+        EventFactory(
+            officer=officer_1,
+            department=department_1,
+            badge_no="67893",
+            rank_desc="junior",
+            year=2017,
+            month=1,
+            day=1,
+        )
+        EventFactory(
+            officer=officer_1,
+            department=department_1,
+            badge_no="12435",
+            rank_desc=None,
+            year=2020,
+            month=5,
+            day=4,
+        )
+        EventFactory(
+            officer=officer_2,
+            department=None,
+            badge_no="67893",
+            rank_desc="senior",
+            year=2019,
+            month=None,
+            day=None,
+        )
+        UseOfForceFactory(officer=officer_1)
+        UseOfForceFactory(officer=officer_2)
+
+        compute_person_cards()
+
+        person.refresh_from_db()
+
+        assert person.card_badges == ["12435", "67893"]
+        assert person.card_latest_rank == "senior"
+        assert person.card_departments == [
+            {"id": department_2.agency_slug, "name": department_2.agency_name},
+            {"id": department_1.agency_slug, "name": department_1.agency_name},
+        ]
+        assert person.all_use_of_forces_count == 2
+        assert SearchIndexChange.objects.filter(object_id=officer_1.id).exists()
+
+        SearchIndexChange.objects.all().delete()
+
+        compute_person_cards()
+
+        assert not SearchIndexChange.objects.exists()
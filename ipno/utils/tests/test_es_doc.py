@@ -0,0 +1,271 @@
+from django.test.testcases import TestCase
+
+from elasticsearch_dsl.utils import AttrDict
+from freezegun import freeze_time
+from mock import MagicMock, Mock, call, patch
+
+from data.models import SearchIndexChange
+from departments.documents import DepartmentESDoc
+from departments.factories import DepartmentFactory
+
+INDEX_NAME = "test_departments_20220101000000000000"
+
+
+@freeze_time("2022-01-01")
+class ESDocTestCase(TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        patch(
+            "departments.documents.DepartmentESDoc._get_connection",
+            return_value=self.connection,
+        ).start()
+        self.create_index_mock = patch("elasticsearch_dsl.Index.create").start()
+        self.actions = []
+        self.bulk_mock = patch(
+            "departments.documents.DepartmentESDoc.bulk",
+            side_effect=lambda actions, **kwargs: self.actions.extend(actions),
+        ).start()
+        self.parallel_bulk_mock = patch(
+            "departments.documents.DepartmentESDoc.parallel_bulk",
+            side_effect=lambda actions, **kwargs: self.actions.extend(actions),
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def test_rebuild_index(self):
+        department = DepartmentFactory()
+        self.connection.indices.exists_alias.return_value = True
+        self.connection.indices.get_alias.return_value = {
+            "test_departments_20211231000000000000": {"aliases": {}}
+        }
+
+        DepartmentESDoc().rebuild_index()
+
+        self.create_index_mock.assert_called_once()
+        assert self.actions[0]["_index"] == INDEX_NAME
+        assert self.actions[0]["_id"] == department.id
+        assert self.parallel_bulk_mock.call_args[1] == {
+            "chunk_size": 500,
+            "thread_count": 4,
+        }
+
+        self.connection.indices.put_settings.assert_called_with(
+            index=INDEX_NAME,
+            body={"index": {"number_of_replicas": None, "refresh_interval": None}},
+        )
+        self.connection.indices.forcemerge.assert_called_with(
+            index=INDEX_NAME, max_num_segments=1
+        )
+        self.connection.indices.update_aliases.assert_called_with(
+            body={
+                "actions": [
+                    {
+                        "remove": {
+                            "index": "test_departments_20211231000000000000",
+                            "alias": "test_departments",
+                        }
+                    },
+                    {"add": {"index": INDEX_NAME, "alias": "test_departments"}},
+                ]
+            }
+        )
+        self.connection.indices.delete.assert_called_with(
+            index="test_departments_20211231000000000000", ignore=404
+        )
+
+    def test_index_data(self):
+        departments = DepartmentFactory.create_batch(5)
+        es_doc = DepartmentESDoc()
+        es_doc.target_index = INDEX_NAME
+
+        with patch(
+            "departments.documents.DepartmentESDoc.get_chunk_data", return_value={}
+        ) as get_chunk_data_mock:
+            stats = es_doc.index_data(
+                {"parallel": False, "chunk_size": 2, "thread_count": 1}
+            )
+
+        self.parallel_bulk_mock.assert_not_called()
+        assert self.bulk_mock.call_count == 3
+        assert self.bulk_mock.call_args[1] == {"chunk_size": 2}
+        assert get_chunk_data_mock.call_count == 3
+        assert sorted(action["_id"] for action in self.actions) == sorted(
+            department.id for department in departments
+        )
+        assert stats["count"] == 5
+
+    def test_index_data_parallel(self):
+        DepartmentFactory.create_batch(5)
+        es_doc = DepartmentESDoc()
+
+        with self.settings(ELASTICSEARCH_INDEXING_CHUNK_SIZE=2):
+            stats = es_doc.index_data({"chunk_size": 2, "thread_count": 2})
+
+        assert self.parallel_bulk_mock.call_count == 2
+        assert self.parallel_bulk_mock.call_args[1] == {
+            "chunk_size": 2,
+            "thread_count": 2,
+        }
+        assert len(self.actions) == 5
+        assert stats["count"] == 5
+
+    def test_rebuild_index_create_index_settings(self):
+        es_doc = DepartmentESDoc()
+
+        with patch("elasticsearch_dsl.Index.settings") as settings_mock:
+            es_doc.create_index(INDEX_NAME)
+
+        settings_mock.assert_called_with(number_of_replicas=0, refresh_interval="-1")
+        self.connection.indices.put_mapping.assert_called_with(
+            index=INDEX_NAME,
+            body={"_meta": {"mapping_hash": es_doc.get_mapping_hash()}},
+        )
+
+    def test_rebuild_index_replace_legacy_index(self):
+        self.connection.indices.exists_alias.return_value = False
+        self.connection.indices.exists.return_value = True
+
+        DepartmentESDoc().rebuild_index()
+
+        assert self.connection.indices.delete.call_args_list == [
+            call(index="test_departments")
+        ]
+        self.connection.indices.update_aliases.assert_called_with(
+            body={
+                "actions": [{"add": {"index": INDEX_NAME, "alias": "test_departments"}}]
+            }
+        )
+
+    def test_rebuild_index_failed(self):
+        DepartmentFactory()
+        self.parallel_bulk_mock.side_effect = Exception("Bulk failed")
+
+        es_doc = DepartmentESDoc()
+
+        with self.assertRaises(Exception):
+            es_doc.rebuild_index()
+
+        self.connection.indices.delete.assert_called_with(index=INDEX_NAME, ignore=404)
+        self.connection.indices.update_aliases.assert_not_called()
+        assert es_doc.target_index is None
+
+    def test_update_index(self):
+        department_1 = DepartmentFactory()
+        department_2 = DepartmentFactory()
+        SearchIndexChange.objects.create(
+            index_name="test_departments", object_id=department_1.id
+        )
+        SearchIndexChange.objects.create(
+            index_name="test_departments", object_id=department_2.id + 1
+        )
+        SearchIndexChange.objects.create(
+            index_name="test_officers", object_id=department_1.id
+        )
+
+        es_doc = DepartmentESDoc()
+        self.connection.indices.exists_alias.return_value = True
+        self.connection.indices.get_alias.return_value = {
+            "test_departments_20211231000000000000": {"aliases": {}}
+        }
+        self.connection.indices.get_mapping.return_value = {
+            "test_departments_20211231000000000000": {
+                "mappings": {"_meta": {"mapping_hash": es_doc.get_mapping_hash()}}
+            }
+        }
+
+        with patch("utils.es_doc.bulk") as delete_bulk_mock:
+            es_doc.update_index()
+
+        self.create_index_mock.assert_not_called()
+        assert [action["_id"] for action in self.actions] == [department_1.id]
+        assert self.actions[0]["_index"] == "test_departments"
+        assert list(delete_bulk_mock.call_args[1]["actions"]) == [
+            {
+                "_op_type": "delete",
+                "_index": "test_departments",
+                "_id": department_2.id + 1,
+            }
+        ]
+        assert list(SearchIndexChange.objects.values_list("index_name", flat=True)) == [
+            "test_officers"
+        ]
+
+    def test_update_index_rebuild_when_mapping_changed(self):
+        SearchIndexChange.objects.create(index_name="test_departments", object_id=1)
+        self.connection.indices.exists_alias.return_value = True
+        self.connection.indices.get_alias.return_value = {
+            "test_departments_20211231000000000000": {"aliases": {}}
+        }
+        self.connection.indices.get_mapping.return_value = {
+            "test_departments_20211231000000000000": {
+                "mappings": {"_meta": {"mapping_hash": "outdated"}}
+            }
+        }
+
+        DepartmentESDoc().update_index()
+
+        self.create_index_mock.assert_called_once()
+        self.connection.indices.update_aliases.assert_called()
+        assert not SearchIndexChange.objects.exists()
+
+    def test_update_index_rebuild_when_no_live_index(self):
+        self.connection.indices.exists_alias.return_value = False
+        self.connection.indices.exists.return_value = False
+
+        DepartmentESDoc().update_index()
+
+        self.create_index_mock.assert_called_once()
+
+    def test_update_index_rebuild_when_full_rebuild_is_recorded(self):
+        SearchIndexChange.objects.create(index_name="test_departments", object_id=1)
+        SearchIndexChange.objects.create(index_name="test_departments", object_id=None)
+        es_doc = DepartmentESDoc()
+        self.connection.indices.exists_alias.return_value = True
+        self.connection.indices.get_alias.return_value = {
+            "test_departments_20211231000000000000": {"aliases": {}}
+        }
+        self.connection.indices.get_mapping.return_value = {
+            "test_departments_20211231000000000000": {
+                "mappings": {"_meta": {"mapping_hash": es_doc.get_mapping_hash()}}
+            }
+        }
+
+        es_doc.update_index()
+
+        self.create_index_mock.assert_called_once()
+        assert not SearchIndexChange.objects.exists()
+
+    def test_get_drifted_ids(self):
+        department_1 = DepartmentFactory()
+        department_2 = DepartmentFactory()
+        department_3 = DepartmentFactory()
+        es_doc = DepartmentESDoc()
+        search_results = es_doc.get_search_results([department_1.id, department_2.id])
+        hits = [
+            Mock(
+                meta=Mock(id=str(department_1.id)),
+                search_result=AttrDict(search_results[department_1.id]),
+            ),
+            Mock(
+                meta=Mock(id=str(department_2.id)),
+                search_result=AttrDict(
+                    {**search_results[department_2.id], "name": "Old name"}
+                ),
+            ),
+            Mock(meta=Mock(id=str(department_3.id)), search_result=None),
+            Mock(
+                meta=Mock(id=str(department_3.id + 1)),
+                search_result=AttrDict(search_results[department_1.id]),
+            ),
+        ]
+
+        search = MagicMock()
+        search.query.return_value = search
+        search.source.return_value = search
+        search.__getitem__.return_value = search
+        search.execute.return_value = hits
+
+        with patch("departments.documents.DepartmentESDoc.search", return_value=search):
+            drifted_ids = es_doc.get_drifted_ids(10)
+
+        search.__getitem__.assert_called_with(slice(None, 10, None))
+        assert drifted_ids == [department_2.id, department_3.id, department_3.id + 1]
@@ -1,10 +1,35 @@
+import base64
+import json
+from urllib.parse import parse_qs, urlparse
+
 from django.test.testcases import TestCase
 
-from mock import Mock
+from rest_framework.exceptions import NotFound
+
+from elasticsearch import NotFoundError
+from mock import MagicMock, Mock
 
 from utils.es_pagination import ESPagination
 
 
+def get_query_param(url, param):
+    return parse_qs(urlparse(url).query).get(param, [None])[0]
+
+
+def encode_cursor(cursor):
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def mock_cursor_response(ids, total, pit_id):
+    response = MagicMock()
+    response.__iter__.return_value = iter(
+        [Mock(id=id, meta=Mock(sort=[1.0, id])) for id in ids]
+    )
+    response.hits.total.value = total
+    response.pit_id = pit_id
+    return response
+
+
 class ESPaginationTestCase(TestCase):
     def test_paginate_es_query(self):
         request = Mock()
@@ -26,3 +51,170 @@ class ESPaginationTestCase(TestCase):
         assert paginator.offset == 30
         assert paginator.request == request
         assert list(page) == [1, 2, 3]
+
+    def test_get_paginated_data(self):
+        request = Mock()
+        request.query_params = {"limit": 20, "offset": 20}
+        request.build_absolute_uri.return_value = "http://testserver/search/"
+        search_result = Mock()
+        search_result.hits.total.value = 50
+
+        paginator = ESPagination()
+        paginator.init_pagination(request)
+        paginator.set_es_response(search_result)
+
+        assert paginator.get_paginated_data([1, 2]) == {
+            "count": 50,
+            "next": "http://testserver/search/?limit=20&offset=40",
+            "previous": "http://testserver/search/?limit=20",
+            "results": [1, 2],
+        }
+
+    def test_paginate_es_query_by_cursor(self):
+        request = Mock()
+        request.query_params = {"limit": 2, "pagination": "cursor"}
+        request.build_absolute_uri.return_value = (
+            "http://testserver/search/?limit=2&pagination=cursor"
+        )
+        search_query = Mock()
+        search_query.open_point_in_time.return_value = "pit-1"
+        search_query.cursor_query.return_value.execute.return_value = (
+            mock_cursor_response([1, 2, 3], 5, None)
+        )
+
+        paginator = ESPagination()
+        page = paginator.paginate_es_query(search_query, request)
+
+        search_query.cursor_query.assert_called_with(3, None, None, False)
+        search_query.open_point_in_time.assert_called_once()
+        assert [doc.id for doc in page] == [1, 2]
+        assert paginator.count == 5
+        assert paginator.get_previous_link() is None
+
+        next_link = paginator.get_next_link()
+        assert get_query_param(next_link, "pagination") is None
+        assert get_query_param(next_link, "limit") == "2"
+        assert paginator.next_cursor["pit"] == "pit-1"
+
+        request.query_params = {
+            "limit": 2,
+            "cursor": get_query_param(next_link, "cursor"),
+        }
+        request.build_absolute_uri.return_value = next_link
+        search_query.cursor_query.return_value.execute.return_value = (
+            mock_cursor_response([3, 4], 5, "pit-2")
+        )
+
+        paginator = ESPagination()
+        page = paginator.paginate_es_query(search_query, request)
+
+        search_query.cursor_query.assert_called_with(3, "pit-1", [1.0, 2], False)
+        search_query.close_point_in_time.assert_called_once_with("pit-2")
+        assert [doc.id for doc in page] == [3, 4]
+        assert paginator.get_next_link() is None
+        assert paginator.previous_cursor == {
+            "pit": None,
+            "after": [1.0, 3],
+            "reverse": True,
+        }
+
+        request.query_params = {
+            "limit": 2,
+            "cursor": get_query_param(paginator.get_previous_link(), "cursor"),
+        }
+        search_query.cursor_query.return_value.execute.return_value = (
+            mock_cursor_response([2, 1], 5, None)
+        )
+
+        paginator = ESPagination()
+        page = paginator.paginate_es_query(search_query, request)
+
+        search_query.cursor_query.assert_called_with(3, None, [1.0, 3], True)
+        search_query.open_point_in_time.assert_called_once()
+        search_query.close_point_in_time.assert_called_once()
+        assert [doc.id for doc in page] == [1, 2]
+        assert paginator.previous_cursor is None
+        assert paginator.next_cursor == {
+            "pit": None,
+            "after": [1.0, 2],
+            "reverse": False,
+        }
+
+    def test_paginate_es_query_by_cursor_backwards(self):
+        request = Mock()
+        request.query_params = {
+            "limit": 1,
+            "cursor": encode_cursor({"pit": None, "after": [1.0, 3], "reverse": True}),
+        }
+        request.build_absolute_uri.return_value = "http://testserver/search/"
+        search_query = Mock()
+        search_query.open_point_in_time.return_value = "pit-1"
+        search_query.cursor_query.return_value.execute.return_value = (
+            mock_cursor_response([2, 1], 3, None)
+        )
+
+        paginator = ESPagination()
+        page = paginator.paginate_es_query(search_query, request)
+
+        assert [doc.id for doc in page] == [2]
+        assert paginator.previous_cursor["pit"] == "pit-1"
+
+        request.query_params = {
+            "limit": 1,
+            "cursor": get_query_param(paginator.get_previous_link(), "cursor"),
+        }
+        search_query.cursor_query.return_value.execute.return_value = (
+            mock_cursor_response([1], 3, "pit-2")
+        )
+
+        paginator = ESPagination()
+        page = paginator.paginate_es_query(search_query, request)
+
+        search_query.cursor_query.assert_called_with(2, "pit-1", [1.0, 2], True)
+        search_query.close_point_in_time.assert_called_once_with("pit-2")
+        assert [doc.id for doc in page] == [1]
+        assert paginator.previous_cursor is None
+        assert paginator.next_cursor["pit"] is None
+
+    def test_paginate_es_query_by_cursor_single_page(self):
+        request = Mock()
+        request.query_params = {"pagination": "cursor"}
+        search_query = Mock()
+        search_query.cursor_query.return_value.execute.return_value = (
+            mock_cursor_response([1, 2], 2, None)
+        )
+
+        paginator = ESPagination()
+        paginator.paginate_es_query(search_query, request)
+
+        search_query.open_point_in_time.assert_not_called()
+        search_query.close_point_in_time.assert_not_called()
+        assert paginator.next_cursor is None
+        assert paginator.previous_cursor is None
+
+    def test_paginate_es_query_by_cursor_with_expired_point_in_time(self):
+        cursor = ESPagination()
+        cursor.request = Mock()
+        cursor.request.build_absolute_uri.return_value = "http://testserver/search/"
+        link = cursor.get_cursor_link(
+            {"pit": "pit-1", "after": [1.0, 2], "reverse": False}
+        )
+
+        request = Mock()
+        request.query_params = {"cursor": get_query_param(link, "cursor")}
+        search_query = Mock()
+        search_query.cursor_query.return_value.execute.side_effect = NotFoundError(
+            404, "search_context_missing_exception"
+        )
+
+        with self.assertRaisesMessage(NotFound, "Cursor has expired"):
+            ESPagination().paginate_es_query(search_query, request)
+
+        search_query.open_point_in_time.assert_not_called()
+
+    def test_paginate_es_query_with_invalid_cursor(self):
+        request = Mock()
+        request.query_params = {"cursor": "invalid"}
+
+        with self.assertRaises(NotFound):
+            ESPagination().paginate_es_query(Mock(), request)
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.conf import settings
 from django.test.testcases import TestCase
 
@@ -29,6 +31,48 @@ class GoogleCloudTestCase(TestCase):
         mock_blob.assert_called_with(destination_url)
         mock_upload_from_string.assert_called_with(file_blob, content_type=content_type)
 
+    @patch("utils.google_cloud.Client")
+    def test_upload_file_from_filename(self, mock_client):
+        mock_upload_from_filename = Mock()
+        mock_blob = Mock(
+            return_value=Mock(upload_from_filename=mock_upload_from_filename)
+        )
+        mock_bucket = Mock(return_value=Mock(blob=mock_blob))
+        mock_client.return_value = Mock(bucket=mock_bucket)
+
+        google_cloud_service = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
+        google_cloud_service.upload_file_from_filename(
+            "destination_url", "/tmp/file.xlsx", "application/xlsx"
+        )
+
+        mock_blob.assert_called_with("destination_url")
+        mock_upload_from_filename.assert_called_with(
+            "/tmp/file.xlsx", content_type="application/xlsx"
+        )
+
+    @patch("utils.google_cloud.Client")
+    def test_generate_signed_url(self, mock_client):
+        mock_generate_signed_url = Mock(return_value="signed_url")
+        mock_blob = Mock(
+            return_value=Mock(generate_signed_url=mock_generate_signed_url)
+        )
+        mock_bucket = Mock(return_value=Mock(blob=mock_blob))
+        mock_client.return_value = Mock(bucket=mock_bucket)
+
+        google_cloud_service = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
+        signed_url = google_cloud_service.generate_signed_url(
+            "object_path", 900, filename="file.xlsx"
+        )
+
+        assert signed_url == "signed_url"
+        mock_blob.assert_called_with("object_path")
+        mock_generate_signed_url.assert_called_with(
+            version="v4",
+            expiration=timedelta(seconds=900),
+            method="GET",
+            response_disposition="attachment; filename=file.xlsx",
+        )
+
     @patch("utils.google_cloud.Client")
     def test_delete_file_from_url(self, mock_client):
         mock_delete = Mock()
@@ -65,6 +109,21 @@ class GoogleCloudTestCase(TestCase):
         mock_blob.assert_called_with(object_path)
         mock_is_object_exists.assert_called()
 
+    @patch("utils.google_cloud.Client")
+    def test_list_object_names(self, mock_client):
+        blob = Mock()
+        blob.name = "exports/officers/person-1-2.xlsx"
+        mock_list_blobs = Mock(return_value=[blob])
+        mock_bucket = Mock(return_value=Mock(list_blobs=mock_list_blobs))
+        mock_client.return_value = Mock(bucket=mock_bucket)
+
+        google_cloud_service = GoogleCloudService(settings.DOCUMENTS_BUCKET_NAME)
+
+        assert google_cloud_service.list_object_names("exports/officers/person-1-") == [
+            "exports/officers/person-1-2.xlsx"
+        ]
+        mock_list_blobs.assert_called_with(prefix="exports/officers/person-1-")
+
     @patch("utils.google_cloud.Client")
     def test_move_blob_internally(self, mock_client):
         mock_blob_return = "mock_blob_return"
@@ -1,10 +1,12 @@
+from io import BytesIO
 from unittest.mock import MagicMock
 
-from django.conf import settings
 from django.test.testcases import TestCase
 
 import pytest
-from mock import Mock, call, patch
+from mock import Mock, patch
+from PIL import Image as PILImage
+from PIL import ImageChops, ImageDraw
 from PIL.Image import Resampling
 
 from utils.constants import (
@@ -12,11 +14,16 @@ from utils.constants import (
     LA_LOC_TOP_LEFT,
     MAP_DOT_RADIUS,
     MAP_DOT_SHARPNESS,
+    PREVIEW_IMAGE_RESOLUTION,
+    PREVIEW_IMAGE_TIME_LIMIT,
 )
 from utils.image_generator import (
     generate_dot_img,
     generate_from_blob,
     generate_map_thumbnail,
+    get_base_map,
+    get_map_thumbnail_hash,
+    init_preview_worker,
 )
 
 
@@ -24,33 +31,38 @@ class ImageGeneratorTestCase(TestCase):
     @patch("utils.image_generator.Image")
     def test_generate_from_url(self, mock_image):
         returned_blob = "returned_blob"
-        mock_sequence = "sequence_0"
-        mock_sample = Mock()
-        mock_make_blob = Mock(return_value=returned_blob)
-        mock_image_sequences_return = Mock(
-            __enter__=Mock(return_value=mock_sequence), __exit__=Mock()
+        mock_first_page = Mock(make_blob=Mock(return_value=returned_blob))
+        mock_image.return_value = Mock(
+            __enter__=Mock(return_value=mock_first_page), __exit__=Mock()
         )
 
-        mock_image_class_2_return = Mock(sample=mock_sample, make_blob=mock_make_blob)
-        mock_image_sequences = Mock(sequence=[mock_image_sequences_return])
+        image_generated = generate_from_blob(b"blob")
 
-        mock_image_class_1 = Mock(
-            __enter__=Mock(return_value=mock_image_sequences), __exit__=Mock()
-        )
-        mock_image_class_2 = Mock(
-            __enter__=Mock(return_value=mock_image_class_2_return), __exit__=Mock()
+        filename = mock_image.call_args.kwargs["filename"]
+        assert filename.endswith(".pdf[0]")
+        mock_image.assert_called_with(
+            filename=filename, resolution=PREVIEW_IMAGE_RESOLUTION
         )
-        mock_image.side_effect = [mock_image_class_1, mock_image_class_2]
+        mock_first_page.sample.assert_called_with(850, 1100)
+        mock_first_page.make_blob.assert_called_with("jpeg")
 
-        blob = "blob"
-        image_generated = generate_from_blob(blob)
+        assert image_generated == returned_blob
 
-        image_calls = [call(blob=blob, resolution=500), call("sequence_0")]
-        mock_image.assert_has_calls(image_calls)
-        mock_sample.assert_called_with(850, 1100)
-        mock_make_blob.assert_called_with("jpeg")
+    @patch("utils.image_generator.Image")
+    @patch("utils.image_generator.PREVIEW_IMAGE_MAX_FILE_SIZE", 3)
+    def test_generate_from_url_skip_large_file(self, mock_image):
+        image_generated = generate_from_blob(b"blob")
 
-        assert image_generated == returned_blob
+        mock_image.assert_not_called()
+        assert image_generated is None
+
+    def test_init_preview_worker(self):
+        limits = {}
+
+        with patch("utils.image_generator.limits", limits):
+            init_preview_worker()
+
+        assert limits == {"time": PREVIEW_IMAGE_TIME_LIMIT}
 
     @patch("utils.image_generator.Image")
     def test_generate_from_url_fail(self, mock_image):
@@ -58,8 +70,7 @@ class ImageGeneratorTestCase(TestCase):
             __enter__=Exception("any error"), __exit__=Mock()
         )
 
-        blob = "blob"
-        image_generated = generate_from_blob(blob)
+        image_generated = generate_from_blob(b"blob")
 
         assert image_generated is None
 
@@ -72,63 +83,54 @@ class ImageGeneratorTestCase(TestCase):
         mock_new_image_return = MagicMock()
         mock_new_image.return_value = mock_new_image_return
 
-        img_width = 150
-        img_height = 300
-        base_image_info = (img_width, img_height)
-        dot_x = 15
-        dot_y = 50
+        dot_x = 15.5
+        dot_y = 50.25
         dot_location = (dot_x, dot_y)
+        tile_size = 2 * MAP_DOT_RADIUS + 3
+        left = 15 - MAP_DOT_RADIUS - 1
+        top = 50 - MAP_DOT_RADIUS - 1
 
         dot_image_return = "dot-image-return"
         mock_new_image_return.resize.return_value = dot_image_return
 
-        result = generate_dot_img(base_image_info, dot_location)
+        result = generate_dot_img(dot_location)
 
         mock_new_image.assert_called_with(
             "RGBA",
-            (img_width * MAP_DOT_SHARPNESS, img_height * MAP_DOT_SHARPNESS),
+            (tile_size * MAP_DOT_SHARPNESS, tile_size * MAP_DOT_SHARPNESS),
             (255, 255, 255, 0),
         )
 
         mock_draw.assert_called_with(mock_new_image_return)
 
         expected_upper_left_ellipse = (
-            MAP_DOT_SHARPNESS * (dot_x - MAP_DOT_RADIUS),
-            MAP_DOT_SHARPNESS * (dot_y - MAP_DOT_RADIUS),
+            MAP_DOT_SHARPNESS * (dot_x - left - MAP_DOT_RADIUS),
+            MAP_DOT_SHARPNESS * (dot_y - top - MAP_DOT_RADIUS),
         )
         expected_bottom_right_ellipse = (
-            MAP_DOT_SHARPNESS * (dot_x + MAP_DOT_RADIUS),
-            MAP_DOT_SHARPNESS * (dot_y + MAP_DOT_RADIUS),
+            MAP_DOT_SHARPNESS * (dot_x - left + MAP_DOT_RADIUS),
+            MAP_DOT_SHARPNESS * (dot_y - top + MAP_DOT_RADIUS),
         )
 
         mock_draw_return.ellipse.assert_called_with(
             [expected_upper_left_ellipse, expected_bottom_right_ellipse], fill="black"
         )
         mock_new_image_return.resize.assert_called_with(
-            base_image_info, Resampling.LANCZOS
+            (tile_size, tile_size), Resampling.LANCZOS
         )
 
-        assert result == dot_image_return
+        assert result == (dot_image_return, (left, top))
 
     @patch("utils.image_generator.generate_dot_img")
     @patch("utils.image_generator.BytesIO")
-    @patch("PIL.Image.alpha_composite")
-    @patch("PIL.Image.open")
+    @patch("utils.image_generator.get_base_map")
     def test_generate_map_thumbnail_success(
-        self, mock_open_image, mock_alpha_composite, mock_byte_io, mock_generate_dot_img
+        self, mock_get_base_map, mock_byte_io, mock_generate_dot_img
     ):
-        mock_open_image_return = MagicMock()
         base_img_width = 128
         base_img_height = 256
-        base_image = MagicMock(
-            width=base_img_width,
-            height=base_img_height,
-        )
-        mock_open_image_return.__enter__.return_value = base_image
-        mock_open_image.return_value = mock_open_image_return
-
-        mock_alpha_composite_return = MagicMock()
-        mock_alpha_composite.return_value = mock_alpha_composite_return
+        image = MagicMock(width=base_img_width, height=base_img_height)
+        mock_get_base_map.return_value.copy.return_value = image
 
         mock_byte_io_object = MagicMock()
         expected_map_bytes = "map-bytes"
@@ -136,15 +138,13 @@ class ImageGeneratorTestCase(TestCase):
         mock_byte_io.return_value = mock_byte_io_object
 
         dot_img_return = "dot-image-return"
-        mock_generate_dot_img.return_value = dot_img_return
+        mock_generate_dot_img.return_value = (dot_img_return, (10, 20))
 
         map_lng = -91.2440566
         map_lat = 30.385919
 
         generated_map = generate_map_thumbnail(map_lng, map_lat)
 
-        mock_open_image.assert_called_with(f"{settings.BASE_DIR}/map.png")
-
         dot_x = (
             (map_lng - LA_LOC_TOP_LEFT[0])
             / (LA_LOC_BOTTOM_RIGHT[0] - LA_LOC_TOP_LEFT[0])
@@ -156,20 +156,69 @@ class ImageGeneratorTestCase(TestCase):
             * base_img_height
         )
 
-        mock_generate_dot_img.assert_called_with(
-            (base_img_width, base_img_height), (dot_x, dot_y)
-        )
-        mock_alpha_composite.assert_called_with(base_image, dot_img_return)
+        mock_generate_dot_img.assert_called_with((dot_x, dot_y))
+        image.alpha_composite.assert_called_with(dot_img_return, dest=(10, 20))
 
         mock_byte_io.assert_called()
-        mock_alpha_composite_return.save.assert_called_with(
-            mock_byte_io_object, format="PNG"
-        )
+        image.save.assert_called_with(mock_byte_io_object, format="PNG")
         mock_byte_io_object.getvalue.assert_called()
         mock_byte_io_object.close.assert_called()
 
         assert generated_map == expected_map_bytes
 
+    def test_generate_map_thumbnail_matches_full_size_render(self):
+        map_lng = -91.2440566
+        map_lat = 30.385919
+
+        base_image = get_base_map()
+        x = (
+            (map_lng - LA_LOC_TOP_LEFT[0])
+            / (LA_LOC_BOTTOM_RIGHT[0] - LA_LOC_TOP_LEFT[0])
+            * base_image.width
+        )
+        y = (
+            (map_lat - LA_LOC_TOP_LEFT[1])
+            / (LA_LOC_BOTTOM_RIGHT[1] - LA_LOC_TOP_LEFT[1])
+            * base_image.height
+        )
+        dot_image = PILImage.new(
+            "RGBA",
+            (
+                base_image.width * MAP_DOT_SHARPNESS,
+                base_image.height * MAP_DOT_SHARPNESS,
+            ),
+            (255, 255, 255, 0),
+        )
+        ImageDraw.Draw(dot_image).ellipse(
+            [
+                (
+                    MAP_DOT_SHARPNESS * (x - MAP_DOT_RADIUS),
+                    MAP_DOT_SHARPNESS * (y - MAP_DOT_RADIUS),
+                ),
+                (
+                    MAP_DOT_SHARPNESS * (x + MAP_DOT_RADIUS),
+                    MAP_DOT_SHARPNESS * (y + MAP_DOT_RADIUS),
+                ),
+            ],
+            fill="black",
+        )
+        expected_image = PILImage.alpha_composite(
+            base_image, dot_image.resize(base_image.size, Resampling.LANCZOS)
+        )
+
+        generated_image = PILImage.open(
+            BytesIO(generate_map_thumbnail(map_lng, map_lat))
+        )
+
+        difference = ImageChops.difference(generated_image, expected_image)
+        assert max(high for _, high in difference.getextrema()) <= 4
+
+    def test_get_map_thumbnail_hash(self):
+        map_hash = get_map_thumbnail_hash(-91.2440566, 30.385919)
+
+        assert map_hash == get_map_thumbnail_hash(-91.2440566, 30.385919)
+        assert map_hash != get_map_thumbnail_hash(-91.2440566, 30.385918)
+
     def test_generate_map_thumbnail_invalid_long(self):
         invalid_map_lng = -150.2440566
         map_lat = 30.385919
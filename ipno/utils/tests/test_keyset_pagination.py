@@ -0,0 +1,109 @@
+import base64
+import json
+from urllib.parse import parse_qs, urlparse
+
+from django.db.models import Q
+from django.test.testcases import TestCase
+
+from rest_framework.exceptions import NotFound
+
+from mock import Mock
+
+from people.factories import PersonFactory
+from people.models import Person
+from utils.keyset_pagination import KeysetPagination
+
+
+def encode_cursor(cursor):
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def get_cursor(url):
+    encoded = parse_qs(urlparse(url).query)["cursor"][0]
+
+    return json.loads(base64.urlsafe_b64decode(encoded.encode()))
+
+
+def mock_request(query_params):
+    request = Mock()
+    request.query_params = query_params
+    request.build_absolute_uri.return_value = "http://testserver/people/?offset=2"
+    return request
+
+
+class KeysetPaginationTestCase(TestCase):
+    def test_get_keyset_filter(self):
+        paginator = KeysetPagination(["-count", "id"])
+
+        assert paginator.get_keyset_filter([4, 10], False) == Q(count__lte=4) & (
+            Q(count__lt=4) | Q(count=4, id__gt=10)
+        )
+        assert paginator.get_keyset_filter([4, 10], True) == Q(count__gte=4) & (
+            Q(count__gt=4) | Q(count=4, id__lt=10)
+        )
+
+    def test_paginate_queryset(self):
+        people = [PersonFactory(all_complaints_count=count) for count in [3, 3, 1]]
+        queryset = Person.objects.all()
+
+        paginator = KeysetPagination(["-all_complaints_count", "-id"])
+        page = paginator.paginate_queryset(queryset, mock_request({"limit": 2}))
+
+        assert page == [people[1], people[0]]
+        assert paginator.get_previous_link() is None
+        next_cursor = get_cursor(paginator.get_next_link())
+        assert next_cursor == {"position": [3, people[0].id], "reverse": False}
+
+        paginator = KeysetPagination(["-all_complaints_count", "-id"])
+        page = paginator.paginate_queryset(
+            queryset,
+            mock_request({"limit": 2, "cursor": encode_cursor(next_cursor)}),
+        )
+
+        assert page == [people[2]]
+        assert paginator.get_next_link() is None
+        previous_cursor = get_cursor(paginator.get_previous_link())
+        assert previous_cursor == {"position": [1, people[2].id], "reverse": True}
+
+        paginator = KeysetPagination(["-all_complaints_count", "-id"])
+        page = paginator.paginate_queryset(
+            queryset,
+            mock_request({"limit": 1, "cursor": encode_cursor(previous_cursor)}),
+        )
+
+        assert page == [people[0]]
+        assert get_cursor(paginator.get_previous_link()) == {
+            "position": [3, people[0].id],
+            "reverse": True,
+        }
+        assert get_cursor(paginator.get_next_link()) == {
+            "position": [3, people[0].id],
+            "reverse": False,
+        }
+
+    def test_get_paginated_data(self):
+        paginator = KeysetPagination(["id"])
+        paginator.request = mock_request({})
+        paginator.next_position = [5]
+        paginator.previous_position = None
+
+        data = paginator.get_paginated_data([1, 2])
+        parsed_url = urlparse(data["next"])
+
+        assert "offset" not in parse_qs(parsed_url.query)
+        assert get_cursor(data["next"]) == {"position": [5], "reverse": False}
+        assert data["previous"] is None
+        assert data["results"] == [1, 2]
+
+    def test_decode_invalid_cursor(self):
+        paginator = KeysetPagination(["-all_complaints_count", "-id"])
+
+        for cursor in [
+            "not-a-cursor",
+            encode_cursor([1, 2]),
+            encode_cursor({"position": [1], "reverse": False}),
+            encode_cursor({"position": [None, 1], "reverse": False}),
+            encode_cursor({"position": [1, 2], "reverse": "no"}),
+        ]:
+            with self.assertRaises(NotFound):
+                paginator.decode_cursor(mock_request({"cursor": cursor}))
@@ -2,7 +2,7 @@ from datetime import date
 
 from django.test.testcases import TestCase
 
-from utils.parse_utils import parse_date
+from utils.parse_utils import parse_date, split_text_chunks
 
 
 class ParseUtilsTestCase(TestCase):
@@ -22,3 +22,18 @@ class ParseUtilsTestCase(TestCase):
         assert parse_date(1990, 12, 1999) is None
 
         assert parse_date("abcd", "def", "gh") is None
+
+    def test_split_text_chunks(self):
+        text = "First  page\ntext\f\fThird page has more words"
+
+        assert split_text_chunks(text, 11) == [
+            {"page": 1, "text": "First page"},
+            {"page": 1, "text": "text"},
+            {"page": 3, "text": "Third page"},
+            {"page": 3, "text": "has more"},
+            {"page": 3, "text": "words"},
+        ]
+
+    def test_split_text_chunks_empty_text(self):
+        assert split_text_chunks(None, 100) == []
+        assert split_text_chunks("", 100) == []
@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from django.test.testcases import TestCase
 
 from mock import MagicMock, Mock, patch
+from reportlab.lib.styles import getSampleStyleSheet
 
 from utils.constants import (
     BASE_MARGIN,
@@ -11,7 +13,7 @@ from utils.constants import (
     PAGE_SIZE,
     SPACER,
 )
-from utils.pdf_creator import ArticlePdfCreator
+from utils.pdf_creator import ArticlePdfCreator, build_pdfs, render_article_pdf
 
 
 class ArticlePdfCreatorTestCase(TestCase):
@@ -79,22 +81,20 @@ class ArticlePdfCreatorTestCase(TestCase):
             },
         ]
 
-    @patch("utils.pdf_creator.getSampleStyleSheet")
-    def test_get_style(self, mock_get_sample_style_sheet):
-        mock_style_body_text = Mock()
-        mock_style_heading_1 = Mock()
-        mock_sample_style_sheet = {
-            "BodyText": mock_style_body_text,
-            "Heading1": mock_style_heading_1,
-        }
-        mock_get_sample_style_sheet.return_value = mock_sample_style_sheet
+    def test_get_style(self):
+        sample_style_sheet = getSampleStyleSheet()
 
         heading_1_style = self.pdf.get_style("Heading1")
-        assert heading_1_style == mock_style_heading_1
+        assert heading_1_style.name == "Heading1"
+        assert heading_1_style is self.pdf.get_style("Heading1")
 
         meta_style = self.pdf.get_style("BodyText", {"fontSize": 11})
-        assert meta_style == mock_style_body_text
-        assert mock_style_body_text.fontSize == 11
+        assert meta_style.parent.name == "BodyText"
+        assert meta_style.fontSize == 11
+        assert meta_style is self.pdf.get_style("BodyText", {"fontSize": 11})
+        assert self.pdf.get_style("BodyText").fontSize == (
+            sample_style_sheet["BodyText"].fontSize
+        )
 
     @patch("utils.pdf_creator.Spacer")
     @patch("utils.pdf_creator.Paragraph")
@@ -279,3 +279,29 @@ class ArticlePdfCreatorTestCase(TestCase):
         mock_buffer_close.assert_called()
 
         assert buffer == "byte-io-getvalue"
+
+    def test_render_article_pdf(self):
+        pdf_buffer, render_time = render_article_pdf(
+            {
+                "title": self.title,
+                "author": self.author,
+                "date": self.date,
+                "content": self.content,
+                "link": self.link,
+            }
+        )
+
+        assert pdf_buffer.startswith(b"%PDF")
+        assert render_time > 0
+
+    @patch("utils.pdf_creator.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("utils.pdf_creator.render_article_pdf")
+    def test_build_pdfs(self, mock_render_article_pdf):
+        mock_render_article_pdf.side_effect = lambda article: (
+            f"pdf-{article['title']}",
+            0.1,
+        )
+
+        result = build_pdfs([{"title": "title-1"}, {"title": "title-2"}])
+
+        assert result == [("pdf-title-1", 0.1), ("pdf-title-2", 0.1)]
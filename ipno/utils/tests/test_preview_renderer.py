@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from mock import Mock, call, patch
+
+from utils.preview_renderer import PreviewRenderer
+
+
+@patch("utils.preview_renderer.ProcessPoolExecutor", ThreadPoolExecutor)
+class PreviewRendererTestCase(SimpleTestCase):
+    @patch("utils.preview_renderer.generate_from_blob")
+    def test_render(self, generate_from_blob_mock):
+        generate_from_blob_mock.side_effect = lambda blob: f"preview-{blob}"
+        on_rendered = Mock()
+
+        with PreviewRenderer(on_rendered, max_workers=2) as renderer:
+            renderer.submit("key-1", "blob-1")
+            renderer.submit("key-2", "blob-2")
+
+        on_rendered.assert_has_calls(
+            [call("key-1", "preview-blob-1"), call("key-2", "preview-blob-2")],
+            any_order=True,
+        )
+        assert on_rendered.call_count == 2
+        assert renderer.jobs == {}
+
+    @patch("utils.preview_renderer.generate_from_blob")
+    def test_render_limits_pending_jobs(self, generate_from_blob_mock):
+        generate_from_blob_mock.side_effect = lambda blob: f"preview-{blob}"
+        on_rendered = Mock()
+
+        with PreviewRenderer(on_rendered, max_pending_jobs=1) as renderer:
+            renderer.submit("key-1", "blob-1")
+            renderer.submit("key-2", "blob-2")
+
+            on_rendered.assert_called_once_with("key-1", "preview-blob-1")
+            assert list(renderer.jobs.values()) == ["key-2"]
+
+        on_rendered.assert_called_with("key-2", "preview-blob-2")
+
+    @patch(
+        "utils.preview_renderer.generate_from_blob",
+        side_effect=Exception("render error"),
+    )
+    def test_render_error(self, _):
+        on_rendered = Mock()
+
+        with PreviewRenderer(on_rendered) as renderer:
+            renderer.submit("key", "blob")
+
+        on_rendered.assert_called_once_with("key", None)
+
+    def test_exit_with_error_cancels_pending_jobs(self):
+        executor = Mock()
+        future = Mock()
+        executor.submit.return_value = future
+        on_rendered = Mock()
+
+        with patch("utils.preview_renderer.ProcessPoolExecutor", return_value=executor):
+            with self.assertRaises(ValueError):
+                with PreviewRenderer(on_rendered) as renderer:
+                    renderer.submit("key", "blob")
+                    raise ValueError("import error")
+
+        future.cancel.assert_called_once()
+        executor.shutdown.assert_called_once_with(wait=True)
+        on_rendered.assert_not_called()
+        assert renderer.jobs == {}
+
+    @patch("utils.preview_renderer.generate_from_blob")
+    @patch("utils.preview_renderer.current_process")
+    def test_render_in_daemonic_process(
+        self, current_process_mock, generate_from_blob_mock
+    ):
+        current_process_mock.return_value.daemon = True
+        generate_from_blob_mock.side_effect = lambda blob: f"preview-{blob}"
+        on_rendered = Mock()
+
+        with patch("utils.preview_renderer.ProcessPoolExecutor") as executor_mock:
+            with PreviewRenderer(on_rendered) as renderer:
+                renderer.submit("key-1", "blob-1")
+
+                on_rendered.assert_called_once_with("key-1", "preview-blob-1")
+
+                renderer.submit("key-2", "blob-2")
+
+        executor_mock.assert_not_called()
+        on_rendered.assert_called_with("key-2", "preview-blob-2")
+        assert renderer.jobs == {}
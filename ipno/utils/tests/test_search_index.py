@@ -0,0 +1,136 @@
+from django.test.testcases import TestCase
+
+from mock import patch
+
+from data.models import SearchIndexChange
+from departments.factories import DepartmentFactory
+from documents.factories import DocumentFactory
+from news_articles.factories import NewsArticleFactory
+from news_articles.factories.matched_sentence_factory import MatchedSentenceFactory
+from officers.factories import EventFactory, OfficerFactory
+from officers.models import Event, Officer
+from people.factories import PersonFactory
+from utils.cache_utils import get_search_index_version
+from utils.search_index import (
+    check_search_index_consistency,
+    record_search_index_changes,
+    update_search_index,
+)
+
+
+class SearchIndexTestCase(TestCase):
+    def get_changes(self):
+        return set(SearchIndexChange.objects.values_list("index_name", "object_id"))
+
+    def test_record_search_index_changes_of_department(self):
+        department = DepartmentFactory()
+        officer = OfficerFactory(department=department)
+        person = PersonFactory(canonical_officer=officer)
+        person.officers.add(officer)
+        document = DocumentFactory()
+        document.departments.add(department)
+        news_article = NewsArticleFactory()
+        matched_sentence = MatchedSentenceFactory(article=news_article)
+        matched_sentence.officers.add(officer)
+        DepartmentFactory()
+
+        record_search_index_changes(type(department), [department.id])
+
+        assert self.get_changes() == {
+            ("test_departments", department.id),
+            ("test_officers", officer.id),
+            ("test_documents", document.id),
+            ("test_articles", news_article.id),
+        }
+
+    def test_record_search_index_changes_of_event(self):
+        officer = OfficerFactory()
+        event = EventFactory(officer=officer)
+        document = DocumentFactory()
+        document.officers.add(officer)
+        DocumentFactory()
+
+        record_search_index_changes(Event, [event.id])
+
+        assert self.get_changes() == {
+            ("test_officers", officer.id),
+            ("test_documents", document.id),
+        }
+
+    def test_record_search_index_changes_ignore_existing_changes(self):
+        officer = OfficerFactory()
+
+        record_search_index_changes(type(officer), [officer.id])
+        record_search_index_changes(type(officer), [officer.id])
+
+        assert SearchIndexChange.objects.count() == 1
+
+    @patch("utils.search_index.SEARCH_INDEX_REBUILD_THRESHOLD", 1)
+    def test_record_search_index_changes_above_rebuild_threshold(self):
+        department = DepartmentFactory()
+        officers = OfficerFactory.create_batch(2, department=department)
+        EventFactory(officer=officers[0])
+
+        record_search_index_changes(
+            Officer, Officer.objects.values_list("id", flat=True)
+        )
+        record_search_index_changes(type(department), [department.id])
+
+        assert self.get_changes() == {
+            ("test_officers", None),
+            ("test_documents", None),
+            ("test_articles", None),
+            ("test_departments", department.id),
+        }
+
+    @patch("departments.documents.DepartmentESDoc.update_index")
+    @patch("officers.documents.OfficerESDoc.update_index")
+    @patch("documents.documents.DocumentESDoc.update_index")
+    @patch("news_articles.documents.NewsArticleESDoc.update_index")
+    def test_update_search_index(
+        self,
+        news_article_update_index,
+        document_update_index,
+        officer_update_index,
+        department_update_index,
+    ):
+        search_index_version = get_search_index_version()
+
+        update_search_index()
+
+        news_article_update_index.assert_called()
+        document_update_index.assert_called()
+        officer_update_index.assert_called()
+        department_update_index.assert_called()
+        assert get_search_index_version() != search_index_version
+
+    @patch("news_articles.documents.NewsArticleESDoc.get_drifted_ids")
+    @patch("documents.documents.DocumentESDoc.get_drifted_ids")
+    @patch("officers.documents.OfficerESDoc.get_drifted_ids")
+    @patch("departments.documents.DepartmentESDoc.get_drifted_ids")
+    def test_check_search_index_consistency(
+        self,
+        department_get_drifted_ids,
+        officer_get_drifted_ids,
+        document_get_drifted_ids,
+        news_article_get_drifted_ids,
+    ):
+        department_get_drifted_ids.return_value = []
+        officer_get_drifted_ids.return_value = [1, 2]
+        document_get_drifted_ids.return_value = []
+        news_article_get_drifted_ids.return_value = [3]
+
+        result = check_search_index_consistency(50)
+
+        officer_get_drifted_ids.assert_called_with(50)
+        assert result == {
+            "test_departments": [],
+            "test_officers": [1, 2],
+            "test_documents": [],
+            "test_articles": [3],
+        }
+        assert self.get_changes() == {
+            ("test_officers", 1),
+            ("test_officers", 2),
+            ("test_articles", 3),
+        }